@@ -11,24 +11,24 @@ __all__ = ["run_query", "API", "errors"]
 
 from ansible.module_utils.json_utils import json
 import argparse
-import copy
 import hmac
 import inspect
+import marshal
 # import json
 import os
-import re
 import sys
 import textwrap
 import time
 import types
 from base64 import b64encode
 from collections import namedtuple
+from contextlib import redirect_stderr, redirect_stdout
 from datetime import date, datetime
-from functools import partial
+from functools import lru_cache, partial
 from hashlib import sha256
 from io import StringIO
 from pprint import pprint
-from urllib.parse import quote, urlparse, urlunparse
+from urllib.parse import quote, urlencode, urlparse, urlunparse
 
 
 
@@ -41,9333 +41,40 @@ FUTURE_VERSION = "2013-11-04"
 # The list of API actions that require a raw output (they will use vanilla
 # "print" instead of pprint). This is useful for actions that return files, so
 # that you can pipe the output to a file.
-RAW_ACTIONS_LIST = ("get-script-code",)
-
-SCHEMA = {
-    "AcceptPendingComputers": {
-        "2011-08-01": {
-            "doc": "\n    Accept a list of pending computers associated with the account used for\n    authentication.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "InsufficientLicenses"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "AcceptPendingComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer IDs to accept.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                },
-                {
-                    "default": {},
-                    "doc": "A mapping from pending computer IDs to existing ones.",
-                    "key": {
-                        "doc": "The ID of the pending computer.",
-                        "type": "integer"
-                    },
-                    "name": "existing_ids",
-                    "optional": True,
-                    "type": "mapping",
-                    "value": {
-                        "doc": "The ID of the computer to replace.",
-                        "type": "integer"
-                    }
-                },
-                {
-                    "default": None,
-                    "doc": "The access group to put the computers into",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Accept a list of pending computers associated with the account used for\n    authentication.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "InsufficientLicenses"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "AcceptPendingComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer IDs to accept.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                },
-                {
-                    "default": {},
-                    "doc": "A mapping from pending computer IDs to existing ones.",
-                    "key": {
-                        "doc": "The ID of the pending computer.",
-                        "type": "integer"
-                    },
-                    "name": "existing_ids",
-                    "optional": True,
-                    "type": "mapping",
-                    "value": {
-                        "doc": "The ID of the computer to replace.",
-                        "type": "integer"
-                    }
-                },
-                {
-                    "default": None,
-                    "doc": "The access group to put the computers into",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddAPTSourcesToRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Add APT sources to a repository profile.\n            An activity will be created to add the given source to the the\n            computers associated with the given profile.",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownAPTSource"
-                }
-            ],
-            "name": "AddAPTSourcesToRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The names of the APT sources to add.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "apt_sources",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Add APT sources to a repository profile.\n            An activity will be created to add the given source to the the\n            computers associated with the given profile.",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownAPTSource"
-                }
-            ],
-            "name": "AddAPTSourcesToRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The names of the APT sources to add.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "apt_sources",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddAccessGroupsToRole": {
-        "2011-08-01": {
-            "doc": "Add the given access groups to a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "UnknownAccessGroups"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                }
-            ],
-            "name": "AddAccessGroupsToRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of access groups to add to the role.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "access_groups",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Add the given access groups to a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "UnknownAccessGroups"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                }
-            ],
-            "name": "AddAccessGroupsToRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of access groups to add to the role.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "access_groups",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddAnnotationToComputers": {
-        "2011-08-01": {
-            "doc": "\n    Add annotation key and optional value to a selection of computers.",
-            "errors": [
-                {
-                    "code": "InvalidAnnotationKey"
-                },
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "AddAnnotationToComputers",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to which to add the annotation.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "Annotation key to add to the selected computers.",
-                    "name": "key",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Annotation value associated with the provided key to add to the selected computers.",
-                    "name": "value",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Add annotation key and optional value to a selection of computers.",
-            "errors": [
-                {
-                    "code": "InvalidAnnotationKey"
-                },
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "AddAnnotationToComputers",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to which to add the annotation.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "Annotation key to add to the selected computers.",
-                    "name": "key",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Annotation value associated with the provided key to add to the selected computers.",
-                    "name": "value",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddPackageFiltersToPocket": {
-        "2011-08-01": {
-            "doc": "\n    Add package filters to a repository pocket.  The pocket must be in pull\n    mode and support blacklist/whitelist filtering.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "NoPocketFiltering"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "AddPackageFiltersToPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to operate on.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of packages to be added or removed from the pocket filter.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Add package filters to a repository pocket.  The pocket must be in pull\n    mode and support blacklist/whitelist filtering.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "NoPocketFiltering"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "AddPackageFiltersToPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to operate on.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of packages to be added or removed from the pocket filter.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddPermissionsToRole": {
-        "2011-08-01": {
-            "doc": "Add permissions to a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                },
-                {
-                    "code": "InvalidRolePermissions"
-                }
-            ],
-            "name": "AddPermissionsToRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of permissions to add.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "permissions",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Add permissions to a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                },
-                {
-                    "code": "InvalidRolePermissions"
-                }
-            ],
-            "name": "AddPermissionsToRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of permissions to add.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "permissions",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddPersonsToRole": {
-        "2011-08-01": {
-            "doc": "Add permissions to a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "UnknownPersonEmails"
-                }
-            ],
-            "name": "AddPersonsToRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of emails of persons to add.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "persons",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Add permissions to a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "UnknownPersonEmails"
-                }
-            ],
-            "name": "AddPersonsToRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of emails of persons to add.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "persons",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddPocketsToRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Add repository pockets to a repository profile.\n            An activity will be created to add the given pockets to the APT\n            sources of the computers associated with the given profile. ",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "AddPocketsToRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The names of the pockets to add.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "pockets",
-                    "type": "list"
-                },
-                {
-                    "doc": "The name of the series the pockets belongs to.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution the series belongs to.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Add repository pockets to a repository profile.\n            An activity will be created to add the given pockets to the APT\n            sources of the computers associated with the given profile. ",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "AddPocketsToRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The names of the pockets to add.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "pockets",
-                    "type": "list"
-                },
-                {
-                    "doc": "The name of the series the pockets belongs to.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution the series belongs to.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddTagsToComputers": {
-        "2011-08-01": {
-            "doc": "Add tags to a selection of computers.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidTag"
-                }
-            ],
-            "name": "AddTagsToComputers",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to add tags to.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "Tag names to be applied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Add tags to a selection of computers.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidTag"
-                }
-            ],
-            "name": "AddTagsToComputers",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to add tags to.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "Tag names to be applied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AddUploaderGPGKeysToPocket": {
-        "2011-08-01": {
-            "doc": "\n    Add GPG keys to a repository pocket in upload mode to validate uploaded\n    packages.\n    ",
-            "errors": [
-                {
-                    "code": "GPGKeyNotAssociated"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "GPGKeyAlreadyAssociated"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "AddUploaderGPGKeysToPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket on which to associate keys.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of GPG keys on which to operate.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "gpg_keys",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Add GPG keys to a repository pocket in upload mode to validate uploaded\n    packages.\n    ",
-            "errors": [
-                {
-                    "code": "GPGKeyNotAssociated"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "GPGKeyAlreadyAssociated"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "AddUploaderGPGKeysToPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket on which to associate keys.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of GPG keys on which to operate.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "gpg_keys",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "ApproveActivities": {
-        "2011-08-01": {
-            "doc": "Approve activities associated with the current account.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidActivityStatusChange"
-                }
-            ],
-            "name": "ApproveActivities",
-            "parameters": [
-                {
-                    "doc": "A query string used to select activities on which to operate.",
-                    "name": "query",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Approve activities associated with the current account.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidActivityStatusChange"
-                }
-            ],
-            "name": "ApproveActivities",
-            "parameters": [
-                {
-                    "doc": "A query string used to select activities on which to operate.",
-                    "name": "query",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AssociateAlert": {
-        "2011-08-01": {
-            "doc": "\n    Associate an alert to computers with specific tags or to all computers.\n    If a tag with a given name doesn't exist, it will be automatically\n    created. An 'all_computers' value of 'true' and a list of tags are mutually\n    exclusive. Only one or the other may be passed.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "InvalidAlertTypeError"
-                }
-            ],
-            "name": "AssociateAlert",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Associate an alert to computers with specific tags or to all computers.\n    If a tag with a given name doesn't exist, it will be automatically\n    created. An 'all_computers' value of 'true' and a list of tags are mutually\n    exclusive. Only one or the other may be passed.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "InvalidAlertTypeError"
-                }
-            ],
-            "name": "AssociateAlert",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AssociatePackageProfile": {
-        "2011-08-01": {
-            "doc": "\n    Associate a package profile to computers with specific tags or to all\n    computers. If a tag with a given name doesn't exist, it will be\n    automatically created.\n\n    An 'all_computers' value of 'true' and a list of tags are mutually\n    exclusive. Only one or the other may be passed.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                }
-            ],
-            "name": "AssociatePackageProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Associate a package profile to computers with specific tags or to all\n    computers. If a tag with a given name doesn't exist, it will be\n    automatically created.\n\n    An 'all_computers' value of 'true' and a list of tags are mutually\n    exclusive. Only one or the other may be passed.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                }
-            ],
-            "name": "AssociatePackageProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AssociateRemovalProfile": {
-        "2011-08-01": {
-            "doc": "\n    Associate a removal profile to computers with the specified tags,\n    or all computers.\n\n    tags and all_computers=true are mutually exclusive.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownRemovalProfile"
-                }
-            ],
-            "name": "AssociateRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Associate a removal profile to computers with the specified tags,\n    or all computers.\n\n    tags and all_computers=true are mutually exclusive.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownRemovalProfile"
-                }
-            ],
-            "name": "AssociateRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AssociateRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Associate repository profile to computers with specified tags\n            or to all computers.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownRepositoryProfile"
-                }
-            ],
-            "name": "AssociateRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Associate repository profile to computers with specified tags\n            or to all computers.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownRepositoryProfile"
-                }
-            ],
-            "name": "AssociateRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "AssociateUpgradeProfile": {
-        "2011-08-01": {
-            "doc": "\n    Associate an upgrade profile to computers with the specified tags,\n    or all computers.\n\n    tags and all_computers=true are mutually exclusive.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownUpgradeProfile"
-                }
-            ],
-            "name": "AssociateUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Associate an upgrade profile to computers with the specified tags,\n    or all computers.\n\n    tags and all_computers=true are mutually exclusive.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownUpgradeProfile"
-                }
-            ],
-            "name": "AssociateUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CancelActivities": {
-        "2011-08-01": {
-            "doc": "\n    Cancel activities associated with the current account.\n\n    Returns a list of activities ids that were cancelled.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidActivityStatusChange"
-                }
-            ],
-            "name": "CancelActivities",
-            "parameters": [
-                {
-                    "doc": "A query string used to select activities on which to operate.",
-                    "name": "query",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Cancel activities associated with the current account.\n\n    Returns a list of activities ids that were cancelled.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidActivityStatusChange"
-                }
-            ],
-            "name": "CancelActivities",
-            "parameters": [
-                {
-                    "doc": "A query string used to select activities on which to operate.",
-                    "name": "query",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "ChangeComputersAccessGroup": {
-        "2011-08-01": {
-            "doc": "Change the access group for a selection of computers.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                }
-            ],
-            "name": "ChangeComputersAccessGroup",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to change access group for.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the access group to assign selected computers to.",
-                    "name": "access_group",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Change the access group for a selection of computers.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                }
-            ],
-            "name": "ChangeComputersAccessGroup",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to change access group for.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the access group to assign selected computers to.",
-                    "name": "access_group",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CopyPackageProfile": {
-        "2011-08-01": {
-            "doc": "\n    Copy an existing package profile to a package profile with a new name and\n    optionally a different title and description.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicatePackageProfile"
-                }
-            ],
-            "name": "CopyPackageProfile",
-            "parameters": [
-                {
-                    "doc": "A name of the existing package profile to copy.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The profile name of the copied package profile.",
-                    "name": "destination_name",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A title for the new profile. If not specified, the title of the source profile is used.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A description for the new profile. If not specified, the title of the source profile is used.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Name of the access group to copy the profile to. Defaults to the origin's access group.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Copy an existing package profile to a package profile with a new name and\n    optionally a different title and description.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicatePackageProfile"
-                }
-            ],
-            "name": "CopyPackageProfile",
-            "parameters": [
-                {
-                    "doc": "A name of the existing package profile to copy.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The profile name of the copied package profile.",
-                    "name": "destination_name",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A title for the new profile. If not specified, the title of the source profile is used.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A description for the new profile. If not specified, the title of the source profile is used.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Name of the access group to copy the profile to. Defaults to the origin's access group.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CopyRole": {
-        "2011-08-01": {
-            "doc": "Copy an existing access role to a role with a new name.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "InvalidRoleName"
-                },
-                {
-                    "code": "DuplicateRoleName"
-                }
-            ],
-            "name": "CopyRole",
-            "parameters": [
-                {
-                    "doc": "The name of the existing role.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the new role.",
-                    "name": "destination_name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The description of the new role.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Copy an existing access role to a role with a new name.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "InvalidRoleName"
-                },
-                {
-                    "code": "DuplicateRoleName"
-                }
-            ],
-            "name": "CopyRole",
-            "parameters": [
-                {
-                    "doc": "The name of the existing role.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the new role.",
-                    "name": "destination_name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The description of the new role.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CopyScript": {
-        "2011-08-01": {
-            "doc": "Copy an existing script to a script with a new name.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateScript"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "CopyScript",
-            "parameters": [
-                {
-                    "doc": "The identity of the existing script.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "doc": "The title of the new script.",
-                    "name": "destination_title",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The access group for the new script. It defaults to the same access group as the existing script.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Copy an existing script to a script with a new name.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateScript"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "CopyScript",
-            "parameters": [
-                {
-                    "doc": "The identity of the existing script.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "doc": "The title of the new script.",
-                    "name": "destination_title",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The access group for the new script. It defaults to the same access group as the existing script.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateAPTSource": {
-        "2011-08-01": {
-            "doc": "\n    Create an APT source in the account used for authentication.\n    ",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateAPTSource"
-                },
-                {
-                    "code": "InvalidAPTLine"
-                }
-            ],
-            "name": "CreateAPTSource",
-            "parameters": [
-                {
-                    "doc": "Name of the APT source. It must be unique within the account, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The APT line of the source.",
-                    "name": "apt_line",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Name of the GPG key used to sign the repository",
-                    "name": "gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": "global",
-                    "doc": "An optional name of the access group to create the APT source into.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Create an APT source in the account used for authentication.\n    ",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateAPTSource"
-                },
-                {
-                    "code": "InvalidAPTLine"
-                }
-            ],
-            "name": "CreateAPTSource",
-            "parameters": [
-                {
-                    "doc": "Name of the APT source. It must be unique within the account, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The APT line of the source.",
-                    "name": "apt_line",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Name of the GPG key used to sign the repository",
-                    "name": "gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": "global",
-                    "doc": "An optional name of the access group to create the APT source into.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateAccessGroup": {
-        "2011-08-01": {
-            "doc": "Create a new access group.",
-            "errors": [
-                {
-                    "code": "DuplicateAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownAccessGroup"
-                }
-            ],
-            "name": "CreateAccessGroup",
-            "parameters": [
-                {
-                    "doc": "The title of the access group.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "The title of the parent access group.",
-                    "name": "parent",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Create a new access group.",
-            "errors": [
-                {
-                    "code": "DuplicateAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownAccessGroup"
-                }
-            ],
-            "name": "CreateAccessGroup",
-            "parameters": [
-                {
-                    "doc": "The name of the access group.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Description of the access group.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name or ID of the parent access group.",
-                    "name": "parent",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateCloudOtps": {
-        "2011-08-01": {
-            "doc": "\n    Create one-time passwords used for registration of cloud instances.\n    ",
-            "errors": [],
-            "name": "CreateCloudOtps",
-            "parameters": [
-                {
-                    "default": 1,
-                    "doc": "The number of OTPs to create",
-                    "name": "count",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Create one-time passwords used for registration of cloud instances.\n    ",
-            "errors": [],
-            "name": "CreateCloudOtps",
-            "parameters": [
-                {
-                    "default": 1,
-                    "doc": "The number of OTPs to create",
-                    "name": "count",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateDistribution": {
-        "2011-08-01": {
-            "doc": "\n    Create a repository distribution associated with the account.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateDistribution"
-                }
-            ],
-            "name": "CreateDistribution",
-            "parameters": [
-                {
-                    "doc": "The name of the distribution. It must be unique within the account, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": "global",
-                    "doc": "An optional name of the access group to create the distribution into.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Create a repository distribution associated with the account.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateDistribution"
-                }
-            ],
-            "name": "CreateDistribution",
-            "parameters": [
-                {
-                    "doc": "The name of the distribution. It must be unique within the account, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": "global",
-                    "doc": "An optional name of the access group to create the distribution into.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreatePackageProfile": {
-        "2011-08-01": {
-            "doc": "\n    Create a package profile.\n\n    source_computer_id and material are mutually exclusive.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "EmptyPackageProfile"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "InvalidPackageProfileName"
-                },
-                {
-                    "code": "InvalidPackageProfileMaterial"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidPackageConstraint"
-                },
-                {
-                    "code": "DuplicatePackageProfile"
-                },
-                {
-                    "code": "NoFoundPackages"
-                },
-                {
-                    "code": "InvalidConstraintType"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "CreatePackageProfile",
-            "parameters": [
-                {
-                    "doc": "The title of the package profile to create.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "doc": "The description of the new profile.",
-                    "name": "description",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A computer ID to find a computer which will be used as the basis of the package profile.",
-                    "name": "source_computer_id",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "Package data in the format of 'dpkg --get-selections' or CSV (as exported by Landscape).",
-                    "name": "material",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Alternative to material, constraint specifications in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "constraints",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": "global",
-                    "doc": "Optional name of the access group to create the profile into",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Create a package profile.\n\n    source_computer_id and material are mutually exclusive.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "EmptyPackageProfile"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "InvalidPackageProfileName"
-                },
-                {
-                    "code": "InvalidPackageProfileMaterial"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidPackageConstraint"
-                },
-                {
-                    "code": "DuplicatePackageProfile"
-                },
-                {
-                    "code": "NoFoundPackages"
-                },
-                {
-                    "code": "InvalidConstraintType"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "CreatePackageProfile",
-            "parameters": [
-                {
-                    "doc": "The title of the package profile to create.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "doc": "The description of the new profile.",
-                    "name": "description",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A computer ID to find a computer which will be used as the basis of the package profile.",
-                    "name": "source_computer_id",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "Package data in the format of 'dpkg --get-selections' or CSV (as exported by Landscape).",
-                    "name": "material",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Alternative to material, constraint specifications in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "constraints",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": "global",
-                    "doc": "Optional name of the access group to create the profile into",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreatePocket": {
-        "2011-08-01": {
-            "doc": "Create a pocket associated with a series in the account.",
-            "errors": [
-                {
-                    "code": "InvalidPocketFilter"
-                },
-                {
-                    "code": "GPGKeyHasNoSecret"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "DuplicatePocket"
-                }
-            ],
-            "name": "CreatePocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket. It must be unique within series, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series to create the pocket in.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution the series belongs to.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of components the pocket will handle.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "components",
-                    "type": "list"
-                },
-                {
-                    "doc": "A list of architectures the pocket will handle.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "architectures",
-                    "type": "list"
-                },
-                {
-                    "doc": "The pocket mode. Can be 'pull', 'mirror' and 'upload'.",
-                    "name": "mode",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the GPG key to use to sign packages lists for this pocket. The GPG key provided must have a private key associated with it.",
-                    "name": "gpg_key",
-                    "type": "unicode"
-                },
-                {
-                    "default":False,
-                    "doc": "Whether the pocket should include selected components also for .udeb packages (debian-installer). It's 'false' by default.",
-                    "name": "include_udeb",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "The URI to mirror for pockets in 'mirror' mode.",
-                    "name": "mirror_uri",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The repository entry under dists/ to mirror for pockets in 'mirror' mode. This parameter is optional and defaults to the same name as local series and pocket. If the suite name ends with a '/', the remote repository is flat (packages are not grouped in components); in this case a single value can be passed for the 'components' parameter. Packages from the remote repository will be mirrored in the specified component.",
-                    "name": "mirror_suite",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to verify the mirrored archive signature. If none is given, the stock Ubuntu archive one will be used.",
-                    "name": "mirror_gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the series pull_pocket belongs to. Must be a series in the same distribution series belongs to. If not specified, it defaults to series.",
-                    "name": "pull_series",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of a pocket in current distribution to sync packages from for pockets in 'pull' mode.",
-                    "name": "pull_pocket",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "If specified, the type of the filter of the pocket. Can be either 'whitelist' or 'blacklist'.",
-                    "name": "filter_type",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default":False,
-                    "doc": "For pockets in upload mode, a boolean indicating whether uploaded packages are required to be signed or not. It's 'false' by default.",
-                    "name": "upload_allow_unsigned",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Create a pocket associated with a series in the account.",
-            "errors": [
-                {
-                    "code": "InvalidPocketFilter"
-                },
-                {
-                    "code": "GPGKeyHasNoSecret"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "DuplicatePocket"
-                }
-            ],
-            "name": "CreatePocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket. It must be unique within series, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series to create the pocket in.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution the series belongs to.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of components the pocket will handle.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "components",
-                    "type": "list"
-                },
-                {
-                    "doc": "A list of architectures the pocket will handle.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "architectures",
-                    "type": "list"
-                },
-                {
-                    "doc": "The pocket mode. Can be 'pull', 'mirror' and 'upload'.",
-                    "name": "mode",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the GPG key to use to sign packages lists for this pocket. The GPG key provided must have a private key associated with it.",
-                    "name": "gpg_key",
-                    "type": "unicode"
-                },
-                {
-                    "default":False,
-                    "doc": "Whether the pocket should include selected components also for .udeb packages (debian-installer). It's 'false' by default.",
-                    "name": "include_udeb",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "The URI to mirror for pockets in 'mirror' mode.",
-                    "name": "mirror_uri",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The repository entry under dists/ to mirror for pockets in 'mirror' mode. This parameter is optional and defaults to the same name as local series and pocket. If the suite name ends with a '/', the remote repository is flat (packages are not grouped in components); in this case a single value can be passed for the 'components' parameter. Packages from the remote repository will be mirrored in the specified component.",
-                    "name": "mirror_suite",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to verify the mirrored archive signature. If none is given, the stock Ubuntu archive one will be used.",
-                    "name": "mirror_gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the series pull_pocket belongs to. Must be a series in the same distribution series belongs to. If not specified, it defaults to series.",
-                    "name": "pull_series",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of a pocket in current distribution to sync packages from for pockets in 'pull' mode.",
-                    "name": "pull_pocket",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "If specified, the type of the filter of the pocket. Can be either 'whitelist' or 'blacklist'.",
-                    "name": "filter_type",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default":False,
-                    "doc": "For pockets in upload mode, a boolean indicating whether uploaded packages are required to be signed or not. It's 'false' by default.",
-                    "name": "upload_allow_unsigned",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateRemovalProfile": {
-        "2011-08-01": {
-            "doc": "Create a removal profile.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidDaysWithoutExchangeValue"
-                }
-            ],
-            "name": "CreateRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "The title of the profile to create.",
-                    "name": "title",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The length of time after which a computer may be removed.",
-                    "name": "days_without_exchange",
-                    "type": "integer"
-                },
-                {
-                    "default": "global",
-                    "doc": "An optional name of an access group the profile will apply to.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Create a removal profile.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidDaysWithoutExchangeValue"
-                }
-            ],
-            "name": "CreateRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "The title of the profile to create.",
-                    "name": "title",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The length of time after which a computer may be removed.",
-                    "name": "days_without_exchange",
-                    "type": "integer"
-                },
-                {
-                    "default": "global",
-                    "doc": "An optional name of an access group the profile will apply to.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Create a repository profile.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "CreateRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Title of the repository profile. It must start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "Description of the repository profile.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": "global",
-                    "doc": "Optional name of the access group to create the profile in.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Create a repository profile.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "CreateRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Title of the repository profile. It must start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "Description of the repository profile.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": "global",
-                    "doc": "Optional name of the access group to create the profile in.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateRole": {
-        "2011-08-01": {
-            "doc": "Create a new access role.",
-            "errors": [
-                {
-                    "code": "InvalidRoleName"
-                },
-                {
-                    "code": "DuplicateRoleName"
-                }
-            ],
-            "name": "CreateRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The description of the role.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Create a new access role.",
-            "errors": [
-                {
-                    "code": "InvalidRoleName"
-                },
-                {
-                    "code": "DuplicateRoleName"
-                }
-            ],
-            "name": "CreateRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The description of the role.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateSavedSearch": {
-        "2011-08-01": {
-            "doc": "Create a new saved search associated with the current account.\n        ",
-            "errors": [
-                {
-                    "code": "InvalidSavedSearchName"
-                },
-                {
-                    "code": "DuplicateSavedSearch"
-                },
-                {
-                    "code": "InvalidSavedSearchCriteria"
-                }
-            ],
-            "name": "CreateSavedSearch",
-            "parameters": [
-                {
-                    "default": None,
-                    "doc": "The \"slug\" name for this saved search. It must consist of only lowercase ASCII letters, numbers and hyphens. This is the text which must be used when using the \"search:name\" syntax.  If this parameter is not included a name will be generated automatically based on the title.",
-                    "name": "name",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The display name for the SavedSearch.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "doc": "The search string to save.",
-                    "name": "search",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Create a new saved search associated with the current account.\n        ",
-            "errors": [
-                {
-                    "code": "InvalidSavedSearchName"
-                },
-                {
-                    "code": "DuplicateSavedSearch"
-                },
-                {
-                    "code": "InvalidSavedSearchCriteria"
-                }
-            ],
-            "name": "CreateSavedSearch",
-            "parameters": [
-                {
-                    "default": None,
-                    "doc": "The \"slug\" name for this saved search. It must consist of only lowercase ASCII letters, numbers and hyphens. This is the text which must be used when using the \"search:name\" syntax.  If this parameter is not included a name will be generated automatically based on the title.",
-                    "name": "name",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The display name for the SavedSearch.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "doc": "The search string to save.",
-                    "name": "search",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateScript": {
-        "2011-08-01": {
-            "doc": "Create a new script.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateScript"
-                },
-                {
-                    "code": "EmptyScriptInterpreter"
-                },
-                {
-                    "code": "ScriptEncoding"
-                },
-                {
-                    "code": "EmptyScriptCode"
-                }
-            ],
-            "name": "CreateScript",
-            "parameters": [
-                {
-                    "doc": "The title of the new script.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "doc": "Amount of time to wait for the process to end.",
-                    "name": "time_limit",
-                    "type": "integer"
-                },
-                {
-                    "doc": "The filename holding the script contents.",
-                    "name": "code",
-                    "type": "data"
-                },
-                {
-                    "default": None,
-                    "doc": "The user to execute the script as.",
-                    "name": "username",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The access group for the new script.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Create a new script.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateScript"
-                },
-                {
-                    "code": "EmptyScriptInterpreter"
-                },
-                {
-                    "code": "ScriptEncoding"
-                },
-                {
-                    "code": "EmptyScriptCode"
-                }
-            ],
-            "name": "CreateScript",
-            "parameters": [
-                {
-                    "doc": "The title of the new script.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "doc": "Amount of time to wait for the process to end.",
-                    "name": "time_limit",
-                    "type": "integer"
-                },
-                {
-                    "doc": "The filename holding the script contents.",
-                    "name": "code",
-                    "type": "data"
-                },
-                {
-                    "default": None,
-                    "doc": "The user to execute the script as.",
-                    "name": "username",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The access group for the new script.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateScriptAttachment": {
-        "2011-08-01": {
-            "doc": "Add a script attachment.",
-            "errors": [
-                {
-                    "code": "TooManyScriptAttachments"
-                },
-                {
-                    "code": "ScriptAttachmentSize"
-                },
-                {
-                    "code": "DuplicateScriptAttachment"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "CreateScriptAttachment",
-            "parameters": [
-                {
-                    "doc": "The identity of the script to add the attachment to.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "doc": "The file to attach",
-                    "name": "file",
-                    "type": "file"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Add a script attachment.",
-            "errors": [
-                {
-                    "code": "TooManyScriptAttachments"
-                },
-                {
-                    "code": "ScriptAttachmentSize"
-                },
-                {
-                    "code": "DuplicateScriptAttachment"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "CreateScriptAttachment",
-            "parameters": [
-                {
-                    "doc": "The identity of the script to add the attachment to.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "doc": "The file to attach",
-                    "name": "file",
-                    "type": "file"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateSeries": {
-        "2011-08-01": {
-            "doc": "\n    Create a series associated with a distribution in the account.\n    ",
-            "errors": [
-                {
-                    "code": "GPGKeyHasNoSecret"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                },
-                {
-                    "code": "DuplicateSeries"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "CreateSeries",
-            "parameters": [
-                {
-                    "doc": "The name of the series. It must be unique within series within the distribution, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution to create the series in.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Pockets that will be created in the series, they will be in mirror mode by default.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "pockets",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "List of components for the created pockets. This parameter is **optional** if no pocket is specified.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "components",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "List of architectures for the created pockets. This parameter is **optional** if no pocket is specified",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "architectures",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to sign packages lists of the created pockets. This parameter is **optional** if no pocket is specified.",
-                    "name": "gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The URI to mirror for the created pockets. This parameter is **optional** if no pocket is specified.",
-                    "name": "mirror_uri",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The remote series to mirror. If not specified, it defaults to the name of the series being created. If a pockets parameter also passed, each of the created pockets will mirror the relevant dists/<mirror_series>-<pocket> repository of the remote archive.",
-                    "name": "mirror_series",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to verify the mirrored repositories for created pockets. If none is given, the stock Ubuntu archive one will be used.",
-                    "name": "mirror_gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default":False,
-                    "doc": "Whether the pocket should include selected components also for .udeb packages (debian-installer). It's 'false' by default.",
-                    "name": "include_udeb",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Create a series associated with a distribution in the account.\n    ",
-            "errors": [
-                {
-                    "code": "GPGKeyHasNoSecret"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                },
-                {
-                    "code": "DuplicateSeries"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "CreateSeries",
-            "parameters": [
-                {
-                    "doc": "The name of the series. It must be unique within series within the distribution, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution to create the series in.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Pockets that will be created in the series, they will be in mirror mode by default.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "pockets",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "List of components for the created pockets. This parameter is **optional** if no pocket is specified.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "components",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "List of architectures for the created pockets. This parameter is **optional** if no pocket is specified",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "architectures",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to sign packages lists of the created pockets. This parameter is **optional** if no pocket is specified.",
-                    "name": "gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The URI to mirror for the created pockets. This parameter is **optional** if no pocket is specified.",
-                    "name": "mirror_uri",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The remote series to mirror. If not specified, it defaults to the name of the series being created. If a pockets parameter also passed, each of the created pockets will mirror the relevant dists/<mirror_series>-<pocket> repository of the remote archive.",
-                    "name": "mirror_series",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to verify the mirrored repositories for created pockets. If none is given, the stock Ubuntu archive one will be used.",
-                    "name": "mirror_gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default":False,
-                    "doc": "Whether the pocket should include selected components also for .udeb packages (debian-installer). It's 'false' by default.",
-                    "name": "include_udeb",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "CreateUpgradeProfile": {
-        "2011-08-01": {
-            "doc": "Create an upgrade profile.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "InvalidScheduleFormat"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "InvalidDeliverDelayWindow"
-                }
-            ],
-            "name": "CreateUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "A human readable title for this upgrade profile.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "doc": "The frequency at which you wish this upgrade profile to be executed. Valid choices are \"hour\" and \"week\".",
-                    "name": "every",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of days of the week on which the upgrade profile will be run. The day names must be abbreviated to their first two letters, as: \"mo\", \"tu\", \"we\", \"th\", \"fr\", \"sa\", \"su\". Required when the every parameter is \"week\" but optional when the every parameter is  \"hour\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "on_days",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The hour, in 24h format, at which the upgrade profile will be run.",
-                    "name": "at_hour",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "doc": "The minute of the hour (0-59) at which the upgrade profile will be run.",
-                    "name": "at_minute",
-                    "type": "integer"
-                },
-                {
-                    "default": 1,
-                    "doc": "An optional number of hours within which the upgrade task should be delivered to computers. The window will be from the time specified by this API call (on_days, at_hour, at_minute) until the provided number of hours later. Defaults to 1 hour.",
-                    "name": "deliver_within",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "Randomise delivery within the given timeframe specified in minutes.",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default":False,
-                    "doc": "(Deprecated) Whether this upgrade is a security upgrade or not.",
-                    "name": "security_upgrade",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "The type of upgrade profile, either \"security\" or \"all\".",
-                    "name": "upgrade_type",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default":False,
-                    "doc": "Whether this upgrade should also autoremove old packages.",
-                    "name": "autoremove",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": "global",
-                    "doc": "An optional name of the access group to create the profile into.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Create an upgrade profile.",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "InvalidScheduleFormat"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "InvalidDeliverDelayWindow"
-                }
-            ],
-            "name": "CreateUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "A human readable title for this upgrade profile.",
-                    "name": "title",
-                    "type": "unicode title"
-                },
-                {
-                    "doc": "The frequency at which you wish this upgrade profile to be executed. Valid choices are \"hour\" and \"week\".",
-                    "name": "every",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of days of the week on which the upgrade profile will be run. The day names must be abbreviated to their first two letters, as: \"mo\", \"tu\", \"we\", \"th\", \"fr\", \"sa\", \"su\". Required when the every parameter is \"week\" but optional when the every parameter is  \"hour\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "on_days",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The hour, in 24h format, at which the upgrade profile will be run.",
-                    "name": "at_hour",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "doc": "The minute of the hour (0-59) at which the upgrade profile will be run.",
-                    "name": "at_minute",
-                    "type": "integer"
-                },
-                {
-                    "default": 1,
-                    "doc": "An optional number of hours within which the upgrade task should be delivered to computers. The window will be from the time specified by this API call (on_days, at_hour, at_minute) until the provided number of hours later. Defaults to 1 hour.",
-                    "name": "deliver_within",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "Randomise delivery within the given timeframe specified in minutes.",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default":False,
-                    "doc": "(Deprecated) Whether this upgrade is a security upgrade or not.",
-                    "name": "security_upgrade",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "The type of upgrade profile, either \"security\" or \"all\".",
-                    "name": "upgrade_type",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default":False,
-                    "doc": "Whether this upgrade should also autoremove old packages.",
-                    "name": "autoremove",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": "global",
-                    "doc": "An optional name of the access group to create the profile into.",
-                    "name": "access_group",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "DeriveSeries": {
-        "2011-08-01": {
-            "doc": "\n    Derive a series from another one in the same distribution. The derived\n    series will have pockets with names corresponding to the origin series,\n    each one configured to pull from the pocket in origin series.\n    ",
-            "errors": [
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "DuplicateSeries"
-                },
-                {
-                    "code": "EmptySeries"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "DeriveSeries",
-            "parameters": [
-                {
-                    "doc": "The name of the derived series. It must be unique within the distribution, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the origin series.",
-                    "name": "origin",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution to derive the series in.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Derive a series from another one in the same distribution. The derived\n    series will have pockets with names corresponding to the origin series,\n    each one configured to pull from the pocket in origin series.\n    ",
-            "errors": [
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "DuplicateSeries"
-                },
-                {
-                    "code": "EmptySeries"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "DeriveSeries",
-            "parameters": [
-                {
-                    "doc": "The name of the derived series. It must be unique within the distribution, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the origin series.",
-                    "name": "origin",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution to derive the series in.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "DiffPullPocket": {
-        "2011-08-01": {
-            "doc": "\n    Return a list of the changes between a pocket configured in pull mode and\n    its origin one.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "DiffPullPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Return a list of the changes between a pocket configured in pull mode and\n    its origin one.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "DiffPullPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "DisableAdministrator": {
-        "2011-08-01": {
-            "doc": "Disable an administrator of your account.",
-            "errors": [
-                {
-                    "code": "PersonNotMemberOfAccount"
-                },
-                {
-                    "code": "UnknownUser"
-                }
-            ],
-            "name": "DisableAdministrator",
-            "parameters": [
-                {
-                    "doc": "The name of the person to disable.",
-                    "name": "email",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Disable an administrator of your account.",
-            "errors": [
-                {
-                    "code": "PersonNotMemberOfAccount"
-                },
-                {
-                    "code": "UnknownUser"
-                }
-            ],
-            "name": "DisableAdministrator",
-            "parameters": [
-                {
-                    "doc": "The name of the person to disable.",
-                    "name": "email",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "DisassociateAlert": {
-        "2011-08-01": {
-            "doc": "Disassociate an alert from computers with specific tags or from\n        all computers.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "InvalidAlertTypeError"
-                }
-            ],
-            "name": "DisassociateAlert",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Disassociate an alert from computers with specific tags or from\n        all computers.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "InvalidAlertTypeError"
-                }
-            ],
-            "name": "DisassociateAlert",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "DisassociatePackageProfile": {
-        "2011-08-01": {
-            "doc": "Disassociate package profile from computers with specified\n            tags or from all computers.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                }
-            ],
-            "name": "DisassociatePackageProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Disassociate package profile from computers with specified\n            tags or from all computers.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                }
-            ],
-            "name": "DisassociatePackageProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "DisassociateRemovalProfile": {
-        "2011-08-01": {
-            "doc": "\n    Disassociate a removal profile from computers with the specified\n    tags, or from all computers.\n\n    tags and all_computers=true are mutually exclusive.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownRemovalProfile"
-                }
-            ],
-            "name": "DisassociateRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Disassociate a removal profile from computers with the specified\n    tags, or from all computers.\n\n    tags and all_computers=true are mutually exclusive.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownRemovalProfile"
-                }
-            ],
-            "name": "DisassociateRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "DisassociateRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Disassociate repository profile from computers with specified\n            tags or from all computers.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownRepositoryProfile"
-                }
-            ],
-            "name": "DisassociateRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Disassociate repository profile from computers with specified\n            tags or from all computers.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownRepositoryProfile"
-                }
-            ],
-            "name": "DisassociateRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "DisassociateUpgradeProfile": {
-        "2011-08-01": {
-            "doc": "\n    Disassociate an upgrade profile from computers with the specified\n    tags, or from all computers.\n\n    tags and all_computers=true are mutually exclusive.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownUpgradeProfile"
-                }
-            ],
-            "name": "DisassociateUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Disassociate an upgrade profile from computers with the specified\n    tags, or from all computers.\n\n    tags and all_computers=true are mutually exclusive.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownTag"
-                },
-                {
-                    "code": "UnknownUpgradeProfile"
-                }
-            ],
-            "name": "DisassociateUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the entity.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Tags to change entity association for",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, change the 'all_computers' flag state for the entity. If the flag is enabled, associated tags will be kept, but they will not be effective until the flag is disabled.",
-                    "name": "all_computers",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "EditPackageProfile": {
-        "2011-08-01": {
-            "doc": "\n    Add or remove constraints related to a package profile. Constraints can\n    be dependencies or conflicts.",
-            "errors": [
-                {
-                    "code": "EmptyPackageProfile"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidPackageConstraint"
-                },
-                {
-                    "code": "InvalidConstraintType"
-                }
-            ],
-            "name": "EditPackageProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the package profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new title of the package profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": [],
-                    "doc": "List of constraints specifications to add in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "add_constraints",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "List of constraints specifications to remove in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "remove_constraints",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Add or remove constraints related to a package profile. Constraints can\n    be dependencies or conflicts.",
-            "errors": [
-                {
-                    "code": "EmptyPackageProfile"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidPackageConstraint"
-                },
-                {
-                    "code": "InvalidConstraintType"
-                }
-            ],
-            "name": "EditPackageProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the package profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new title of the package profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": [],
-                    "doc": "List of constraints specifications to add in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "add_constraints",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "List of constraints specifications to remove in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "remove_constraints",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "EditPocket": {
-        "2011-08-01": {
-            "doc": "Edit configuration for a repository pocket from a series in a distribution.",
-            "errors": [
-                {
-                    "code": "GPGKeyHasNoSecret"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "EditPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to edit.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of components the pocket will handle.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "components",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of architectures the pocket will handle.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "architectures",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to sign packages lists for this pocket. The GPG key provided must have a private key associated with it.",
-                    "name": "gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The URI to mirror for pockets in 'mirror' mode.",
-                    "name": "mirror_uri",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The repository entry under dists/ to mirror for pockets in 'mirror' mode.",
-                    "name": "mirror_suite",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to verify the mirrored archive signature. If '-' is given, the stock Ubuntu archive one will be used.",
-                    "name": "mirror_gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "For pockets in upload mode, a boolean indicating whether uploaded packages are required to be signed or not.",
-                    "name": "upload_allow_unsigned",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "Whether the pocket should include selected components also for .udeb packages (debian-installer). ",
-                    "name": "include_udeb",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Edit configuration for a repository pocket from a series in a distribution.",
-            "errors": [
-                {
-                    "code": "GPGKeyHasNoSecret"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "EditPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to edit.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of components the pocket will handle.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "components",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of architectures the pocket will handle.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "architectures",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to sign packages lists for this pocket. The GPG key provided must have a private key associated with it.",
-                    "name": "gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The URI to mirror for pockets in 'mirror' mode.",
-                    "name": "mirror_uri",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The repository entry under dists/ to mirror for pockets in 'mirror' mode.",
-                    "name": "mirror_suite",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The name of the GPG key to use to verify the mirrored archive signature. If '-' is given, the stock Ubuntu archive one will be used.",
-                    "name": "mirror_gpg_key",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "For pockets in upload mode, a boolean indicating whether uploaded packages are required to be signed or not.",
-                    "name": "upload_allow_unsigned",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "Whether the pocket should include selected components also for .udeb packages (debian-installer). ",
-                    "name": "include_udeb",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "EditRemovalProfile": {
-        "2011-08-01": {
-            "doc": "Edit an removal profile.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidDaysWithoutExchangeValue"
-                },
-                {
-                    "code": "UnknownRemovalProfile"
-                }
-            ],
-            "name": "EditRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the profile to edit.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new title of the profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The length of time after which a computer may be removed.",
-                    "name": "days_without_exchange",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Edit an removal profile.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidDaysWithoutExchangeValue"
-                },
-                {
-                    "code": "UnknownRemovalProfile"
-                }
-            ],
-            "name": "EditRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the profile to edit.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new title of the profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The length of time after which a computer may be removed.",
-                    "name": "days_without_exchange",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "EditRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Edit a repository profile.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "EditRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile to edit.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Title of the repository profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "Description of the repository profile.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Edit a repository profile.",
-            "errors": [
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "EditRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile to edit.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Title of the repository profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "Description of the repository profile.",
-                    "name": "description",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "EditSavedSearch": {
-        "2011-08-01": {
-            "doc": "Edit a saved search associated with the current account.",
-            "errors": [
-                {
-                    "code": "UnknownSavedSearch"
-                },
-                {
-                    "code": "DuplicateSavedSearch"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "InvalidSavedSearchCriteria"
-                }
-            ],
-            "name": "EditSavedSearch",
-            "parameters": [
-                {
-                    "doc": "The \"slug\" name for this saved search, this is the text which must be used when using the \"search:name\" syntax. A saved search with this name must already exist in the account.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new display name for the saved search. If this parameter is not included then the title will not be modified.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "The search string to save. If this parameter is not included then the search string will not be modified.",
-                    "name": "search",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Edit a saved search associated with the current account.",
-            "errors": [
-                {
-                    "code": "UnknownSavedSearch"
-                },
-                {
-                    "code": "DuplicateSavedSearch"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "InvalidSavedSearchCriteria"
-                }
-            ],
-            "name": "EditSavedSearch",
-            "parameters": [
-                {
-                    "doc": "The \"slug\" name for this saved search, this is the text which must be used when using the \"search:name\" syntax. A saved search with this name must already exist in the account.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new display name for the saved search. If this parameter is not included then the title will not be modified.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "The search string to save. If this parameter is not included then the search string will not be modified.",
-                    "name": "search",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "EditScript": {
-        "2011-08-01": {
-            "doc": "Edit a script.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateScript"
-                },
-                {
-                    "code": "EmptyScriptInterpreter"
-                },
-                {
-                    "code": "ScriptEncoding"
-                },
-                {
-                    "code": "EmptyScriptCode"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "EditScript",
-            "parameters": [
-                {
-                    "doc": "The identifier of the script you wish to edit.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The new script title.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "Amount of time to wait for the process to end.",
-                    "name": "time_limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The filename holding the script contents.",
-                    "name": "code",
-                    "optional": True,
-                    "type": "data"
-                },
-                {
-                    "default": None,
-                    "doc": "The user to execute the script as.",
-                    "name": "username",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Edit a script.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateScript"
-                },
-                {
-                    "code": "EmptyScriptInterpreter"
-                },
-                {
-                    "code": "ScriptEncoding"
-                },
-                {
-                    "code": "EmptyScriptCode"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "EditScript",
-            "parameters": [
-                {
-                    "doc": "The identifier of the script you wish to edit.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The new script title.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "Amount of time to wait for the process to end.",
-                    "name": "time_limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The filename holding the script contents.",
-                    "name": "code",
-                    "optional": True,
-                    "type": "data"
-                },
-                {
-                    "default": None,
-                    "doc": "The user to execute the script as.",
-                    "name": "username",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "EditUpgradeProfile": {
-        "2011-08-01": {
-            "doc": "Edit an upgrade profile.",
-            "errors": [
-                {
-                    "code": "UnknownUpgradeProfile"
-                },
-                {
-                    "code": "InvalidDeliverDelayWindow"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "InvalidScheduleFormat"
-                }
-            ],
-            "name": "EditUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "The name for this upgrade profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new title of the upgrade profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "The frequency at which you wish this upgrade profile to be executed. Valid choices are \"hour\" and \"week\".",
-                    "name": "every",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of days of the week on which the upgrade profile will be run. The day names must be abbreviated to their first two letters, as: \"mo\", \"tu\", \"we\", \"th\", \"fr\", \"sa\", \"su\". Required when the every parameter is \"week\" but optional when the every parameter is  \"hour\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "on_days",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The hour, in 24h format, at which the upgrade profile will be run.",
-                    "name": "at_hour",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The minute of the hour (0-59) at which the upgrade profile will be run.",
-                    "name": "at_minute",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 1,
-                    "doc": "An optional number of hours within which the upgrade task should be delivered to computers. The window will be from the time specified by this API call (on_days, at_hour, at_minute) until the provided number of hours later. Defaults to 1 hour.",
-                    "name": "deliver_within",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "Randomise delivery within the given timeframe specified in minutes.",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default":False,
-                    "doc": "(Deprecated) Whether this upgrade is a security upgrade or not.",
-                    "name": "security_upgrade",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "The type of upgrade profile, either \"security\" or \"all\".",
-                    "name": "upgrade_type",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Whether this upgrade should also autoremove old packages.",
-                    "name": "autoremove",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Edit an upgrade profile.",
-            "errors": [
-                {
-                    "code": "UnknownUpgradeProfile"
-                },
-                {
-                    "code": "InvalidDeliverDelayWindow"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "InvalidParameterCombination"
-                },
-                {
-                    "code": "InvalidScheduleFormat"
-                }
-            ],
-            "name": "EditUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "The name for this upgrade profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new title of the upgrade profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": None,
-                    "doc": "The frequency at which you wish this upgrade profile to be executed. Valid choices are \"hour\" and \"week\".",
-                    "name": "every",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of days of the week on which the upgrade profile will be run. The day names must be abbreviated to their first two letters, as: \"mo\", \"tu\", \"we\", \"th\", \"fr\", \"sa\", \"su\". Required when the every parameter is \"week\" but optional when the every parameter is  \"hour\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "on_days",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The hour, in 24h format, at which the upgrade profile will be run.",
-                    "name": "at_hour",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The minute of the hour (0-59) at which the upgrade profile will be run.",
-                    "name": "at_minute",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 1,
-                    "doc": "An optional number of hours within which the upgrade task should be delivered to computers. The window will be from the time specified by this API call (on_days, at_hour, at_minute) until the provided number of hours later. Defaults to 1 hour.",
-                    "name": "deliver_within",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "Randomise delivery within the given timeframe specified in minutes.",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default":False,
-                    "doc": "(Deprecated) Whether this upgrade is a security upgrade or not.",
-                    "name": "security_upgrade",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "The type of upgrade profile, either \"security\" or \"all\".",
-                    "name": "upgrade_type",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "Whether this upgrade should also autoremove old packages.",
-                    "name": "autoremove",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "ExecuteScript": {
-        "2011-08-01": {
-            "doc": "Execute a script on computers.",
-            "errors": [
-                {
-                    "code": "RequiresUser"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "UnknownScript"
-                },
-                {
-                    "code": "InvalidTime"
-                },
-                {
-                    "code": "UnknownComputers"
-                }
-            ],
-            "name": "ExecuteScript",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to execute the script on.   Multiple occurrences will be joined with a logical AND.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The identity of the script stored in the server.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The username to execute the script as on the client. Required if the script has no default username.",
-                    "name": "username",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to deliver the script.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Execute a script on computers.",
-            "errors": [
-                {
-                    "code": "RequiresUser"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "UnknownScript"
-                },
-                {
-                    "code": "InvalidTime"
-                },
-                {
-                    "code": "UnknownComputers"
-                }
-            ],
-            "name": "ExecuteScript",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to execute the script on.   Multiple occurrences will be joined with a logical AND.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The identity of the script stored in the server.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The username to execute the script as on the client. Required if the script has no default username.",
-                    "name": "username",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to deliver the script.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetAPTSources": {
-        "2011-08-01": {
-            "doc": "\n        Get a list of apt sources in the account used for authentication.\n        ",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                }
-            ],
-            "name": "GetAPTSources",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "List of names of the APT source to be returned. Multiple names can be supplied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n        Get a list of apt sources in the account used for authentication.\n        ",
-            "errors": [
-                {
-                    "code": "UnknownAccessGroup"
-                }
-            ],
-            "name": "GetAPTSources",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "List of names of the APT source to be returned. Multiple names can be supplied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetAccessGroups": {
-        "2011-08-01": {
-            "doc": "List all access groups in the account.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                }
-            ],
-            "name": "GetAccessGroups",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "The name of the access group.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "List all access groups in the account.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                }
-            ],
-            "name": "GetAccessGroups",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "The name of the access group.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetActivities": {
-        "2011-08-01": {
-            "doc": "\n    Retrieve activities associated with the current account, ordered by\n    creation time.\n\n    Some activities requested take an extended period of time to complete.\n    These activities will not have discrete activity_status values. Instead\n    they will report estimated percent complete in the progress field for the\n    activity. The progress field will have one of the following values::\n\n      0: if activity is not started\n      -1: if an error occurred\n      1 to 100: percent complete of ongoing activity\n\n    Common examples of activities with progress would be syncing a pocket\n    repository mirror or provisioning a new system.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "GetActivities",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Retrieve activities associated with the current account, ordered by\n    creation time.\n\n    Some activities requested take an extended period of time to complete.\n    These activities will not have discrete activity_status values. Instead\n    they will report estimated percent complete in the progress field for the\n    activity. The progress field will have one of the following values::\n\n      0: if activity is not started\n      -1: if an error occurred\n      1 to 100: percent complete of ongoing activity\n\n    Common examples of activities with progress would be syncing a pocket\n    repository mirror or provisioning a new system.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "GetActivities",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetActivityTypes": {
-        "2011-08-01": {
-            "doc": "\n    Retrieve a list of possible activity types for use with the *type:* query\n    criteria.\n    ",
-            "errors": [],
-            "name": "GetActivityTypes",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Retrieve a list of possible activity types for use with the *type:* query\n    criteria.\n    ",
-            "errors": [],
-            "name": "GetActivityTypes",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetAdministrators": {
-        "2011-08-01": {
-            "doc": "Retrieve the list of administrators in the account.",
-            "errors": [],
-            "name": "GetAdministrators",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Retrieve the list of administrators in the account.",
-            "errors": [],
-            "name": "GetAdministrators",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetAlertSubscribers": {
-        "2011-08-01": {
-            "doc": "Get a a list of people who subscribe to a given alert.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                }
-            ],
-            "name": "GetAlertSubscribers",
-            "parameters": [
-                {
-                    "doc": "The alert type to check the subscription on.",
-                    "name": "alert_type",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get a a list of people who subscribe to a given alert.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                }
-            ],
-            "name": "GetAlertSubscribers",
-            "parameters": [
-                {
-                    "doc": "The alert type to check the subscription on.",
-                    "name": "alert_type",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetAlerts": {
-        "2011-08-01": {
-            "doc": "Get a list of alerts in an account.",
-            "errors": [],
-            "name": "GetAlerts",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get a list of alerts in an account.",
-            "errors": [],
-            "name": "GetAlerts",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetCSVComplianceData": {
-        "2011-08-01": {
-            "doc": "Return a CSV formatted report of compliance data.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetCSVComplianceData",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Return a CSV formatted report of compliance data.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetCSVComplianceData",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetComputers": {
-        "2011-08-01": {
-            "doc": "\n    Get a list of computers associated with the account.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetComputers",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, include the details of all network devices attached to the computer.",
-                    "name": "with_network",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, include the details of all hardware information known.",
-                    "name": "with_hardware",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, include the details of all custom annotation information known.",
-                    "name": "with_annotations",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Get a list of computers associated with the account.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetComputers",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, include the details of all network devices attached to the computer.",
-                    "name": "with_network",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, include the details of all hardware information known.",
-                    "name": "with_hardware",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default":False,
-                    "doc": "If True, include the details of all custom annotation information known.",
-                    "name": "with_annotations",
-                    "optional": True,
-                    "type": "boolean"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetComputersNotUpgraded": {
-        "2011-08-01": {
-            "doc": "Report the ids of computers, within a given selection, that are not covered by an upgrade profile.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetComputersNotUpgraded",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Report the ids of computers, within a given selection, that are not covered by an upgrade profile.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetComputersNotUpgraded",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetDistributions": {
-        "2011-08-01": {
-            "doc": "Get info about distributions.",
-            "errors": [],
-            "name": "GetDistributions",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of distribution names to get info for. If this is not provided, the call will return all distributions for the account.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get info about distributions.",
-            "errors": [],
-            "name": "GetDistributions",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of distribution names to get info for. If this is not provided, the call will return all distributions for the account.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetEventLog": {
-        "2011-08-01": {
-            "doc": "Retrieve event log for the account.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "GetEventLog",
-            "parameters": [
-                {
-                    "default": None,
-                    "doc": "The number of days prior to today from which to fetch log entries. It defaults to 30 days.",
-                    "name": "days",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Retrieve event log for the account.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "GetEventLog",
-            "parameters": [
-                {
-                    "default": None,
-                    "doc": "The number of days prior to today from which to fetch log entries. It defaults to 30 days.",
-                    "name": "days",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetGPGKeys": {
-        "2011-08-01": {
-            "doc": "Get info about GPG keys.",
-            "errors": [],
-            "name": "GetGPGKeys",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of GPG keys to get info for. If this is not provided, the call will return all keys for the account.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get info about GPG keys.",
-            "errors": [],
-            "name": "GetGPGKeys",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of GPG keys to get info for. If this is not provided, the call will return all keys for the account.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetJujuEnvironments": {
-        "2011-08-01": {
-            "doc": "Get the details of all the Juju environments in the account.",
-            "errors": [],
-            "name": "GetJujuEnvironments",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get the details of all the Juju environments in the account.",
-            "errors": [],
-            "name": "GetJujuEnvironments",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetJujuModels": {
-        "2011-08-01": {
-            "doc": "Get the details of all the Juju models in the account.",
-            "errors": [],
-            "name": "GetJujuModels",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get the details of all the Juju models in the account.",
-            "errors": [],
-            "name": "GetJujuModels",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetNotPingingComputers": {
-        "2011-08-01": {
-            "doc": "Report the ids of computers, within a given selection, that have not pinged the server in a given number of minutes.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetNotPingingComputers",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "doc": "The number of minutes elapsed in which no ping from included computers has been seen.",
-                    "name": "since_minutes",
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Report the ids of computers, within a given selection, that have not pinged the server in a given number of minutes.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetNotPingingComputers",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "doc": "The number of minutes elapsed in which no ping from included computers has been seen.",
-                    "name": "since_minutes",
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetPackageProfiles": {
-        "2011-08-01": {
-            "doc": "Get the details of all Package Profiles defined in the account.\n            ",
-            "errors": [],
-            "name": "GetPackageProfiles",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of package profile names to limit the result.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get the details of all Package Profiles defined in the account.\n            ",
-            "errors": [],
-            "name": "GetPackageProfiles",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of package profile names to limit the result.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetPackages": {
-        "2011-08-01": {
-            "doc": "\n    Get a list of packages associated with the account used for\n    authentication.\n\n    A package is considered installed if dpkg reports it as installed on the\n    system.\n\n    A package is considered available if it can be fetched from an APT\n    source. Note that this means that it's possible for an installed package\n    to be not available.\n\n    A package is considered an upgrade if it's available and if it has a\n    version higher than a non-held installed package with the same name.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "UnknownComputers"
-                }
-            ],
-            "name": "GetPackages",
-            "parameters": [
-                {
-                    "doc": "A query string used to select computers to query packages on.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A string to restrict the search to.  All fields are searched, not just those returned. (e.g., description)",
-                    "name": "search",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Restrict the search to these package names. ",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "If true only packages in the installed state will be returned, if false only packages not installed will be returned. If not given both installed and not installed packages will be returned.",
-                    "name": "installed",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "If true only packages in the available state will be returned, if false only packages not available will be returned. If not given both available and not available packages will be returned.",
-                    "name": "available",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "If True, only installable packages that are upgrades for an for an installed one are returned. IfFalse, only installable packages that are not upgrades are returned. If not given, packages will be returned regardless of wether they are upgrades or not.",
-                    "name": "upgrade",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "If True, only installed packages that are held on computers are returned. IfFalse, only packages that are not held on computers are returned. If not given, packages will be returned regardless of the held state.",
-                    "name": "held",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Get a list of packages associated with the account used for\n    authentication.\n\n    A package is considered installed if dpkg reports it as installed on the\n    system.\n\n    A package is considered available if it can be fetched from an APT\n    source. Note that this means that it's possible for an installed package\n    to be not available.\n\n    A package is considered an upgrade if it's available and if it has a\n    version higher than a non-held installed package with the same name.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "UnknownComputers"
-                }
-            ],
-            "name": "GetPackages",
-            "parameters": [
-                {
-                    "doc": "A query string used to select computers to query packages on.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "A string to restrict the search to.  All fields are searched, not just those returned. (e.g., description)",
-                    "name": "search",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "Restrict the search to these package names. ",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "If true only packages in the installed state will be returned, if false only packages not installed will be returned. If not given both installed and not installed packages will be returned.",
-                    "name": "installed",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "If true only packages in the available state will be returned, if false only packages not available will be returned. If not given both available and not available packages will be returned.",
-                    "name": "available",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "If True, only installable packages that are upgrades for an for an installed one are returned. IfFalse, only installable packages that are not upgrades are returned. If not given, packages will be returned regardless of wether they are upgrades or not.",
-                    "name": "upgrade",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "If True, only installed packages that are held on computers are returned. IfFalse, only packages that are not held on computers are returned. If not given, packages will be returned regardless of the held state.",
-                    "name": "held",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetPendingComputers": {
-        "2011-08-01": {
-            "doc": "\n    Get a list of pending computers associated with the account used for\n    authentication.\n    ",
-            "errors": [],
-            "name": "GetPendingComputers",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Get a list of pending computers associated with the account used for\n    authentication.\n    ",
-            "errors": [],
-            "name": "GetPendingComputers",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetPermissions": {
-        "2011-08-01": {
-            "doc": "List all available permissions.",
-            "errors": [],
-            "name": "GetPermissions",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "List all available permissions.",
-            "errors": [],
-            "name": "GetPermissions",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetRemovalProfiles": {
-        "2011-08-01": {
-            "doc": "List all existing removal profiles.",
-            "errors": [],
-            "name": "GetRemovalProfiles",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "List all existing removal profiles.",
-            "errors": [],
-            "name": "GetRemovalProfiles",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetRepositoryProfiles": {
-        "2011-08-01": {
-            "doc": "Get a list of repository profiles in the account.",
-            "errors": [],
-            "name": "GetRepositoryProfiles",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of repository profile names to get info for. If this is not provided, the call will return all repository profiles for the account.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get a list of repository profiles in the account.",
-            "errors": [],
-            "name": "GetRepositoryProfiles",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of repository profile names to get info for. If this is not provided, the call will return all repository profiles for the account.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetRoles": {
-        "2011-08-01": {
-            "doc": "Get all available roles.",
-            "errors": [],
-            "name": "GetRoles",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of role names to limit the result.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Get all available roles.",
-            "errors": [],
-            "name": "GetRoles",
-            "parameters": [
-                {
-                    "default": [],
-                    "doc": "A list of role names to limit the result.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetSavedSearches": {
-        "2011-08-01": {
-            "doc": "Retrieve saved searches associated with the current account.",
-            "errors": [],
-            "name": "GetSavedSearches",
-            "parameters": [
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Retrieve saved searches associated with the current account.",
-            "errors": [],
-            "name": "GetSavedSearches",
-            "parameters": [
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetScriptCode": {
-        "2011-08-01": {
-            "doc": "Retrieve the code portion of a given script.",
-            "errors": [
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "GetScriptCode",
-            "parameters": [
-                {
-                    "doc": "The identity of the script you wish to get the code for.",
-                    "name": "script_id",
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Retrieve the code portion of a given script.",
-            "errors": [
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "GetScriptCode",
-            "parameters": [
-                {
-                    "doc": "The identity of the script you wish to get the code for.",
-                    "name": "script_id",
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetScripts": {
-        "2011-08-01": {
-            "doc": "Retrieve stored scripts associated with the current account.",
-            "errors": [],
-            "name": "GetScripts",
-            "parameters": [
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Retrieve stored scripts associated with the current account.",
-            "errors": [],
-            "name": "GetScripts",
-            "parameters": [
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetSettings": {
-        "2011-08-01": {
-            "doc": "\n    Get all settings and their value for the current LDS installation.",
-            "errors": [],
-            "name": "GetSettings",
-            "parameters": [],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Get all settings and their value for the current LDS installation.",
-            "errors": [],
-            "name": "GetSettings",
-            "parameters": [],
-            "result": {}
-        }
-    },
-    "GetUSNTimeToFix": {
-        "2011-08-01": {
-            "doc": "Return a break down of machines unpatched periods following a USN release.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetUSNTimeToFix",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of periods of days to report on USN fixes being applied in",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "fixed_in_days",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The period of days in the past to search for USNs that are pending on a computer.  This is independent of the in_last argument.",
-                    "name": "pending_in_days",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The period of days to look into the past to find USN releases to be considered in these statistics.",
-                    "name": "in_last",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Return a break down of machines unpatched periods following a USN release.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetUSNTimeToFix",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": [],
-                    "doc": "A list of periods of days to report on USN fixes being applied in",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "fixed_in_days",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "The period of days in the past to search for USNs that are pending on a computer.  This is independent of the in_last argument.",
-                    "name": "pending_in_days",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": None,
-                    "doc": "The period of days to look into the past to find USN releases to be considered in these statistics.",
-                    "name": "in_last",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetUpgradeProfiles": {
-        "2011-08-01": {
-            "doc": "List all previously created upgrade profiles.",
-            "errors": [],
-            "name": "GetUpgradeProfiles",
-            "parameters": [
-                {
-                    "default": None,
-                    "doc": " The type of upgrade you wish to list. This can be either \"all\" or \"security\", in which case the result will be a list of upgrade profiles with an upgrade type of \"all\" or \"security\" respectively. If omitted, the resulting list will contain all upgrade profiles, regardless of their upgrade type.",
-                    "name": "upgrade_type",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "List all previously created upgrade profiles.",
-            "errors": [],
-            "name": "GetUpgradeProfiles",
-            "parameters": [
-                {
-                    "default": None,
-                    "doc": " The type of upgrade you wish to list. This can be either \"all\" or \"security\", in which case the result will be a list of upgrade profiles with an upgrade type of \"all\" or \"security\" respectively. If omitted, the resulting list will contain all upgrade profiles, regardless of their upgrade type.",
-                    "name": "upgrade_type",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "GetUpgradedComputersByFrequency": {
-        "2011-08-01": {
-            "doc": "Return a dictionary of computer IDs broken down by their upgrade schedule.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetUpgradedComputersByFrequency",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Return a dictionary of computer IDs broken down by their upgrade schedule.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "GetUpgradedComputersByFrequency",
-            "parameters": [
-                {
-                    "default": "",
-                    "doc": "A query string with space separated tokens used to filter the returned result objects.",
-                    "name": "query",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 1000,
-                    "doc": "The maximum number of results returned by the method. It defaults to 1000.",
-                    "name": "limit",
-                    "optional": True,
-                    "type": "integer"
-                },
-                {
-                    "default": 0,
-                    "doc": "The offset inside the list of results.",
-                    "name": "offset",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "ImportGPGKey": {
-        "2011-08-01": {
-            "doc": "Import a GPG key.",
-            "errors": [
-                {
-                    "code": "MultipleGPGKey"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateGPGKey"
-                },
-                {
-                    "code": "GPGKeyImportError"
-                }
-            ],
-            "name": "ImportGPGKey",
-            "parameters": [
-                {
-                    "doc": "Name of the GPG key. It must be unique within the account, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The text representation of the key.",
-                    "name": "material",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Import a GPG key.",
-            "errors": [
-                {
-                    "code": "MultipleGPGKey"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "DuplicateGPGKey"
-                },
-                {
-                    "code": "GPGKeyImportError"
-                }
-            ],
-            "name": "ImportGPGKey",
-            "parameters": [
-                {
-                    "doc": "Name of the GPG key. It must be unique within the account, start with an alphanumeric character and only contain lowercase letters, numbers and - or + signs.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The text representation of the key.",
-                    "name": "material",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "InstallPackages": {
-        "2011-08-01": {
-            "doc": "Install packages on selected computers.",
-            "errors": [
-                {
-                    "code": "UnknownComputers"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "UnknownPackages"
-                },
-                {
-                    "code": "InvalidTime"
-                }
-            ],
-            "name": "InstallPackages",
-            "parameters": [
-                {
-                    "doc": "A qualified criteria to be used in the search.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of package names on which to operate. Multiple package names can be supplied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to perform the package operation.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 0,
-                    "doc": "Randomise delivery within the given time frame specified in minutes",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Install packages on selected computers.",
-            "errors": [
-                {
-                    "code": "UnknownComputers"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "UnknownPackages"
-                },
-                {
-                    "code": "InvalidTime"
-                }
-            ],
-            "name": "InstallPackages",
-            "parameters": [
-                {
-                    "doc": "A qualified criteria to be used in the search.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of package names on which to operate. Multiple package names can be supplied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to perform the package operation.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 0,
-                    "doc": "Randomise delivery within the given time frame specified in minutes",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "InviteAdministrator": {
-        "2011-08-01": {
-            "doc": "Invite an administrator to your account.",
-            "errors": [
-                {
-                    "code": "RepeatedInvitation"
-                },
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "InvalidEmailAddress"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "MaximumAccountAdministrators"
-                }
-            ],
-            "name": "InviteAdministrator",
-            "parameters": [
-                {
-                    "doc": "The name of the person to invite.",
-                    "name": "name",
-                    "type": "unicode line"
-                },
-                {
-                    "doc": "The email address of the administrator, to which the invitation will be send.",
-                    "name": "email",
-                    "type": "unicode line"
-                },
-                {
-                    "default": [
-                        "GlobalAdmin"
-                    ],
-                    "doc": "If specified, the roles that the administrator is going to have in your account. Default to GlobalAdmin",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "roles",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Invite an administrator to your account.",
-            "errors": [
-                {
-                    "code": "RepeatedInvitation"
-                },
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "InvalidEmailAddress"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "MaximumAccountAdministrators"
-                }
-            ],
-            "name": "InviteAdministrator",
-            "parameters": [
-                {
-                    "doc": "The name of the person to invite.",
-                    "name": "name",
-                    "type": "unicode line"
-                },
-                {
-                    "doc": "The email address of the administrator, to which the invitation will be send.",
-                    "name": "email",
-                    "type": "unicode line"
-                },
-                {
-                    "default": [
-                        "GlobalAdmin"
-                    ],
-                    "doc": "If specified, the roles that the administrator is going to have in your account. Default to GlobalAdmin",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "roles",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "ListPocket": {
-        "2011-08-01": {
-            "doc": "Return a list of the packages in a pocket.",
-            "errors": [
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "ListPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Return a list of the packages in a pocket.",
-            "errors": [
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "ListPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "ModifyPackageProfile": {
-        "2011-08-01": {
-            "doc": "THIS FUNCTION IS DEPRECATED. please use edit-package-profile instead. \n    Add or remove constraints related to a package profile. Constraints can\n    be dependencies or conflicts.",
-            "errors": [
-                {
-                    "code": "EmptyPackageProfile"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidPackageConstraint"
-                },
-                {
-                    "code": "InvalidConstraintType"
-                }
-            ],
-            "name": "ModifyPackageProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the package profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new title of the package profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": [],
-                    "doc": "List of constraints specifications to add in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "add_constraints",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "List of constraints specifications to remove in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "remove_constraints",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "THIS FUNCTION IS DEPRECATED. please use edit-package-profile instead. \n    Add or remove constraints related to a package profile. Constraints can\n    be dependencies or conflicts.",
-            "errors": [
-                {
-                    "code": "EmptyPackageProfile"
-                },
-                {
-                    "code": "UnknownPackageProfileName"
-                },
-                {
-                    "code": "MissingParameter"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidPackageConstraint"
-                },
-                {
-                    "code": "InvalidConstraintType"
-                }
-            ],
-            "name": "ModifyPackageProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the package profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "default": None,
-                    "doc": "The new title of the package profile.",
-                    "name": "title",
-                    "optional": True,
-                    "type": "unicode title"
-                },
-                {
-                    "default": [],
-                    "doc": "List of constraints specifications to add in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "add_constraints",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default": [],
-                    "doc": "List of constraints specifications to remove in the form of \"depends packagename\" or \"conflicts packagename < 1.0\".",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "remove_constraints",
-                    "optional": True,
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "PullPackagesToPocket": {
-        "2011-08-01": {
-            "doc": "\n    Import packages to a pocket in pull mode from its parent pocket.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "PullPackagesToPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to pull packages to.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Import packages to a pocket in pull mode from its parent pocket.\n    ",
-            "errors": [
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "PullPackagesToPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to pull packages to.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RebootComputers": {
-        "2011-08-01": {
-            "doc": "Reboot a list of computers.",
-            "errors": [
-                {
-                    "code": "InvalidTime"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "RebootComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer ids to reboot.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to deliver the script.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Reboot a list of computers.",
-            "errors": [
-                {
-                    "code": "InvalidTime"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "RebootComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer ids to reboot.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to deliver the script.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RegisterJujuEnvironment": {
-        "2011-08-01": {
-            "doc": "Register a Juju environment.",
-            "errors": [
-                {
-                    "code": "InvalidEnvironmentName"
-                },
-                {
-                    "code": "EnvironmentCredentialsError"
-                },
-                {
-                    "code": "DuplicateEnvironment"
-                },
-                {
-                    "code": "EnvironmentConnectionFailed"
-                }
-            ],
-            "name": "RegisterJujuEnvironment",
-            "parameters": [
-                {
-                    "doc": "The name of the environment.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The endpoint address of the Juju API.",
-                    "name": "endpoint",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The username used to authenticate with the Juju API.",
-                    "name": "username",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The password used to authenticate with the Juju API.",
-                    "name": "password",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Register a Juju environment.",
-            "errors": [
-                {
-                    "code": "InvalidEnvironmentName"
-                },
-                {
-                    "code": "EnvironmentCredentialsError"
-                },
-                {
-                    "code": "DuplicateEnvironment"
-                },
-                {
-                    "code": "EnvironmentConnectionFailed"
-                }
-            ],
-            "name": "RegisterJujuEnvironment",
-            "parameters": [
-                {
-                    "doc": "The name of the environment.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The endpoint address of the Juju API.",
-                    "name": "endpoint",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The username used to authenticate with the Juju API.",
-                    "name": "username",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The password used to authenticate with the Juju API.",
-                    "name": "password",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RegisterJujuModel": {
-        "2011-08-01": {
-            "doc": "Register a Juju model.",
-            "errors": [
-                {
-                    "code": "DuplicateJujuModel"
-                },
-                {
-                    "code": "InvalidJujuModelName"
-                },
-                {
-                    "code": "JujuControllerCredentialsError"
-                },
-                {
-                    "code": "JujuControllerConnectionFailed"
-                }
-            ],
-            "name": "RegisterJujuModel",
-            "parameters": [
-                {
-                    "doc": "The name of the model.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The endpoint address of the Juju API.",
-                    "name": "endpoint",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The username used to authenticate with the Juju API.",
-                    "name": "username",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The password used to authenticate with the Juju API.",
-                    "name": "password",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The UUID of the model to register from the controller.",
-                    "name": "uuid",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Register a Juju model.",
-            "errors": [
-                {
-                    "code": "DuplicateJujuModel"
-                },
-                {
-                    "code": "InvalidJujuModelName"
-                },
-                {
-                    "code": "JujuControllerCredentialsError"
-                },
-                {
-                    "code": "JujuControllerConnectionFailed"
-                }
-            ],
-            "name": "RegisterJujuModel",
-            "parameters": [
-                {
-                    "doc": "The name of the model.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The endpoint address of the Juju API.",
-                    "name": "endpoint",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The username used to authenticate with the Juju API.",
-                    "name": "username",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The password used to authenticate with the Juju API.",
-                    "name": "password",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The UUID of the model to register from the controller.",
-                    "name": "uuid",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RejectPendingComputers": {
-        "2011-08-01": {
-            "doc": "\n    Reject a list of pending computers associated with the account used for\n    authentication.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "RejectPendingComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer IDs to reject.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Reject a list of pending computers associated with the account used for\n    authentication.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "RejectPendingComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer IDs to reject.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveAPTSource": {
-        "2011-08-01": {
-            "doc": "Remove apt source from the account.",
-            "errors": [
-                {
-                    "code": "UnknownAPTSource"
-                },
-                {
-                    "code": "APTSourceInUse"
-                }
-            ],
-            "name": "RemoveAPTSource",
-            "parameters": [
-                {
-                    "doc": "The name of the apt source to be removed.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove apt source from the account.",
-            "errors": [
-                {
-                    "code": "UnknownAPTSource"
-                },
-                {
-                    "code": "APTSourceInUse"
-                }
-            ],
-            "name": "RemoveAPTSource",
-            "parameters": [
-                {
-                    "doc": "The name of the apt source to be removed.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveAPTSourceFromRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Remove APT source from a repository profile.\n            An activity will be created to remove the source from the\n            computers associated with the given profile.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "UnknownAPTSource"
-                }
-            ],
-            "name": "RemoveAPTSourceFromRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the APT source to remove.",
-                    "name": "apt_source",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove APT source from a repository profile.\n            An activity will be created to remove the source from the\n            computers associated with the given profile.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "UnknownAPTSource"
-                }
-            ],
-            "name": "RemoveAPTSourceFromRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the APT source to remove.",
-                    "name": "apt_source",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveAPTSources": {
-        "2011-08-01": {
-            "doc": "Deprecated: use RemoveAPTSource instead.",
-            "errors": [
-                {
-                    "code": "UnknownAPTSource"
-                },
-                {
-                    "code": "APTSourceInUse"
-                }
-            ],
-            "name": "RemoveAPTSources",
-            "parameters": [
-                {
-                    "doc": "List of names of the APT sources be removed. Multiple names can be supplied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Deprecated: use RemoveAPTSource instead.",
-            "errors": [
-                {
-                    "code": "UnknownAPTSource"
-                },
-                {
-                    "code": "APTSourceInUse"
-                }
-            ],
-            "name": "RemoveAPTSources",
-            "parameters": [
-                {
-                    "doc": "List of names of the APT sources be removed. Multiple names can be supplied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveAPTSourcesFromRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "\n            Deprecated: use RemoveAPTSourceFromRepositoryProfile instead.\n        ",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownAPTSource"
-                }
-            ],
-            "name": "RemoveAPTSourcesFromRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The names of the APT sources to remove.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "apt_sources",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n            Deprecated: use RemoveAPTSourceFromRepositoryProfile instead.\n        ",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownAPTSource"
-                }
-            ],
-            "name": "RemoveAPTSourcesFromRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The names of the APT sources to remove.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "apt_sources",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveAccessGroup": {
-        "2011-08-01": {
-            "doc": "Remove an access group.",
-            "errors": [
-                {
-                    "code": "InvalidAccessGroup"
-                },
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "RemoveAccessGroup",
-            "parameters": [
-                {
-                    "doc": "The name of the access group to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove an access group.",
-            "errors": [
-                {
-                    "code": "InvalidAccessGroup"
-                },
-                {
-                    "code": "UnknownAccessGroup"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "RemoveAccessGroup",
-            "parameters": [
-                {
-                    "doc": "The name of the access group to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveAccessGroupsFromRole": {
-        "2011-08-01": {
-            "doc": "Remove the given access groups to a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "UnknownAccessGroups"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                }
-            ],
-            "name": "RemoveAccessGroupsFromRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of access groups to remove from the role.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "access_groups",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove the given access groups to a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "UnknownAccessGroups"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                }
-            ],
-            "name": "RemoveAccessGroupsFromRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of access groups to remove from the role.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "access_groups",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveAnnotationFromComputers": {
-        "2011-08-01": {
-            "doc": "Remove annotation key from a selection of computers.",
-            "errors": [
-                {
-                    "code": "InvalidAnnotationKey"
-                },
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "RemoveAnnotationFromComputers",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers from which to remove annotation.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "Annotation key to disassociate.",
-                    "name": "key",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove annotation key from a selection of computers.",
-            "errors": [
-                {
-                    "code": "InvalidAnnotationKey"
-                },
-                {
-                    "code": "InvalidQuery"
-                }
-            ],
-            "name": "RemoveAnnotationFromComputers",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers from which to remove annotation.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "Annotation key to disassociate.",
-                    "name": "key",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveComputers": {
-        "2011-08-01": {
-            "doc": "Remove a list of computers by ID.",
-            "errors": [
-                {
-                    "code": "UnknownComputer"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                }
-            ],
-            "name": "RemoveComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer ids to remove.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove a list of computers by ID.",
-            "errors": [
-                {
-                    "code": "UnknownComputer"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                }
-            ],
-            "name": "RemoveComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer ids to remove.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveDistribution": {
-        "2011-08-01": {
-            "doc": "Remove the specified repository distribution.",
-            "errors": [
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "RemoveDistribution",
-            "parameters": [
-                {
-                    "doc": "The name of the distribution to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove the specified repository distribution.",
-            "errors": [
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "RemoveDistribution",
-            "parameters": [
-                {
-                    "doc": "The name of the distribution to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveGPGKey": {
-        "2011-08-01": {
-            "doc": "Remove a GPG key.",
-            "errors": [
-                {
-                    "code": "GPGKeyInUse"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                }
-            ],
-            "name": "RemoveGPGKey",
-            "parameters": [
-                {
-                    "doc": "Name of the GPG key to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove a GPG key.",
-            "errors": [
-                {
-                    "code": "GPGKeyInUse"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                }
-            ],
-            "name": "RemoveGPGKey",
-            "parameters": [
-                {
-                    "doc": "Name of the GPG key to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveJujuEnvironment": {
-        "2011-08-01": {
-            "doc": "Remove a Juju environment from the account.",
-            "errors": [
-                {
-                    "code": "UnknownEnvironment"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                },
-                {
-                    "code": "JujuModelRemovalError"
-                },
-                {
-                    "code": "EnvironmentRemovalError"
-                }
-            ],
-            "name": "RemoveJujuEnvironment",
-            "parameters": [
-                {
-                    "doc": "Name of the environment to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove a Juju environment from the account.",
-            "errors": [
-                {
-                    "code": "UnknownEnvironment"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                },
-                {
-                    "code": "JujuModelRemovalError"
-                },
-                {
-                    "code": "EnvironmentRemovalError"
-                }
-            ],
-            "name": "RemoveJujuEnvironment",
-            "parameters": [
-                {
-                    "doc": "Name of the environment to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveJujuModel": {
-        "2011-08-01": {
-            "doc": "Remove a Juju model from the account.",
-            "errors": [
-                {
-                    "code": "UnknownJujuModel"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "JujuModelRemovalError"
-                },
-                {
-                    "code": "EnvironmentRemovalError"
-                }
-            ],
-            "name": "RemoveJujuModel",
-            "parameters": [
-                {
-                    "doc": "Name of the model to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove a Juju model from the account.",
-            "errors": [
-                {
-                    "code": "UnknownJujuModel"
-                },
-                {
-                    "code": "UnknownEntityIDs"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "JujuModelRemovalError"
-                },
-                {
-                    "code": "EnvironmentRemovalError"
-                }
-            ],
-            "name": "RemoveJujuModel",
-            "parameters": [
-                {
-                    "doc": "Name of the model to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemovePackageFiltersFromPocket": {
-        "2011-08-01": {
-            "doc": "\n    Remove package filters from a repository pocket.  The pocket must be in\n    pull mode and support blacklist/whitelist filtering.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "NoPocketFiltering"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "RemovePackageFiltersFromPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to operate on.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of packages to be added or removed from the pocket filter.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Remove package filters from a repository pocket.  The pocket must be in\n    pull mode and support blacklist/whitelist filtering.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "NoPocketFiltering"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "RemovePackageFiltersFromPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to operate on.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of packages to be added or removed from the pocket filter.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemovePackageProfile": {
-        "2011-08-01": {
-            "doc": "Remove a package profile, given its name.",
-            "errors": [
-                {
-                    "code": "UnknownPackageProfileName"
-                }
-            ],
-            "name": "RemovePackageProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the package profile to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove a package profile, given its name.",
-            "errors": [
-                {
-                    "code": "UnknownPackageProfileName"
-                }
-            ],
-            "name": "RemovePackageProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the package profile to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemovePackages": {
-        "2011-08-01": {
-            "doc": "Remove packages on selected computers.",
-            "errors": [
-                {
-                    "code": "UnknownComputers"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "UnknownPackages"
-                },
-                {
-                    "code": "InvalidTime"
-                }
-            ],
-            "name": "RemovePackages",
-            "parameters": [
-                {
-                    "doc": "A qualified criteria to be used in the search.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of package names on which to operate. Multiple package names can be supplied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to perform the package operation.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 0,
-                    "doc": "Randomise delivery within the given time frame specified in minutes",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove packages on selected computers.",
-            "errors": [
-                {
-                    "code": "UnknownComputers"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "UnknownPackages"
-                },
-                {
-                    "code": "InvalidTime"
-                }
-            ],
-            "name": "RemovePackages",
-            "parameters": [
-                {
-                    "doc": "A qualified criteria to be used in the search.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of package names on which to operate. Multiple package names can be supplied.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to perform the package operation.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 0,
-                    "doc": "Randomise delivery within the given time frame specified in minutes",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemovePackagesFromPocket": {
-        "2011-08-01": {
-            "doc": "Remove packages from pockets in upload mode.",
-            "errors": [
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "RemovePackagesFromPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to remove packages from.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of packages to be removed from the pockets.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove packages from pockets in upload mode.",
-            "errors": [
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "RemovePackagesFromPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to remove packages from.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of names of packages to be removed from the pockets.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemovePermissionsFromRole": {
-        "2011-08-01": {
-            "doc": "Remove permissions from a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                },
-                {
-                    "code": "InvalidRolePermissions"
-                }
-            ],
-            "name": "RemovePermissionsFromRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of permissions to remove.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "permissions",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove permissions from a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                },
-                {
-                    "code": "InvalidRolePermissions"
-                }
-            ],
-            "name": "RemovePermissionsFromRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of permissions to remove.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "permissions",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemovePersonsFromRole": {
-        "2011-08-01": {
-            "doc": "Remove people from a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "UnknownPersonEmails"
-                },
-                {
-                    "code": "SelfRevokeGlobalAdmin"
-                }
-            ],
-            "name": "RemovePersonsFromRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of email addresses of people to remove.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "persons",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove people from a role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "UnknownPersonEmails"
-                },
-                {
-                    "code": "SelfRevokeGlobalAdmin"
-                }
-            ],
-            "name": "RemovePersonsFromRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role to modify.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of email addresses of people to remove.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "persons",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemovePocket": {
-        "2011-08-01": {
-            "doc": "Remove a repository pocket from a series in a distribution.",
-            "errors": [
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "RemovePocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove a repository pocket from a series in a distribution.",
-            "errors": [
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "RemovePocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemovePocketsFromRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Remove repository pockets from a repository profile.\n            An activity will be created to remove the pockets from the APT\n            sources of the computers associated with the given profile.",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "RemovePocketsFromRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The names of the pockets to remove.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "pockets",
-                    "type": "list"
-                },
-                {
-                    "doc": "The name of the series the pocket belongs to.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution the series belongs to.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove repository pockets from a repository profile.\n            An activity will be created to remove the pockets from the APT\n            sources of the computers associated with the given profile.",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "RemovePocketsFromRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "Name of the repository profile.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The names of the pockets to remove.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "pockets",
-                    "type": "list"
-                },
-                {
-                    "doc": "The name of the series the pocket belongs to.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution the series belongs to.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveRemovalProfile": {
-        "2011-08-01": {
-            "doc": "Remove an existing removal profile by name.",
-            "errors": [
-                {
-                    "code": "UnknownRemovalProfile"
-                }
-            ],
-            "name": "RemoveRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the removal profile you wish toremove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove an existing removal profile by name.",
-            "errors": [
-                {
-                    "code": "UnknownRemovalProfile"
-                }
-            ],
-            "name": "RemoveRemovalProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the removal profile you wish toremove.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveRepositoryProfile": {
-        "2011-08-01": {
-            "doc": "Remove repository profile from the account.",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "RemoveRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the repository profile to be removed.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove repository profile from the account.",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "RemoveRepositoryProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the repository profile to be removed.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveRepositoryProfiles": {
-        "2011-08-01": {
-            "doc": "Deprecated: use RemoveRepositoryProfile instead.",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "RemoveRepositoryProfiles",
-            "parameters": [
-                {
-                    "doc": "Names of the repository profiles to be removed.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Deprecated: use RemoveRepositoryProfile instead.",
-            "errors": [
-                {
-                    "code": "UnknownRepositoryProfile"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "RemoveRepositoryProfiles",
-            "parameters": [
-                {
-                    "doc": "Names of the repository profiles to be removed.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "names",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveRole": {
-        "2011-08-01": {
-            "doc": "Remove an access role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                }
-            ],
-            "name": "RemoveRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove an access role.",
-            "errors": [
-                {
-                    "code": "UnknownRole"
-                },
-                {
-                    "code": "ReadOnlyRole"
-                }
-            ],
-            "name": "RemoveRole",
-            "parameters": [
-                {
-                    "doc": "The name of the role.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveSavedSearch": {
-        "2011-08-01": {
-            "doc": "Remove a saved search associated with the current account.",
-            "errors": [
-                {
-                    "code": "UnknownSavedSearch"
-                }
-            ],
-            "name": "RemoveSavedSearch",
-            "parameters": [
-                {
-                    "doc": "The \"slug\" name for this saved search.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove a saved search associated with the current account.",
-            "errors": [
-                {
-                    "code": "UnknownSavedSearch"
-                }
-            ],
-            "name": "RemoveSavedSearch",
-            "parameters": [
-                {
-                    "doc": "The \"slug\" name for this saved search.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveScript": {
-        "2011-08-01": {
-            "doc": "Remove scripts.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "RemoveScript",
-            "parameters": [
-                {
-                    "doc": "The identity of the script to remove.",
-                    "name": "script_id",
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove scripts.",
-            "errors": [
-                {
-                    "code": "Unauthorised"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "RemoveScript",
-            "parameters": [
-                {
-                    "doc": "The identity of the script to remove.",
-                    "name": "script_id",
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveScriptAttachment": {
-        "2011-08-01": {
-            "doc": "Remove a script attachment.",
-            "errors": [
-                {
-                    "code": "UnknownScriptAttachment"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "RemoveScriptAttachment",
-            "parameters": [
-                {
-                    "doc": "The identity of the script to remove.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "doc": "The filename of the attachment to remove.",
-                    "name": "filename",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove a script attachment.",
-            "errors": [
-                {
-                    "code": "UnknownScriptAttachment"
-                },
-                {
-                    "code": "UnknownScript"
-                }
-            ],
-            "name": "RemoveScriptAttachment",
-            "parameters": [
-                {
-                    "doc": "The identity of the script to remove.",
-                    "name": "script_id",
-                    "type": "integer"
-                },
-                {
-                    "doc": "The filename of the attachment to remove.",
-                    "name": "filename",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveSeries": {
-        "2011-08-01": {
-            "doc": "\n    Remove a repository series from a distribution.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "RemoveSeries",
-            "parameters": [
-                {
-                    "doc": "The name of the series to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Remove a repository series from a distribution.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "RemoveSeries",
-            "parameters": [
-                {
-                    "doc": "The name of the series to remove.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveTagsFromComputers": {
-        "2011-08-01": {
-            "doc": "Remove tags from a selection of computers.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidTag"
-                }
-            ],
-            "name": "RemoveTagsFromComputers",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to remove tags from.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "Tag names to be removed.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove tags from a selection of computers.",
-            "errors": [
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidTag"
-                }
-            ],
-            "name": "RemoveTagsFromComputers",
-            "parameters": [
-                {
-                    "doc": "A query string used to select the computers to remove tags from.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "Tag names to be removed.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "tags",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveUpgradeProfile": {
-        "2011-08-01": {
-            "doc": "Remove an existing upgrade profile by name.",
-            "errors": [
-                {
-                    "code": "UnknownUpgradeProfile"
-                }
-            ],
-            "name": "RemoveUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the upgrade profile you wish to cancel.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Remove an existing upgrade profile by name.",
-            "errors": [
-                {
-                    "code": "UnknownUpgradeProfile"
-                }
-            ],
-            "name": "RemoveUpgradeProfile",
-            "parameters": [
-                {
-                    "doc": "The name of the upgrade profile you wish to cancel.",
-                    "name": "name",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RemoveUploaderGPGKeysFromPocket": {
-        "2011-08-01": {
-            "doc": "\n    Remove GPG keys for uploaded packages validation from a repository pocket\n    in upload mode.\n    ",
-            "errors": [
-                {
-                    "code": "GPGKeyNotAssociated"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "GPGKeyAlreadyAssociated"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "RemoveUploaderGPGKeysFromPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket on which to associate keys.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of GPG keys on which to operate.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "gpg_keys",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Remove GPG keys for uploaded packages validation from a repository pocket\n    in upload mode.\n    ",
-            "errors": [
-                {
-                    "code": "GPGKeyNotAssociated"
-                },
-                {
-                    "code": "UnknownSeries"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "UnknownGPGKey"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "GPGKeyAlreadyAssociated"
-                },
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "OperationInProgress"
-                }
-            ],
-            "name": "RemoveUploaderGPGKeysFromPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket on which to associate keys.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series containing the pocket.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution containing the series.",
-                    "name": "distribution",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "A list of GPG keys on which to operate.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "gpg_keys",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "RenameComputers": {
-        "2011-08-01": {
-            "doc": "Rename a set of computers.",
-            "errors": [
-                {
-                    "code": "InvalidTitle"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "RenameComputers",
-            "parameters": [
-                {
-                    "doc": "mapping of computer_ids to computer titles",
-                    "key": {
-                        "doc": "The ID of the computer to rename",
-                        "type": "integer"
-                    },
-                    "name": "computer_titles",
-                    "type": "mapping",
-                    "value": {
-                        "doc": "The new name to apply.",
-                        "type": "unicode"
-                    }
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Rename a set of computers.",
-            "errors": [
-                {
-                    "code": "InvalidTitle"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "RenameComputers",
-            "parameters": [
-                {
-                    "doc": "mapping of computer_ids to computer titles",
-                    "key": {
-                        "doc": "The ID of the computer to rename",
-                        "type": "integer"
-                    },
-                    "name": "computer_titles",
-                    "type": "mapping",
-                    "value": {
-                        "doc": "The new name to apply.",
-                        "type": "unicode"
-                    }
-                }
-            ],
-            "result": {}
-        }
-    },
-    "SetSettings": {
-        "2011-08-01": {
-            "doc": "\n    Set configuration settings for the current LDS installation.",
-            "errors": [
-                {
-                    "code": "SettingsValue"
-                }
-            ],
-            "name": "SetSettings",
-            "parameters": [
-                {
-                    "doc": "Key/value pairs to set, separated by '='. 'true' and 'false' strings will be interpreted as booleans.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "key_values",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Set configuration settings for the current LDS installation.",
-            "errors": [
-                {
-                    "code": "SettingsValue"
-                }
-            ],
-            "name": "SetSettings",
-            "parameters": [
-                {
-                    "doc": "Key/value pairs to set, separated by '='. 'true' and 'false' strings will be interpreted as booleans.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "key_values",
-                    "type": "list"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "ShutdownComputers": {
-        "2011-08-01": {
-            "doc": "Shutdown a list of computers.",
-            "errors": [
-                {
-                    "code": "InvalidTime"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "ShutdownComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer ids to shutdown.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to deliver the script.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Shutdown a list of computers.",
-            "errors": [
-                {
-                    "code": "InvalidTime"
-                },
-                {
-                    "code": "UnknownComputer"
-                }
-            ],
-            "name": "ShutdownComputers",
-            "parameters": [
-                {
-                    "doc": "A list of computer ids to shutdown.",
-                    "item": {
-                        "type": "integer"
-                    },
-                    "name": "computer_ids",
-                    "type": "list"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to deliver the script.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "SubscribeToAlert": {
-        "2011-08-01": {
-            "doc": "Subscribe to an alert.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "SubscribeToAlert",
-            "parameters": [
-                {
-                    "doc": "The alert type to add a subscription to.",
-                    "name": "alert_type",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Subscribe to an alert.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                },
-                {
-                    "code": "Unauthorised"
-                }
-            ],
-            "name": "SubscribeToAlert",
-            "parameters": [
-                {
-                    "doc": "The alert type to add a subscription to.",
-                    "name": "alert_type",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "SyncMirrorPocket": {
-        "2011-08-01": {
-            "doc": "Synchronize a mirror repository pocket.",
-            "errors": [
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "SyncMirrorPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to synchronize.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Synchronize a mirror repository pocket.",
-            "errors": [
-                {
-                    "code": "InvalidPocketMode"
-                },
-                {
-                    "code": "UnknownDistribution"
-                },
-                {
-                    "code": "OperationInProgress"
-                },
-                {
-                    "code": "UnknownPocket"
-                },
-                {
-                    "code": "UnknownSeries"
-                }
-            ],
-            "name": "SyncMirrorPocket",
-            "parameters": [
-                {
-                    "doc": "The name of the pocket to synchronize.",
-                    "name": "name",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the series.",
-                    "name": "series",
-                    "type": "unicode"
-                },
-                {
-                    "doc": "The name of the distribution.",
-                    "name": "distribution",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "UnsubscribeFromAlert": {
-        "2011-08-01": {
-            "doc": "Unsubscribe from an alert.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                }
-            ],
-            "name": "UnsubscribeFromAlert",
-            "parameters": [
-                {
-                    "doc": "The alert type to remove a subscription from.",
-                    "name": "alert_type",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "Unsubscribe from an alert.",
-            "errors": [
-                {
-                    "code": "UnknownAlertTypeError"
-                }
-            ],
-            "name": "UnsubscribeFromAlert",
-            "parameters": [
-                {
-                    "doc": "The alert type to remove a subscription from.",
-                    "name": "alert_type",
-                    "type": "unicode"
-                }
-            ],
-            "result": {}
-        }
-    },
-    "UpgradePackages": {
-        "2011-08-01": {
-            "doc": "\n    Request upgrading of all packages identified as being upgradable, on all\n    computers selected by query.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownComputers"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidTime"
-                }
-            ],
-            "name": "UpgradePackages",
-            "parameters": [
-                {
-                    "doc": "A qualified criteria to be used in the search.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "List of package names on which to perform an upgrade. Multiple package names can be supplied like packages.1=foo and packages.2=bar.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If 'true' then only packages with USNs, i.e. security upgrades will be applied.",
-                    "name": "security_only",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default": None,
-                    "doc": "A time in the future to perform the package upgrade.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 0,
-                    "doc": "Randomise delivery within the given time frame specified in minutes",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        },
-        "2013-11-04": {
-            "doc": "\n    Request upgrading of all packages identified as being upgradable, on all\n    computers selected by query.\n    ",
-            "errors": [
-                {
-                    "code": "UnknownComputers"
-                },
-                {
-                    "code": "InvalidQuery"
-                },
-                {
-                    "code": "InvalidTime"
-                }
-            ],
-            "name": "UpgradePackages",
-            "parameters": [
-                {
-                    "doc": "A qualified criteria to be used in the search.",
-                    "name": "query",
-                    "type": "unicode"
-                },
-                {
-                    "default": [],
-                    "doc": "List of package names on which to perform an upgrade. Multiple package names can be supplied like packages.1=foo and packages.2=bar.",
-                    "item": {
-                        "type": "unicode"
-                    },
-                    "name": "packages",
-                    "optional": True,
-                    "type": "list"
-                },
-                {
-                    "default":False,
-                    "doc": "If 'true' then only packages with USNs, i.e. security upgrades will be applied.",
-                    "name": "security_only",
-                    "optional": True,
-                    "type": "boolean"
-                },
-                {
-                    "default":  None,
-                    "doc": "A time in the future to perform the package upgrade.",
-                    "name": "deliver_after",
-                    "optional": True,
-                    "type": "unicode"
-                },
-                {
-                    "default": 0,
-                    "doc": "Randomise delivery within the given time frame specified in minutes",
-                    "name": "deliver_delay_window",
-                    "optional": True,
-                    "type": "integer"
-                }
-            ],
-            "result": {}
-        }
-    }
-}
+RAW_ACTIONS_LIST = frozenset(("get-script-code",))
+
 
 class _ErrorsContainer(object):
     """
     A container for Exception subclasses which is used as a fake module object.
     """
 
+    __slots__ = ("_registry",)
+
+    def __init__(self):
+        self._registry = {}
+
     def add_error(self, error_name, error):
         """
         Add an exception to this errors container.
         """
 
         error.__module__ = __name__ + ".errors"
-        setattr(self, error_name, error)
+        self._registry[error_name] = error
 
     def lookup_error(self, error_name):
         """
         Find an exception by name. If it's not found, C{None} will be returned.
         """
 
-        return getattr(self, error_name, None)
+        return self._registry.get(error_name)
+
+    def __getattr__(self, name):
+        # Keeps "from ...base.errors import UnknownComputer" working.
+        try:
+            return self._registry[name]
+        except KeyError:
+            raise AttributeError(name)
 
 
 class HTTPError(Exception):
@@ -9382,72 +89,125 @@ class HTTPError(Exception):
     @ivar error_message: The value of the "message" key from the message data.
     """
 
+    __slots__ = ("code", "message", "message_data", "error_code", "error_message")
+
     def __init__(self, code, message=None, message_data=None):
         self.code = code
         self.message = message
         self.message_data = None
         self.error_code = None
         self.error_message = None
-        if message is not None and message.startswith("{"):
-            self.message_data = json.loads(message)
         if message_data:
             self.message_data = message_data
+        elif message is not None and message[:1] == "{":
+            # Cheap pre-check before handing the body to the JSON parser;
+            # non-JSON bodies that merely start with a brace are kept as a
+            # plain message instead of blowing up inside error handling.
+            try:
+                self.message_data = json.loads(message)
+            except ValueError:
+                self.message_data = None
         if self.message_data:
             self.error_code = self.message_data["error"]
             self.error_message = self.message_data["message"]
 
+    @classmethod
+    def from_response(cls, response):
+        """Build an error from a C{requests} response.
+
+        When the server tagged the body as JSON, the already-decoded payload
+        is handed over as C{message_data} so C{__init__} doesn't parse the
+        body a second time.
+        """
+
+        if "application/json" in response.headers.get("Content-Type", ""):
+            try:
+                return cls(
+                    response.status_code, response.text, message_data=response.json()
+                )
+            except ValueError:
+                pass
+        return cls(response.status_code, response.text)
+
     def __str__(self):
-        s = "<%s code=%s" % (type(self).__name__, self.code)
+        name = type(self).__name__
         if self.error_code is not None:
-            s += " error_code=%s error_message=%s" % (
-                self.error_code,
-                self.error_message,
+            return (
+                f"<{name} code={self.code} error_code={self.error_code}"
+                f" error_message={self.error_message}>"
             )
-        else:
-            s += " message=%s" % (self.message)
-        return s + ">"
+        return f"<{name} code={self.code} message={self.message}>"
 
 
 class APIError(HTTPError):
     """Exception for a known API error"""
 
+    __slots__ = ()
+
 
 _Action = namedtuple(
     "action", ("name", "method_name", "doc", "required_args", "optional_args")
 )
 
 
-def fetch(url, post_body, headers, connect_timeout=30, total_timeout=600, cainfo=True):
+_session = None
+
+
+def _get_session():
     """
-    Wrapper around C{requests.session}, setting up the proper options and timeout.
+    Return the shared C{requests.Session}, creating it on first use.
 
-    @return: The body of the response.
+    Reusing one session keeps sockets and TLS sessions alive across
+    queries instead of paying a fresh handshake per call.
     """
 
-    session = requests.session()
+    global _session
+    if _session is None:
+        _session = requests.session()
+    return _session
 
-    headers["Content-type"] = "application/x-www-form-urlencoded"
+
+def fetch(
+    url, post_body, headers=None, connect_timeout=30, total_timeout=600, cainfo=True
+):
+    """
+    Wrapper around C{requests.Session}, setting up the proper options and timeout.
+
+    @return: The body of the response as C{bytes}.
+    """
+
+    session = _get_session()
+
+    request_headers = {"Content-type": "application/x-www-form-urlencoded"}
     if headers:
-        session.headers.update(headers)
+        request_headers.update(headers)
+
+    if isinstance(post_body, str):
+        post_body = post_body.encode("utf-8")
 
     response = session.post(
         url,
-        data=post_body.encode("utf-8"),
+        data=post_body,
+        headers=request_headers,
         allow_redirects=True,
         timeout=(connect_timeout, total_timeout),
         verify=cainfo,
     )
 
     if not response.ok:
-        raise HTTPError(response.status_code, response.text)
+        raise HTTPError.from_response(response)
 
-    return response.text
+    return response.content
 
 
+@lru_cache(maxsize=64)
 def parse(url):
     """
     Split the given URL into the host, port, and path.
 
+    The result is cached: an L{API} instance re-parses the same fixed URI
+    on every query.
+
     @type url: C{str}
     @param url: An URL to parse.
     """
@@ -9472,6 +232,27 @@ def parse(url):
     return str(host), port, str(path)
 
 
+def _b64_file(path, chunk_size=3 * 1024 * 1024):
+    """
+    Base64-encode a file incrementally, keeping only one chunk of raw data
+    in memory at a time instead of the whole file plus its encoding.
+
+    The chunk size is a multiple of 3 so no base64 padding appears
+    mid-stream.
+
+    @return: The encoded contents as C{bytes}.
+    """
+
+    encoded = []
+    with open(path, "rb") as the_file:
+        while True:
+            chunk = the_file.read(chunk_size)
+            if not chunk:
+                break
+            encoded.append(b64encode(chunk))
+    return b"".join(encoded)
+
+
 def run_query(
     access_key,
     secret_key,
@@ -9493,14 +274,6 @@ def run_query(
         certificate. For example, "~/landscape_server_ca.crt".
     """
 
-    for key, value in list(params.items()):
-        if isinstance(key, str):
-            params.pop(key)
-            key = str(key)
-        if isinstance(value, str):
-            value = str(value)
-        params[key] = value
-
     timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     params.update(
         {
@@ -9518,21 +291,18 @@ def run_query(
     if not path:
         path = "/"
         uri = "%s/" % uri
-    signed_params = "&".join(
-        "%s=%s" % (quote(key, safe="~"), quote(value, safe="~"))
-        for key, value in sorted(params.items())
-    )
+    signed_params = urlencode(sorted(params.items()), safe="~", quote_via=quote)
     to_sign = "%s\n%s\n%s\n%s" % (method, signed_host, path, signed_params)
-    digest = hmac.new(
-        secret_key.encode("utf-8"), to_sign.encode("utf-8"), sha256
-    ).digest()
+    digest = hmac.digest(secret_key.encode("utf-8"), to_sign.encode("utf-8"), sha256)
     signature = b64encode(digest)
     signed_params += "&signature=%s" % quote(signature)
+    # Everything in signed_params is already percent-encoded ASCII.
+    post_body = signed_params.encode("ascii")
     try:
-        return fetch(uri, signed_params, {"Host": signed_host}, cainfo=ssl_ca_file)
+        return fetch(uri, post_body, {"Host": signed_host}, cainfo=ssl_ca_file)
     except HTTPError as e:
         if e.error_code is not None:
-            error_class = errors.lookup_error(_get_error_code_name(e.error_code))
+            error_class = _lookup_error_class(e.error_code)
             if error_class:
                 raise error_class(e.code, e.message)
         raise e
@@ -9550,29 +320,448 @@ def _get_error_code_name(error_code):
         return error_code + "Error"
 
 
+@lru_cache(maxsize=None)
+def _cli_arg_name(name):
+    """
+    The command-line spelling of a schema parameter name.  Cached because
+    the same parameter names are looked up for parser building and again
+    when the parsed arguments are read back.
+    """
+
+    return name.replace("_", "-")
+
+
+_error_class_cache = {}
+
+
+def _lookup_error_class(error_code):
+    """
+    Resolve the exception class for a raw API error code, memoizing the
+    result so bulk failures don't redo the name suffixing and registry
+    lookup once per sub-error.
+    """
+
+    try:
+        return _error_class_cache[error_code]
+    except KeyError:
+        error_class = _get_errors().lookup_error(_get_error_code_name(error_code))
+        _error_class_cache[error_code] = error_class
+        return error_class
+
+
+@lru_cache(maxsize=None)
 def _lowercase_api_name(name):
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    """Turn an API action name like C{GetComputers} into C{get_computers}."""
+
+    out = []
+    for i, char in enumerate(name):
+        if i and "A" <= char <= "Z":
+            prev = name[i - 1]
+            if (
+                "a" <= prev <= "z"
+                or "0" <= prev <= "9"
+                or (i + 1 < len(name) and "a" <= name[i + 1] <= "z")
+            ):
+                out.append("_")
+        out.append(char)
+    return "".join(out).lower()
 
 
-def load_schema():
+# The schema dict is large enough that compiling its literal dominates the
+# import time of this module.  The literal lives in schemas.py and the parsed
+# dict is cached in a marshalled sidecar file, which can be read back without
+# invoking the compiler at all.  The cache is rebuilt automatically whenever
+# schemas.py changes.
+_SCHEMA_CACHE_NAME = "base_schema.dat"
+_SCHEMA_CACHE_VERSION = 3
+
+_schema = None
+
+
+def _schema_source_path():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "schemas.py")
+
+
+def _schema_cache_path():
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), _SCHEMA_CACHE_NAME
+    )
+
+
+def _read_schema_cache():
+    """
+    Read the schema dict from the marshalled sidecar file. Returns C{None}
+    if the cache is missing, unreadable, or stale.
+    """
+
+    try:
+        with open(_schema_cache_path(), "rb") as cache_file:
+            cache_version, source_mtime, schema = marshal.load(cache_file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if cache_version != _SCHEMA_CACHE_VERSION:
+        return None
+    try:
+        if source_mtime != os.path.getmtime(_schema_source_path()):
+            return None
+    except OSError:
+        return None
+    return schema
+
+
+def _write_schema_cache(schema):
+    """
+    Write the schema dict to the marshalled sidecar file. Failures are
+    ignored: the cache is a best-effort optimization and the install
+    directory may not be writable.
+    """
+
+    try:
+        source_mtime = os.path.getmtime(_schema_source_path())
+        with open(_schema_cache_path(), "wb") as cache_file:
+            marshal.dump((_SCHEMA_CACHE_VERSION, source_mtime, schema), cache_file)
+    except (OSError, ValueError):
+        pass
+
+
+def _share_identical_versions(schema):
+    """
+    Collapse identical per-version entries onto shared dicts.
+
+    Almost every action describes exactly the same payload for the
+    "2011-08-01" and "2013-11-04" versions, so aliasing the duplicates
+    halves the number of live schema structures.
+    """
+
+    for version_handlers in schema.values():
+        canonical = []
+        for version, handler in version_handlers.items():
+            for other in canonical:
+                if handler == other:
+                    version_handlers[version] = other
+                    break
+            else:
+                canonical.append(handler)
+    return schema
+
+
+# Sentinel marking slots that have no value in the originating spec, so
+# "key in spec" keeps working like it did for the plain dicts.
+_MISSING = object()
+
+
+class _ParamSpec(object):
+    """
+    Immutable, dict-compatible view of a single schema parameter spec.
+
+    Parameter specs used to be plain dicts; storing them in a slotted
+    class drops the per-instance dict and hash table overhead.  Only the
+    read-only mapping operations used by the encoders and the command
+    line are provided.
+    """
+
+    __slots__ = (
+        "name",
+        "type",
+        "doc",
+        "default",
+        "optional",
+        "item",
+        "key",
+        "value",
+    )
+
+    def __init__(self, mapping):
+        for slot in self.__slots__:
+            object.__setattr__(self, slot, mapping.get(slot, _MISSING))
+
+    def __getitem__(self, key):
+        try:
+            value = object.__getattribute__(self, key)
+        except AttributeError:
+            raise KeyError(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        for slot in self.__slots__:
+            if object.__getattribute__(self, slot) is not _MISSING:
+                yield slot
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, dict(self.items()))
+
+
+def _compact_parameters(schema):
+    """
+    Convert every parameter spec dict (including the nested C{item},
+    C{key} and C{value} specs) into a slotted L{_ParamSpec}.  Runs after
+    every load, since the marshal cache stores plain dicts; the flyweight
+    sharing between actions is preserved.
+    """
+
+    memo = {}
+
+    def convert(param):
+        try:
+            return memo[id(param)][1]
+        except KeyError:
+            pass
+        fields = dict(param)
+        for nested in ("item", "key", "value"):
+            if isinstance(fields.get(nested), dict):
+                fields[nested] = convert(fields[nested])
+        spec = _ParamSpec(fields)
+        # Keep a reference to the source dict so its id can't be reused.
+        memo[id(param)] = (param, spec)
+        return spec
+
+    seen = set()
+    for version_handlers in schema.values():
+        for handler in version_handlers.values():
+            if id(handler) in seen:
+                continue
+            seen.add(id(handler))
+            handler["parameters"] = [
+                convert(parameter) for parameter in handler["parameters"]
+            ]
+    return schema
+
+
+def _freeze_schema(schema):
+    """
+    Make the loaded schema read-only from top to bottom: parameter lists
+    become tuples and the action, version and handler maps are all
+    wrapped in C{types.MappingProxyType}.
+    """
+
+    frozen = {}
+    for action_name, version_handlers in schema.items():
+        for version, handler in version_handlers.items():
+            previous = frozen.get(id(handler))
+            if previous is None:
+                handler["parameters"] = tuple(handler["parameters"])
+                previous = types.MappingProxyType(handler)
+                frozen[id(handler)] = previous
+            version_handlers[version] = previous
+        schema[action_name] = types.MappingProxyType(version_handlers)
+    return types.MappingProxyType(schema)
+
+
+def _structural_key(value):
+    """
+    Build a hashable key describing a schema value, used to find
+    structurally identical parameter specs.
+    """
+
+    if isinstance(value, dict):
+        return tuple(sorted((k, _structural_key(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return ("list",) + tuple(_structural_key(v) for v in value)
+    return value
+
+
+# Shared default objects: many optional parameters default to the same
+# empty container, so alias those onto one instance instead of keeping
+# one allocation per spec.  They are treated as read-only everywhere.
+_EMPTY_LIST = []
+_EMPTY_DICT = {}
+
+
+def _flatten_error_codes(schema):
+    """
+    Replace each action's list of one-key C{{"code": ...}} dicts with a
+    flat tuple of the code strings.  One dict per error code is pure
+    overhead: the only consumer is exception generation.
+    """
+
+    seen = set()
+    for version_handlers in schema.values():
+        for handler in version_handlers.values():
+            if id(handler) in seen:
+                continue
+            seen.add(id(handler))
+            handler["errors"] = tuple(
+                error["code"] if isinstance(error, dict) else error
+                for error in handler["errors"]
+            )
+    return schema
+
+
+def _canonicalize_defaults(schema):
+    """
+    Point every empty-container parameter default at a shared singleton.
+    C{None}, C{True} and C{False} defaults are already singletons.
+    """
+
+    seen = set()
+    for version_handlers in schema.values():
+        for handler in version_handlers.values():
+            if id(handler) in seen:
+                continue
+            seen.add(id(handler))
+            for parameter in handler["parameters"]:
+                default = parameter.get("default")
+                if isinstance(default, list) and not default:
+                    parameter["default"] = _EMPTY_LIST
+                elif isinstance(default, dict) and not default:
+                    parameter["default"] = _EMPTY_DICT
+    return schema
+
+
+def _share_duplicate_parameters(schema):
+    """
+    Replace structurally identical parameter specs with one shared dict.
+
+    Common specs such as the query/limit/offset triple are repeated in
+    dozens of actions; a flyweight table keyed on structure collapses the
+    roughly 700 parameter dicts down to the ~240 distinct ones.  The
+    nested item/key/value specs (mostly one-line dicts like
+    C{{"type": "integer"}}) go through the same table, so they are shared
+    even between parameters that differ otherwise.
+    """
+
+    flyweights = {}
+    seen = set()
+    for version_handlers in schema.values():
+        for handler in version_handlers.values():
+            if id(handler) in seen:
+                continue
+            seen.add(id(handler))
+            parameters = handler["parameters"]
+            for i, parameter in enumerate(parameters):
+                for nested in ("item", "key", "value"):
+                    sub = parameter.get(nested)
+                    if isinstance(sub, dict):
+                        parameter[nested] = flyweights.setdefault(
+                            _structural_key(sub), sub
+                        )
+                key = _structural_key(parameter)
+                parameters[i] = flyweights.setdefault(key, parameter)
+    return schema
+
+
+def _intern_schema_strings(schema):
     """
-    Load the schema from the C{schemas.json} file.
+    C{sys.intern} the short, heavily repeated strings in the schema (dict
+    keys, parameter names, type names, error codes) so equal strings
+    collapse onto a single object and dict lookups on them can take the
+    pointer-comparison fast path.  Docstrings are deduplicated through a
+    plain memo table instead: they repeat across actions too, but they
+    are large and don't belong in the interpreter's intern table.
+    """
+
+    seen = set()
+    doc_memo = {}
+
+    def walk(mapping):
+        if id(mapping) in seen:
+            return
+        seen.add(id(mapping))
+        for key in list(mapping):
+            value = mapping.pop(key)
+            key = sys.intern(key)
+            if isinstance(value, str):
+                if key != "doc":
+                    value = sys.intern(value)
+                else:
+                    value = doc_memo.setdefault(value, value)
+            elif isinstance(value, dict):
+                walk(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        walk(item)
+            elif isinstance(value, tuple):
+                # Flattened error-code tuples.
+                value = tuple(
+                    sys.intern(item) if isinstance(item, str) else item
+                    for item in value
+                )
+            mapping[key] = value
+
+    walk(schema)
+    return schema
+
 
-    Invoking this method will populate the module-level C{errors} object with
-    exception classes based on the schema.
+def _import_schema_literal():
+    """
+    Import the schema dict by compiling the literal in C{schemas.py}. This
+    is the slow path, only used when the marshalled cache is not usable.
     """
-    # this_directory = os.path.dirname(schema_path+"/schemas.json")
-    # schema_filename = os.path.join(this_directory, )
 
+    try:
+        from ansible_collections.gikuluca.landscape.plugins.module_utils.schemas import (
+            SCHEMA,
+        )
+    except ImportError:
+        # Running outside of an installed collection (e.g. as a script).
+        from schemas import SCHEMA
     return SCHEMA
 
 
+def load_schema():
+    """
+    Load the schema, preferring the marshalled C{base_schema.dat} sidecar
+    over compiling the literal in C{schemas.py}. The result is cached at
+    module level, so only the first call does any work.
+    """
+
+    global _schema
+    if _schema is not None:
+        return _schema
+    schema = _read_schema_cache()
+    if schema is None:
+        schema = _share_identical_versions(_import_schema_literal())
+        schema = _flatten_error_codes(schema)
+        schema = _share_duplicate_parameters(_canonicalize_defaults(schema))
+        _write_schema_cache(schema)
+    _schema = _freeze_schema(_compact_parameters(_intern_schema_strings(schema)))
+    return _schema
+
+
+def __getattr__(name):
+    # PEP 562: resolve the schema and everything derived from it lazily,
+    # so that merely importing this module stays cheap.
+    if name == "SCHEMA":
+        return load_schema()
+    if name == "errors":
+        return _get_errors()
+    if name == "API":
+        return _get_api_classes()[0]
+    if name == "APIv2":
+        return _get_api_classes()[1]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
 def _build_exception(name):
     # TODO: Put __doc__ on the generated errors (must be included in the
     # schema)
     class _APIError(APIError):
-        pass
+        __slots__ = ()
 
     _APIError.__name__ = str(name)
     return _APIError
@@ -9585,23 +774,15 @@ def _build_exceptions(schema):
     """
 
     errors = _ErrorsContainer()
-    for action, version_handlers in list(schema.items()):
-        for version, handler in list(version_handlers.items()):
-            for error in handler["errors"]:
-                exception_name = _get_error_code_name(error["code"])
-                exception_type = _build_exception(exception_name)
+    for action, version_handlers in schema.items():
+        for version, handler in version_handlers.items():
+            for error_code in handler["errors"]:
+                exception_name = _get_error_code_name(error_code)
                 if not errors.lookup_error(exception_name):
-                    errors.add_error(exception_name, exception_type)
+                    errors.add_error(exception_name, _build_exception(exception_name))
     return errors
 
 
-_schema = load_schema()
-errors = _build_exceptions(_schema)
-# A hack to make "from landscape_api.base.errors import UnknownComputer" to
-# work:
-sys.modules[__name__ + ".errors"] = errors
-
-
 class MultiError(APIError):
     """
     An exception that represents multiple sub-exceptions.
@@ -9609,49 +790,65 @@ class MultiError(APIError):
     @ivar errors: A list of instances of L{APIError} or its subclasses.
     """
 
+    __slots__ = ("errors",)
+
     def __init__(self, http_code, message):
         # Subclass from APIError just for convenience in catching; we're not
         # using its functionality
         APIError.__init__(self, http_code, message)
-        self.errors = []
+        errors = []
+        code = self.code
         for sub_error in self.message_data["errors"]:
-            if sub_error.get("error") is not None:
-                error_class = errors.lookup_error(
-                    _get_error_code_name(sub_error["error"])
-                )
-                if error_class:
-                    exception = error_class(self.code, message_data=sub_error)
-                else:
-                    exception = APIError(self.code, message_data=sub_error)
-            else:
-                exception = APIError(self.code, message_data=sub_error)
-            self.errors.append(exception)
+            error_code = sub_error.get("error")
+            error_class = APIError
+            if error_code is not None:
+                error_class = _lookup_error_class(error_code) or APIError
+            errors.append(error_class(code, message_data=sub_error))
+        self.errors = errors
 
     def __str__(self):
         return "<%s errors=%s>" % (type(self).__name__, self.errors)
 
 
 class UnauthorisedError(APIError):
-    pass
+    __slots__ = ()
 
 
 class SignatureDoesNotMatchError(APIError):
-    pass
+    __slots__ = ()
 
 
 class AuthFailureError(APIError):
-    pass
+    __slots__ = ()
 
 
 class InvalidCredentialsError(APIError):
-    pass
+    __slots__ = ()
 
 
-errors.add_error("MultiError", MultiError)
-errors.add_error("Unauthorised", UnauthorisedError)
-errors.add_error("SignatureDoesNotMatchError", SignatureDoesNotMatchError)
-errors.add_error("AuthFailureError", AuthFailureError)
-errors.add_error("InvalidCredentialsError", InvalidCredentialsError)
+_errors = None
+
+
+def _get_errors():
+    """
+    Build (on first use) and return the errors container holding the
+    exception classes generated from the schema, plus the hand-written
+    ones defined above.
+    """
+
+    global _errors
+    if _errors is None:
+        container = _build_exceptions(load_schema())
+        container.add_error("MultiError", MultiError)
+        container.add_error("Unauthorised", UnauthorisedError)
+        container.add_error("SignatureDoesNotMatchError", SignatureDoesNotMatchError)
+        container.add_error("AuthFailureError", AuthFailureError)
+        container.add_error("InvalidCredentialsError", InvalidCredentialsError)
+        # A hack to make "from landscape_api.base.errors import
+        # UnknownComputer" to work:
+        sys.modules[__name__ + ".errors"] = container
+        _errors = container
+    return _errors
 
 
 class _API(object):
@@ -9676,6 +873,13 @@ class _API(object):
 
     _run_query = staticmethod(run_query)
 
+    # Maps schema type names (including the space-separated aliases)
+    # straight to encoder functions, so the hot path skips both the
+    # string replace and the getattr-by-name.  Populated right after the
+    # class body; encoders added by subclasses still resolve through the
+    # getattr fallback in _encode_argument.
+    _encoder_dispatch = {}  # type: ignore
+
     #     'overridden_apis' contains information about command-line API actions
     # that we want to override to (locally) take different arguments and invoke
     # a hand-coded method. This is used for situations where we want to provide
@@ -9696,7 +900,10 @@ class _API(object):
         self._secret_key = secret_key
         self._ssl_ca_file = ssl_ca_file
         self._json = json
-        self._schema = schema if schema is not None else _schema
+        self._schema = schema if schema is not None else load_schema()
+        # Lazily-built per-action index of parameter name -> parameter
+        # spec, so repeated calls don't rescan the schema parameter lists.
+        self._action_index = {}
 
     def run_query(self, action_name, arguments):
         """
@@ -9712,9 +919,11 @@ class _API(object):
             self._uri,
             self._ssl_ca_file,
         )
-        if not self._json:
-            result = json.loads(result)
-        return result
+        if self._json:
+            # Raw mode wants text; parse mode below feeds the bytes straight
+            # to the decoder without this intermediate str.
+            return result.decode("utf-8")
+        return json.loads(result)
 
     def call(self, method, **kwargs):
         """
@@ -9722,12 +931,36 @@ class _API(object):
         in the schema.
         """
 
-        action = self._schema[method][self.version]
-        parameters = action["parameters"]
-        fields = [(x["name"], x) for x in parameters]
-        arguments = self._encode_struct_fields(fields, kwargs)
+        fields, required = self._get_action_index(method)
+        if not required <= kwargs.keys():
+            # Report the first missing parameter in schema order, like the
+            # per-field check in _encode_struct_fields would.
+            for name in fields:
+                if name in required and name not in kwargs:
+                    raise TypeError("Missing parameter %s" % (name,))
+        arguments = self._encode_struct_fields(fields.items(), kwargs)
         return self.run_query(method, arguments)
 
+    def _get_action_index(self, method):
+        """
+        Return an (index, required) pair for the given action, building
+        and caching it on first use.  The index maps parameter name to
+        parameter spec; required is a frozenset of the non-optional
+        parameter names, used for a single up-front membership check.
+        """
+
+        try:
+            return self._action_index[method]
+        except KeyError:
+            action = self._schema[method][self.version]
+            index = {x["name"]: x for x in action["parameters"]}
+            required = frozenset(
+                name for name, spec in index.items() if not spec.get("optional")
+            )
+            entry = (index, required)
+            self._action_index[method] = entry
+            return entry
+
     def _encode_struct_fields(self, fields, arguments, prefix=""):
         """
         Encode multiple named fields. This is used for both base argument
@@ -9765,8 +998,12 @@ class _API(object):
 
         if parameter.get("optional") and value == parameter.get("default"):
             return {}
-        kind = parameter["type"].replace(" ", "_")
-        handler = getattr(self, "_encode_%s" % (kind,))
+        kind = parameter["type"]
+        handler = self._encoder_dispatch.get(kind)
+        if handler is not None:
+            return handler(self, parameter, str(name), value)
+        # Fallback for encoder methods added by subclasses.
+        handler = getattr(self, "_encode_%s" % (kind.replace(" ", "_"),))
         return handler(parameter, str(name), value)
 
     def _encode_integer(self, parameter, name, arg):
@@ -9787,6 +1024,9 @@ class _API(object):
         object, into an HTTP argument.
         """
 
+        if type(value) is str:
+            # The common case by far; skip the datetime check.
+            return {name: value}
         if isinstance(value, (datetime, date)):
             # This is really dumb compatibility stuff for APIs that aren't
             # properly specifying their type.
@@ -9798,14 +1038,10 @@ class _API(object):
     _encode_unicode_title = _encode_unicode
 
     def _encode_file(self, parameter, name, value):
-        contents = None
-        with open(value, "rb") as the_file:
-            contents = the_file.read()
-        encoded_contents = b64encode(contents).decode("utf-8")
-        # We send the filename along with the contents of the file.close
+        encoded_contents = _b64_file(value).decode("ascii")
+        # We send the filename along with the contents of the file.
         filename = os.path.basename(value)
-        payload = filename + "$$" + encoded_contents
-        return {name: str(payload)}
+        return {name: filename + "$$" + encoded_contents}
 
     def _encode_boolean(self, parameter, name, value):
         return {name: "true" if value else "false"}
@@ -9823,12 +1059,20 @@ class _API(object):
         "foo.N" arguments.
         """
 
-        result = {}
         if isinstance(sequence, str):
             sequence = [item.strip() for item in sequence.split(",")]
+        item_parameter = parameter["item"]
+        if item_parameter["type"] in ("integer", "float", "enum", "raw string"):
+            # Scalar item types encode as plain str(item); build the result
+            # in one comprehension instead of a dict merge per item.
+            return {
+                "%s.%s" % (name, i): str(item)
+                for i, item in enumerate(sequence, 1)
+            }
+        result = {}
         for i, item in enumerate(sequence):
             encoded_item = self._encode_argument(
-                parameter["item"], "%s.%s" % (name, i + 1), item
+                item_parameter, "%s.%s" % (name, i + 1), item
             )
             result.update(encoded_item)
         return result
@@ -9843,7 +1087,7 @@ class _API(object):
         if isinstance(items, str):
             items = {k.strip(): v.strip() for k, v in _parse_csv_mapping_safely(items)}
         elif hasattr(items, "items"):
-            items = list(items.items())
+            items = items.items()
 
         keyparam = parameter["key"]
         valueparam = parameter["value"]
@@ -9855,15 +1099,11 @@ class _API(object):
         return result
 
     def _encode_data(self, parameter, name, value):
-        contents = None
-        with open(value, "rb") as the_file:
-            contents = the_file.read()
-        encoded_contents = b64encode(contents)
-        return {name: encoded_contents}
+        return {name: _b64_file(value)}
 
     def _encode_structure(self, parameter, name, dictionary):
         return self._encode_struct_fields(
-            iter(list(parameter["fields"].items())),
+            parameter["fields"].items(),
             dictionary.copy(),
             prefix=name + ".",
         )
@@ -9881,6 +1121,25 @@ class _API(object):
         return self.run_query(method, arguments)
 
 
+_API._encoder_dispatch = {
+    "boolean": _API._encode_boolean,
+    "data": _API._encode_data,
+    "date": _API._encode_date,
+    "enum": _API._encode_enum,
+    "file": _API._encode_file,
+    "float": _API._encode_float,
+    "integer": _API._encode_integer,
+    "list": _API._encode_list,
+    "mapping": _API._encode_mapping,
+    "raw string": _API._encode_raw_string,
+    "raw_string": _API._encode_raw_string,
+    "structure": _API._encode_structure,
+    "unicode": _API._encode_unicode,
+    "unicode line": _API._encode_unicode_line,
+    "unicode title": _API._encode_unicode_title,
+}
+
+
 def api_factory(schema, version=LATEST_VERSION):
     """
     A creator of L{API} classes. It will read a schema and create the methods
@@ -9906,25 +1165,49 @@ def api_factory(schema, version=LATEST_VERSION):
 
     def _make_api_caller(action_name, action):
         method_name = _lowercase_api_name(action_name)
-        positional_parameters = []
-        optional_parameters = []
-        defaults = []
+        signature_params = [
+            inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        names = []
+        for parameter in action["parameters"]:
+            if not parameter.get("optional"):
+                names.append(parameter["name"])
+                signature_params.append(
+                    inspect.Parameter(
+                        parameter["name"], inspect.Parameter.POSITIONAL_OR_KEYWORD
+                    )
+                )
         for parameter in action["parameters"]:
             if parameter.get("optional"):
-                optional_parameters.append(parameter["name"])
-                defaults.append(parameter["default"])
-            else:
-                positional_parameters.append(parameter["name"])
+                names.append(parameter["name"])
+                signature_params.append(
+                    inspect.Parameter(
+                        parameter["name"],
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=parameter["default"],
+                    )
+                )
+        names = tuple(names)
 
-        positional_parameters.extend(optional_parameters)
+        def caller(self, *args, **kwargs):
+            if len(args) > len(names):
+                raise TypeError(
+                    "%s() takes at most %d arguments (%d given)"
+                    % (method_name, len(names) + 1, len(args) + 1)
+                )
+            for name, value in zip(names, args):
+                if name in kwargs:
+                    raise TypeError(
+                        "%s() got multiple values for argument %r"
+                        % (method_name, name)
+                    )
+                kwargs[name] = value
+            # Missing required and unknown parameters are reported by call().
+            return self.call(action_name, **kwargs)
 
-        caller = _change_function(
-            _caller,
-            str(method_name),
-            positional_parameters,
-            defaults,
-            action_name,
-        )
+        caller.__name__ = str(method_name)
+        caller.__qualname__ = str(method_name)
+        caller.__signature__ = inspect.Signature(signature_params)
         caller.__doc__ = _generate_doc(action)
         return caller
 
@@ -9947,72 +1230,10 @@ def api_factory(schema, version=LATEST_VERSION):
             type_doc += " (of %s)" % (_describe_type(parameter["item"]),)
         return type_doc
 
-    def _change_function(func, newname, positional_parameters, defaults, action_name):
-        """
-        Return a new function with the provided name C{newname}, and changing
-        the signature corresponding to C{positional_parameters} and
-        C{defaults}.
-        """
-
-        argcount = len(positional_parameters) + 1
-        code = func.__code__
-        params = positional_parameters[:]
-        params.insert(0, "self")
-        varnames = [str(param) for param in params]
-        # See _caller for the defined variable _args
-        varnames.append("_args")
-        varnames = tuple(varnames)
-        co_nlocals = len(varnames)
-        func_defaults = tuple(defaults) if defaults else None
-
-        try:
-            newcode = code.replace(
-                co_argcount=argcount,
-                co_nlocals=co_nlocals,
-                co_name=str(newname),
-                co_varnames=varnames,
-            )
-        except Exception:
-            newcode = types.CodeType(
-                argcount,
-                code.co_kwonlyargcount,
-                co_nlocals,
-                code.co_stacksize,
-                code.co_flags,
-                code.co_code,
-                code.co_consts,
-                code.co_names,
-                varnames,
-                code.co_filename,
-                str(newname),
-                code.co_firstlineno,
-                code.co_lnotab,
-                code.co_freevars,
-                code.co_cellvars,
-            )
-
-        # Make locals and action_name available to the method
-        func_globals = func.__globals__.copy()
-        func_globals["action_name"] = action_name
-        return types.FunctionType(
-            newcode, func_globals, str(newname), func_defaults, func.__closure__
-        )
-
-    def _caller(self):
-        """Wrapper calling C{API.call} with the proper action name."""
-
-        # TODO: Improve this
-        global action_name
-        # The locals of this function aren't obvious, because _change_function
-        # modifies the parameters, and we have to access them with locals().
-        _args = locals().copy()
-        _args.pop("self")
-        return self.call(action_name, **_args)  # noqa
-
     api_class = type("API", (_API,), {})
     api_class.version = version
     actions = _get_action_callers()
-    for k, v in list(actions.items()):
+    for k, v in actions.items():
         if not getattr(api_class, k, None):
             setattr(api_class, k, v)
         else:
@@ -10024,78 +1245,95 @@ def api_factory(schema, version=LATEST_VERSION):
     return api_class
 
 
-class API(api_factory(_schema)):  # type: ignore
+_api_classes = None
+
+
+def _get_api_classes():
+    """
+    Build (on first use) the concrete L{API} and L{APIv2} classes from the
+    loaded schema.  Deferring this keeps module import cheap for users
+    that never instantiate an API object.
+    """
 
-    overridden_apis = {
-        "ImportGPGKey": {
-            "method": "import_gpg_key_from_file",
-            "doc": None,
-            "replace_args": {
-                "material": {
-                    "name": "filename",
-                    "type": "unicode",
-                    "doc": "The filename of the GPG file.",
-                }
-            },
+    global _api_classes
+    if _api_classes is not None:
+        return _api_classes
+
+    class API(api_factory(load_schema())):  # type: ignore
+
+        overridden_apis = {
+            "ImportGPGKey": {
+                "method": "import_gpg_key_from_file",
+                "doc": None,
+                "replace_args": {
+                    "material": {
+                        "name": "filename",
+                        "type": "unicode",
+                        "doc": "The filename of the GPG file.",
+                    }
+                },
+            }
         }
-    }
-
-    extra_actions = [
-        _Action(
-            "ssh",
-            "ssh",
-            "Try to ssh to a landscape computer",
-            [
-                {
-                    "name": "query",
-                    "type": "unicode",
-                    "doc": "A query string which should return " "one computer",
-                }
-            ],
-            [
-                {
-                    "name": "user",
-                    "type": "unicode",
-                    "default": None,
-                    "doc": "If specified, the user to pass to " "the ssh command",
-                }
-            ],
-        )
-    ]
 
-    def import_gpg_key_from_file(self, name, filename):
-        """
-        Import a GPG key with contents from the given filename.
-        """
+        extra_actions = [
+            _Action(
+                "ssh",
+                "ssh",
+                "Try to ssh to a landscape computer",
+                [
+                    {
+                        "name": "query",
+                        "type": "unicode",
+                        "doc": "A query string which should return " "one computer",
+                    }
+                ],
+                [
+                    {
+                        "name": "user",
+                        "type": "unicode",
+                        "default": None,
+                        "doc": "If specified, the user to pass to " "the ssh command",
+                    }
+                ],
+            )
+        ]
 
-        with open(filename, "rt") as _file:
-            material = _file.read()
+        def import_gpg_key_from_file(self, name, filename):
+            """
+            Import a GPG key with contents from the given filename.
+            """
 
-        return self.call("ImportGPGKey", name=name, material=material)
+            with open(filename, "rt") as _file:
+                material = _file.read()
 
-    def ssh(self, query, user=None):
-        """
-        Calls C{get_computers}, and then the ssh command with the given result.
-        """
+            return self.call("ImportGPGKey", name=name, material=material)
 
-        data = self.get_computers(query, with_network=True)
-        if len(data) != 1:
-            raise ValueError("Expected one computer as result, got %d" % len(data))
-        computer = data[0]
-        if not computer.get("network_devices", []):
-            raise ValueError("Couldn't find a network device")
-        address = computer["network_devices"][0]["ip_address"]
-        args = ["ssh"]
-        if user is not None:
-            args.extend(["-l", user])
-        args.append(address)
-        os.execvp("ssh", args)
+        def ssh(self, query, user=None):
+            """
+            Calls C{get_computers}, and then the ssh command with the given
+            result.
+            """
 
+            data = self.get_computers(query, with_network=True)
+            if len(data) != 1:
+                raise ValueError("Expected one computer as result, got %d" % len(data))
+            computer = data[0]
+            if not computer.get("network_devices", []):
+                raise ValueError("Couldn't find a network device")
+            address = computer["network_devices"][0]["ip_address"]
+            args = ["ssh"]
+            if user is not None:
+                args.extend(["-l", user])
+            args.append(address)
+            os.execvp("ssh", args)
 
-class APIv2(api_factory(_schema, version=FUTURE_VERSION)):  # type: ignore
-    """Development version of the API."""
+    class APIv2(api_factory(load_schema(), version=FUTURE_VERSION)):  # type: ignore
+        """Development version of the API."""
 
-    _run_query = staticmethod(partial(run_query, version=FUTURE_VERSION))
+        _run_query = staticmethod(partial(run_query, version=FUTURE_VERSION))
+
+    _api_classes = (API, APIv2)
+    return _api_classes
 
 
 class ParseActionsError(Exception):
@@ -10118,6 +1356,12 @@ class SchemaParameterAction(argparse.Action):
     parameters and convert them to Python objects.
     """
 
+    # Maps schema type names to parser methods, so parse_argument skips the
+    # per-call string formatting and getattr.  Populated right after the
+    # class body; parsers added by subclasses keep working through the
+    # getattr fallback.
+    _parser_dispatch = {}  # type: ignore
+
     def __init__(self, *args, **kwargs):
         self.schema_parameter = kwargs.pop("schema_parameter")
         argparse.Action.__init__(self, *args, **kwargs)
@@ -10127,10 +1371,13 @@ class SchemaParameterAction(argparse.Action):
         setattr(namespace, self.dest, value)
 
     def parse_argument(self, parameter, value):
-        suffix = parameter["type"].replace(" ", "_")
-        parser = getattr(self, "parse_%s" % (suffix,))
+        parser = self._parser_dispatch.get(parameter["type"])
+        if parser is None:
+            # Fallback for parser methods added by subclasses.
+            suffix = parameter["type"].replace(" ", "_")
+            parser = getattr(type(self), "parse_%s" % (suffix,))
         try:
-            return parser(parameter, value)
+            return parser(self, parameter, value)
         except UsageError:
             raise
         except:  # noqa
@@ -10182,13 +1429,38 @@ class SchemaParameterAction(argparse.Action):
         return value.decode("utf-8")
 
 
+SchemaParameterAction._parser_dispatch = {
+    "boolean": SchemaParameterAction.parse_boolean,
+    "data": SchemaParameterAction.parse_data,
+    "enum": SchemaParameterAction.parse_enum,
+    "float": SchemaParameterAction.parse_float,
+    "integer": SchemaParameterAction.parse_integer,
+    "mapping": SchemaParameterAction.parse_mapping,
+    "raw string": SchemaParameterAction.parse_raw_string,
+    "unicode": SchemaParameterAction.parse_unicode,
+    "unicode line": SchemaParameterAction.parse_unicode_line,
+    "unicode title": SchemaParameterAction.parse_unicode_title,
+}
+
+
 def _parse_csv_list_safely(value):
-    """Yield each substring separated by commas.
+    """Return each substring separated by commas.
 
     Substrings can contain escaped commas as "\\," and they will be
     unescaped by this function.
     """
 
+    if "\\" not in value:
+        # Fast path: no escapes, so str.split does all the work.  A single
+        # trailing comma produces no empty item, matching the char loop.
+        items = value.split(",")
+        if items[-1] == "":
+            items.pop()
+        return items
+    return _unescape_csv_items(value)
+
+
+def _unescape_csv_items(value):
     item = ""
     escaped = False
     for c in value:
@@ -10237,6 +1509,9 @@ class CommandLine(object):
         self.stderr = stderr
         self.exit = exit
         self.environ = environ
+        # Parsers are cached per (prog, action): repeat dispatches of the
+        # same action reuse the ArgumentParser instead of rebuilding it.
+        self._action_parsers = {}
 
     def main(self, argv, schema):  # noqa
         """
@@ -10245,7 +1520,8 @@ class CommandLine(object):
         """
 
         version = self.environ.get("LANDSCAPE_API_VERSION", LATEST_VERSION)
-        actions = self.get_actions(schema, version)
+        action_builders = self.get_action_builders(schema, version)
+        action_names = sorted(action_builders)
 
         try:
             # Build main parser
@@ -10254,11 +1530,10 @@ class CommandLine(object):
             # Special case for empty command line
             if len(argv) == 0:
                 raise UsageError(
-                    stdout=self.format_main_usage(parser, actions), error_code=0
+                    stdout=self.format_main_usage(parser, action_names),
+                    error_code=0,
                 )
 
-            action_map = dict([(action.name, action) for action in actions])
-
             (args, argv) = self.wrap_parse_args(parser.parse_known_args, argv)
 
             print_help_only = False
@@ -10266,7 +1541,8 @@ class CommandLine(object):
                 args.help and not args.action
             ):
                 raise UsageError(
-                    stdout=self.format_main_usage(parser, actions), error_code=0
+                    stdout=self.format_main_usage(parser, action_names),
+                    error_code=0,
                 )
             if args.action == "help":
                 print_help_only = True
@@ -10274,7 +1550,7 @@ class CommandLine(object):
             if args.help:
                 print_help_only = True
 
-            if args.action != "call" and args.action not in action_map:
+            if args.action != "call" and args.action not in action_builders:
                 if args.action is None:
                     raise UsageError(stderr="Please specify an action.\n")
                 raise UsageError(stderr="Unknown action: %s\n" % args.action)
@@ -10282,7 +1558,9 @@ class CommandLine(object):
             if args.action == "call":
                 action_parser = self.get_call_parser(parser)
             else:
-                action = action_map[args.action]
+                # Second phase: build the full descriptor only for the
+                # action actually dispatched.
+                action = action_builders[args.action]()
                 action_parser = self.get_action_parser(parser, action)
 
             if print_help_only:
@@ -10324,7 +1602,10 @@ class CommandLine(object):
         if args.json_output or action.name in RAW_ACTIONS_LIST:
             # Some of the methods require raw output, for instance the code
             # part of scripts.
-            self.stdout.write(str(result) + "\n")
+            if not isinstance(result, str):
+                result = str(result)
+            self.stdout.write(result)
+            self.stdout.write("\n")
         else:
             pprint(result, stream=self.stdout)
 
@@ -10333,13 +1614,9 @@ class CommandLine(object):
         Format and print an HTTP error in a nice way.
         """
 
-        message = error.error_message
-        error_code = error.error_code
-        if isinstance(message, str):
-            message = message.encode("utf-8")
-        if isinstance(error_code, str):
-            error_code = error_code.encode("utf-8")
-        self.stderr.write("Error code: %s\nError message: %s\n" % (error_code, message))
+        self.stderr.write(
+            f"Error code: {error.error_code}\nError message: {error.error_message}\n"
+        )
 
         if isinstance(error, MultiError):
             for error in error.errors:
@@ -10350,23 +1627,23 @@ class CommandLine(object):
         Call a known, supported API action, using methods on L{API}.
         """
 
+        ns = vars(args)
         positional_args = []
         keyword_args = {}
         for req_arg in action.required_args:
-            # Special case to allow query to be multiple
-            # space-separated tokens without having to be quoted on the
-            # command line.
-            argname = req_arg["name"].replace("_", "-")
-            value = (
-                " ".join(args.query) if argname == "query" else getattr(args, argname)
-            )
+            argname = _cli_arg_name(req_arg["name"])
+            value = ns[argname]
+            if argname == "query":
+                # Special case to allow query to be multiple
+                # space-separated tokens without having to be quoted on the
+                # command line.
+                value = " ".join(value)
             positional_args.append(value)
         for opt_arg in action.optional_args:
-            opt_arg_name = opt_arg["name"].replace("_", "-")
-            opt_arg_parameter_name = opt_arg["name"]
-            arg = getattr(args, opt_arg_name, None)
+            opt_arg_name = _cli_arg_name(opt_arg["name"])
+            arg = ns.get(opt_arg_name)
             if arg is not None and arg != action_parser.get_default(opt_arg_name):
-                keyword_args[opt_arg_parameter_name] = arg
+                keyword_args[opt_arg["name"]] = arg
         handler = getattr(api, action.method_name)
         return handler(*positional_args, **keyword_args)
 
@@ -10389,34 +1666,30 @@ class CommandLine(object):
         or environment variables.
         """
 
-        if args.key is not None:
-            access_key = args.key
-        elif "LANDSCAPE_API_KEY" in self.environ:
-            access_key = self.environ["LANDSCAPE_API_KEY"]
-        else:
-            raise UsageError(stderr="Access key not specified.\n")
-
-        if args.secret is not None:
-            secret_key = args.secret
-        elif "LANDSCAPE_API_SECRET" in self.environ:
-            secret_key = self.environ["LANDSCAPE_API_SECRET"]
-        else:
-            raise UsageError(stderr="Secret key not specified.\n")
+        def resolve(value, envvar, error):
+            if value is not None:
+                return value
+            env_value = self.environ.get(envvar)
+            if env_value is None:
+                raise UsageError(stderr=error)
+            return env_value
 
-        if args.uri is not None:
-            uri = args.uri
-        elif "LANDSCAPE_API_URI" in self.environ:
-            uri = self.environ["LANDSCAPE_API_URI"]
-        else:
-            raise UsageError(stderr="URI not specified.\n")
+        access_key = resolve(
+            args.key, "LANDSCAPE_API_KEY", "Access key not specified.\n"
+        )
+        secret_key = resolve(
+            args.secret, "LANDSCAPE_API_SECRET", "Secret key not specified.\n"
+        )
+        uri = resolve(args.uri, "LANDSCAPE_API_URI", "URI not specified.\n")
 
         if args.ssl_ca_file is not None:
             ssl_ca_file = args.ssl_ca_file
         else:
             ssl_ca_file = self.environ.get("LANDSCAPE_API_SSL_CA_FILE")
 
-        api_class = APIv2 if version == FUTURE_VERSION else API
-        if schema is not _schema:
+        api, api_v2 = _get_api_classes()
+        api_class = api_v2 if version == FUTURE_VERSION else api
+        if schema is not load_schema():
             api_class = api_factory(schema, version=version)
 
         return api_class(
@@ -10424,6 +1697,19 @@ class CommandLine(object):
         )
 
     def get_action_parser(self, parser, action):
+        """
+        Return an L{argparse.ArgumentParser} for a particular action,
+        building it on first use.
+        """
+
+        key = (parser.prog, action.name)
+        action_parser = self._action_parsers.get(key)
+        if action_parser is None:
+            action_parser = self._build_action_parser(parser, action)
+            self._action_parsers[key] = action_parser
+        return action_parser
+
+    def _build_action_parser(self, parser, action):
         """
         Build an L{argparse.ArgumentParser} for a particular action.
         """
@@ -10434,7 +1720,7 @@ class CommandLine(object):
             prog="%s %s" % (parser.prog, action.name),
         )
         for req_arg in action.required_args:
-            argname = req_arg["name"].replace("_", "-")
+            argname = _cli_arg_name(req_arg["name"])
             argdoc = self.get_parameter_doc(req_arg)
             if argname == "query":
                 # Special case to allow query to be multiple space-separated
@@ -10448,7 +1734,7 @@ class CommandLine(object):
                     schema_parameter=req_arg,
                 )
         for opt_arg in action.optional_args:
-            argname = opt_arg["name"].replace("_", "-")
+            argname = _cli_arg_name(opt_arg["name"])
             argdoc = self.get_parameter_doc(opt_arg)
             if opt_arg["default"] is False:
                 action_parser.add_argument(
@@ -10557,29 +1843,20 @@ class CommandLine(object):
         @param kwargs: Keyword args for the C{parse_args} call.
         """
 
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        sys.stdout = StringIO()
-        sys.stderr = StringIO()
-
+        stdout = StringIO()
+        stderr = StringIO()
         try:
-            try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
                 return parse_args(*args, **kwargs)
-            except SystemExit as e:
-                code = e.code
-                stdout = sys.stdout.getvalue()
-                stderr = sys.stderr.getvalue()
-                raise UsageError(stdout, stderr, code)
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
-
-    def format_main_usage(self, parser, actions):
+        except SystemExit as e:
+            raise UsageError(stdout.getvalue(), stderr.getvalue(), e.code)
+
+    def format_main_usage(self, parser, action_names):
         """
         Format a help display for the command line
 
         @param parser: The main argparse object for the program.
-        @param actions: The actions available.
+        @param action_names: The names of the available actions.
         @returns: A formatted help string.
         """
 
@@ -10593,8 +1870,8 @@ class CommandLine(object):
             parser_help,
         ]
         # Add action docs
-        for action in actions:
-            help_lines.append("  %s" % action.name)
+        for name in action_names:
+            help_lines.append("  %s" % name)
         help_lines.append(
             "\nType '%(prog)s help ACTION' for help on a specific action.\n"
             % {"prog": prog}
@@ -10615,18 +1892,32 @@ class CommandLine(object):
             doc += " %s" % (suffix,)
         return doc
 
-    def get_actions(self, schema, version):
+    def get_action_builders(self, schema, version):
         """
-        Return a list of data structures representing callable actions provided
-        by the API, based on the schema.
+        Return a mapping of command-line action name to a zero-argument
+        callable building the corresponding L{_Action}.
+
+        This is the cheap first phase of action resolution: listing and
+        validating action names needs only the names, so the full
+        descriptors (argument partitioning, overridden parameters) are
+        built on demand for the one action actually dispatched.
 
         @param schema: The schema, as returned from L{load_schema}.
         @param version: The API version to use.
         """
 
-        overridden_apis = API.overridden_apis
-        actions = []
-        for name, version_handlers in list(schema.items()):
+        overridden_apis = _get_api_classes()[0].overridden_apis
+        builders = {}
+
+        def schema_builder(name, schema_action):
+            return lambda: self._get_action_from_schema(name, schema_action)
+
+        def override_builder(action_name, override_data):
+            return lambda: self._get_overridden_action(
+                schema, version, action_name, override_data
+            )
+
+        for name, version_handlers in schema.items():
             if name in overridden_apis:
                 # Don't add the base schema if it's been overridden; we don't
                 # want duplicate actions.
@@ -10635,35 +1926,73 @@ class CommandLine(object):
             if schema_action is None:
                 # This action is not supported by this API version
                 continue
-            actions.append(self._get_action_from_schema(name, schema_action))
+            builders[self._get_cmdline_name(name, schema_action)] = schema_builder(
+                name, schema_action
+            )
 
-        for action_name, override_data in list(overridden_apis.items()):
+        for action_name, override_data in overridden_apis.items():
             if action_name not in schema:
                 # We ignore overridden APIs that aren't in the schema because
                 # tests override the schema without necessarily providing all
                 # the APIs that we override by default.
                 continue
-            overridden_schema = copy.deepcopy(schema[action_name][version])
-            for parameter in overridden_schema["parameters"]:
-                if parameter["name"] in override_data["replace_args"]:
-                    replacement = override_data["replace_args"][parameter["name"]]
-                    parameter.clear()
-                    parameter.update(replacement)
-            overridden_doc = override_data.get("doc")
-            if overridden_doc:
-                overridden_schema["doc"] = overridden_doc
-
-            actions.append(
-                self._get_action_from_schema(
-                    action_name,
-                    overridden_schema,
-                    overridden_method_name=override_data["method"],
-                )
-            )
+            schema_action = schema[action_name][version]
+            builders[
+                self._get_cmdline_name(action_name, schema_action)
+            ] = override_builder(action_name, override_data)
+
+        for action in _get_api_classes()[0].extra_actions:
+            builders[action.name] = lambda action=action: action
+
+        return builders
+
+    def get_actions(self, schema, version):
+        """
+        Return a list of data structures representing callable actions provided
+        by the API, based on the schema.
+
+        @param schema: The schema, as returned from L{load_schema}.
+        @param version: The API version to use.
+        """
+
+        return sorted(
+            build() for build in self.get_action_builders(schema, version).values()
+        )
+
+    def _get_overridden_action(self, schema, version, action_name, override_data):
+        """
+        Build the L{_Action} for an overridden API, substituting the
+        replaced arguments and documentation from C{overridden_apis}.
+        """
+
+        # A shallow copy is enough: the parameter sequence is rebuilt below
+        # and the remaining values are never mutated.
+        overridden_schema = dict(schema[action_name][version])
+        replace_args = override_data["replace_args"]
+        overridden_schema["parameters"] = [
+            replace_args.get(parameter["name"], parameter)
+            for parameter in overridden_schema["parameters"]
+        ]
+        overridden_doc = override_data.get("doc")
+        if overridden_doc:
+            overridden_schema["doc"] = overridden_doc
+
+        return self._get_action_from_schema(
+            action_name,
+            overridden_schema,
+            overridden_method_name=override_data["method"],
+        )
 
-        actions.extend(API.extra_actions)
+    def _get_cmdline_name(self, name, schema_action):
+        """
+        Compute the command-line name for an action without building its
+        full descriptor.
+        """
 
-        return sorted(actions)
+        cli_name = schema_action.get("cli_name")
+        if cli_name is not None:
+            return cli_name
+        return _lowercase_api_name(name).replace("_", "-")
 
     def _get_action_from_schema(self, name, schema_action, overridden_method_name=None):
         """
@@ -10674,22 +2003,21 @@ class CommandLine(object):
         cli_name = schema_action.get("cli_name")
         cmdline_name = method_name.replace("_", "-") if cli_name is None else cli_name
         action_doc = schema_action["doc"]
-        req_args = [
-            parameter
-            for parameter in schema_action["parameters"]
-            if not parameter.get("optional")
-        ]
-        opt_args = [
-            parameter
-            for parameter in schema_action["parameters"]
-            if parameter.get("optional")
-        ]
+        req_args = []
+        opt_args = []
+        for parameter in schema_action["parameters"]:
+            if parameter.get("optional"):
+                opt_args.append(parameter)
+            else:
+                req_args.append(parameter)
         if overridden_method_name:
             method_name = overridden_method_name
         return _Action(cmdline_name, method_name, action_doc, req_args, opt_args)
 
 
-def main(argv, stdout, stderr, exit, environ, schema=_schema):
+def main(argv, stdout, stderr, exit, environ, schema=None):
+    if schema is None:
+        schema = load_schema()
     return CommandLine(stdout, stderr, exit, environ).main(argv, schema)
 
 
@@ -0,0 +1,7101 @@
+# Copyright (c) 2020 Jiří Altman <jiri.altman@konicaminolta.cz>
+# Copyright (c) 2005-2013 Canonical Limited.  All rights reserved.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+"""Landscape API schema data.
+
+This module only holds the big C{SCHEMA} dict describing every API action
+for each supported API version.  It is imported lazily by
+C{base.load_schema}, which caches the parsed dict in a marshalled sidecar
+file so that regular startups do not pay for compiling this literal.
+
+Generated by tools/generate_schemas.py; do not hand-edit the literal.
+"""
+
+SCHEMA = {'AcceptPendingComputers': {'2011-08-01': {'doc': '\n'
+                                                  '    Accept a list of pending '
+                                                  'computers associated with the '
+                                                  'account used for\n'
+                                                  '    authentication.',
+                                           'errors': [{'code': 'UnknownAccessGroup'},
+                                                      {'code': 'InsufficientLicenses'},
+                                                      {'code': 'UnknownComputer'}],
+                                           'name': 'AcceptPendingComputers',
+                                           'parameters': [{'doc': 'A list of computer '
+                                                                  'IDs to accept.',
+                                                           'item': {'type': 'integer'},
+                                                           'name': 'computer_ids',
+                                                           'type': 'list'},
+                                                          {'default': {},
+                                                           'doc': 'A mapping from '
+                                                                  'pending computer '
+                                                                  'IDs to existing '
+                                                                  'ones.',
+                                                           'key': {'doc': 'The ID of '
+                                                                          'the pending '
+                                                                          'computer.',
+                                                                   'type': 'integer'},
+                                                           'name': 'existing_ids',
+                                                           'optional': True,
+                                                           'type': 'mapping',
+                                                           'value': {'doc': 'The ID of '
+                                                                            'the '
+                                                                            'computer '
+                                                                            'to '
+                                                                            'replace.',
+                                                                     'type': 'integer'}},
+                                                          {'default': None,
+                                                           'doc': 'The access group to '
+                                                                  'put the computers '
+                                                                  'into',
+                                                           'name': 'access_group',
+                                                           'optional': True,
+                                                           'type': 'unicode'}],
+                                           'result': {}},
+                            '2013-11-04': {'doc': '\n'
+                                                  '    Accept a list of pending '
+                                                  'computers associated with the '
+                                                  'account used for\n'
+                                                  '    authentication.',
+                                           'errors': [{'code': 'UnknownAccessGroup'},
+                                                      {'code': 'InsufficientLicenses'},
+                                                      {'code': 'UnknownComputer'}],
+                                           'name': 'AcceptPendingComputers',
+                                           'parameters': [{'doc': 'A list of computer '
+                                                                  'IDs to accept.',
+                                                           'item': {'type': 'integer'},
+                                                           'name': 'computer_ids',
+                                                           'type': 'list'},
+                                                          {'default': {},
+                                                           'doc': 'A mapping from '
+                                                                  'pending computer '
+                                                                  'IDs to existing '
+                                                                  'ones.',
+                                                           'key': {'doc': 'The ID of '
+                                                                          'the pending '
+                                                                          'computer.',
+                                                                   'type': 'integer'},
+                                                           'name': 'existing_ids',
+                                                           'optional': True,
+                                                           'type': 'mapping',
+                                                           'value': {'doc': 'The ID of '
+                                                                            'the '
+                                                                            'computer '
+                                                                            'to '
+                                                                            'replace.',
+                                                                     'type': 'integer'}},
+                                                          {'default': None,
+                                                           'doc': 'The access group to '
+                                                                  'put the computers '
+                                                                  'into',
+                                                           'name': 'access_group',
+                                                           'optional': True,
+                                                           'type': 'unicode'}],
+                                           'result': {}}},
+ 'AddAPTSourcesToRepositoryProfile': {'2011-08-01': {'doc': 'Add APT sources to a '
+                                                            'repository profile.\n'
+                                                            '            An activity '
+                                                            'will be created to add '
+                                                            'the given source to the '
+                                                            'the\n'
+                                                            '            computers '
+                                                            'associated with the given '
+                                                            'profile.',
+                                                     'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                                {'code': 'Unauthorised'},
+                                                                {'code': 'UnknownAPTSource'}],
+                                                     'name': 'AddAPTSourcesToRepositoryProfile',
+                                                     'parameters': [{'doc': 'Name of '
+                                                                            'the '
+                                                                            'repository '
+                                                                            'profile.',
+                                                                     'name': 'name',
+                                                                     'type': 'unicode'},
+                                                                    {'doc': 'The names '
+                                                                            'of the '
+                                                                            'APT '
+                                                                            'sources '
+                                                                            'to add.',
+                                                                     'item': {'type': 'unicode'},
+                                                                     'name': 'apt_sources',
+                                                                     'type': 'list'}],
+                                                     'result': {}},
+                                      '2013-11-04': {'doc': 'Add APT sources to a '
+                                                            'repository profile.\n'
+                                                            '            An activity '
+                                                            'will be created to add '
+                                                            'the given source to the '
+                                                            'the\n'
+                                                            '            computers '
+                                                            'associated with the given '
+                                                            'profile.',
+                                                     'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                                {'code': 'Unauthorised'},
+                                                                {'code': 'UnknownAPTSource'}],
+                                                     'name': 'AddAPTSourcesToRepositoryProfile',
+                                                     'parameters': [{'doc': 'Name of '
+                                                                            'the '
+                                                                            'repository '
+                                                                            'profile.',
+                                                                     'name': 'name',
+                                                                     'type': 'unicode'},
+                                                                    {'doc': 'The names '
+                                                                            'of the '
+                                                                            'APT '
+                                                                            'sources '
+                                                                            'to add.',
+                                                                     'item': {'type': 'unicode'},
+                                                                     'name': 'apt_sources',
+                                                                     'type': 'list'}],
+                                                     'result': {}}},
+ 'AddAccessGroupsToRole': {'2011-08-01': {'doc': 'Add the given access groups to a '
+                                                 'role.',
+                                          'errors': [{'code': 'UnknownRole'},
+                                                     {'code': 'UnknownAccessGroups'},
+                                                     {'code': 'ReadOnlyRole'}],
+                                          'name': 'AddAccessGroupsToRole',
+                                          'parameters': [{'doc': 'The name of the role '
+                                                                 'to modify.',
+                                                          'name': 'name',
+                                                          'type': 'unicode'},
+                                                         {'doc': 'A list of names of '
+                                                                 'access groups to add '
+                                                                 'to the role.',
+                                                          'item': {'type': 'unicode'},
+                                                          'name': 'access_groups',
+                                                          'type': 'list'}],
+                                          'result': {}},
+                           '2013-11-04': {'doc': 'Add the given access groups to a '
+                                                 'role.',
+                                          'errors': [{'code': 'UnknownRole'},
+                                                     {'code': 'UnknownAccessGroups'},
+                                                     {'code': 'ReadOnlyRole'}],
+                                          'name': 'AddAccessGroupsToRole',
+                                          'parameters': [{'doc': 'The name of the role '
+                                                                 'to modify.',
+                                                          'name': 'name',
+                                                          'type': 'unicode'},
+                                                         {'doc': 'A list of names of '
+                                                                 'access groups to add '
+                                                                 'to the role.',
+                                                          'item': {'type': 'unicode'},
+                                                          'name': 'access_groups',
+                                                          'type': 'list'}],
+                                          'result': {}}},
+ 'AddAnnotationToComputers': {'2011-08-01': {'doc': '\n'
+                                                    '    Add annotation key and '
+                                                    'optional value to a selection of '
+                                                    'computers.',
+                                             'errors': [{'code': 'InvalidAnnotationKey'},
+                                                        {'code': 'InvalidQuery'}],
+                                             'name': 'AddAnnotationToComputers',
+                                             'parameters': [{'doc': 'A query string '
+                                                                    'used to select '
+                                                                    'the computers to '
+                                                                    'which to add the '
+                                                                    'annotation.',
+                                                             'name': 'query',
+                                                             'type': 'unicode'},
+                                                            {'doc': 'Annotation key to '
+                                                                    'add to the '
+                                                                    'selected '
+                                                                    'computers.',
+                                                             'name': 'key',
+                                                             'type': 'unicode'},
+                                                            {'default': None,
+                                                             'doc': 'Annotation value '
+                                                                    'associated with '
+                                                                    'the provided key '
+                                                                    'to add to the '
+                                                                    'selected '
+                                                                    'computers.',
+                                                             'name': 'value',
+                                                             'optional': True,
+                                                             'type': 'unicode'}],
+                                             'result': {}},
+                              '2013-11-04': {'doc': '\n'
+                                                    '    Add annotation key and '
+                                                    'optional value to a selection of '
+                                                    'computers.',
+                                             'errors': [{'code': 'InvalidAnnotationKey'},
+                                                        {'code': 'InvalidQuery'}],
+                                             'name': 'AddAnnotationToComputers',
+                                             'parameters': [{'doc': 'A query string '
+                                                                    'used to select '
+                                                                    'the computers to '
+                                                                    'which to add the '
+                                                                    'annotation.',
+                                                             'name': 'query',
+                                                             'type': 'unicode'},
+                                                            {'doc': 'Annotation key to '
+                                                                    'add to the '
+                                                                    'selected '
+                                                                    'computers.',
+                                                             'name': 'key',
+                                                             'type': 'unicode'},
+                                                            {'default': None,
+                                                             'doc': 'Annotation value '
+                                                                    'associated with '
+                                                                    'the provided key '
+                                                                    'to add to the '
+                                                                    'selected '
+                                                                    'computers.',
+                                                             'name': 'value',
+                                                             'optional': True,
+                                                             'type': 'unicode'}],
+                                             'result': {}}},
+ 'AddPackageFiltersToPocket': {'2011-08-01': {'doc': '\n'
+                                                     '    Add package filters to a '
+                                                     'repository pocket.  The pocket '
+                                                     'must be in pull\n'
+                                                     '    mode and support '
+                                                     'blacklist/whitelist filtering.\n'
+                                                     '    ',
+                                              'errors': [{'code': 'UnknownPocket'},
+                                                         {'code': 'UnknownSeries'},
+                                                         {'code': 'InvalidPocketMode'},
+                                                         {'code': 'UnknownDistribution'},
+                                                         {'code': 'NoPocketFiltering'},
+                                                         {'code': 'OperationInProgress'}],
+                                              'name': 'AddPackageFiltersToPocket',
+                                              'parameters': [{'doc': 'The name of the '
+                                                                     'pocket to '
+                                                                     'operate on.',
+                                                              'name': 'name',
+                                                              'type': 'unicode'},
+                                                             {'doc': 'The name of the '
+                                                                     'series '
+                                                                     'containing the '
+                                                                     'pocket.',
+                                                              'name': 'series',
+                                                              'type': 'unicode'},
+                                                             {'doc': 'The name of the '
+                                                                     'distribution '
+                                                                     'containing the '
+                                                                     'series.',
+                                                              'name': 'distribution',
+                                                              'type': 'unicode'},
+                                                             {'doc': 'A list of names '
+                                                                     'of packages to '
+                                                                     'be added or '
+                                                                     'removed from the '
+                                                                     'pocket filter.',
+                                                              'item': {'type': 'unicode'},
+                                                              'name': 'packages',
+                                                              'type': 'list'}],
+                                              'result': {}},
+                               '2013-11-04': {'doc': '\n'
+                                                     '    Add package filters to a '
+                                                     'repository pocket.  The pocket '
+                                                     'must be in pull\n'
+                                                     '    mode and support '
+                                                     'blacklist/whitelist filtering.\n'
+                                                     '    ',
+                                              'errors': [{'code': 'UnknownPocket'},
+                                                         {'code': 'UnknownSeries'},
+                                                         {'code': 'InvalidPocketMode'},
+                                                         {'code': 'UnknownDistribution'},
+                                                         {'code': 'NoPocketFiltering'},
+                                                         {'code': 'OperationInProgress'}],
+                                              'name': 'AddPackageFiltersToPocket',
+                                              'parameters': [{'doc': 'The name of the '
+                                                                     'pocket to '
+                                                                     'operate on.',
+                                                              'name': 'name',
+                                                              'type': 'unicode'},
+                                                             {'doc': 'The name of the '
+                                                                     'series '
+                                                                     'containing the '
+                                                                     'pocket.',
+                                                              'name': 'series',
+                                                              'type': 'unicode'},
+                                                             {'doc': 'The name of the '
+                                                                     'distribution '
+                                                                     'containing the '
+                                                                     'series.',
+                                                              'name': 'distribution',
+                                                              'type': 'unicode'},
+                                                             {'doc': 'A list of names '
+                                                                     'of packages to '
+                                                                     'be added or '
+                                                                     'removed from the '
+                                                                     'pocket filter.',
+                                                              'item': {'type': 'unicode'},
+                                                              'name': 'packages',
+                                                              'type': 'list'}],
+                                              'result': {}}},
+ 'AddPermissionsToRole': {'2011-08-01': {'doc': 'Add permissions to a role.',
+                                         'errors': [{'code': 'UnknownRole'},
+                                                    {'code': 'ReadOnlyRole'},
+                                                    {'code': 'InvalidRolePermissions'}],
+                                         'name': 'AddPermissionsToRole',
+                                         'parameters': [{'doc': 'The name of the role '
+                                                                'to modify.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'},
+                                                        {'doc': 'A list of permissions '
+                                                                'to add.',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'permissions',
+                                                         'type': 'list'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Add permissions to a role.',
+                                         'errors': [{'code': 'UnknownRole'},
+                                                    {'code': 'ReadOnlyRole'},
+                                                    {'code': 'InvalidRolePermissions'}],
+                                         'name': 'AddPermissionsToRole',
+                                         'parameters': [{'doc': 'The name of the role '
+                                                                'to modify.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'},
+                                                        {'doc': 'A list of permissions '
+                                                                'to add.',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'permissions',
+                                                         'type': 'list'}],
+                                         'result': {}}},
+ 'AddPersonsToRole': {'2011-08-01': {'doc': 'Add permissions to a role.',
+                                     'errors': [{'code': 'UnknownRole'},
+                                                {'code': 'UnknownPersonEmails'}],
+                                     'name': 'AddPersonsToRole',
+                                     'parameters': [{'doc': 'The name of the role to '
+                                                            'modify.',
+                                                     'name': 'name',
+                                                     'type': 'unicode'},
+                                                    {'doc': 'A list of emails of '
+                                                            'persons to add.',
+                                                     'item': {'type': 'unicode'},
+                                                     'name': 'persons',
+                                                     'type': 'list'}],
+                                     'result': {}},
+                      '2013-11-04': {'doc': 'Add permissions to a role.',
+                                     'errors': [{'code': 'UnknownRole'},
+                                                {'code': 'UnknownPersonEmails'}],
+                                     'name': 'AddPersonsToRole',
+                                     'parameters': [{'doc': 'The name of the role to '
+                                                            'modify.',
+                                                     'name': 'name',
+                                                     'type': 'unicode'},
+                                                    {'doc': 'A list of emails of '
+                                                            'persons to add.',
+                                                     'item': {'type': 'unicode'},
+                                                     'name': 'persons',
+                                                     'type': 'list'}],
+                                     'result': {}}},
+ 'AddPocketsToRepositoryProfile': {'2011-08-01': {'doc': 'Add repository pockets to a '
+                                                         'repository profile.\n'
+                                                         '            An activity will '
+                                                         'be created to add the given '
+                                                         'pockets to the APT\n'
+                                                         '            sources of the '
+                                                         'computers associated with '
+                                                         'the given profile. ',
+                                                  'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                             {'code': 'Unauthorised'},
+                                                             {'code': 'UnknownDistribution'},
+                                                             {'code': 'UnknownPocket'},
+                                                             {'code': 'UnknownSeries'}],
+                                                  'name': 'AddPocketsToRepositoryProfile',
+                                                  'parameters': [{'doc': 'Name of the '
+                                                                         'repository '
+                                                                         'profile.',
+                                                                  'name': 'name',
+                                                                  'type': 'unicode'},
+                                                                 {'doc': 'The names of '
+                                                                         'the pockets '
+                                                                         'to add.',
+                                                                  'item': {'type': 'unicode'},
+                                                                  'name': 'pockets',
+                                                                  'type': 'list'},
+                                                                 {'doc': 'The name of '
+                                                                         'the series '
+                                                                         'the pockets '
+                                                                         'belongs to.',
+                                                                  'name': 'series',
+                                                                  'type': 'unicode'},
+                                                                 {'doc': 'The name of '
+                                                                         'the '
+                                                                         'distribution '
+                                                                         'the series '
+                                                                         'belongs to.',
+                                                                  'name': 'distribution',
+                                                                  'type': 'unicode'}],
+                                                  'result': {}},
+                                   '2013-11-04': {'doc': 'Add repository pockets to a '
+                                                         'repository profile.\n'
+                                                         '            An activity will '
+                                                         'be created to add the given '
+                                                         'pockets to the APT\n'
+                                                         '            sources of the '
+                                                         'computers associated with '
+                                                         'the given profile. ',
+                                                  'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                             {'code': 'Unauthorised'},
+                                                             {'code': 'UnknownDistribution'},
+                                                             {'code': 'UnknownPocket'},
+                                                             {'code': 'UnknownSeries'}],
+                                                  'name': 'AddPocketsToRepositoryProfile',
+                                                  'parameters': [{'doc': 'Name of the '
+                                                                         'repository '
+                                                                         'profile.',
+                                                                  'name': 'name',
+                                                                  'type': 'unicode'},
+                                                                 {'doc': 'The names of '
+                                                                         'the pockets '
+                                                                         'to add.',
+                                                                  'item': {'type': 'unicode'},
+                                                                  'name': 'pockets',
+                                                                  'type': 'list'},
+                                                                 {'doc': 'The name of '
+                                                                         'the series '
+                                                                         'the pockets '
+                                                                         'belongs to.',
+                                                                  'name': 'series',
+                                                                  'type': 'unicode'},
+                                                                 {'doc': 'The name of '
+                                                                         'the '
+                                                                         'distribution '
+                                                                         'the series '
+                                                                         'belongs to.',
+                                                                  'name': 'distribution',
+                                                                  'type': 'unicode'}],
+                                                  'result': {}}},
+ 'AddTagsToComputers': {'2011-08-01': {'doc': 'Add tags to a selection of computers.',
+                                       'errors': [{'code': 'InvalidQuery'},
+                                                  {'code': 'InvalidTag'}],
+                                       'name': 'AddTagsToComputers',
+                                       'parameters': [{'doc': 'A query string used to '
+                                                              'select the computers to '
+                                                              'add tags to.',
+                                                       'name': 'query',
+                                                       'type': 'unicode'},
+                                                      {'doc': 'Tag names to be '
+                                                              'applied.',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'tags',
+                                                       'type': 'list'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': 'Add tags to a selection of computers.',
+                                       'errors': [{'code': 'InvalidQuery'},
+                                                  {'code': 'InvalidTag'}],
+                                       'name': 'AddTagsToComputers',
+                                       'parameters': [{'doc': 'A query string used to '
+                                                              'select the computers to '
+                                                              'add tags to.',
+                                                       'name': 'query',
+                                                       'type': 'unicode'},
+                                                      {'doc': 'Tag names to be '
+                                                              'applied.',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'tags',
+                                                       'type': 'list'}],
+                                       'result': {}}},
+ 'AddUploaderGPGKeysToPocket': {'2011-08-01': {'doc': '\n'
+                                                      '    Add GPG keys to a '
+                                                      'repository pocket in upload '
+                                                      'mode to validate uploaded\n'
+                                                      '    packages.\n'
+                                                      '    ',
+                                               'errors': [{'code': 'GPGKeyNotAssociated'},
+                                                          {'code': 'UnknownSeries'},
+                                                          {'code': 'UnknownDistribution'},
+                                                          {'code': 'UnknownGPGKey'},
+                                                          {'code': 'UnknownPocket'},
+                                                          {'code': 'GPGKeyAlreadyAssociated'},
+                                                          {'code': 'InvalidPocketMode'},
+                                                          {'code': 'OperationInProgress'}],
+                                               'name': 'AddUploaderGPGKeysToPocket',
+                                               'parameters': [{'doc': 'The name of the '
+                                                                      'pocket on which '
+                                                                      'to associate '
+                                                                      'keys.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'The name of the '
+                                                                      'series '
+                                                                      'containing the '
+                                                                      'pocket.',
+                                                               'name': 'series',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'The name of the '
+                                                                      'distribution '
+                                                                      'containing the '
+                                                                      'series.',
+                                                               'name': 'distribution',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'A list of GPG '
+                                                                      'keys on which '
+                                                                      'to operate.',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'gpg_keys',
+                                                               'type': 'list'}],
+                                               'result': {}},
+                                '2013-11-04': {'doc': '\n'
+                                                      '    Add GPG keys to a '
+                                                      'repository pocket in upload '
+                                                      'mode to validate uploaded\n'
+                                                      '    packages.\n'
+                                                      '    ',
+                                               'errors': [{'code': 'GPGKeyNotAssociated'},
+                                                          {'code': 'UnknownSeries'},
+                                                          {'code': 'UnknownDistribution'},
+                                                          {'code': 'UnknownGPGKey'},
+                                                          {'code': 'UnknownPocket'},
+                                                          {'code': 'GPGKeyAlreadyAssociated'},
+                                                          {'code': 'InvalidPocketMode'},
+                                                          {'code': 'OperationInProgress'}],
+                                               'name': 'AddUploaderGPGKeysToPocket',
+                                               'parameters': [{'doc': 'The name of the '
+                                                                      'pocket on which '
+                                                                      'to associate '
+                                                                      'keys.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'The name of the '
+                                                                      'series '
+                                                                      'containing the '
+                                                                      'pocket.',
+                                                               'name': 'series',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'The name of the '
+                                                                      'distribution '
+                                                                      'containing the '
+                                                                      'series.',
+                                                               'name': 'distribution',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'A list of GPG '
+                                                                      'keys on which '
+                                                                      'to operate.',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'gpg_keys',
+                                                               'type': 'list'}],
+                                               'result': {}}},
+ 'ApproveActivities': {'2011-08-01': {'doc': 'Approve activities associated with the '
+                                             'current account.',
+                                      'errors': [{'code': 'InvalidQuery'},
+                                                 {'code': 'InvalidActivityStatusChange'}],
+                                      'name': 'ApproveActivities',
+                                      'parameters': [{'doc': 'A query string used to '
+                                                             'select activities on '
+                                                             'which to operate.',
+                                                      'name': 'query',
+                                                      'type': 'unicode'}],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Approve activities associated with the '
+                                             'current account.',
+                                      'errors': [{'code': 'InvalidQuery'},
+                                                 {'code': 'InvalidActivityStatusChange'}],
+                                      'name': 'ApproveActivities',
+                                      'parameters': [{'doc': 'A query string used to '
+                                                             'select activities on '
+                                                             'which to operate.',
+                                                      'name': 'query',
+                                                      'type': 'unicode'}],
+                                      'result': {}}},
+ 'AssociateAlert': {'2011-08-01': {'doc': '\n'
+                                          '    Associate an alert to computers with '
+                                          'specific tags or to all computers.\n'
+                                          "    If a tag with a given name doesn't "
+                                          'exist, it will be automatically\n'
+                                          "    created. An 'all_computers' value of "
+                                          "'true' and a list of tags are mutually\n"
+                                          '    exclusive. Only one or the other may be '
+                                          'passed.',
+                                   'errors': [{'code': 'UnknownAlertTypeError'},
+                                              {'code': 'InvalidParameterCombination'},
+                                              {'code': 'UnknownTag'},
+                                              {'code': 'InvalidAlertTypeError'}],
+                                   'name': 'AssociateAlert',
+                                   'parameters': [{'doc': 'Name of the entity.',
+                                                   'name': 'name',
+                                                   'type': 'unicode'},
+                                                  {'default': [],
+                                                   'doc': 'Tags to change entity '
+                                                          'association for',
+                                                   'item': {'type': 'unicode'},
+                                                   'name': 'tags',
+                                                   'optional': True,
+                                                   'type': 'list'},
+                                                  {'default': False,
+                                                   'doc': 'If True, change the '
+                                                          "'all_computers' flag state "
+                                                          'for the entity. If the flag '
+                                                          'is enabled, associated tags '
+                                                          'will be kept, but they will '
+                                                          'not be effective until the '
+                                                          'flag is disabled.',
+                                                   'name': 'all_computers',
+                                                   'optional': True,
+                                                   'type': 'boolean'}],
+                                   'result': {}},
+                    '2013-11-04': {'doc': '\n'
+                                          '    Associate an alert to computers with '
+                                          'specific tags or to all computers.\n'
+                                          "    If a tag with a given name doesn't "
+                                          'exist, it will be automatically\n'
+                                          "    created. An 'all_computers' value of "
+                                          "'true' and a list of tags are mutually\n"
+                                          '    exclusive. Only one or the other may be '
+                                          'passed.',
+                                   'errors': [{'code': 'UnknownAlertTypeError'},
+                                              {'code': 'InvalidParameterCombination'},
+                                              {'code': 'UnknownTag'},
+                                              {'code': 'InvalidAlertTypeError'}],
+                                   'name': 'AssociateAlert',
+                                   'parameters': [{'doc': 'Name of the entity.',
+                                                   'name': 'name',
+                                                   'type': 'unicode'},
+                                                  {'default': [],
+                                                   'doc': 'Tags to change entity '
+                                                          'association for',
+                                                   'item': {'type': 'unicode'},
+                                                   'name': 'tags',
+                                                   'optional': True,
+                                                   'type': 'list'},
+                                                  {'default': False,
+                                                   'doc': 'If True, change the '
+                                                          "'all_computers' flag state "
+                                                          'for the entity. If the flag '
+                                                          'is enabled, associated tags '
+                                                          'will be kept, but they will '
+                                                          'not be effective until the '
+                                                          'flag is disabled.',
+                                                   'name': 'all_computers',
+                                                   'optional': True,
+                                                   'type': 'boolean'}],
+                                   'result': {}}},
+ 'AssociatePackageProfile': {'2011-08-01': {'doc': '\n'
+                                                   '    Associate a package profile to '
+                                                   'computers with specific tags or to '
+                                                   'all\n'
+                                                   '    computers. If a tag with a '
+                                                   "given name doesn't exist, it will "
+                                                   'be\n'
+                                                   '    automatically created.\n'
+                                                   '\n'
+                                                   "    An 'all_computers' value of "
+                                                   "'true' and a list of tags are "
+                                                   'mutually\n'
+                                                   '    exclusive. Only one or the '
+                                                   'other may be passed.',
+                                            'errors': [{'code': 'InvalidParameterCombination'},
+                                                       {'code': 'UnknownTag'},
+                                                       {'code': 'UnknownPackageProfileName'}],
+                                            'name': 'AssociatePackageProfile',
+                                            'parameters': [{'doc': 'Name of the '
+                                                                   'entity.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'},
+                                                           {'default': [],
+                                                            'doc': 'Tags to change '
+                                                                   'entity association '
+                                                                   'for',
+                                                            'item': {'type': 'unicode'},
+                                                            'name': 'tags',
+                                                            'optional': True,
+                                                            'type': 'list'},
+                                                           {'default': False,
+                                                            'doc': 'If True, change '
+                                                                   'the '
+                                                                   "'all_computers' "
+                                                                   'flag state for the '
+                                                                   'entity. If the '
+                                                                   'flag is enabled, '
+                                                                   'associated tags '
+                                                                   'will be kept, but '
+                                                                   'they will not be '
+                                                                   'effective until '
+                                                                   'the flag is '
+                                                                   'disabled.',
+                                                            'name': 'all_computers',
+                                                            'optional': True,
+                                                            'type': 'boolean'}],
+                                            'result': {}},
+                             '2013-11-04': {'doc': '\n'
+                                                   '    Associate a package profile to '
+                                                   'computers with specific tags or to '
+                                                   'all\n'
+                                                   '    computers. If a tag with a '
+                                                   "given name doesn't exist, it will "
+                                                   'be\n'
+                                                   '    automatically created.\n'
+                                                   '\n'
+                                                   "    An 'all_computers' value of "
+                                                   "'true' and a list of tags are "
+                                                   'mutually\n'
+                                                   '    exclusive. Only one or the '
+                                                   'other may be passed.',
+                                            'errors': [{'code': 'InvalidParameterCombination'},
+                                                       {'code': 'UnknownTag'},
+                                                       {'code': 'UnknownPackageProfileName'}],
+                                            'name': 'AssociatePackageProfile',
+                                            'parameters': [{'doc': 'Name of the '
+                                                                   'entity.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'},
+                                                           {'default': [],
+                                                            'doc': 'Tags to change '
+                                                                   'entity association '
+                                                                   'for',
+                                                            'item': {'type': 'unicode'},
+                                                            'name': 'tags',
+                                                            'optional': True,
+                                                            'type': 'list'},
+                                                           {'default': False,
+                                                            'doc': 'If True, change '
+                                                                   'the '
+                                                                   "'all_computers' "
+                                                                   'flag state for the '
+                                                                   'entity. If the '
+                                                                   'flag is enabled, '
+                                                                   'associated tags '
+                                                                   'will be kept, but '
+                                                                   'they will not be '
+                                                                   'effective until '
+                                                                   'the flag is '
+                                                                   'disabled.',
+                                                            'name': 'all_computers',
+                                                            'optional': True,
+                                                            'type': 'boolean'}],
+                                            'result': {}}},
+ 'AssociateRemovalProfile': {'2011-08-01': {'doc': '\n'
+                                                   '    Associate a removal profile to '
+                                                   'computers with the specified '
+                                                   'tags,\n'
+                                                   '    or all computers.\n'
+                                                   '\n'
+                                                   '    tags and all_computers=true '
+                                                   'are mutually exclusive.',
+                                            'errors': [{'code': 'InvalidParameterCombination'},
+                                                       {'code': 'UnknownTag'},
+                                                       {'code': 'UnknownRemovalProfile'}],
+                                            'name': 'AssociateRemovalProfile',
+                                            'parameters': [{'doc': 'Name of the '
+                                                                   'entity.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'},
+                                                           {'default': [],
+                                                            'doc': 'Tags to change '
+                                                                   'entity association '
+                                                                   'for',
+                                                            'item': {'type': 'unicode'},
+                                                            'name': 'tags',
+                                                            'optional': True,
+                                                            'type': 'list'},
+                                                           {'default': False,
+                                                            'doc': 'If True, change '
+                                                                   'the '
+                                                                   "'all_computers' "
+                                                                   'flag state for the '
+                                                                   'entity. If the '
+                                                                   'flag is enabled, '
+                                                                   'associated tags '
+                                                                   'will be kept, but '
+                                                                   'they will not be '
+                                                                   'effective until '
+                                                                   'the flag is '
+                                                                   'disabled.',
+                                                            'name': 'all_computers',
+                                                            'optional': True,
+                                                            'type': 'boolean'}],
+                                            'result': {}},
+                             '2013-11-04': {'doc': '\n'
+                                                   '    Associate a removal profile to '
+                                                   'computers with the specified '
+                                                   'tags,\n'
+                                                   '    or all computers.\n'
+                                                   '\n'
+                                                   '    tags and all_computers=true '
+                                                   'are mutually exclusive.',
+                                            'errors': [{'code': 'InvalidParameterCombination'},
+                                                       {'code': 'UnknownTag'},
+                                                       {'code': 'UnknownRemovalProfile'}],
+                                            'name': 'AssociateRemovalProfile',
+                                            'parameters': [{'doc': 'Name of the '
+                                                                   'entity.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'},
+                                                           {'default': [],
+                                                            'doc': 'Tags to change '
+                                                                   'entity association '
+                                                                   'for',
+                                                            'item': {'type': 'unicode'},
+                                                            'name': 'tags',
+                                                            'optional': True,
+                                                            'type': 'list'},
+                                                           {'default': False,
+                                                            'doc': 'If True, change '
+                                                                   'the '
+                                                                   "'all_computers' "
+                                                                   'flag state for the '
+                                                                   'entity. If the '
+                                                                   'flag is enabled, '
+                                                                   'associated tags '
+                                                                   'will be kept, but '
+                                                                   'they will not be '
+                                                                   'effective until '
+                                                                   'the flag is '
+                                                                   'disabled.',
+                                                            'name': 'all_computers',
+                                                            'optional': True,
+                                                            'type': 'boolean'}],
+                                            'result': {}}},
+ 'AssociateRepositoryProfile': {'2011-08-01': {'doc': 'Associate repository profile to '
+                                                      'computers with specified tags\n'
+                                                      '            or to all '
+                                                      'computers.',
+                                               'errors': [{'code': 'InvalidParameterCombination'},
+                                                          {'code': 'UnknownTag'},
+                                                          {'code': 'UnknownRepositoryProfile'}],
+                                               'name': 'AssociateRepositoryProfile',
+                                               'parameters': [{'doc': 'Name of the '
+                                                                      'entity.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'default': [],
+                                                               'doc': 'Tags to change '
+                                                                      'entity '
+                                                                      'association for',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'tags',
+                                                               'optional': True,
+                                                               'type': 'list'},
+                                                              {'default': False,
+                                                               'doc': 'If True, change '
+                                                                      'the '
+                                                                      "'all_computers' "
+                                                                      'flag state for '
+                                                                      'the entity. If '
+                                                                      'the flag is '
+                                                                      'enabled, '
+                                                                      'associated tags '
+                                                                      'will be kept, '
+                                                                      'but they will '
+                                                                      'not be '
+                                                                      'effective until '
+                                                                      'the flag is '
+                                                                      'disabled.',
+                                                               'name': 'all_computers',
+                                                               'optional': True,
+                                                               'type': 'boolean'}],
+                                               'result': {}},
+                                '2013-11-04': {'doc': 'Associate repository profile to '
+                                                      'computers with specified tags\n'
+                                                      '            or to all '
+                                                      'computers.',
+                                               'errors': [{'code': 'InvalidParameterCombination'},
+                                                          {'code': 'UnknownTag'},
+                                                          {'code': 'UnknownRepositoryProfile'}],
+                                               'name': 'AssociateRepositoryProfile',
+                                               'parameters': [{'doc': 'Name of the '
+                                                                      'entity.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'default': [],
+                                                               'doc': 'Tags to change '
+                                                                      'entity '
+                                                                      'association for',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'tags',
+                                                               'optional': True,
+                                                               'type': 'list'},
+                                                              {'default': False,
+                                                               'doc': 'If True, change '
+                                                                      'the '
+                                                                      "'all_computers' "
+                                                                      'flag state for '
+                                                                      'the entity. If '
+                                                                      'the flag is '
+                                                                      'enabled, '
+                                                                      'associated tags '
+                                                                      'will be kept, '
+                                                                      'but they will '
+                                                                      'not be '
+                                                                      'effective until '
+                                                                      'the flag is '
+                                                                      'disabled.',
+                                                               'name': 'all_computers',
+                                                               'optional': True,
+                                                               'type': 'boolean'}],
+                                               'result': {}}},
+ 'AssociateUpgradeProfile': {'2011-08-01': {'doc': '\n'
+                                                   '    Associate an upgrade profile '
+                                                   'to computers with the specified '
+                                                   'tags,\n'
+                                                   '    or all computers.\n'
+                                                   '\n'
+                                                   '    tags and all_computers=true '
+                                                   'are mutually exclusive.',
+                                            'errors': [{'code': 'InvalidParameterCombination'},
+                                                       {'code': 'UnknownTag'},
+                                                       {'code': 'UnknownUpgradeProfile'}],
+                                            'name': 'AssociateUpgradeProfile',
+                                            'parameters': [{'doc': 'Name of the '
+                                                                   'entity.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'},
+                                                           {'default': [],
+                                                            'doc': 'Tags to change '
+                                                                   'entity association '
+                                                                   'for',
+                                                            'item': {'type': 'unicode'},
+                                                            'name': 'tags',
+                                                            'optional': True,
+                                                            'type': 'list'},
+                                                           {'default': False,
+                                                            'doc': 'If True, change '
+                                                                   'the '
+                                                                   "'all_computers' "
+                                                                   'flag state for the '
+                                                                   'entity. If the '
+                                                                   'flag is enabled, '
+                                                                   'associated tags '
+                                                                   'will be kept, but '
+                                                                   'they will not be '
+                                                                   'effective until '
+                                                                   'the flag is '
+                                                                   'disabled.',
+                                                            'name': 'all_computers',
+                                                            'optional': True,
+                                                            'type': 'boolean'}],
+                                            'result': {}},
+                             '2013-11-04': {'doc': '\n'
+                                                   '    Associate an upgrade profile '
+                                                   'to computers with the specified '
+                                                   'tags,\n'
+                                                   '    or all computers.\n'
+                                                   '\n'
+                                                   '    tags and all_computers=true '
+                                                   'are mutually exclusive.',
+                                            'errors': [{'code': 'InvalidParameterCombination'},
+                                                       {'code': 'UnknownTag'},
+                                                       {'code': 'UnknownUpgradeProfile'}],
+                                            'name': 'AssociateUpgradeProfile',
+                                            'parameters': [{'doc': 'Name of the '
+                                                                   'entity.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'},
+                                                           {'default': [],
+                                                            'doc': 'Tags to change '
+                                                                   'entity association '
+                                                                   'for',
+                                                            'item': {'type': 'unicode'},
+                                                            'name': 'tags',
+                                                            'optional': True,
+                                                            'type': 'list'},
+                                                           {'default': False,
+                                                            'doc': 'If True, change '
+                                                                   'the '
+                                                                   "'all_computers' "
+                                                                   'flag state for the '
+                                                                   'entity. If the '
+                                                                   'flag is enabled, '
+                                                                   'associated tags '
+                                                                   'will be kept, but '
+                                                                   'they will not be '
+                                                                   'effective until '
+                                                                   'the flag is '
+                                                                   'disabled.',
+                                                            'name': 'all_computers',
+                                                            'optional': True,
+                                                            'type': 'boolean'}],
+                                            'result': {}}},
+ 'CancelActivities': {'2011-08-01': {'doc': '\n'
+                                            '    Cancel activities associated with the '
+                                            'current account.\n'
+                                            '\n'
+                                            '    Returns a list of activities ids that '
+                                            'were cancelled.\n'
+                                            '    ',
+                                     'errors': [{'code': 'InvalidQuery'},
+                                                {'code': 'InvalidActivityStatusChange'}],
+                                     'name': 'CancelActivities',
+                                     'parameters': [{'doc': 'A query string used to '
+                                                            'select activities on '
+                                                            'which to operate.',
+                                                     'name': 'query',
+                                                     'type': 'unicode'}],
+                                     'result': {}},
+                      '2013-11-04': {'doc': '\n'
+                                            '    Cancel activities associated with the '
+                                            'current account.\n'
+                                            '\n'
+                                            '    Returns a list of activities ids that '
+                                            'were cancelled.\n'
+                                            '    ',
+                                     'errors': [{'code': 'InvalidQuery'},
+                                                {'code': 'InvalidActivityStatusChange'}],
+                                     'name': 'CancelActivities',
+                                     'parameters': [{'doc': 'A query string used to '
+                                                            'select activities on '
+                                                            'which to operate.',
+                                                     'name': 'query',
+                                                     'type': 'unicode'}],
+                                     'result': {}}},
+ 'ChangeComputersAccessGroup': {'2011-08-01': {'doc': 'Change the access group for a '
+                                                      'selection of computers.',
+                                               'errors': [{'code': 'UnknownAccessGroup'},
+                                                          {'code': 'InvalidQuery'},
+                                                          {'code': 'Unauthorised'},
+                                                          {'code': 'UnknownEntityIDs'}],
+                                               'name': 'ChangeComputersAccessGroup',
+                                               'parameters': [{'doc': 'A query string '
+                                                                      'used to select '
+                                                                      'the computers '
+                                                                      'to change '
+                                                                      'access group '
+                                                                      'for.',
+                                                               'name': 'query',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'The name of the '
+                                                                      'access group to '
+                                                                      'assign selected '
+                                                                      'computers to.',
+                                                               'name': 'access_group',
+                                                               'type': 'unicode'}],
+                                               'result': {}},
+                                '2013-11-04': {'doc': 'Change the access group for a '
+                                                      'selection of computers.',
+                                               'errors': [{'code': 'UnknownAccessGroup'},
+                                                          {'code': 'InvalidQuery'},
+                                                          {'code': 'Unauthorised'},
+                                                          {'code': 'UnknownEntityIDs'}],
+                                               'name': 'ChangeComputersAccessGroup',
+                                               'parameters': [{'doc': 'A query string '
+                                                                      'used to select '
+                                                                      'the computers '
+                                                                      'to change '
+                                                                      'access group '
+                                                                      'for.',
+                                                               'name': 'query',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'The name of the '
+                                                                      'access group to '
+                                                                      'assign selected '
+                                                                      'computers to.',
+                                                               'name': 'access_group',
+                                                               'type': 'unicode'}],
+                                               'result': {}}},
+ 'CopyPackageProfile': {'2011-08-01': {'doc': '\n'
+                                              '    Copy an existing package profile to '
+                                              'a package profile with a new name and\n'
+                                              '    optionally a different title and '
+                                              'description.\n'
+                                              '    ',
+                                       'errors': [{'code': 'UnknownAccessGroup'},
+                                                  {'code': 'UnknownPackageProfileName'},
+                                                  {'code': 'Unauthorised'},
+                                                  {'code': 'DuplicatePackageProfile'}],
+                                       'name': 'CopyPackageProfile',
+                                       'parameters': [{'doc': 'A name of the existing '
+                                                              'package profile to '
+                                                              'copy.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The profile name of the '
+                                                              'copied package profile.',
+                                                       'name': 'destination_name',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'A title for the new '
+                                                              'profile. If not '
+                                                              'specified, the title of '
+                                                              'the source profile is '
+                                                              'used.',
+                                                       'name': 'title',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'A description for the '
+                                                              'new profile. If not '
+                                                              'specified, the title of '
+                                                              'the source profile is '
+                                                              'used.',
+                                                       'name': 'description',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'Name of the access '
+                                                              'group to copy the '
+                                                              'profile to. Defaults to '
+                                                              "the origin's access "
+                                                              'group.',
+                                                       'name': 'access_group',
+                                                       'optional': True,
+                                                       'type': 'unicode'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': '\n'
+                                              '    Copy an existing package profile to '
+                                              'a package profile with a new name and\n'
+                                              '    optionally a different title and '
+                                              'description.\n'
+                                              '    ',
+                                       'errors': [{'code': 'UnknownAccessGroup'},
+                                                  {'code': 'UnknownPackageProfileName'},
+                                                  {'code': 'Unauthorised'},
+                                                  {'code': 'DuplicatePackageProfile'}],
+                                       'name': 'CopyPackageProfile',
+                                       'parameters': [{'doc': 'A name of the existing '
+                                                              'package profile to '
+                                                              'copy.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The profile name of the '
+                                                              'copied package profile.',
+                                                       'name': 'destination_name',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'A title for the new '
+                                                              'profile. If not '
+                                                              'specified, the title of '
+                                                              'the source profile is '
+                                                              'used.',
+                                                       'name': 'title',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'A description for the '
+                                                              'new profile. If not '
+                                                              'specified, the title of '
+                                                              'the source profile is '
+                                                              'used.',
+                                                       'name': 'description',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'Name of the access '
+                                                              'group to copy the '
+                                                              'profile to. Defaults to '
+                                                              "the origin's access "
+                                                              'group.',
+                                                       'name': 'access_group',
+                                                       'optional': True,
+                                                       'type': 'unicode'}],
+                                       'result': {}}},
+ 'CopyRole': {'2011-08-01': {'doc': 'Copy an existing access role to a role with a new '
+                                    'name.',
+                             'errors': [{'code': 'UnknownRole'},
+                                        {'code': 'InvalidRoleName'},
+                                        {'code': 'DuplicateRoleName'}],
+                             'name': 'CopyRole',
+                             'parameters': [{'doc': 'The name of the existing role.',
+                                             'name': 'name',
+                                             'type': 'unicode'},
+                                            {'doc': 'The name of the new role.',
+                                             'name': 'destination_name',
+                                             'type': 'unicode'},
+                                            {'default': None,
+                                             'doc': 'The description of the new role.',
+                                             'name': 'description',
+                                             'optional': True,
+                                             'type': 'unicode'}],
+                             'result': {}},
+              '2013-11-04': {'doc': 'Copy an existing access role to a role with a new '
+                                    'name.',
+                             'errors': [{'code': 'UnknownRole'},
+                                        {'code': 'InvalidRoleName'},
+                                        {'code': 'DuplicateRoleName'}],
+                             'name': 'CopyRole',
+                             'parameters': [{'doc': 'The name of the existing role.',
+                                             'name': 'name',
+                                             'type': 'unicode'},
+                                            {'doc': 'The name of the new role.',
+                                             'name': 'destination_name',
+                                             'type': 'unicode'},
+                                            {'default': None,
+                                             'doc': 'The description of the new role.',
+                                             'name': 'description',
+                                             'optional': True,
+                                             'type': 'unicode'}],
+                             'result': {}}},
+ 'CopyScript': {'2011-08-01': {'doc': 'Copy an existing script to a script with a new '
+                                      'name.',
+                               'errors': [{'code': 'UnknownAccessGroup'},
+                                          {'code': 'Unauthorised'},
+                                          {'code': 'DuplicateScript'},
+                                          {'code': 'UnknownScript'}],
+                               'name': 'CopyScript',
+                               'parameters': [{'doc': 'The identity of the existing '
+                                                      'script.',
+                                               'name': 'script_id',
+                                               'type': 'integer'},
+                                              {'doc': 'The title of the new script.',
+                                               'name': 'destination_title',
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The access group for the new '
+                                                      'script. It defaults to the same '
+                                                      'access group as the existing '
+                                                      'script.',
+                                               'name': 'access_group',
+                                               'optional': True,
+                                               'type': 'unicode'}],
+                               'result': {}},
+                '2013-11-04': {'doc': 'Copy an existing script to a script with a new '
+                                      'name.',
+                               'errors': [{'code': 'UnknownAccessGroup'},
+                                          {'code': 'Unauthorised'},
+                                          {'code': 'DuplicateScript'},
+                                          {'code': 'UnknownScript'}],
+                               'name': 'CopyScript',
+                               'parameters': [{'doc': 'The identity of the existing '
+                                                      'script.',
+                                               'name': 'script_id',
+                                               'type': 'integer'},
+                                              {'doc': 'The title of the new script.',
+                                               'name': 'destination_title',
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The access group for the new '
+                                                      'script. It defaults to the same '
+                                                      'access group as the existing '
+                                                      'script.',
+                                               'name': 'access_group',
+                                               'optional': True,
+                                               'type': 'unicode'}],
+                               'result': {}}},
+ 'CreateAPTSource': {'2011-08-01': {'doc': '\n'
+                                           '    Create an APT source in the account '
+                                           'used for authentication.\n'
+                                           '    ',
+                                    'errors': [{'code': 'Unauthorised'},
+                                               {'code': 'DuplicateAPTSource'},
+                                               {'code': 'InvalidAPTLine'}],
+                                    'name': 'CreateAPTSource',
+                                    'parameters': [{'doc': 'Name of the APT source. It '
+                                                           'must be unique within the '
+                                                           'account, start with an '
+                                                           'alphanumeric character and '
+                                                           'only contain lowercase '
+                                                           'letters, numbers and - or '
+                                                           '+ signs.',
+                                                    'name': 'name',
+                                                    'type': 'unicode'},
+                                                   {'doc': 'The APT line of the '
+                                                           'source.',
+                                                    'name': 'apt_line',
+                                                    'type': 'unicode'},
+                                                   {'default': None,
+                                                    'doc': 'Name of the GPG key used '
+                                                           'to sign the repository',
+                                                    'name': 'gpg_key',
+                                                    'optional': True,
+                                                    'type': 'unicode'},
+                                                   {'default': 'global',
+                                                    'doc': 'An optional name of the '
+                                                           'access group to create the '
+                                                           'APT source into.',
+                                                    'name': 'access_group',
+                                                    'optional': True,
+                                                    'type': 'unicode'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': '\n'
+                                           '    Create an APT source in the account '
+                                           'used for authentication.\n'
+                                           '    ',
+                                    'errors': [{'code': 'Unauthorised'},
+                                               {'code': 'DuplicateAPTSource'},
+                                               {'code': 'InvalidAPTLine'}],
+                                    'name': 'CreateAPTSource',
+                                    'parameters': [{'doc': 'Name of the APT source. It '
+                                                           'must be unique within the '
+                                                           'account, start with an '
+                                                           'alphanumeric character and '
+                                                           'only contain lowercase '
+                                                           'letters, numbers and - or '
+                                                           '+ signs.',
+                                                    'name': 'name',
+                                                    'type': 'unicode'},
+                                                   {'doc': 'The APT line of the '
+                                                           'source.',
+                                                    'name': 'apt_line',
+                                                    'type': 'unicode'},
+                                                   {'default': None,
+                                                    'doc': 'Name of the GPG key used '
+                                                           'to sign the repository',
+                                                    'name': 'gpg_key',
+                                                    'optional': True,
+                                                    'type': 'unicode'},
+                                                   {'default': 'global',
+                                                    'doc': 'An optional name of the '
+                                                           'access group to create the '
+                                                           'APT source into.',
+                                                    'name': 'access_group',
+                                                    'optional': True,
+                                                    'type': 'unicode'}],
+                                    'result': {}}},
+ 'CreateAccessGroup': {'2011-08-01': {'doc': 'Create a new access group.',
+                                      'errors': [{'code': 'DuplicateAccessGroup'},
+                                                 {'code': 'Unauthorised'},
+                                                 {'code': 'UnknownAccessGroup'}],
+                                      'name': 'CreateAccessGroup',
+                                      'parameters': [{'doc': 'The title of the access '
+                                                             'group.',
+                                                      'name': 'title',
+                                                      'type': 'unicode title'},
+                                                     {'default': None,
+                                                      'doc': 'The title of the parent '
+                                                             'access group.',
+                                                      'name': 'parent',
+                                                      'optional': True,
+                                                      'type': 'unicode'}],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Create a new access group.',
+                                      'errors': [{'code': 'DuplicateAccessGroup'},
+                                                 {'code': 'Unauthorised'},
+                                                 {'code': 'UnknownAccessGroup'}],
+                                      'name': 'CreateAccessGroup',
+                                      'parameters': [{'doc': 'The name of the access '
+                                                             'group.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'},
+                                                     {'default': None,
+                                                      'doc': 'Description of the '
+                                                             'access group.',
+                                                      'name': 'description',
+                                                      'optional': True,
+                                                      'type': 'unicode'},
+                                                     {'default': None,
+                                                      'doc': 'The name or ID of the '
+                                                             'parent access group.',
+                                                      'name': 'parent',
+                                                      'optional': True,
+                                                      'type': 'unicode'}],
+                                      'result': {}}},
+ 'CreateCloudOtps': {'2011-08-01': {'doc': '\n'
+                                           '    Create one-time passwords used for '
+                                           'registration of cloud instances.\n'
+                                           '    ',
+                                    'errors': [],
+                                    'name': 'CreateCloudOtps',
+                                    'parameters': [{'default': 1,
+                                                    'doc': 'The number of OTPs to '
+                                                           'create',
+                                                    'name': 'count',
+                                                    'optional': True,
+                                                    'type': 'integer'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': '\n'
+                                           '    Create one-time passwords used for '
+                                           'registration of cloud instances.\n'
+                                           '    ',
+                                    'errors': [],
+                                    'name': 'CreateCloudOtps',
+                                    'parameters': [{'default': 1,
+                                                    'doc': 'The number of OTPs to '
+                                                           'create',
+                                                    'name': 'count',
+                                                    'optional': True,
+                                                    'type': 'integer'}],
+                                    'result': {}}},
+ 'CreateDistribution': {'2011-08-01': {'doc': '\n'
+                                              '    Create a repository distribution '
+                                              'associated with the account.\n'
+                                              '    ',
+                                       'errors': [{'code': 'UnknownAccessGroup'},
+                                                  {'code': 'Unauthorised'},
+                                                  {'code': 'DuplicateDistribution'}],
+                                       'name': 'CreateDistribution',
+                                       'parameters': [{'doc': 'The name of the '
+                                                              'distribution. It must '
+                                                              'be unique within the '
+                                                              'account, start with an '
+                                                              'alphanumeric character '
+                                                              'and only contain '
+                                                              'lowercase letters, '
+                                                              'numbers and - or + '
+                                                              'signs.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': 'global',
+                                                       'doc': 'An optional name of the '
+                                                              'access group to create '
+                                                              'the distribution into.',
+                                                       'name': 'access_group',
+                                                       'optional': True,
+                                                       'type': 'unicode'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': '\n'
+                                              '    Create a repository distribution '
+                                              'associated with the account.\n'
+                                              '    ',
+                                       'errors': [{'code': 'UnknownAccessGroup'},
+                                                  {'code': 'Unauthorised'},
+                                                  {'code': 'DuplicateDistribution'}],
+                                       'name': 'CreateDistribution',
+                                       'parameters': [{'doc': 'The name of the '
+                                                              'distribution. It must '
+                                                              'be unique within the '
+                                                              'account, start with an '
+                                                              'alphanumeric character '
+                                                              'and only contain '
+                                                              'lowercase letters, '
+                                                              'numbers and - or + '
+                                                              'signs.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': 'global',
+                                                       'doc': 'An optional name of the '
+                                                              'access group to create '
+                                                              'the distribution into.',
+                                                       'name': 'access_group',
+                                                       'optional': True,
+                                                       'type': 'unicode'}],
+                                       'result': {}}},
+ 'CreatePackageProfile': {'2011-08-01': {'doc': '\n'
+                                                '    Create a package profile.\n'
+                                                '\n'
+                                                '    source_computer_id and material '
+                                                'are mutually exclusive.\n'
+                                                '    ',
+                                         'errors': [{'code': 'UnknownAccessGroup'},
+                                                    {'code': 'EmptyPackageProfile'},
+                                                    {'code': 'InvalidParameterCombination'},
+                                                    {'code': 'InvalidPackageProfileName'},
+                                                    {'code': 'InvalidPackageProfileMaterial'},
+                                                    {'code': 'Unauthorised'},
+                                                    {'code': 'InvalidPackageConstraint'},
+                                                    {'code': 'DuplicatePackageProfile'},
+                                                    {'code': 'NoFoundPackages'},
+                                                    {'code': 'InvalidConstraintType'},
+                                                    {'code': 'UnknownComputer'}],
+                                         'name': 'CreatePackageProfile',
+                                         'parameters': [{'doc': 'The title of the '
+                                                                'package profile to '
+                                                                'create.',
+                                                         'name': 'title',
+                                                         'type': 'unicode title'},
+                                                        {'doc': 'The description of '
+                                                                'the new profile.',
+                                                         'name': 'description',
+                                                         'type': 'unicode'},
+                                                        {'default': None,
+                                                         'doc': 'A computer ID to find '
+                                                                'a computer which will '
+                                                                'be used as the basis '
+                                                                'of the package '
+                                                                'profile.',
+                                                         'name': 'source_computer_id',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'default': None,
+                                                         'doc': 'Package data in the '
+                                                                "format of 'dpkg "
+                                                                "--get-selections' or "
+                                                                'CSV (as exported by '
+                                                                'Landscape).',
+                                                         'name': 'material',
+                                                         'optional': True,
+                                                         'type': 'unicode'},
+                                                        {'default': [],
+                                                         'doc': 'Alternative to '
+                                                                'material, constraint '
+                                                                'specifications in the '
+                                                                'form of "depends '
+                                                                'packagename" or '
+                                                                '"conflicts '
+                                                                'packagename < 1.0".',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'constraints',
+                                                         'optional': True,
+                                                         'type': 'list'},
+                                                        {'default': 'global',
+                                                         'doc': 'Optional name of the '
+                                                                'access group to '
+                                                                'create the profile '
+                                                                'into',
+                                                         'name': 'access_group',
+                                                         'optional': True,
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': '\n'
+                                                '    Create a package profile.\n'
+                                                '\n'
+                                                '    source_computer_id and material '
+                                                'are mutually exclusive.\n'
+                                                '    ',
+                                         'errors': [{'code': 'UnknownAccessGroup'},
+                                                    {'code': 'EmptyPackageProfile'},
+                                                    {'code': 'InvalidParameterCombination'},
+                                                    {'code': 'InvalidPackageProfileName'},
+                                                    {'code': 'InvalidPackageProfileMaterial'},
+                                                    {'code': 'Unauthorised'},
+                                                    {'code': 'InvalidPackageConstraint'},
+                                                    {'code': 'DuplicatePackageProfile'},
+                                                    {'code': 'NoFoundPackages'},
+                                                    {'code': 'InvalidConstraintType'},
+                                                    {'code': 'UnknownComputer'}],
+                                         'name': 'CreatePackageProfile',
+                                         'parameters': [{'doc': 'The title of the '
+                                                                'package profile to '
+                                                                'create.',
+                                                         'name': 'title',
+                                                         'type': 'unicode title'},
+                                                        {'doc': 'The description of '
+                                                                'the new profile.',
+                                                         'name': 'description',
+                                                         'type': 'unicode'},
+                                                        {'default': None,
+                                                         'doc': 'A computer ID to find '
+                                                                'a computer which will '
+                                                                'be used as the basis '
+                                                                'of the package '
+                                                                'profile.',
+                                                         'name': 'source_computer_id',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'default': None,
+                                                         'doc': 'Package data in the '
+                                                                "format of 'dpkg "
+                                                                "--get-selections' or "
+                                                                'CSV (as exported by '
+                                                                'Landscape).',
+                                                         'name': 'material',
+                                                         'optional': True,
+                                                         'type': 'unicode'},
+                                                        {'default': [],
+                                                         'doc': 'Alternative to '
+                                                                'material, constraint '
+                                                                'specifications in the '
+                                                                'form of "depends '
+                                                                'packagename" or '
+                                                                '"conflicts '
+                                                                'packagename < 1.0".',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'constraints',
+                                                         'optional': True,
+                                                         'type': 'list'},
+                                                        {'default': 'global',
+                                                         'doc': 'Optional name of the '
+                                                                'access group to '
+                                                                'create the profile '
+                                                                'into',
+                                                         'name': 'access_group',
+                                                         'optional': True,
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'CreatePocket': {'2011-08-01': {'doc': 'Create a pocket associated with a series in '
+                                        'the account.',
+                                 'errors': [{'code': 'InvalidPocketFilter'},
+                                            {'code': 'GPGKeyHasNoSecret'},
+                                            {'code': 'UnknownSeries'},
+                                            {'code': 'InvalidParameterCombination'},
+                                            {'code': 'UnknownDistribution'},
+                                            {'code': 'MissingParameter'},
+                                            {'code': 'UnknownGPGKey'},
+                                            {'code': 'UnknownPocket'},
+                                            {'code': 'OperationInProgress'},
+                                            {'code': 'InvalidPocketMode'},
+                                            {'code': 'DuplicatePocket'}],
+                                 'name': 'CreatePocket',
+                                 'parameters': [{'doc': 'The name of the pocket. It '
+                                                        'must be unique within series, '
+                                                        'start with an alphanumeric '
+                                                        'character and only contain '
+                                                        'lowercase letters, numbers '
+                                                        'and - or + signs.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the series to '
+                                                        'create the pocket in.',
+                                                 'name': 'series',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution '
+                                                        'the series belongs to.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'},
+                                                {'doc': 'A list of components the '
+                                                        'pocket will handle.',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'components',
+                                                 'type': 'list'},
+                                                {'doc': 'A list of architectures the '
+                                                        'pocket will handle.',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'architectures',
+                                                 'type': 'list'},
+                                                {'doc': 'The pocket mode. Can be '
+                                                        "'pull', 'mirror' and "
+                                                        "'upload'.",
+                                                 'name': 'mode',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the GPG key to '
+                                                        'use to sign packages lists '
+                                                        'for this pocket. The GPG key '
+                                                        'provided must have a private '
+                                                        'key associated with it.',
+                                                 'name': 'gpg_key',
+                                                 'type': 'unicode'},
+                                                {'default': False,
+                                                 'doc': 'Whether the pocket should '
+                                                        'include selected components '
+                                                        'also for .udeb packages '
+                                                        "(debian-installer). It's "
+                                                        "'false' by default.",
+                                                 'name': 'include_udeb',
+                                                 'optional': True,
+                                                 'type': 'boolean'},
+                                                {'default': None,
+                                                 'doc': 'The URI to mirror for pockets '
+                                                        "in 'mirror' mode.",
+                                                 'name': 'mirror_uri',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The repository entry under '
+                                                        'dists/ to mirror for pockets '
+                                                        "in 'mirror' mode. This "
+                                                        'parameter is optional and '
+                                                        'defaults to the same name as '
+                                                        'local series and pocket. If '
+                                                        'the suite name ends with a '
+                                                        "'/', the remote repository is "
+                                                        'flat (packages are not '
+                                                        'grouped in components); in '
+                                                        'this case a single value can '
+                                                        'be passed for the '
+                                                        "'components' parameter. "
+                                                        'Packages from the remote '
+                                                        'repository will be mirrored '
+                                                        'in the specified component.',
+                                                 'name': 'mirror_suite',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The name of the GPG key to '
+                                                        'use to verify the mirrored '
+                                                        'archive signature. If none is '
+                                                        'given, the stock Ubuntu '
+                                                        'archive one will be used.',
+                                                 'name': 'mirror_gpg_key',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The name of the series '
+                                                        'pull_pocket belongs to. Must '
+                                                        'be a series in the same '
+                                                        'distribution series belongs '
+                                                        'to. If not specified, it '
+                                                        'defaults to series.',
+                                                 'name': 'pull_series',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The name of a pocket in '
+                                                        'current distribution to sync '
+                                                        'packages from for pockets in '
+                                                        "'pull' mode.",
+                                                 'name': 'pull_pocket',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'If specified, the type of the '
+                                                        'filter of the pocket. Can be '
+                                                        "either 'whitelist' or "
+                                                        "'blacklist'.",
+                                                 'name': 'filter_type',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': False,
+                                                 'doc': 'For pockets in upload mode, a '
+                                                        'boolean indicating whether '
+                                                        'uploaded packages are '
+                                                        'required to be signed or not. '
+                                                        "It's 'false' by default.",
+                                                 'name': 'upload_allow_unsigned',
+                                                 'optional': True,
+                                                 'type': 'boolean'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': 'Create a pocket associated with a series in '
+                                        'the account.',
+                                 'errors': [{'code': 'InvalidPocketFilter'},
+                                            {'code': 'GPGKeyHasNoSecret'},
+                                            {'code': 'UnknownSeries'},
+                                            {'code': 'InvalidParameterCombination'},
+                                            {'code': 'UnknownDistribution'},
+                                            {'code': 'MissingParameter'},
+                                            {'code': 'UnknownGPGKey'},
+                                            {'code': 'UnknownPocket'},
+                                            {'code': 'OperationInProgress'},
+                                            {'code': 'InvalidPocketMode'},
+                                            {'code': 'DuplicatePocket'}],
+                                 'name': 'CreatePocket',
+                                 'parameters': [{'doc': 'The name of the pocket. It '
+                                                        'must be unique within series, '
+                                                        'start with an alphanumeric '
+                                                        'character and only contain '
+                                                        'lowercase letters, numbers '
+                                                        'and - or + signs.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the series to '
+                                                        'create the pocket in.',
+                                                 'name': 'series',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution '
+                                                        'the series belongs to.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'},
+                                                {'doc': 'A list of components the '
+                                                        'pocket will handle.',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'components',
+                                                 'type': 'list'},
+                                                {'doc': 'A list of architectures the '
+                                                        'pocket will handle.',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'architectures',
+                                                 'type': 'list'},
+                                                {'doc': 'The pocket mode. Can be '
+                                                        "'pull', 'mirror' and "
+                                                        "'upload'.",
+                                                 'name': 'mode',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the GPG key to '
+                                                        'use to sign packages lists '
+                                                        'for this pocket. The GPG key '
+                                                        'provided must have a private '
+                                                        'key associated with it.',
+                                                 'name': 'gpg_key',
+                                                 'type': 'unicode'},
+                                                {'default': False,
+                                                 'doc': 'Whether the pocket should '
+                                                        'include selected components '
+                                                        'also for .udeb packages '
+                                                        "(debian-installer). It's "
+                                                        "'false' by default.",
+                                                 'name': 'include_udeb',
+                                                 'optional': True,
+                                                 'type': 'boolean'},
+                                                {'default': None,
+                                                 'doc': 'The URI to mirror for pockets '
+                                                        "in 'mirror' mode.",
+                                                 'name': 'mirror_uri',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The repository entry under '
+                                                        'dists/ to mirror for pockets '
+                                                        "in 'mirror' mode. This "
+                                                        'parameter is optional and '
+                                                        'defaults to the same name as '
+                                                        'local series and pocket. If '
+                                                        'the suite name ends with a '
+                                                        "'/', the remote repository is "
+                                                        'flat (packages are not '
+                                                        'grouped in components); in '
+                                                        'this case a single value can '
+                                                        'be passed for the '
+                                                        "'components' parameter. "
+                                                        'Packages from the remote '
+                                                        'repository will be mirrored '
+                                                        'in the specified component.',
+                                                 'name': 'mirror_suite',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The name of the GPG key to '
+                                                        'use to verify the mirrored '
+                                                        'archive signature. If none is '
+                                                        'given, the stock Ubuntu '
+                                                        'archive one will be used.',
+                                                 'name': 'mirror_gpg_key',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The name of the series '
+                                                        'pull_pocket belongs to. Must '
+                                                        'be a series in the same '
+                                                        'distribution series belongs '
+                                                        'to. If not specified, it '
+                                                        'defaults to series.',
+                                                 'name': 'pull_series',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The name of a pocket in '
+                                                        'current distribution to sync '
+                                                        'packages from for pockets in '
+                                                        "'pull' mode.",
+                                                 'name': 'pull_pocket',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'If specified, the type of the '
+                                                        'filter of the pocket. Can be '
+                                                        "either 'whitelist' or "
+                                                        "'blacklist'.",
+                                                 'name': 'filter_type',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': False,
+                                                 'doc': 'For pockets in upload mode, a '
+                                                        'boolean indicating whether '
+                                                        'uploaded packages are '
+                                                        'required to be signed or not. '
+                                                        "It's 'false' by default.",
+                                                 'name': 'upload_allow_unsigned',
+                                                 'optional': True,
+                                                 'type': 'boolean'}],
+                                 'result': {}}},
+ 'CreateRemovalProfile': {'2011-08-01': {'doc': 'Create a removal profile.',
+                                         'errors': [{'code': 'UnknownAccessGroup'},
+                                                    {'code': 'Unauthorised'},
+                                                    {'code': 'InvalidDaysWithoutExchangeValue'}],
+                                         'name': 'CreateRemovalProfile',
+                                         'parameters': [{'doc': 'The title of the '
+                                                                'profile to create.',
+                                                         'name': 'title',
+                                                         'type': 'unicode'},
+                                                        {'doc': 'The length of time '
+                                                                'after which a '
+                                                                'computer may be '
+                                                                'removed.',
+                                                         'name': 'days_without_exchange',
+                                                         'type': 'integer'},
+                                                        {'default': 'global',
+                                                         'doc': 'An optional name of '
+                                                                'an access group the '
+                                                                'profile will apply '
+                                                                'to.',
+                                                         'name': 'access_group',
+                                                         'optional': True,
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Create a removal profile.',
+                                         'errors': [{'code': 'UnknownAccessGroup'},
+                                                    {'code': 'Unauthorised'},
+                                                    {'code': 'InvalidDaysWithoutExchangeValue'}],
+                                         'name': 'CreateRemovalProfile',
+                                         'parameters': [{'doc': 'The title of the '
+                                                                'profile to create.',
+                                                         'name': 'title',
+                                                         'type': 'unicode'},
+                                                        {'doc': 'The length of time '
+                                                                'after which a '
+                                                                'computer may be '
+                                                                'removed.',
+                                                         'name': 'days_without_exchange',
+                                                         'type': 'integer'},
+                                                        {'default': 'global',
+                                                         'doc': 'An optional name of '
+                                                                'an access group the '
+                                                                'profile will apply '
+                                                                'to.',
+                                                         'name': 'access_group',
+                                                         'optional': True,
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'CreateRepositoryProfile': {'2011-08-01': {'doc': 'Create a repository profile.',
+                                            'errors': [{'code': 'UnknownAccessGroup'},
+                                                       {'code': 'Unauthorised'}],
+                                            'name': 'CreateRepositoryProfile',
+                                            'parameters': [{'doc': 'Title of the '
+                                                                   'repository '
+                                                                   'profile. It must '
+                                                                   'start with an '
+                                                                   'alphanumeric '
+                                                                   'character and only '
+                                                                   'contain lowercase '
+                                                                   'letters, numbers '
+                                                                   'and - or + signs.',
+                                                            'name': 'title',
+                                                            'type': 'unicode title'},
+                                                           {'default': None,
+                                                            'doc': 'Description of the '
+                                                                   'repository '
+                                                                   'profile.',
+                                                            'name': 'description',
+                                                            'optional': True,
+                                                            'type': 'unicode'},
+                                                           {'default': 'global',
+                                                            'doc': 'Optional name of '
+                                                                   'the access group '
+                                                                   'to create the '
+                                                                   'profile in.',
+                                                            'name': 'access_group',
+                                                            'optional': True,
+                                                            'type': 'unicode'}],
+                                            'result': {}},
+                             '2013-11-04': {'doc': 'Create a repository profile.',
+                                            'errors': [{'code': 'UnknownAccessGroup'},
+                                                       {'code': 'Unauthorised'}],
+                                            'name': 'CreateRepositoryProfile',
+                                            'parameters': [{'doc': 'Title of the '
+                                                                   'repository '
+                                                                   'profile. It must '
+                                                                   'start with an '
+                                                                   'alphanumeric '
+                                                                   'character and only '
+                                                                   'contain lowercase '
+                                                                   'letters, numbers '
+                                                                   'and - or + signs.',
+                                                            'name': 'title',
+                                                            'type': 'unicode title'},
+                                                           {'default': None,
+                                                            'doc': 'Description of the '
+                                                                   'repository '
+                                                                   'profile.',
+                                                            'name': 'description',
+                                                            'optional': True,
+                                                            'type': 'unicode'},
+                                                           {'default': 'global',
+                                                            'doc': 'Optional name of '
+                                                                   'the access group '
+                                                                   'to create the '
+                                                                   'profile in.',
+                                                            'name': 'access_group',
+                                                            'optional': True,
+                                                            'type': 'unicode'}],
+                                            'result': {}}},
+ 'CreateRole': {'2011-08-01': {'doc': 'Create a new access role.',
+                               'errors': [{'code': 'InvalidRoleName'},
+                                          {'code': 'DuplicateRoleName'}],
+                               'name': 'CreateRole',
+                               'parameters': [{'doc': 'The name of the role.',
+                                               'name': 'name',
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The description of the role.',
+                                               'name': 'description',
+                                               'optional': True,
+                                               'type': 'unicode'}],
+                               'result': {}},
+                '2013-11-04': {'doc': 'Create a new access role.',
+                               'errors': [{'code': 'InvalidRoleName'},
+                                          {'code': 'DuplicateRoleName'}],
+                               'name': 'CreateRole',
+                               'parameters': [{'doc': 'The name of the role.',
+                                               'name': 'name',
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The description of the role.',
+                                               'name': 'description',
+                                               'optional': True,
+                                               'type': 'unicode'}],
+                               'result': {}}},
+ 'CreateSavedSearch': {'2011-08-01': {'doc': 'Create a new saved search associated '
+                                             'with the current account.\n'
+                                             '        ',
+                                      'errors': [{'code': 'InvalidSavedSearchName'},
+                                                 {'code': 'DuplicateSavedSearch'},
+                                                 {'code': 'InvalidSavedSearchCriteria'}],
+                                      'name': 'CreateSavedSearch',
+                                      'parameters': [{'default': None,
+                                                      'doc': 'The "slug" name for this '
+                                                             'saved search. It must '
+                                                             'consist of only '
+                                                             'lowercase ASCII letters, '
+                                                             'numbers and hyphens. '
+                                                             'This is the text which '
+                                                             'must be used when using '
+                                                             'the "search:name" '
+                                                             'syntax.  If this '
+                                                             'parameter is not '
+                                                             'included a name will be '
+                                                             'generated automatically '
+                                                             'based on the title.',
+                                                      'name': 'name',
+                                                      'optional': True,
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The display name for the '
+                                                             'SavedSearch.',
+                                                      'name': 'title',
+                                                      'type': 'unicode title'},
+                                                     {'doc': 'The search string to '
+                                                             'save.',
+                                                      'name': 'search',
+                                                      'type': 'unicode'}],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Create a new saved search associated '
+                                             'with the current account.\n'
+                                             '        ',
+                                      'errors': [{'code': 'InvalidSavedSearchName'},
+                                                 {'code': 'DuplicateSavedSearch'},
+                                                 {'code': 'InvalidSavedSearchCriteria'}],
+                                      'name': 'CreateSavedSearch',
+                                      'parameters': [{'default': None,
+                                                      'doc': 'The "slug" name for this '
+                                                             'saved search. It must '
+                                                             'consist of only '
+                                                             'lowercase ASCII letters, '
+                                                             'numbers and hyphens. '
+                                                             'This is the text which '
+                                                             'must be used when using '
+                                                             'the "search:name" '
+                                                             'syntax.  If this '
+                                                             'parameter is not '
+                                                             'included a name will be '
+                                                             'generated automatically '
+                                                             'based on the title.',
+                                                      'name': 'name',
+                                                      'optional': True,
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The display name for the '
+                                                             'SavedSearch.',
+                                                      'name': 'title',
+                                                      'type': 'unicode title'},
+                                                     {'doc': 'The search string to '
+                                                             'save.',
+                                                      'name': 'search',
+                                                      'type': 'unicode'}],
+                                      'result': {}}},
+ 'CreateScript': {'2011-08-01': {'doc': 'Create a new script.',
+                                 'errors': [{'code': 'UnknownAccessGroup'},
+                                            {'code': 'Unauthorised'},
+                                            {'code': 'DuplicateScript'},
+                                            {'code': 'EmptyScriptInterpreter'},
+                                            {'code': 'ScriptEncoding'},
+                                            {'code': 'EmptyScriptCode'}],
+                                 'name': 'CreateScript',
+                                 'parameters': [{'doc': 'The title of the new script.',
+                                                 'name': 'title',
+                                                 'type': 'unicode title'},
+                                                {'doc': 'Amount of time to wait for '
+                                                        'the process to end.',
+                                                 'name': 'time_limit',
+                                                 'type': 'integer'},
+                                                {'doc': 'The filename holding the '
+                                                        'script contents.',
+                                                 'name': 'code',
+                                                 'type': 'data'},
+                                                {'default': None,
+                                                 'doc': 'The user to execute the '
+                                                        'script as.',
+                                                 'name': 'username',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The access group for the new '
+                                                        'script.',
+                                                 'name': 'access_group',
+                                                 'optional': True,
+                                                 'type': 'unicode'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': 'Create a new script.',
+                                 'errors': [{'code': 'UnknownAccessGroup'},
+                                            {'code': 'Unauthorised'},
+                                            {'code': 'DuplicateScript'},
+                                            {'code': 'EmptyScriptInterpreter'},
+                                            {'code': 'ScriptEncoding'},
+                                            {'code': 'EmptyScriptCode'}],
+                                 'name': 'CreateScript',
+                                 'parameters': [{'doc': 'The title of the new script.',
+                                                 'name': 'title',
+                                                 'type': 'unicode title'},
+                                                {'doc': 'Amount of time to wait for '
+                                                        'the process to end.',
+                                                 'name': 'time_limit',
+                                                 'type': 'integer'},
+                                                {'doc': 'The filename holding the '
+                                                        'script contents.',
+                                                 'name': 'code',
+                                                 'type': 'data'},
+                                                {'default': None,
+                                                 'doc': 'The user to execute the '
+                                                        'script as.',
+                                                 'name': 'username',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The access group for the new '
+                                                        'script.',
+                                                 'name': 'access_group',
+                                                 'optional': True,
+                                                 'type': 'unicode'}],
+                                 'result': {}}},
+ 'CreateScriptAttachment': {'2011-08-01': {'doc': 'Add a script attachment.',
+                                           'errors': [{'code': 'TooManyScriptAttachments'},
+                                                      {'code': 'ScriptAttachmentSize'},
+                                                      {'code': 'DuplicateScriptAttachment'},
+                                                      {'code': 'UnknownScript'}],
+                                           'name': 'CreateScriptAttachment',
+                                           'parameters': [{'doc': 'The identity of the '
+                                                                  'script to add the '
+                                                                  'attachment to.',
+                                                           'name': 'script_id',
+                                                           'type': 'integer'},
+                                                          {'doc': 'The file to attach',
+                                                           'name': 'file',
+                                                           'type': 'file'}],
+                                           'result': {}},
+                            '2013-11-04': {'doc': 'Add a script attachment.',
+                                           'errors': [{'code': 'TooManyScriptAttachments'},
+                                                      {'code': 'ScriptAttachmentSize'},
+                                                      {'code': 'DuplicateScriptAttachment'},
+                                                      {'code': 'UnknownScript'}],
+                                           'name': 'CreateScriptAttachment',
+                                           'parameters': [{'doc': 'The identity of the '
+                                                                  'script to add the '
+                                                                  'attachment to.',
+                                                           'name': 'script_id',
+                                                           'type': 'integer'},
+                                                          {'doc': 'The file to attach',
+                                                           'name': 'file',
+                                                           'type': 'file'}],
+                                           'result': {}}},
+ 'CreateSeries': {'2011-08-01': {'doc': '\n'
+                                        '    Create a series associated with a '
+                                        'distribution in the account.\n'
+                                        '    ',
+                                 'errors': [{'code': 'GPGKeyHasNoSecret'},
+                                            {'code': 'InvalidParameterCombination'},
+                                            {'code': 'UnknownDistribution'},
+                                            {'code': 'UnknownGPGKey'},
+                                            {'code': 'DuplicateSeries'},
+                                            {'code': 'MissingParameter'},
+                                            {'code': 'OperationInProgress'}],
+                                 'name': 'CreateSeries',
+                                 'parameters': [{'doc': 'The name of the series. It '
+                                                        'must be unique within series '
+                                                        'within the distribution, '
+                                                        'start with an alphanumeric '
+                                                        'character and only contain '
+                                                        'lowercase letters, numbers '
+                                                        'and - or + signs.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution '
+                                                        'to create the series in.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'},
+                                                {'default': [],
+                                                 'doc': 'Pockets that will be created '
+                                                        'in the series, they will be '
+                                                        'in mirror mode by default.',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'pockets',
+                                                 'optional': True,
+                                                 'type': 'list'},
+                                                {'default': [],
+                                                 'doc': 'List of components for the '
+                                                        'created pockets. This '
+                                                        'parameter is **optional** if '
+                                                        'no pocket is specified.',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'components',
+                                                 'optional': True,
+                                                 'type': 'list'},
+                                                {'default': [],
+                                                 'doc': 'List of architectures for the '
+                                                        'created pockets. This '
+                                                        'parameter is **optional** if '
+                                                        'no pocket is specified',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'architectures',
+                                                 'optional': True,
+                                                 'type': 'list'},
+                                                {'default': None,
+                                                 'doc': 'The name of the GPG key to '
+                                                        'use to sign packages lists of '
+                                                        'the created pockets. This '
+                                                        'parameter is **optional** if '
+                                                        'no pocket is specified.',
+                                                 'name': 'gpg_key',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The URI to mirror for the '
+                                                        'created pockets. This '
+                                                        'parameter is **optional** if '
+                                                        'no pocket is specified.',
+                                                 'name': 'mirror_uri',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The remote series to mirror. '
+                                                        'If not specified, it defaults '
+                                                        'to the name of the series '
+                                                        'being created. If a pockets '
+                                                        'parameter also passed, each '
+                                                        'of the created pockets will '
+                                                        'mirror the relevant '
+                                                        'dists/<mirror_series>-<pocket> '
+                                                        'repository of the remote '
+                                                        'archive.',
+                                                 'name': 'mirror_series',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The name of the GPG key to '
+                                                        'use to verify the mirrored '
+                                                        'repositories for created '
+                                                        'pockets. If none is given, '
+                                                        'the stock Ubuntu archive one '
+                                                        'will be used.',
+                                                 'name': 'mirror_gpg_key',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': False,
+                                                 'doc': 'Whether the pocket should '
+                                                        'include selected components '
+                                                        'also for .udeb packages '
+                                                        "(debian-installer). It's "
+                                                        "'false' by default.",
+                                                 'name': 'include_udeb',
+                                                 'optional': True,
+                                                 'type': 'boolean'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': '\n'
+                                        '    Create a series associated with a '
+                                        'distribution in the account.\n'
+                                        '    ',
+                                 'errors': [{'code': 'GPGKeyHasNoSecret'},
+                                            {'code': 'InvalidParameterCombination'},
+                                            {'code': 'UnknownDistribution'},
+                                            {'code': 'UnknownGPGKey'},
+                                            {'code': 'DuplicateSeries'},
+                                            {'code': 'MissingParameter'},
+                                            {'code': 'OperationInProgress'}],
+                                 'name': 'CreateSeries',
+                                 'parameters': [{'doc': 'The name of the series. It '
+                                                        'must be unique within series '
+                                                        'within the distribution, '
+                                                        'start with an alphanumeric '
+                                                        'character and only contain '
+                                                        'lowercase letters, numbers '
+                                                        'and - or + signs.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution '
+                                                        'to create the series in.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'},
+                                                {'default': [],
+                                                 'doc': 'Pockets that will be created '
+                                                        'in the series, they will be '
+                                                        'in mirror mode by default.',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'pockets',
+                                                 'optional': True,
+                                                 'type': 'list'},
+                                                {'default': [],
+                                                 'doc': 'List of components for the '
+                                                        'created pockets. This '
+                                                        'parameter is **optional** if '
+                                                        'no pocket is specified.',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'components',
+                                                 'optional': True,
+                                                 'type': 'list'},
+                                                {'default': [],
+                                                 'doc': 'List of architectures for the '
+                                                        'created pockets. This '
+                                                        'parameter is **optional** if '
+                                                        'no pocket is specified',
+                                                 'item': {'type': 'unicode'},
+                                                 'name': 'architectures',
+                                                 'optional': True,
+                                                 'type': 'list'},
+                                                {'default': None,
+                                                 'doc': 'The name of the GPG key to '
+                                                        'use to sign packages lists of '
+                                                        'the created pockets. This '
+                                                        'parameter is **optional** if '
+                                                        'no pocket is specified.',
+                                                 'name': 'gpg_key',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The URI to mirror for the '
+                                                        'created pockets. This '
+                                                        'parameter is **optional** if '
+                                                        'no pocket is specified.',
+                                                 'name': 'mirror_uri',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The remote series to mirror. '
+                                                        'If not specified, it defaults '
+                                                        'to the name of the series '
+                                                        'being created. If a pockets '
+                                                        'parameter also passed, each '
+                                                        'of the created pockets will '
+                                                        'mirror the relevant '
+                                                        'dists/<mirror_series>-<pocket> '
+                                                        'repository of the remote '
+                                                        'archive.',
+                                                 'name': 'mirror_series',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': None,
+                                                 'doc': 'The name of the GPG key to '
+                                                        'use to verify the mirrored '
+                                                        'repositories for created '
+                                                        'pockets. If none is given, '
+                                                        'the stock Ubuntu archive one '
+                                                        'will be used.',
+                                                 'name': 'mirror_gpg_key',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': False,
+                                                 'doc': 'Whether the pocket should '
+                                                        'include selected components '
+                                                        'also for .udeb packages '
+                                                        "(debian-installer). It's "
+                                                        "'false' by default.",
+                                                 'name': 'include_udeb',
+                                                 'optional': True,
+                                                 'type': 'boolean'}],
+                                 'result': {}}},
+ 'CreateUpgradeProfile': {'2011-08-01': {'doc': 'Create an upgrade profile.',
+                                         'errors': [{'code': 'UnknownAccessGroup'},
+                                                    {'code': 'InvalidParameterCombination'},
+                                                    {'code': 'InvalidScheduleFormat'},
+                                                    {'code': 'Unauthorised'},
+                                                    {'code': 'MissingParameter'},
+                                                    {'code': 'InvalidDeliverDelayWindow'}],
+                                         'name': 'CreateUpgradeProfile',
+                                         'parameters': [{'doc': 'A human readable '
+                                                                'title for this '
+                                                                'upgrade profile.',
+                                                         'name': 'title',
+                                                         'type': 'unicode title'},
+                                                        {'doc': 'The frequency at '
+                                                                'which you wish this '
+                                                                'upgrade profile to be '
+                                                                'executed. Valid '
+                                                                'choices are "hour" '
+                                                                'and "week".',
+                                                         'name': 'every',
+                                                         'type': 'unicode'},
+                                                        {'default': [],
+                                                         'doc': 'A list of days of the '
+                                                                'week on which the '
+                                                                'upgrade profile will '
+                                                                'be run. The day names '
+                                                                'must be abbreviated '
+                                                                'to their first two '
+                                                                'letters, as: "mo", '
+                                                                '"tu", "we", "th", '
+                                                                '"fr", "sa", "su". '
+                                                                'Required when the '
+                                                                'every parameter is '
+                                                                '"week" but optional '
+                                                                'when the every '
+                                                                'parameter is  "hour".',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'on_days',
+                                                         'optional': True,
+                                                         'type': 'list'},
+                                                        {'default': None,
+                                                         'doc': 'The hour, in 24h '
+                                                                'format, at which the '
+                                                                'upgrade profile will '
+                                                                'be run.',
+                                                         'name': 'at_hour',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'doc': 'The minute of the '
+                                                                'hour (0-59) at which '
+                                                                'the upgrade profile '
+                                                                'will be run.',
+                                                         'name': 'at_minute',
+                                                         'type': 'integer'},
+                                                        {'default': 1,
+                                                         'doc': 'An optional number of '
+                                                                'hours within which '
+                                                                'the upgrade task '
+                                                                'should be delivered '
+                                                                'to computers. The '
+                                                                'window will be from '
+                                                                'the time specified by '
+                                                                'this API call '
+                                                                '(on_days, at_hour, '
+                                                                'at_minute) until the '
+                                                                'provided number of '
+                                                                'hours later. Defaults '
+                                                                'to 1 hour.',
+                                                         'name': 'deliver_within',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'default': 0,
+                                                         'doc': 'Randomise delivery '
+                                                                'within the given '
+                                                                'timeframe specified '
+                                                                'in minutes.',
+                                                         'name': 'deliver_delay_window',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'default': False,
+                                                         'doc': '(Deprecated) Whether '
+                                                                'this upgrade is a '
+                                                                'security upgrade or '
+                                                                'not.',
+                                                         'name': 'security_upgrade',
+                                                         'optional': True,
+                                                         'type': 'boolean'},
+                                                        {'default': None,
+                                                         'doc': 'The type of upgrade '
+                                                                'profile, either '
+                                                                '"security" or "all".',
+                                                         'name': 'upgrade_type',
+                                                         'optional': True,
+                                                         'type': 'unicode'},
+                                                        {'default': False,
+                                                         'doc': 'Whether this upgrade '
+                                                                'should also '
+                                                                'autoremove old '
+                                                                'packages.',
+                                                         'name': 'autoremove',
+                                                         'optional': True,
+                                                         'type': 'boolean'},
+                                                        {'default': 'global',
+                                                         'doc': 'An optional name of '
+                                                                'the access group to '
+                                                                'create the profile '
+                                                                'into.',
+                                                         'name': 'access_group',
+                                                         'optional': True,
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Create an upgrade profile.',
+                                         'errors': [{'code': 'UnknownAccessGroup'},
+                                                    {'code': 'InvalidParameterCombination'},
+                                                    {'code': 'InvalidScheduleFormat'},
+                                                    {'code': 'Unauthorised'},
+                                                    {'code': 'MissingParameter'},
+                                                    {'code': 'InvalidDeliverDelayWindow'}],
+                                         'name': 'CreateUpgradeProfile',
+                                         'parameters': [{'doc': 'A human readable '
+                                                                'title for this '
+                                                                'upgrade profile.',
+                                                         'name': 'title',
+                                                         'type': 'unicode title'},
+                                                        {'doc': 'The frequency at '
+                                                                'which you wish this '
+                                                                'upgrade profile to be '
+                                                                'executed. Valid '
+                                                                'choices are "hour" '
+                                                                'and "week".',
+                                                         'name': 'every',
+                                                         'type': 'unicode'},
+                                                        {'default': [],
+                                                         'doc': 'A list of days of the '
+                                                                'week on which the '
+                                                                'upgrade profile will '
+                                                                'be run. The day names '
+                                                                'must be abbreviated '
+                                                                'to their first two '
+                                                                'letters, as: "mo", '
+                                                                '"tu", "we", "th", '
+                                                                '"fr", "sa", "su". '
+                                                                'Required when the '
+                                                                'every parameter is '
+                                                                '"week" but optional '
+                                                                'when the every '
+                                                                'parameter is  "hour".',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'on_days',
+                                                         'optional': True,
+                                                         'type': 'list'},
+                                                        {'default': None,
+                                                         'doc': 'The hour, in 24h '
+                                                                'format, at which the '
+                                                                'upgrade profile will '
+                                                                'be run.',
+                                                         'name': 'at_hour',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'doc': 'The minute of the '
+                                                                'hour (0-59) at which '
+                                                                'the upgrade profile '
+                                                                'will be run.',
+                                                         'name': 'at_minute',
+                                                         'type': 'integer'},
+                                                        {'default': 1,
+                                                         'doc': 'An optional number of '
+                                                                'hours within which '
+                                                                'the upgrade task '
+                                                                'should be delivered '
+                                                                'to computers. The '
+                                                                'window will be from '
+                                                                'the time specified by '
+                                                                'this API call '
+                                                                '(on_days, at_hour, '
+                                                                'at_minute) until the '
+                                                                'provided number of '
+                                                                'hours later. Defaults '
+                                                                'to 1 hour.',
+                                                         'name': 'deliver_within',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'default': 0,
+                                                         'doc': 'Randomise delivery '
+                                                                'within the given '
+                                                                'timeframe specified '
+                                                                'in minutes.',
+                                                         'name': 'deliver_delay_window',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'default': False,
+                                                         'doc': '(Deprecated) Whether '
+                                                                'this upgrade is a '
+                                                                'security upgrade or '
+                                                                'not.',
+                                                         'name': 'security_upgrade',
+                                                         'optional': True,
+                                                         'type': 'boolean'},
+                                                        {'default': None,
+                                                         'doc': 'The type of upgrade '
+                                                                'profile, either '
+                                                                '"security" or "all".',
+                                                         'name': 'upgrade_type',
+                                                         'optional': True,
+                                                         'type': 'unicode'},
+                                                        {'default': False,
+                                                         'doc': 'Whether this upgrade '
+                                                                'should also '
+                                                                'autoremove old '
+                                                                'packages.',
+                                                         'name': 'autoremove',
+                                                         'optional': True,
+                                                         'type': 'boolean'},
+                                                        {'default': 'global',
+                                                         'doc': 'An optional name of '
+                                                                'the access group to '
+                                                                'create the profile '
+                                                                'into.',
+                                                         'name': 'access_group',
+                                                         'optional': True,
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'DeriveSeries': {'2011-08-01': {'doc': '\n'
+                                        '    Derive a series from another one in the '
+                                        'same distribution. The derived\n'
+                                        '    series will have pockets with names '
+                                        'corresponding to the origin series,\n'
+                                        '    each one configured to pull from the '
+                                        'pocket in origin series.\n'
+                                        '    ',
+                                 'errors': [{'code': 'OperationInProgress'},
+                                            {'code': 'UnknownDistribution'},
+                                            {'code': 'DuplicateSeries'},
+                                            {'code': 'EmptySeries'},
+                                            {'code': 'UnknownSeries'}],
+                                 'name': 'DeriveSeries',
+                                 'parameters': [{'doc': 'The name of the derived '
+                                                        'series. It must be unique '
+                                                        'within the distribution, '
+                                                        'start with an alphanumeric '
+                                                        'character and only contain '
+                                                        'lowercase letters, numbers '
+                                                        'and - or + signs.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the origin '
+                                                        'series.',
+                                                 'name': 'origin',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution '
+                                                        'to derive the series in.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': '\n'
+                                        '    Derive a series from another one in the '
+                                        'same distribution. The derived\n'
+                                        '    series will have pockets with names '
+                                        'corresponding to the origin series,\n'
+                                        '    each one configured to pull from the '
+                                        'pocket in origin series.\n'
+                                        '    ',
+                                 'errors': [{'code': 'OperationInProgress'},
+                                            {'code': 'UnknownDistribution'},
+                                            {'code': 'DuplicateSeries'},
+                                            {'code': 'EmptySeries'},
+                                            {'code': 'UnknownSeries'}],
+                                 'name': 'DeriveSeries',
+                                 'parameters': [{'doc': 'The name of the derived '
+                                                        'series. It must be unique '
+                                                        'within the distribution, '
+                                                        'start with an alphanumeric '
+                                                        'character and only contain '
+                                                        'lowercase letters, numbers '
+                                                        'and - or + signs.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the origin '
+                                                        'series.',
+                                                 'name': 'origin',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution '
+                                                        'to derive the series in.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'}],
+                                 'result': {}}},
+ 'DiffPullPocket': {'2011-08-01': {'doc': '\n'
+                                          '    Return a list of the changes between a '
+                                          'pocket configured in pull mode and\n'
+                                          '    its origin one.\n'
+                                          '    ',
+                                   'errors': [{'code': 'InvalidPocketMode'},
+                                              {'code': 'UnknownDistribution'},
+                                              {'code': 'OperationInProgress'},
+                                              {'code': 'UnknownPocket'},
+                                              {'code': 'UnknownSeries'}],
+                                   'name': 'DiffPullPocket',
+                                   'parameters': [{'doc': 'The name of the pocket.',
+                                                   'name': 'name',
+                                                   'type': 'unicode'},
+                                                  {'doc': 'The name of the series.',
+                                                   'name': 'series',
+                                                   'type': 'unicode'},
+                                                  {'doc': 'The name of the '
+                                                          'distribution.',
+                                                   'name': 'distribution',
+                                                   'type': 'unicode'}],
+                                   'result': {}},
+                    '2013-11-04': {'doc': '\n'
+                                          '    Return a list of the changes between a '
+                                          'pocket configured in pull mode and\n'
+                                          '    its origin one.\n'
+                                          '    ',
+                                   'errors': [{'code': 'InvalidPocketMode'},
+                                              {'code': 'UnknownDistribution'},
+                                              {'code': 'OperationInProgress'},
+                                              {'code': 'UnknownPocket'},
+                                              {'code': 'UnknownSeries'}],
+                                   'name': 'DiffPullPocket',
+                                   'parameters': [{'doc': 'The name of the pocket.',
+                                                   'name': 'name',
+                                                   'type': 'unicode'},
+                                                  {'doc': 'The name of the series.',
+                                                   'name': 'series',
+                                                   'type': 'unicode'},
+                                                  {'doc': 'The name of the '
+                                                          'distribution.',
+                                                   'name': 'distribution',
+                                                   'type': 'unicode'}],
+                                   'result': {}}},
+ 'DisableAdministrator': {'2011-08-01': {'doc': 'Disable an administrator of your '
+                                                'account.',
+                                         'errors': [{'code': 'PersonNotMemberOfAccount'},
+                                                    {'code': 'UnknownUser'}],
+                                         'name': 'DisableAdministrator',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'person to disable.',
+                                                         'name': 'email',
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Disable an administrator of your '
+                                                'account.',
+                                         'errors': [{'code': 'PersonNotMemberOfAccount'},
+                                                    {'code': 'UnknownUser'}],
+                                         'name': 'DisableAdministrator',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'person to disable.',
+                                                         'name': 'email',
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'DisassociateAlert': {'2011-08-01': {'doc': 'Disassociate an alert from computers '
+                                             'with specific tags or from\n'
+                                             '        all computers.',
+                                      'errors': [{'code': 'UnknownAlertTypeError'},
+                                                 {'code': 'InvalidParameterCombination'},
+                                                 {'code': 'UnknownTag'},
+                                                 {'code': 'InvalidAlertTypeError'}],
+                                      'name': 'DisassociateAlert',
+                                      'parameters': [{'doc': 'Name of the entity.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'},
+                                                     {'default': [],
+                                                      'doc': 'Tags to change entity '
+                                                             'association for',
+                                                      'item': {'type': 'unicode'},
+                                                      'name': 'tags',
+                                                      'optional': True,
+                                                      'type': 'list'},
+                                                     {'default': False,
+                                                      'doc': 'If True, change the '
+                                                             "'all_computers' flag "
+                                                             'state for the entity. If '
+                                                             'the flag is enabled, '
+                                                             'associated tags will be '
+                                                             'kept, but they will not '
+                                                             'be effective until the '
+                                                             'flag is disabled.',
+                                                      'name': 'all_computers',
+                                                      'optional': True,
+                                                      'type': 'boolean'}],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Disassociate an alert from computers '
+                                             'with specific tags or from\n'
+                                             '        all computers.',
+                                      'errors': [{'code': 'UnknownAlertTypeError'},
+                                                 {'code': 'InvalidParameterCombination'},
+                                                 {'code': 'UnknownTag'},
+                                                 {'code': 'InvalidAlertTypeError'}],
+                                      'name': 'DisassociateAlert',
+                                      'parameters': [{'doc': 'Name of the entity.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'},
+                                                     {'default': [],
+                                                      'doc': 'Tags to change entity '
+                                                             'association for',
+                                                      'item': {'type': 'unicode'},
+                                                      'name': 'tags',
+                                                      'optional': True,
+                                                      'type': 'list'},
+                                                     {'default': False,
+                                                      'doc': 'If True, change the '
+                                                             "'all_computers' flag "
+                                                             'state for the entity. If '
+                                                             'the flag is enabled, '
+                                                             'associated tags will be '
+                                                             'kept, but they will not '
+                                                             'be effective until the '
+                                                             'flag is disabled.',
+                                                      'name': 'all_computers',
+                                                      'optional': True,
+                                                      'type': 'boolean'}],
+                                      'result': {}}},
+ 'DisassociatePackageProfile': {'2011-08-01': {'doc': 'Disassociate package profile '
+                                                      'from computers with specified\n'
+                                                      '            tags or from all '
+                                                      'computers.',
+                                               'errors': [{'code': 'InvalidParameterCombination'},
+                                                          {'code': 'UnknownTag'},
+                                                          {'code': 'UnknownPackageProfileName'}],
+                                               'name': 'DisassociatePackageProfile',
+                                               'parameters': [{'doc': 'Name of the '
+                                                                      'entity.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'default': [],
+                                                               'doc': 'Tags to change '
+                                                                      'entity '
+                                                                      'association for',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'tags',
+                                                               'optional': True,
+                                                               'type': 'list'},
+                                                              {'default': False,
+                                                               'doc': 'If True, change '
+                                                                      'the '
+                                                                      "'all_computers' "
+                                                                      'flag state for '
+                                                                      'the entity. If '
+                                                                      'the flag is '
+                                                                      'enabled, '
+                                                                      'associated tags '
+                                                                      'will be kept, '
+                                                                      'but they will '
+                                                                      'not be '
+                                                                      'effective until '
+                                                                      'the flag is '
+                                                                      'disabled.',
+                                                               'name': 'all_computers',
+                                                               'optional': True,
+                                                               'type': 'boolean'}],
+                                               'result': {}},
+                                '2013-11-04': {'doc': 'Disassociate package profile '
+                                                      'from computers with specified\n'
+                                                      '            tags or from all '
+                                                      'computers.',
+                                               'errors': [{'code': 'InvalidParameterCombination'},
+                                                          {'code': 'UnknownTag'},
+                                                          {'code': 'UnknownPackageProfileName'}],
+                                               'name': 'DisassociatePackageProfile',
+                                               'parameters': [{'doc': 'Name of the '
+                                                                      'entity.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'default': [],
+                                                               'doc': 'Tags to change '
+                                                                      'entity '
+                                                                      'association for',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'tags',
+                                                               'optional': True,
+                                                               'type': 'list'},
+                                                              {'default': False,
+                                                               'doc': 'If True, change '
+                                                                      'the '
+                                                                      "'all_computers' "
+                                                                      'flag state for '
+                                                                      'the entity. If '
+                                                                      'the flag is '
+                                                                      'enabled, '
+                                                                      'associated tags '
+                                                                      'will be kept, '
+                                                                      'but they will '
+                                                                      'not be '
+                                                                      'effective until '
+                                                                      'the flag is '
+                                                                      'disabled.',
+                                                               'name': 'all_computers',
+                                                               'optional': True,
+                                                               'type': 'boolean'}],
+                                               'result': {}}},
+ 'DisassociateRemovalProfile': {'2011-08-01': {'doc': '\n'
+                                                      '    Disassociate a removal '
+                                                      'profile from computers with the '
+                                                      'specified\n'
+                                                      '    tags, or from all '
+                                                      'computers.\n'
+                                                      '\n'
+                                                      '    tags and all_computers=true '
+                                                      'are mutually exclusive.',
+                                               'errors': [{'code': 'InvalidParameterCombination'},
+                                                          {'code': 'UnknownTag'},
+                                                          {'code': 'UnknownRemovalProfile'}],
+                                               'name': 'DisassociateRemovalProfile',
+                                               'parameters': [{'doc': 'Name of the '
+                                                                      'entity.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'default': [],
+                                                               'doc': 'Tags to change '
+                                                                      'entity '
+                                                                      'association for',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'tags',
+                                                               'optional': True,
+                                                               'type': 'list'},
+                                                              {'default': False,
+                                                               'doc': 'If True, change '
+                                                                      'the '
+                                                                      "'all_computers' "
+                                                                      'flag state for '
+                                                                      'the entity. If '
+                                                                      'the flag is '
+                                                                      'enabled, '
+                                                                      'associated tags '
+                                                                      'will be kept, '
+                                                                      'but they will '
+                                                                      'not be '
+                                                                      'effective until '
+                                                                      'the flag is '
+                                                                      'disabled.',
+                                                               'name': 'all_computers',
+                                                               'optional': True,
+                                                               'type': 'boolean'}],
+                                               'result': {}},
+                                '2013-11-04': {'doc': '\n'
+                                                      '    Disassociate a removal '
+                                                      'profile from computers with the '
+                                                      'specified\n'
+                                                      '    tags, or from all '
+                                                      'computers.\n'
+                                                      '\n'
+                                                      '    tags and all_computers=true '
+                                                      'are mutually exclusive.',
+                                               'errors': [{'code': 'InvalidParameterCombination'},
+                                                          {'code': 'UnknownTag'},
+                                                          {'code': 'UnknownRemovalProfile'}],
+                                               'name': 'DisassociateRemovalProfile',
+                                               'parameters': [{'doc': 'Name of the '
+                                                                      'entity.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'default': [],
+                                                               'doc': 'Tags to change '
+                                                                      'entity '
+                                                                      'association for',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'tags',
+                                                               'optional': True,
+                                                               'type': 'list'},
+                                                              {'default': False,
+                                                               'doc': 'If True, change '
+                                                                      'the '
+                                                                      "'all_computers' "
+                                                                      'flag state for '
+                                                                      'the entity. If '
+                                                                      'the flag is '
+                                                                      'enabled, '
+                                                                      'associated tags '
+                                                                      'will be kept, '
+                                                                      'but they will '
+                                                                      'not be '
+                                                                      'effective until '
+                                                                      'the flag is '
+                                                                      'disabled.',
+                                                               'name': 'all_computers',
+                                                               'optional': True,
+                                                               'type': 'boolean'}],
+                                               'result': {}}},
+ 'DisassociateRepositoryProfile': {'2011-08-01': {'doc': 'Disassociate repository '
+                                                         'profile from computers with '
+                                                         'specified\n'
+                                                         '            tags or from all '
+                                                         'computers.',
+                                                  'errors': [{'code': 'InvalidParameterCombination'},
+                                                             {'code': 'UnknownTag'},
+                                                             {'code': 'UnknownRepositoryProfile'}],
+                                                  'name': 'DisassociateRepositoryProfile',
+                                                  'parameters': [{'doc': 'Name of the '
+                                                                         'entity.',
+                                                                  'name': 'name',
+                                                                  'type': 'unicode'},
+                                                                 {'default': [],
+                                                                  'doc': 'Tags to '
+                                                                         'change '
+                                                                         'entity '
+                                                                         'association '
+                                                                         'for',
+                                                                  'item': {'type': 'unicode'},
+                                                                  'name': 'tags',
+                                                                  'optional': True,
+                                                                  'type': 'list'},
+                                                                 {'default': False,
+                                                                  'doc': 'If True, '
+                                                                         'change the '
+                                                                         "'all_computers' "
+                                                                         'flag state '
+                                                                         'for the '
+                                                                         'entity. If '
+                                                                         'the flag is '
+                                                                         'enabled, '
+                                                                         'associated '
+                                                                         'tags will be '
+                                                                         'kept, but '
+                                                                         'they will '
+                                                                         'not be '
+                                                                         'effective '
+                                                                         'until the '
+                                                                         'flag is '
+                                                                         'disabled.',
+                                                                  'name': 'all_computers',
+                                                                  'optional': True,
+                                                                  'type': 'boolean'}],
+                                                  'result': {}},
+                                   '2013-11-04': {'doc': 'Disassociate repository '
+                                                         'profile from computers with '
+                                                         'specified\n'
+                                                         '            tags or from all '
+                                                         'computers.',
+                                                  'errors': [{'code': 'InvalidParameterCombination'},
+                                                             {'code': 'UnknownTag'},
+                                                             {'code': 'UnknownRepositoryProfile'}],
+                                                  'name': 'DisassociateRepositoryProfile',
+                                                  'parameters': [{'doc': 'Name of the '
+                                                                         'entity.',
+                                                                  'name': 'name',
+                                                                  'type': 'unicode'},
+                                                                 {'default': [],
+                                                                  'doc': 'Tags to '
+                                                                         'change '
+                                                                         'entity '
+                                                                         'association '
+                                                                         'for',
+                                                                  'item': {'type': 'unicode'},
+                                                                  'name': 'tags',
+                                                                  'optional': True,
+                                                                  'type': 'list'},
+                                                                 {'default': False,
+                                                                  'doc': 'If True, '
+                                                                         'change the '
+                                                                         "'all_computers' "
+                                                                         'flag state '
+                                                                         'for the '
+                                                                         'entity. If '
+                                                                         'the flag is '
+                                                                         'enabled, '
+                                                                         'associated '
+                                                                         'tags will be '
+                                                                         'kept, but '
+                                                                         'they will '
+                                                                         'not be '
+                                                                         'effective '
+                                                                         'until the '
+                                                                         'flag is '
+                                                                         'disabled.',
+                                                                  'name': 'all_computers',
+                                                                  'optional': True,
+                                                                  'type': 'boolean'}],
+                                                  'result': {}}},
+ 'DisassociateUpgradeProfile': {'2011-08-01': {'doc': '\n'
+                                                      '    Disassociate an upgrade '
+                                                      'profile from computers with the '
+                                                      'specified\n'
+                                                      '    tags, or from all '
+                                                      'computers.\n'
+                                                      '\n'
+                                                      '    tags and all_computers=true '
+                                                      'are mutually exclusive.',
+                                               'errors': [{'code': 'InvalidParameterCombination'},
+                                                          {'code': 'UnknownTag'},
+                                                          {'code': 'UnknownUpgradeProfile'}],
+                                               'name': 'DisassociateUpgradeProfile',
+                                               'parameters': [{'doc': 'Name of the '
+                                                                      'entity.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'default': [],
+                                                               'doc': 'Tags to change '
+                                                                      'entity '
+                                                                      'association for',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'tags',
+                                                               'optional': True,
+                                                               'type': 'list'},
+                                                              {'default': False,
+                                                               'doc': 'If True, change '
+                                                                      'the '
+                                                                      "'all_computers' "
+                                                                      'flag state for '
+                                                                      'the entity. If '
+                                                                      'the flag is '
+                                                                      'enabled, '
+                                                                      'associated tags '
+                                                                      'will be kept, '
+                                                                      'but they will '
+                                                                      'not be '
+                                                                      'effective until '
+                                                                      'the flag is '
+                                                                      'disabled.',
+                                                               'name': 'all_computers',
+                                                               'optional': True,
+                                                               'type': 'boolean'}],
+                                               'result': {}},
+                                '2013-11-04': {'doc': '\n'
+                                                      '    Disassociate an upgrade '
+                                                      'profile from computers with the '
+                                                      'specified\n'
+                                                      '    tags, or from all '
+                                                      'computers.\n'
+                                                      '\n'
+                                                      '    tags and all_computers=true '
+                                                      'are mutually exclusive.',
+                                               'errors': [{'code': 'InvalidParameterCombination'},
+                                                          {'code': 'UnknownTag'},
+                                                          {'code': 'UnknownUpgradeProfile'}],
+                                               'name': 'DisassociateUpgradeProfile',
+                                               'parameters': [{'doc': 'Name of the '
+                                                                      'entity.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'default': [],
+                                                               'doc': 'Tags to change '
+                                                                      'entity '
+                                                                      'association for',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'tags',
+                                                               'optional': True,
+                                                               'type': 'list'},
+                                                              {'default': False,
+                                                               'doc': 'If True, change '
+                                                                      'the '
+                                                                      "'all_computers' "
+                                                                      'flag state for '
+                                                                      'the entity. If '
+                                                                      'the flag is '
+                                                                      'enabled, '
+                                                                      'associated tags '
+                                                                      'will be kept, '
+                                                                      'but they will '
+                                                                      'not be '
+                                                                      'effective until '
+                                                                      'the flag is '
+                                                                      'disabled.',
+                                                               'name': 'all_computers',
+                                                               'optional': True,
+                                                               'type': 'boolean'}],
+                                               'result': {}}},
+ 'EditPackageProfile': {'2011-08-01': {'doc': '\n'
+                                              '    Add or remove constraints related '
+                                              'to a package profile. Constraints can\n'
+                                              '    be dependencies or conflicts.',
+                                       'errors': [{'code': 'EmptyPackageProfile'},
+                                                  {'code': 'UnknownPackageProfileName'},
+                                                  {'code': 'MissingParameter'},
+                                                  {'code': 'Unauthorised'},
+                                                  {'code': 'InvalidPackageConstraint'},
+                                                  {'code': 'InvalidConstraintType'}],
+                                       'name': 'EditPackageProfile',
+                                       'parameters': [{'doc': 'The name of the package '
+                                                              'profile.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The new title of the '
+                                                              'package profile.',
+                                                       'name': 'title',
+                                                       'optional': True,
+                                                       'type': 'unicode title'},
+                                                      {'default': [],
+                                                       'doc': 'List of constraints '
+                                                              'specifications to add '
+                                                              'in the form of "depends '
+                                                              'packagename" or '
+                                                              '"conflicts packagename '
+                                                              '< 1.0".',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'add_constraints',
+                                                       'optional': True,
+                                                       'type': 'list'},
+                                                      {'default': [],
+                                                       'doc': 'List of constraints '
+                                                              'specifications to '
+                                                              'remove in the form of '
+                                                              '"depends packagename" '
+                                                              'or "conflicts '
+                                                              'packagename < 1.0".',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'remove_constraints',
+                                                       'optional': True,
+                                                       'type': 'list'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': '\n'
+                                              '    Add or remove constraints related '
+                                              'to a package profile. Constraints can\n'
+                                              '    be dependencies or conflicts.',
+                                       'errors': [{'code': 'EmptyPackageProfile'},
+                                                  {'code': 'UnknownPackageProfileName'},
+                                                  {'code': 'MissingParameter'},
+                                                  {'code': 'Unauthorised'},
+                                                  {'code': 'InvalidPackageConstraint'},
+                                                  {'code': 'InvalidConstraintType'}],
+                                       'name': 'EditPackageProfile',
+                                       'parameters': [{'doc': 'The name of the package '
+                                                              'profile.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The new title of the '
+                                                              'package profile.',
+                                                       'name': 'title',
+                                                       'optional': True,
+                                                       'type': 'unicode title'},
+                                                      {'default': [],
+                                                       'doc': 'List of constraints '
+                                                              'specifications to add '
+                                                              'in the form of "depends '
+                                                              'packagename" or '
+                                                              '"conflicts packagename '
+                                                              '< 1.0".',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'add_constraints',
+                                                       'optional': True,
+                                                       'type': 'list'},
+                                                      {'default': [],
+                                                       'doc': 'List of constraints '
+                                                              'specifications to '
+                                                              'remove in the form of '
+                                                              '"depends packagename" '
+                                                              'or "conflicts '
+                                                              'packagename < 1.0".',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'remove_constraints',
+                                                       'optional': True,
+                                                       'type': 'list'}],
+                                       'result': {}}},
+ 'EditPocket': {'2011-08-01': {'doc': 'Edit configuration for a repository pocket from '
+                                      'a series in a distribution.',
+                               'errors': [{'code': 'GPGKeyHasNoSecret'},
+                                          {'code': 'UnknownSeries'},
+                                          {'code': 'UnknownDistribution'},
+                                          {'code': 'UnknownPocket'},
+                                          {'code': 'InvalidPocketMode'},
+                                          {'code': 'OperationInProgress'}],
+                               'name': 'EditPocket',
+                               'parameters': [{'doc': 'The name of the pocket to edit.',
+                                               'name': 'name',
+                                               'type': 'unicode'},
+                                              {'doc': 'The name of the series '
+                                                      'containing the pocket.',
+                                               'name': 'series',
+                                               'type': 'unicode'},
+                                              {'doc': 'The name of the distribution '
+                                                      'containing the series.',
+                                               'name': 'distribution',
+                                               'type': 'unicode'},
+                                              {'default': [],
+                                               'doc': 'A list of components the pocket '
+                                                      'will handle.',
+                                               'item': {'type': 'unicode'},
+                                               'name': 'components',
+                                               'optional': True,
+                                               'type': 'list'},
+                                              {'default': [],
+                                               'doc': 'A list of architectures the '
+                                                      'pocket will handle.',
+                                               'item': {'type': 'unicode'},
+                                               'name': 'architectures',
+                                               'optional': True,
+                                               'type': 'list'},
+                                              {'default': None,
+                                               'doc': 'The name of the GPG key to use '
+                                                      'to sign packages lists for this '
+                                                      'pocket. The GPG key provided '
+                                                      'must have a private key '
+                                                      'associated with it.',
+                                               'name': 'gpg_key',
+                                               'optional': True,
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The URI to mirror for pockets '
+                                                      "in 'mirror' mode.",
+                                               'name': 'mirror_uri',
+                                               'optional': True,
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The repository entry under '
+                                                      'dists/ to mirror for pockets in '
+                                                      "'mirror' mode.",
+                                               'name': 'mirror_suite',
+                                               'optional': True,
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The name of the GPG key to use '
+                                                      'to verify the mirrored archive '
+                                                      "signature. If '-' is given, the "
+                                                      'stock Ubuntu archive one will '
+                                                      'be used.',
+                                               'name': 'mirror_gpg_key',
+                                               'optional': True,
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'For pockets in upload mode, a '
+                                                      'boolean indicating whether '
+                                                      'uploaded packages are required '
+                                                      'to be signed or not.',
+                                               'name': 'upload_allow_unsigned',
+                                               'optional': True,
+                                               'type': 'boolean'},
+                                              {'default': None,
+                                               'doc': 'Whether the pocket should '
+                                                      'include selected components '
+                                                      'also for .udeb packages '
+                                                      '(debian-installer). ',
+                                               'name': 'include_udeb',
+                                               'optional': True,
+                                               'type': 'boolean'}],
+                               'result': {}},
+                '2013-11-04': {'doc': 'Edit configuration for a repository pocket from '
+                                      'a series in a distribution.',
+                               'errors': [{'code': 'GPGKeyHasNoSecret'},
+                                          {'code': 'UnknownSeries'},
+                                          {'code': 'UnknownDistribution'},
+                                          {'code': 'UnknownPocket'},
+                                          {'code': 'InvalidPocketMode'},
+                                          {'code': 'OperationInProgress'}],
+                               'name': 'EditPocket',
+                               'parameters': [{'doc': 'The name of the pocket to edit.',
+                                               'name': 'name',
+                                               'type': 'unicode'},
+                                              {'doc': 'The name of the series '
+                                                      'containing the pocket.',
+                                               'name': 'series',
+                                               'type': 'unicode'},
+                                              {'doc': 'The name of the distribution '
+                                                      'containing the series.',
+                                               'name': 'distribution',
+                                               'type': 'unicode'},
+                                              {'default': [],
+                                               'doc': 'A list of components the pocket '
+                                                      'will handle.',
+                                               'item': {'type': 'unicode'},
+                                               'name': 'components',
+                                               'optional': True,
+                                               'type': 'list'},
+                                              {'default': [],
+                                               'doc': 'A list of architectures the '
+                                                      'pocket will handle.',
+                                               'item': {'type': 'unicode'},
+                                               'name': 'architectures',
+                                               'optional': True,
+                                               'type': 'list'},
+                                              {'default': None,
+                                               'doc': 'The name of the GPG key to use '
+                                                      'to sign packages lists for this '
+                                                      'pocket. The GPG key provided '
+                                                      'must have a private key '
+                                                      'associated with it.',
+                                               'name': 'gpg_key',
+                                               'optional': True,
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The URI to mirror for pockets '
+                                                      "in 'mirror' mode.",
+                                               'name': 'mirror_uri',
+                                               'optional': True,
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The repository entry under '
+                                                      'dists/ to mirror for pockets in '
+                                                      "'mirror' mode.",
+                                               'name': 'mirror_suite',
+                                               'optional': True,
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'The name of the GPG key to use '
+                                                      'to verify the mirrored archive '
+                                                      "signature. If '-' is given, the "
+                                                      'stock Ubuntu archive one will '
+                                                      'be used.',
+                                               'name': 'mirror_gpg_key',
+                                               'optional': True,
+                                               'type': 'unicode'},
+                                              {'default': None,
+                                               'doc': 'For pockets in upload mode, a '
+                                                      'boolean indicating whether '
+                                                      'uploaded packages are required '
+                                                      'to be signed or not.',
+                                               'name': 'upload_allow_unsigned',
+                                               'optional': True,
+                                               'type': 'boolean'},
+                                              {'default': None,
+                                               'doc': 'Whether the pocket should '
+                                                      'include selected components '
+                                                      'also for .udeb packages '
+                                                      '(debian-installer). ',
+                                               'name': 'include_udeb',
+                                               'optional': True,
+                                               'type': 'boolean'}],
+                               'result': {}}},
+ 'EditRemovalProfile': {'2011-08-01': {'doc': 'Edit an removal profile.',
+                                       'errors': [{'code': 'Unauthorised'},
+                                                  {'code': 'InvalidDaysWithoutExchangeValue'},
+                                                  {'code': 'UnknownRemovalProfile'}],
+                                       'name': 'EditRemovalProfile',
+                                       'parameters': [{'doc': 'The name of the profile '
+                                                              'to edit.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The new title of the '
+                                                              'profile.',
+                                                       'name': 'title',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The length of time '
+                                                              'after which a computer '
+                                                              'may be removed.',
+                                                       'name': 'days_without_exchange',
+                                                       'optional': True,
+                                                       'type': 'integer'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': 'Edit an removal profile.',
+                                       'errors': [{'code': 'Unauthorised'},
+                                                  {'code': 'InvalidDaysWithoutExchangeValue'},
+                                                  {'code': 'UnknownRemovalProfile'}],
+                                       'name': 'EditRemovalProfile',
+                                       'parameters': [{'doc': 'The name of the profile '
+                                                              'to edit.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The new title of the '
+                                                              'profile.',
+                                                       'name': 'title',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The length of time '
+                                                              'after which a computer '
+                                                              'may be removed.',
+                                                       'name': 'days_without_exchange',
+                                                       'optional': True,
+                                                       'type': 'integer'}],
+                                       'result': {}}},
+ 'EditRepositoryProfile': {'2011-08-01': {'doc': 'Edit a repository profile.',
+                                          'errors': [{'code': 'InvalidParameterCombination'},
+                                                     {'code': 'UnknownRepositoryProfile'},
+                                                     {'code': 'Unauthorised'}],
+                                          'name': 'EditRepositoryProfile',
+                                          'parameters': [{'doc': 'Name of the '
+                                                                 'repository profile '
+                                                                 'to edit.',
+                                                          'name': 'name',
+                                                          'type': 'unicode'},
+                                                         {'default': None,
+                                                          'doc': 'Title of the '
+                                                                 'repository profile.',
+                                                          'name': 'title',
+                                                          'optional': True,
+                                                          'type': 'unicode title'},
+                                                         {'default': None,
+                                                          'doc': 'Description of the '
+                                                                 'repository profile.',
+                                                          'name': 'description',
+                                                          'optional': True,
+                                                          'type': 'unicode'}],
+                                          'result': {}},
+                           '2013-11-04': {'doc': 'Edit a repository profile.',
+                                          'errors': [{'code': 'InvalidParameterCombination'},
+                                                     {'code': 'UnknownRepositoryProfile'},
+                                                     {'code': 'Unauthorised'}],
+                                          'name': 'EditRepositoryProfile',
+                                          'parameters': [{'doc': 'Name of the '
+                                                                 'repository profile '
+                                                                 'to edit.',
+                                                          'name': 'name',
+                                                          'type': 'unicode'},
+                                                         {'default': None,
+                                                          'doc': 'Title of the '
+                                                                 'repository profile.',
+                                                          'name': 'title',
+                                                          'optional': True,
+                                                          'type': 'unicode title'},
+                                                         {'default': None,
+                                                          'doc': 'Description of the '
+                                                                 'repository profile.',
+                                                          'name': 'description',
+                                                          'optional': True,
+                                                          'type': 'unicode'}],
+                                          'result': {}}},
+ 'EditSavedSearch': {'2011-08-01': {'doc': 'Edit a saved search associated with the '
+                                           'current account.',
+                                    'errors': [{'code': 'UnknownSavedSearch'},
+                                               {'code': 'DuplicateSavedSearch'},
+                                               {'code': 'MissingParameter'},
+                                               {'code': 'InvalidSavedSearchCriteria'}],
+                                    'name': 'EditSavedSearch',
+                                    'parameters': [{'doc': 'The "slug" name for this '
+                                                           'saved search, this is the '
+                                                           'text which must be used '
+                                                           'when using the '
+                                                           '"search:name" syntax. A '
+                                                           'saved search with this '
+                                                           'name must already exist in '
+                                                           'the account.',
+                                                    'name': 'name',
+                                                    'type': 'unicode'},
+                                                   {'default': None,
+                                                    'doc': 'The new display name for '
+                                                           'the saved search. If this '
+                                                           'parameter is not included '
+                                                           'then the title will not be '
+                                                           'modified.',
+                                                    'name': 'title',
+                                                    'optional': True,
+                                                    'type': 'unicode title'},
+                                                   {'default': None,
+                                                    'doc': 'The search string to save. '
+                                                           'If this parameter is not '
+                                                           'included then the search '
+                                                           'string will not be '
+                                                           'modified.',
+                                                    'name': 'search',
+                                                    'optional': True,
+                                                    'type': 'unicode'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'Edit a saved search associated with the '
+                                           'current account.',
+                                    'errors': [{'code': 'UnknownSavedSearch'},
+                                               {'code': 'DuplicateSavedSearch'},
+                                               {'code': 'MissingParameter'},
+                                               {'code': 'InvalidSavedSearchCriteria'}],
+                                    'name': 'EditSavedSearch',
+                                    'parameters': [{'doc': 'The "slug" name for this '
+                                                           'saved search, this is the '
+                                                           'text which must be used '
+                                                           'when using the '
+                                                           '"search:name" syntax. A '
+                                                           'saved search with this '
+                                                           'name must already exist in '
+                                                           'the account.',
+                                                    'name': 'name',
+                                                    'type': 'unicode'},
+                                                   {'default': None,
+                                                    'doc': 'The new display name for '
+                                                           'the saved search. If this '
+                                                           'parameter is not included '
+                                                           'then the title will not be '
+                                                           'modified.',
+                                                    'name': 'title',
+                                                    'optional': True,
+                                                    'type': 'unicode title'},
+                                                   {'default': None,
+                                                    'doc': 'The search string to save. '
+                                                           'If this parameter is not '
+                                                           'included then the search '
+                                                           'string will not be '
+                                                           'modified.',
+                                                    'name': 'search',
+                                                    'optional': True,
+                                                    'type': 'unicode'}],
+                                    'result': {}}},
+ 'EditScript': {'2011-08-01': {'doc': 'Edit a script.',
+                               'errors': [{'code': 'Unauthorised'},
+                                          {'code': 'DuplicateScript'},
+                                          {'code': 'EmptyScriptInterpreter'},
+                                          {'code': 'ScriptEncoding'},
+                                          {'code': 'EmptyScriptCode'},
+                                          {'code': 'UnknownScript'}],
+                               'name': 'EditScript',
+                               'parameters': [{'doc': 'The identifier of the script '
+                                                      'you wish to edit.',
+                                               'name': 'script_id',
+                                               'type': 'integer'},
+                                              {'default': None,
+                                               'doc': 'The new script title.',
+                                               'name': 'title',
+                                               'optional': True,
+                                               'type': 'unicode title'},
+                                              {'default': None,
+                                               'doc': 'Amount of time to wait for the '
+                                                      'process to end.',
+                                               'name': 'time_limit',
+                                               'optional': True,
+                                               'type': 'integer'},
+                                              {'default': None,
+                                               'doc': 'The filename holding the script '
+                                                      'contents.',
+                                               'name': 'code',
+                                               'optional': True,
+                                               'type': 'data'},
+                                              {'default': None,
+                                               'doc': 'The user to execute the script '
+                                                      'as.',
+                                               'name': 'username',
+                                               'optional': True,
+                                               'type': 'unicode'}],
+                               'result': {}},
+                '2013-11-04': {'doc': 'Edit a script.',
+                               'errors': [{'code': 'Unauthorised'},
+                                          {'code': 'DuplicateScript'},
+                                          {'code': 'EmptyScriptInterpreter'},
+                                          {'code': 'ScriptEncoding'},
+                                          {'code': 'EmptyScriptCode'},
+                                          {'code': 'UnknownScript'}],
+                               'name': 'EditScript',
+                               'parameters': [{'doc': 'The identifier of the script '
+                                                      'you wish to edit.',
+                                               'name': 'script_id',
+                                               'type': 'integer'},
+                                              {'default': None,
+                                               'doc': 'The new script title.',
+                                               'name': 'title',
+                                               'optional': True,
+                                               'type': 'unicode title'},
+                                              {'default': None,
+                                               'doc': 'Amount of time to wait for the '
+                                                      'process to end.',
+                                               'name': 'time_limit',
+                                               'optional': True,
+                                               'type': 'integer'},
+                                              {'default': None,
+                                               'doc': 'The filename holding the script '
+                                                      'contents.',
+                                               'name': 'code',
+                                               'optional': True,
+                                               'type': 'data'},
+                                              {'default': None,
+                                               'doc': 'The user to execute the script '
+                                                      'as.',
+                                               'name': 'username',
+                                               'optional': True,
+                                               'type': 'unicode'}],
+                               'result': {}}},
+ 'EditUpgradeProfile': {'2011-08-01': {'doc': 'Edit an upgrade profile.',
+                                       'errors': [{'code': 'UnknownUpgradeProfile'},
+                                                  {'code': 'InvalidDeliverDelayWindow'},
+                                                  {'code': 'MissingParameter'},
+                                                  {'code': 'InvalidParameterCombination'},
+                                                  {'code': 'InvalidScheduleFormat'}],
+                                       'name': 'EditUpgradeProfile',
+                                       'parameters': [{'doc': 'The name for this '
+                                                              'upgrade profile.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The new title of the '
+                                                              'upgrade profile.',
+                                                       'name': 'title',
+                                                       'optional': True,
+                                                       'type': 'unicode title'},
+                                                      {'default': None,
+                                                       'doc': 'The frequency at which '
+                                                              'you wish this upgrade '
+                                                              'profile to be executed. '
+                                                              'Valid choices are '
+                                                              '"hour" and "week".',
+                                                       'name': 'every',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': [],
+                                                       'doc': 'A list of days of the '
+                                                              'week on which the '
+                                                              'upgrade profile will be '
+                                                              'run. The day names must '
+                                                              'be abbreviated to their '
+                                                              'first two letters, as: '
+                                                              '"mo", "tu", "we", "th", '
+                                                              '"fr", "sa", "su". '
+                                                              'Required when the every '
+                                                              'parameter is "week" but '
+                                                              'optional when the every '
+                                                              'parameter is  "hour".',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'on_days',
+                                                       'optional': True,
+                                                       'type': 'list'},
+                                                      {'default': None,
+                                                       'doc': 'The hour, in 24h '
+                                                              'format, at which the '
+                                                              'upgrade profile will be '
+                                                              'run.',
+                                                       'name': 'at_hour',
+                                                       'optional': True,
+                                                       'type': 'integer'},
+                                                      {'default': None,
+                                                       'doc': 'The minute of the hour '
+                                                              '(0-59) at which the '
+                                                              'upgrade profile will be '
+                                                              'run.',
+                                                       'name': 'at_minute',
+                                                       'optional': True,
+                                                       'type': 'integer'},
+                                                      {'default': 1,
+                                                       'doc': 'An optional number of '
+                                                              'hours within which the '
+                                                              'upgrade task should be '
+                                                              'delivered to computers. '
+                                                              'The window will be from '
+                                                              'the time specified by '
+                                                              'this API call (on_days, '
+                                                              'at_hour, at_minute) '
+                                                              'until the provided '
+                                                              'number of hours later. '
+                                                              'Defaults to 1 hour.',
+                                                       'name': 'deliver_within',
+                                                       'optional': True,
+                                                       'type': 'integer'},
+                                                      {'default': None,
+                                                       'doc': 'Randomise delivery '
+                                                              'within the given '
+                                                              'timeframe specified in '
+                                                              'minutes.',
+                                                       'name': 'deliver_delay_window',
+                                                       'optional': True,
+                                                       'type': 'integer'},
+                                                      {'default': False,
+                                                       'doc': '(Deprecated) Whether '
+                                                              'this upgrade is a '
+                                                              'security upgrade or '
+                                                              'not.',
+                                                       'name': 'security_upgrade',
+                                                       'optional': True,
+                                                       'type': 'boolean'},
+                                                      {'default': None,
+                                                       'doc': 'The type of upgrade '
+                                                              'profile, either '
+                                                              '"security" or "all".',
+                                                       'name': 'upgrade_type',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'Whether this upgrade '
+                                                              'should also autoremove '
+                                                              'old packages.',
+                                                       'name': 'autoremove',
+                                                       'optional': True,
+                                                       'type': 'boolean'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': 'Edit an upgrade profile.',
+                                       'errors': [{'code': 'UnknownUpgradeProfile'},
+                                                  {'code': 'InvalidDeliverDelayWindow'},
+                                                  {'code': 'MissingParameter'},
+                                                  {'code': 'InvalidParameterCombination'},
+                                                  {'code': 'InvalidScheduleFormat'}],
+                                       'name': 'EditUpgradeProfile',
+                                       'parameters': [{'doc': 'The name for this '
+                                                              'upgrade profile.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'The new title of the '
+                                                              'upgrade profile.',
+                                                       'name': 'title',
+                                                       'optional': True,
+                                                       'type': 'unicode title'},
+                                                      {'default': None,
+                                                       'doc': 'The frequency at which '
+                                                              'you wish this upgrade '
+                                                              'profile to be executed. '
+                                                              'Valid choices are '
+                                                              '"hour" and "week".',
+                                                       'name': 'every',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': [],
+                                                       'doc': 'A list of days of the '
+                                                              'week on which the '
+                                                              'upgrade profile will be '
+                                                              'run. The day names must '
+                                                              'be abbreviated to their '
+                                                              'first two letters, as: '
+                                                              '"mo", "tu", "we", "th", '
+                                                              '"fr", "sa", "su". '
+                                                              'Required when the every '
+                                                              'parameter is "week" but '
+                                                              'optional when the every '
+                                                              'parameter is  "hour".',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'on_days',
+                                                       'optional': True,
+                                                       'type': 'list'},
+                                                      {'default': None,
+                                                       'doc': 'The hour, in 24h '
+                                                              'format, at which the '
+                                                              'upgrade profile will be '
+                                                              'run.',
+                                                       'name': 'at_hour',
+                                                       'optional': True,
+                                                       'type': 'integer'},
+                                                      {'default': None,
+                                                       'doc': 'The minute of the hour '
+                                                              '(0-59) at which the '
+                                                              'upgrade profile will be '
+                                                              'run.',
+                                                       'name': 'at_minute',
+                                                       'optional': True,
+                                                       'type': 'integer'},
+                                                      {'default': 1,
+                                                       'doc': 'An optional number of '
+                                                              'hours within which the '
+                                                              'upgrade task should be '
+                                                              'delivered to computers. '
+                                                              'The window will be from '
+                                                              'the time specified by '
+                                                              'this API call (on_days, '
+                                                              'at_hour, at_minute) '
+                                                              'until the provided '
+                                                              'number of hours later. '
+                                                              'Defaults to 1 hour.',
+                                                       'name': 'deliver_within',
+                                                       'optional': True,
+                                                       'type': 'integer'},
+                                                      {'default': None,
+                                                       'doc': 'Randomise delivery '
+                                                              'within the given '
+                                                              'timeframe specified in '
+                                                              'minutes.',
+                                                       'name': 'deliver_delay_window',
+                                                       'optional': True,
+                                                       'type': 'integer'},
+                                                      {'default': False,
+                                                       'doc': '(Deprecated) Whether '
+                                                              'this upgrade is a '
+                                                              'security upgrade or '
+                                                              'not.',
+                                                       'name': 'security_upgrade',
+                                                       'optional': True,
+                                                       'type': 'boolean'},
+                                                      {'default': None,
+                                                       'doc': 'The type of upgrade '
+                                                              'profile, either '
+                                                              '"security" or "all".',
+                                                       'name': 'upgrade_type',
+                                                       'optional': True,
+                                                       'type': 'unicode'},
+                                                      {'default': None,
+                                                       'doc': 'Whether this upgrade '
+                                                              'should also autoremove '
+                                                              'old packages.',
+                                                       'name': 'autoremove',
+                                                       'optional': True,
+                                                       'type': 'boolean'}],
+                                       'result': {}}},
+ 'ExecuteScript': {'2011-08-01': {'doc': 'Execute a script on computers.',
+                                  'errors': [{'code': 'RequiresUser'},
+                                             {'code': 'InvalidQuery'},
+                                             {'code': 'UnknownScript'},
+                                             {'code': 'InvalidTime'},
+                                             {'code': 'UnknownComputers'}],
+                                  'name': 'ExecuteScript',
+                                  'parameters': [{'doc': 'A query string used to '
+                                                         'select the computers to '
+                                                         'execute the script on.   '
+                                                         'Multiple occurrences will be '
+                                                         'joined with a logical AND.',
+                                                  'name': 'query',
+                                                  'type': 'unicode'},
+                                                 {'doc': 'The identity of the script '
+                                                         'stored in the server.',
+                                                  'name': 'script_id',
+                                                  'type': 'integer'},
+                                                 {'default': None,
+                                                  'doc': 'The username to execute the '
+                                                         'script as on the client. '
+                                                         'Required if the script has '
+                                                         'no default username.',
+                                                  'name': 'username',
+                                                  'optional': True,
+                                                  'type': 'unicode'},
+                                                 {'default': None,
+                                                  'doc': 'A time in the future to '
+                                                         'deliver the script.',
+                                                  'name': 'deliver_after',
+                                                  'optional': True,
+                                                  'type': 'unicode'}],
+                                  'result': {}},
+                   '2013-11-04': {'doc': 'Execute a script on computers.',
+                                  'errors': [{'code': 'RequiresUser'},
+                                             {'code': 'InvalidQuery'},
+                                             {'code': 'UnknownScript'},
+                                             {'code': 'InvalidTime'},
+                                             {'code': 'UnknownComputers'}],
+                                  'name': 'ExecuteScript',
+                                  'parameters': [{'doc': 'A query string used to '
+                                                         'select the computers to '
+                                                         'execute the script on.   '
+                                                         'Multiple occurrences will be '
+                                                         'joined with a logical AND.',
+                                                  'name': 'query',
+                                                  'type': 'unicode'},
+                                                 {'doc': 'The identity of the script '
+                                                         'stored in the server.',
+                                                  'name': 'script_id',
+                                                  'type': 'integer'},
+                                                 {'default': None,
+                                                  'doc': 'The username to execute the '
+                                                         'script as on the client. '
+                                                         'Required if the script has '
+                                                         'no default username.',
+                                                  'name': 'username',
+                                                  'optional': True,
+                                                  'type': 'unicode'},
+                                                 {'default': None,
+                                                  'doc': 'A time in the future to '
+                                                         'deliver the script.',
+                                                  'name': 'deliver_after',
+                                                  'optional': True,
+                                                  'type': 'unicode'}],
+                                  'result': {}}},
+ 'GetAPTSources': {'2011-08-01': {'doc': '\n'
+                                         '        Get a list of apt sources in the '
+                                         'account used for authentication.\n'
+                                         '        ',
+                                  'errors': [{'code': 'UnknownAccessGroup'}],
+                                  'name': 'GetAPTSources',
+                                  'parameters': [{'default': [],
+                                                  'doc': 'List of names of the APT '
+                                                         'source to be returned. '
+                                                         'Multiple names can be '
+                                                         'supplied.',
+                                                  'item': {'type': 'unicode'},
+                                                  'name': 'names',
+                                                  'optional': True,
+                                                  'type': 'list'}],
+                                  'result': {}},
+                   '2013-11-04': {'doc': '\n'
+                                         '        Get a list of apt sources in the '
+                                         'account used for authentication.\n'
+                                         '        ',
+                                  'errors': [{'code': 'UnknownAccessGroup'}],
+                                  'name': 'GetAPTSources',
+                                  'parameters': [{'default': [],
+                                                  'doc': 'List of names of the APT '
+                                                         'source to be returned. '
+                                                         'Multiple names can be '
+                                                         'supplied.',
+                                                  'item': {'type': 'unicode'},
+                                                  'name': 'names',
+                                                  'optional': True,
+                                                  'type': 'list'}],
+                                  'result': {}}},
+ 'GetAccessGroups': {'2011-08-01': {'doc': 'List all access groups in the account.',
+                                    'errors': [{'code': 'Unauthorised'},
+                                               {'code': 'UnknownEntityIDs'}],
+                                    'name': 'GetAccessGroups',
+                                    'parameters': [{'default': [],
+                                                    'doc': 'The name of the access '
+                                                           'group.',
+                                                    'item': {'type': 'unicode'},
+                                                    'name': 'names',
+                                                    'optional': True,
+                                                    'type': 'list'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'List all access groups in the account.',
+                                    'errors': [{'code': 'Unauthorised'},
+                                               {'code': 'UnknownEntityIDs'}],
+                                    'name': 'GetAccessGroups',
+                                    'parameters': [{'default': [],
+                                                    'doc': 'The name of the access '
+                                                           'group.',
+                                                    'item': {'type': 'unicode'},
+                                                    'name': 'names',
+                                                    'optional': True,
+                                                    'type': 'list'}],
+                                    'result': {}}},
+ 'GetActivities': {'2011-08-01': {'doc': '\n'
+                                         '    Retrieve activities associated with the '
+                                         'current account, ordered by\n'
+                                         '    creation time.\n'
+                                         '\n'
+                                         '    Some activities requested take an '
+                                         'extended period of time to complete.\n'
+                                         '    These activities will not have discrete '
+                                         'activity_status values. Instead\n'
+                                         '    they will report estimated percent '
+                                         'complete in the progress field for the\n'
+                                         '    activity. The progress field will have '
+                                         'one of the following values::\n'
+                                         '\n'
+                                         '      0: if activity is not started\n'
+                                         '      -1: if an error occurred\n'
+                                         '      1 to 100: percent complete of ongoing '
+                                         'activity\n'
+                                         '\n'
+                                         '    Common examples of activities with '
+                                         'progress would be syncing a pocket\n'
+                                         '    repository mirror or provisioning a new '
+                                         'system.\n'
+                                         '    ',
+                                  'errors': [{'code': 'InvalidQuery'},
+                                             {'code': 'InvalidQuery'},
+                                             {'code': 'Unauthorised'}],
+                                  'name': 'GetActivities',
+                                  'parameters': [{'default': '',
+                                                  'doc': 'A query string with space '
+                                                         'separated tokens used to '
+                                                         'filter the returned result '
+                                                         'objects.',
+                                                  'name': 'query',
+                                                  'optional': True,
+                                                  'type': 'unicode'},
+                                                 {'default': 1000,
+                                                  'doc': 'The maximum number of '
+                                                         'results returned by the '
+                                                         'method. It defaults to 1000.',
+                                                  'name': 'limit',
+                                                  'optional': True,
+                                                  'type': 'integer'},
+                                                 {'default': 0,
+                                                  'doc': 'The offset inside the list '
+                                                         'of results.',
+                                                  'name': 'offset',
+                                                  'optional': True,
+                                                  'type': 'integer'}],
+                                  'result': {}},
+                   '2013-11-04': {'doc': '\n'
+                                         '    Retrieve activities associated with the '
+                                         'current account, ordered by\n'
+                                         '    creation time.\n'
+                                         '\n'
+                                         '    Some activities requested take an '
+                                         'extended period of time to complete.\n'
+                                         '    These activities will not have discrete '
+                                         'activity_status values. Instead\n'
+                                         '    they will report estimated percent '
+                                         'complete in the progress field for the\n'
+                                         '    activity. The progress field will have '
+                                         'one of the following values::\n'
+                                         '\n'
+                                         '      0: if activity is not started\n'
+                                         '      -1: if an error occurred\n'
+                                         '      1 to 100: percent complete of ongoing '
+                                         'activity\n'
+                                         '\n'
+                                         '    Common examples of activities with '
+                                         'progress would be syncing a pocket\n'
+                                         '    repository mirror or provisioning a new '
+                                         'system.\n'
+                                         '    ',
+                                  'errors': [{'code': 'InvalidQuery'},
+                                             {'code': 'InvalidQuery'},
+                                             {'code': 'Unauthorised'}],
+                                  'name': 'GetActivities',
+                                  'parameters': [{'default': '',
+                                                  'doc': 'A query string with space '
+                                                         'separated tokens used to '
+                                                         'filter the returned result '
+                                                         'objects.',
+                                                  'name': 'query',
+                                                  'optional': True,
+                                                  'type': 'unicode'},
+                                                 {'default': 1000,
+                                                  'doc': 'The maximum number of '
+                                                         'results returned by the '
+                                                         'method. It defaults to 1000.',
+                                                  'name': 'limit',
+                                                  'optional': True,
+                                                  'type': 'integer'},
+                                                 {'default': 0,
+                                                  'doc': 'The offset inside the list '
+                                                         'of results.',
+                                                  'name': 'offset',
+                                                  'optional': True,
+                                                  'type': 'integer'}],
+                                  'result': {}}},
+ 'GetActivityTypes': {'2011-08-01': {'doc': '\n'
+                                            '    Retrieve a list of possible activity '
+                                            'types for use with the *type:* query\n'
+                                            '    criteria.\n'
+                                            '    ',
+                                     'errors': [],
+                                     'name': 'GetActivityTypes',
+                                     'parameters': [],
+                                     'result': {}},
+                      '2013-11-04': {'doc': '\n'
+                                            '    Retrieve a list of possible activity '
+                                            'types for use with the *type:* query\n'
+                                            '    criteria.\n'
+                                            '    ',
+                                     'errors': [],
+                                     'name': 'GetActivityTypes',
+                                     'parameters': [],
+                                     'result': {}}},
+ 'GetAdministrators': {'2011-08-01': {'doc': 'Retrieve the list of administrators in '
+                                             'the account.',
+                                      'errors': [],
+                                      'name': 'GetAdministrators',
+                                      'parameters': [],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Retrieve the list of administrators in '
+                                             'the account.',
+                                      'errors': [],
+                                      'name': 'GetAdministrators',
+                                      'parameters': [],
+                                      'result': {}}},
+ 'GetAlertSubscribers': {'2011-08-01': {'doc': 'Get a a list of people who subscribe '
+                                               'to a given alert.',
+                                        'errors': [{'code': 'UnknownAlertTypeError'}],
+                                        'name': 'GetAlertSubscribers',
+                                        'parameters': [{'doc': 'The alert type to '
+                                                               'check the subscription '
+                                                               'on.',
+                                                        'name': 'alert_type',
+                                                        'type': 'unicode'}],
+                                        'result': {}},
+                         '2013-11-04': {'doc': 'Get a a list of people who subscribe '
+                                               'to a given alert.',
+                                        'errors': [{'code': 'UnknownAlertTypeError'}],
+                                        'name': 'GetAlertSubscribers',
+                                        'parameters': [{'doc': 'The alert type to '
+                                                               'check the subscription '
+                                                               'on.',
+                                                        'name': 'alert_type',
+                                                        'type': 'unicode'}],
+                                        'result': {}}},
+ 'GetAlerts': {'2011-08-01': {'doc': 'Get a list of alerts in an account.',
+                              'errors': [],
+                              'name': 'GetAlerts',
+                              'parameters': [],
+                              'result': {}},
+               '2013-11-04': {'doc': 'Get a list of alerts in an account.',
+                              'errors': [],
+                              'name': 'GetAlerts',
+                              'parameters': [],
+                              'result': {}}},
+ 'GetCSVComplianceData': {'2011-08-01': {'doc': 'Return a CSV formatted report of '
+                                                'compliance data.',
+                                         'errors': [{'code': 'InvalidQuery'}],
+                                         'name': 'GetCSVComplianceData',
+                                         'parameters': [{'default': '',
+                                                         'doc': 'A query string with '
+                                                                'space separated '
+                                                                'tokens used to filter '
+                                                                'the returned result '
+                                                                'objects.',
+                                                         'name': 'query',
+                                                         'optional': True,
+                                                         'type': 'unicode'},
+                                                        {'default': 1000,
+                                                         'doc': 'The maximum number of '
+                                                                'results returned by '
+                                                                'the method. It '
+                                                                'defaults to 1000.',
+                                                         'name': 'limit',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'default': 0,
+                                                         'doc': 'The offset inside the '
+                                                                'list of results.',
+                                                         'name': 'offset',
+                                                         'optional': True,
+                                                         'type': 'integer'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Return a CSV formatted report of '
+                                                'compliance data.',
+                                         'errors': [{'code': 'InvalidQuery'}],
+                                         'name': 'GetCSVComplianceData',
+                                         'parameters': [{'default': '',
+                                                         'doc': 'A query string with '
+                                                                'space separated '
+                                                                'tokens used to filter '
+                                                                'the returned result '
+                                                                'objects.',
+                                                         'name': 'query',
+                                                         'optional': True,
+                                                         'type': 'unicode'},
+                                                        {'default': 1000,
+                                                         'doc': 'The maximum number of '
+                                                                'results returned by '
+                                                                'the method. It '
+                                                                'defaults to 1000.',
+                                                         'name': 'limit',
+                                                         'optional': True,
+                                                         'type': 'integer'},
+                                                        {'default': 0,
+                                                         'doc': 'The offset inside the '
+                                                                'list of results.',
+                                                         'name': 'offset',
+                                                         'optional': True,
+                                                         'type': 'integer'}],
+                                         'result': {}}},
+ 'GetComputers': {'2011-08-01': {'doc': '\n'
+                                        '    Get a list of computers associated with '
+                                        'the account.\n'
+                                        '    ',
+                                 'errors': [{'code': 'InvalidQuery'}],
+                                 'name': 'GetComputers',
+                                 'parameters': [{'default': '',
+                                                 'doc': 'A query string with space '
+                                                        'separated tokens used to '
+                                                        'filter the returned result '
+                                                        'objects.',
+                                                 'name': 'query',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': 1000,
+                                                 'doc': 'The maximum number of results '
+                                                        'returned by the method. It '
+                                                        'defaults to 1000.',
+                                                 'name': 'limit',
+                                                 'optional': True,
+                                                 'type': 'integer'},
+                                                {'default': 0,
+                                                 'doc': 'The offset inside the list of '
+                                                        'results.',
+                                                 'name': 'offset',
+                                                 'optional': True,
+                                                 'type': 'integer'},
+                                                {'default': False,
+                                                 'doc': 'If True, include the details '
+                                                        'of all network devices '
+                                                        'attached to the computer.',
+                                                 'name': 'with_network',
+                                                 'optional': True,
+                                                 'type': 'boolean'},
+                                                {'default': False,
+                                                 'doc': 'If True, include the details '
+                                                        'of all hardware information '
+                                                        'known.',
+                                                 'name': 'with_hardware',
+                                                 'optional': True,
+                                                 'type': 'boolean'},
+                                                {'default': False,
+                                                 'doc': 'If True, include the details '
+                                                        'of all custom annotation '
+                                                        'information known.',
+                                                 'name': 'with_annotations',
+                                                 'optional': True,
+                                                 'type': 'boolean'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': '\n'
+                                        '    Get a list of computers associated with '
+                                        'the account.\n'
+                                        '    ',
+                                 'errors': [{'code': 'InvalidQuery'}],
+                                 'name': 'GetComputers',
+                                 'parameters': [{'default': '',
+                                                 'doc': 'A query string with space '
+                                                        'separated tokens used to '
+                                                        'filter the returned result '
+                                                        'objects.',
+                                                 'name': 'query',
+                                                 'optional': True,
+                                                 'type': 'unicode'},
+                                                {'default': 1000,
+                                                 'doc': 'The maximum number of results '
+                                                        'returned by the method. It '
+                                                        'defaults to 1000.',
+                                                 'name': 'limit',
+                                                 'optional': True,
+                                                 'type': 'integer'},
+                                                {'default': 0,
+                                                 'doc': 'The offset inside the list of '
+                                                        'results.',
+                                                 'name': 'offset',
+                                                 'optional': True,
+                                                 'type': 'integer'},
+                                                {'default': False,
+                                                 'doc': 'If True, include the details '
+                                                        'of all network devices '
+                                                        'attached to the computer.',
+                                                 'name': 'with_network',
+                                                 'optional': True,
+                                                 'type': 'boolean'},
+                                                {'default': False,
+                                                 'doc': 'If True, include the details '
+                                                        'of all hardware information '
+                                                        'known.',
+                                                 'name': 'with_hardware',
+                                                 'optional': True,
+                                                 'type': 'boolean'},
+                                                {'default': False,
+                                                 'doc': 'If True, include the details '
+                                                        'of all custom annotation '
+                                                        'information known.',
+                                                 'name': 'with_annotations',
+                                                 'optional': True,
+                                                 'type': 'boolean'}],
+                                 'result': {}}},
+ 'GetComputersNotUpgraded': {'2011-08-01': {'doc': 'Report the ids of computers, '
+                                                   'within a given selection, that are '
+                                                   'not covered by an upgrade profile.',
+                                            'errors': [{'code': 'InvalidQuery'}],
+                                            'name': 'GetComputersNotUpgraded',
+                                            'parameters': [{'default': '',
+                                                            'doc': 'A query string '
+                                                                   'with space '
+                                                                   'separated tokens '
+                                                                   'used to filter the '
+                                                                   'returned result '
+                                                                   'objects.',
+                                                            'name': 'query',
+                                                            'optional': True,
+                                                            'type': 'unicode'},
+                                                           {'default': 1000,
+                                                            'doc': 'The maximum number '
+                                                                   'of results '
+                                                                   'returned by the '
+                                                                   'method. It '
+                                                                   'defaults to 1000.',
+                                                            'name': 'limit',
+                                                            'optional': True,
+                                                            'type': 'integer'},
+                                                           {'default': 0,
+                                                            'doc': 'The offset inside '
+                                                                   'the list of '
+                                                                   'results.',
+                                                            'name': 'offset',
+                                                            'optional': True,
+                                                            'type': 'integer'}],
+                                            'result': {}},
+                             '2013-11-04': {'doc': 'Report the ids of computers, '
+                                                   'within a given selection, that are '
+                                                   'not covered by an upgrade profile.',
+                                            'errors': [{'code': 'InvalidQuery'}],
+                                            'name': 'GetComputersNotUpgraded',
+                                            'parameters': [{'default': '',
+                                                            'doc': 'A query string '
+                                                                   'with space '
+                                                                   'separated tokens '
+                                                                   'used to filter the '
+                                                                   'returned result '
+                                                                   'objects.',
+                                                            'name': 'query',
+                                                            'optional': True,
+                                                            'type': 'unicode'},
+                                                           {'default': 1000,
+                                                            'doc': 'The maximum number '
+                                                                   'of results '
+                                                                   'returned by the '
+                                                                   'method. It '
+                                                                   'defaults to 1000.',
+                                                            'name': 'limit',
+                                                            'optional': True,
+                                                            'type': 'integer'},
+                                                           {'default': 0,
+                                                            'doc': 'The offset inside '
+                                                                   'the list of '
+                                                                   'results.',
+                                                            'name': 'offset',
+                                                            'optional': True,
+                                                            'type': 'integer'}],
+                                            'result': {}}},
+ 'GetDistributions': {'2011-08-01': {'doc': 'Get info about distributions.',
+                                     'errors': [],
+                                     'name': 'GetDistributions',
+                                     'parameters': [{'default': [],
+                                                     'doc': 'A list of distribution '
+                                                            'names to get info for. If '
+                                                            'this is not provided, the '
+                                                            'call will return all '
+                                                            'distributions for the '
+                                                            'account.',
+                                                     'item': {'type': 'unicode'},
+                                                     'name': 'names',
+                                                     'optional': True,
+                                                     'type': 'list'}],
+                                     'result': {}},
+                      '2013-11-04': {'doc': 'Get info about distributions.',
+                                     'errors': [],
+                                     'name': 'GetDistributions',
+                                     'parameters': [{'default': [],
+                                                     'doc': 'A list of distribution '
+                                                            'names to get info for. If '
+                                                            'this is not provided, the '
+                                                            'call will return all '
+                                                            'distributions for the '
+                                                            'account.',
+                                                     'item': {'type': 'unicode'},
+                                                     'name': 'names',
+                                                     'optional': True,
+                                                     'type': 'list'}],
+                                     'result': {}}},
+ 'GetEventLog': {'2011-08-01': {'doc': 'Retrieve event log for the account.',
+                                'errors': [{'code': 'Unauthorised'}],
+                                'name': 'GetEventLog',
+                                'parameters': [{'default': None,
+                                                'doc': 'The number of days prior to '
+                                                       'today from which to fetch log '
+                                                       'entries. It defaults to 30 '
+                                                       'days.',
+                                                'name': 'days',
+                                                'optional': True,
+                                                'type': 'integer'},
+                                               {'default': 1000,
+                                                'doc': 'The maximum number of results '
+                                                       'returned by the method. It '
+                                                       'defaults to 1000.',
+                                                'name': 'limit',
+                                                'optional': True,
+                                                'type': 'integer'},
+                                               {'default': 0,
+                                                'doc': 'The offset inside the list of '
+                                                       'results.',
+                                                'name': 'offset',
+                                                'optional': True,
+                                                'type': 'integer'}],
+                                'result': {}},
+                 '2013-11-04': {'doc': 'Retrieve event log for the account.',
+                                'errors': [{'code': 'Unauthorised'}],
+                                'name': 'GetEventLog',
+                                'parameters': [{'default': None,
+                                                'doc': 'The number of days prior to '
+                                                       'today from which to fetch log '
+                                                       'entries. It defaults to 30 '
+                                                       'days.',
+                                                'name': 'days',
+                                                'optional': True,
+                                                'type': 'integer'},
+                                               {'default': 1000,
+                                                'doc': 'The maximum number of results '
+                                                       'returned by the method. It '
+                                                       'defaults to 1000.',
+                                                'name': 'limit',
+                                                'optional': True,
+                                                'type': 'integer'},
+                                               {'default': 0,
+                                                'doc': 'The offset inside the list of '
+                                                       'results.',
+                                                'name': 'offset',
+                                                'optional': True,
+                                                'type': 'integer'}],
+                                'result': {}}},
+ 'GetGPGKeys': {'2011-08-01': {'doc': 'Get info about GPG keys.',
+                               'errors': [],
+                               'name': 'GetGPGKeys',
+                               'parameters': [{'default': [],
+                                               'doc': 'A list of GPG keys to get info '
+                                                      'for. If this is not provided, '
+                                                      'the call will return all keys '
+                                                      'for the account.',
+                                               'item': {'type': 'unicode'},
+                                               'name': 'names',
+                                               'optional': True,
+                                               'type': 'list'}],
+                               'result': {}},
+                '2013-11-04': {'doc': 'Get info about GPG keys.',
+                               'errors': [],
+                               'name': 'GetGPGKeys',
+                               'parameters': [{'default': [],
+                                               'doc': 'A list of GPG keys to get info '
+                                                      'for. If this is not provided, '
+                                                      'the call will return all keys '
+                                                      'for the account.',
+                                               'item': {'type': 'unicode'},
+                                               'name': 'names',
+                                               'optional': True,
+                                               'type': 'list'}],
+                               'result': {}}},
+ 'GetJujuEnvironments': {'2011-08-01': {'doc': 'Get the details of all the Juju '
+                                               'environments in the account.',
+                                        'errors': [],
+                                        'name': 'GetJujuEnvironments',
+                                        'parameters': [],
+                                        'result': {}},
+                         '2013-11-04': {'doc': 'Get the details of all the Juju '
+                                               'environments in the account.',
+                                        'errors': [],
+                                        'name': 'GetJujuEnvironments',
+                                        'parameters': [],
+                                        'result': {}}},
+ 'GetJujuModels': {'2011-08-01': {'doc': 'Get the details of all the Juju models in '
+                                         'the account.',
+                                  'errors': [],
+                                  'name': 'GetJujuModels',
+                                  'parameters': [],
+                                  'result': {}},
+                   '2013-11-04': {'doc': 'Get the details of all the Juju models in '
+                                         'the account.',
+                                  'errors': [],
+                                  'name': 'GetJujuModels',
+                                  'parameters': [],
+                                  'result': {}}},
+ 'GetNotPingingComputers': {'2011-08-01': {'doc': 'Report the ids of computers, within '
+                                                  'a given selection, that have not '
+                                                  'pinged the server in a given number '
+                                                  'of minutes.',
+                                           'errors': [{'code': 'InvalidQuery'}],
+                                           'name': 'GetNotPingingComputers',
+                                           'parameters': [{'default': '',
+                                                           'doc': 'A query string with '
+                                                                  'space separated '
+                                                                  'tokens used to '
+                                                                  'filter the returned '
+                                                                  'result objects.',
+                                                           'name': 'query',
+                                                           'optional': True,
+                                                           'type': 'unicode'},
+                                                          {'default': 1000,
+                                                           'doc': 'The maximum number '
+                                                                  'of results returned '
+                                                                  'by the method. It '
+                                                                  'defaults to 1000.',
+                                                           'name': 'limit',
+                                                           'optional': True,
+                                                           'type': 'integer'},
+                                                          {'default': 0,
+                                                           'doc': 'The offset inside '
+                                                                  'the list of '
+                                                                  'results.',
+                                                           'name': 'offset',
+                                                           'optional': True,
+                                                           'type': 'integer'},
+                                                          {'doc': 'The number of '
+                                                                  'minutes elapsed in '
+                                                                  'which no ping from '
+                                                                  'included computers '
+                                                                  'has been seen.',
+                                                           'name': 'since_minutes',
+                                                           'type': 'integer'}],
+                                           'result': {}},
+                            '2013-11-04': {'doc': 'Report the ids of computers, within '
+                                                  'a given selection, that have not '
+                                                  'pinged the server in a given number '
+                                                  'of minutes.',
+                                           'errors': [{'code': 'InvalidQuery'}],
+                                           'name': 'GetNotPingingComputers',
+                                           'parameters': [{'default': '',
+                                                           'doc': 'A query string with '
+                                                                  'space separated '
+                                                                  'tokens used to '
+                                                                  'filter the returned '
+                                                                  'result objects.',
+                                                           'name': 'query',
+                                                           'optional': True,
+                                                           'type': 'unicode'},
+                                                          {'default': 1000,
+                                                           'doc': 'The maximum number '
+                                                                  'of results returned '
+                                                                  'by the method. It '
+                                                                  'defaults to 1000.',
+                                                           'name': 'limit',
+                                                           'optional': True,
+                                                           'type': 'integer'},
+                                                          {'default': 0,
+                                                           'doc': 'The offset inside '
+                                                                  'the list of '
+                                                                  'results.',
+                                                           'name': 'offset',
+                                                           'optional': True,
+                                                           'type': 'integer'},
+                                                          {'doc': 'The number of '
+                                                                  'minutes elapsed in '
+                                                                  'which no ping from '
+                                                                  'included computers '
+                                                                  'has been seen.',
+                                                           'name': 'since_minutes',
+                                                           'type': 'integer'}],
+                                           'result': {}}},
+ 'GetPackageProfiles': {'2011-08-01': {'doc': 'Get the details of all Package Profiles '
+                                              'defined in the account.\n'
+                                              '            ',
+                                       'errors': [],
+                                       'name': 'GetPackageProfiles',
+                                       'parameters': [{'default': [],
+                                                       'doc': 'A list of package '
+                                                              'profile names to limit '
+                                                              'the result.',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'names',
+                                                       'optional': True,
+                                                       'type': 'list'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': 'Get the details of all Package Profiles '
+                                              'defined in the account.\n'
+                                              '            ',
+                                       'errors': [],
+                                       'name': 'GetPackageProfiles',
+                                       'parameters': [{'default': [],
+                                                       'doc': 'A list of package '
+                                                              'profile names to limit '
+                                                              'the result.',
+                                                       'item': {'type': 'unicode'},
+                                                       'name': 'names',
+                                                       'optional': True,
+                                                       'type': 'list'}],
+                                       'result': {}}},
+ 'GetPackages': {'2011-08-01': {'doc': '\n'
+                                       '    Get a list of packages associated with the '
+                                       'account used for\n'
+                                       '    authentication.\n'
+                                       '\n'
+                                       '    A package is considered installed if dpkg '
+                                       'reports it as installed on the\n'
+                                       '    system.\n'
+                                       '\n'
+                                       '    A package is considered available if it '
+                                       'can be fetched from an APT\n'
+                                       "    source. Note that this means that it's "
+                                       'possible for an installed package\n'
+                                       '    to be not available.\n'
+                                       '\n'
+                                       "    A package is considered an upgrade if it's "
+                                       'available and if it has a\n'
+                                       '    version higher than a non-held installed '
+                                       'package with the same name.\n'
+                                       '    ',
+                                'errors': [{'code': 'InvalidQuery'},
+                                           {'code': 'UnknownComputers'}],
+                                'name': 'GetPackages',
+                                'parameters': [{'doc': 'A query string used to select '
+                                                       'computers to query packages '
+                                                       'on.',
+                                                'name': 'query',
+                                                'type': 'unicode'},
+                                               {'default': None,
+                                                'doc': 'A string to restrict the '
+                                                       'search to.  All fields are '
+                                                       'searched, not just those '
+                                                       'returned. (e.g., description)',
+                                                'name': 'search',
+                                                'optional': True,
+                                                'type': 'unicode'},
+                                               {'default': [],
+                                                'doc': 'Restrict the search to these '
+                                                       'package names. ',
+                                                'item': {'type': 'unicode'},
+                                                'name': 'names',
+                                                'optional': True,
+                                                'type': 'list'},
+                                               {'default': None,
+                                                'doc': 'If true only packages in the '
+                                                       'installed state will be '
+                                                       'returned, if false only '
+                                                       'packages not installed will be '
+                                                       'returned. If not given both '
+                                                       'installed and not installed '
+                                                       'packages will be returned.',
+                                                'name': 'installed',
+                                                'optional': True,
+                                                'type': 'boolean'},
+                                               {'default': None,
+                                                'doc': 'If true only packages in the '
+                                                       'available state will be '
+                                                       'returned, if false only '
+                                                       'packages not available will be '
+                                                       'returned. If not given both '
+                                                       'available and not available '
+                                                       'packages will be returned.',
+                                                'name': 'available',
+                                                'optional': True,
+                                                'type': 'boolean'},
+                                               {'default': None,
+                                                'doc': 'If True, only installable '
+                                                       'packages that are upgrades for '
+                                                       'an for an installed one are '
+                                                       'returned. IfFalse, only '
+                                                       'installable packages that are '
+                                                       'not upgrades are returned. If '
+                                                       'not given, packages will be '
+                                                       'returned regardless of wether '
+                                                       'they are upgrades or not.',
+                                                'name': 'upgrade',
+                                                'optional': True,
+                                                'type': 'boolean'},
+                                               {'default': None,
+                                                'doc': 'If True, only installed '
+                                                       'packages that are held on '
+                                                       'computers are returned. '
+                                                       'IfFalse, only packages that '
+                                                       'are not held on computers are '
+                                                       'returned. If not given, '
+                                                       'packages will be returned '
+                                                       'regardless of the held state.',
+                                                'name': 'held',
+                                                'optional': True,
+                                                'type': 'boolean'},
+                                               {'default': 0,
+                                                'doc': 'The offset inside the list of '
+                                                       'results.',
+                                                'name': 'offset',
+                                                'optional': True,
+                                                'type': 'integer'},
+                                               {'default': 1000,
+                                                'doc': 'The maximum number of results '
+                                                       'returned by the method. It '
+                                                       'defaults to 1000.',
+                                                'name': 'limit',
+                                                'optional': True,
+                                                'type': 'integer'}],
+                                'result': {}},
+                 '2013-11-04': {'doc': '\n'
+                                       '    Get a list of packages associated with the '
+                                       'account used for\n'
+                                       '    authentication.\n'
+                                       '\n'
+                                       '    A package is considered installed if dpkg '
+                                       'reports it as installed on the\n'
+                                       '    system.\n'
+                                       '\n'
+                                       '    A package is considered available if it '
+                                       'can be fetched from an APT\n'
+                                       "    source. Note that this means that it's "
+                                       'possible for an installed package\n'
+                                       '    to be not available.\n'
+                                       '\n'
+                                       "    A package is considered an upgrade if it's "
+                                       'available and if it has a\n'
+                                       '    version higher than a non-held installed '
+                                       'package with the same name.\n'
+                                       '    ',
+                                'errors': [{'code': 'InvalidQuery'},
+                                           {'code': 'UnknownComputers'}],
+                                'name': 'GetPackages',
+                                'parameters': [{'doc': 'A query string used to select '
+                                                       'computers to query packages '
+                                                       'on.',
+                                                'name': 'query',
+                                                'type': 'unicode'},
+                                               {'default': None,
+                                                'doc': 'A string to restrict the '
+                                                       'search to.  All fields are '
+                                                       'searched, not just those '
+                                                       'returned. (e.g., description)',
+                                                'name': 'search',
+                                                'optional': True,
+                                                'type': 'unicode'},
+                                               {'default': [],
+                                                'doc': 'Restrict the search to these '
+                                                       'package names. ',
+                                                'item': {'type': 'unicode'},
+                                                'name': 'names',
+                                                'optional': True,
+                                                'type': 'list'},
+                                               {'default': None,
+                                                'doc': 'If true only packages in the '
+                                                       'installed state will be '
+                                                       'returned, if false only '
+                                                       'packages not installed will be '
+                                                       'returned. If not given both '
+                                                       'installed and not installed '
+                                                       'packages will be returned.',
+                                                'name': 'installed',
+                                                'optional': True,
+                                                'type': 'boolean'},
+                                               {'default': None,
+                                                'doc': 'If true only packages in the '
+                                                       'available state will be '
+                                                       'returned, if false only '
+                                                       'packages not available will be '
+                                                       'returned. If not given both '
+                                                       'available and not available '
+                                                       'packages will be returned.',
+                                                'name': 'available',
+                                                'optional': True,
+                                                'type': 'boolean'},
+                                               {'default': None,
+                                                'doc': 'If True, only installable '
+                                                       'packages that are upgrades for '
+                                                       'an for an installed one are '
+                                                       'returned. IfFalse, only '
+                                                       'installable packages that are '
+                                                       'not upgrades are returned. If '
+                                                       'not given, packages will be '
+                                                       'returned regardless of wether '
+                                                       'they are upgrades or not.',
+                                                'name': 'upgrade',
+                                                'optional': True,
+                                                'type': 'boolean'},
+                                               {'default': None,
+                                                'doc': 'If True, only installed '
+                                                       'packages that are held on '
+                                                       'computers are returned. '
+                                                       'IfFalse, only packages that '
+                                                       'are not held on computers are '
+                                                       'returned. If not given, '
+                                                       'packages will be returned '
+                                                       'regardless of the held state.',
+                                                'name': 'held',
+                                                'optional': True,
+                                                'type': 'boolean'},
+                                               {'default': 0,
+                                                'doc': 'The offset inside the list of '
+                                                       'results.',
+                                                'name': 'offset',
+                                                'optional': True,
+                                                'type': 'integer'},
+                                               {'default': 1000,
+                                                'doc': 'The maximum number of results '
+                                                       'returned by the method. It '
+                                                       'defaults to 1000.',
+                                                'name': 'limit',
+                                                'optional': True,
+                                                'type': 'integer'}],
+                                'result': {}}},
+ 'GetPendingComputers': {'2011-08-01': {'doc': '\n'
+                                               '    Get a list of pending computers '
+                                               'associated with the account used for\n'
+                                               '    authentication.\n'
+                                               '    ',
+                                        'errors': [],
+                                        'name': 'GetPendingComputers',
+                                        'parameters': [],
+                                        'result': {}},
+                         '2013-11-04': {'doc': '\n'
+                                               '    Get a list of pending computers '
+                                               'associated with the account used for\n'
+                                               '    authentication.\n'
+                                               '    ',
+                                        'errors': [],
+                                        'name': 'GetPendingComputers',
+                                        'parameters': [],
+                                        'result': {}}},
+ 'GetPermissions': {'2011-08-01': {'doc': 'List all available permissions.',
+                                   'errors': [],
+                                   'name': 'GetPermissions',
+                                   'parameters': [],
+                                   'result': {}},
+                    '2013-11-04': {'doc': 'List all available permissions.',
+                                   'errors': [],
+                                   'name': 'GetPermissions',
+                                   'parameters': [],
+                                   'result': {}}},
+ 'GetRemovalProfiles': {'2011-08-01': {'doc': 'List all existing removal profiles.',
+                                       'errors': [],
+                                       'name': 'GetRemovalProfiles',
+                                       'parameters': [],
+                                       'result': {}},
+                        '2013-11-04': {'doc': 'List all existing removal profiles.',
+                                       'errors': [],
+                                       'name': 'GetRemovalProfiles',
+                                       'parameters': [],
+                                       'result': {}}},
+ 'GetRepositoryProfiles': {'2011-08-01': {'doc': 'Get a list of repository profiles in '
+                                                 'the account.',
+                                          'errors': [],
+                                          'name': 'GetRepositoryProfiles',
+                                          'parameters': [{'default': [],
+                                                          'doc': 'A list of repository '
+                                                                 'profile names to get '
+                                                                 'info for. If this is '
+                                                                 'not provided, the '
+                                                                 'call will return all '
+                                                                 'repository profiles '
+                                                                 'for the account.',
+                                                          'item': {'type': 'unicode'},
+                                                          'name': 'names',
+                                                          'optional': True,
+                                                          'type': 'list'}],
+                                          'result': {}},
+                           '2013-11-04': {'doc': 'Get a list of repository profiles in '
+                                                 'the account.',
+                                          'errors': [],
+                                          'name': 'GetRepositoryProfiles',
+                                          'parameters': [{'default': [],
+                                                          'doc': 'A list of repository '
+                                                                 'profile names to get '
+                                                                 'info for. If this is '
+                                                                 'not provided, the '
+                                                                 'call will return all '
+                                                                 'repository profiles '
+                                                                 'for the account.',
+                                                          'item': {'type': 'unicode'},
+                                                          'name': 'names',
+                                                          'optional': True,
+                                                          'type': 'list'}],
+                                          'result': {}}},
+ 'GetRoles': {'2011-08-01': {'doc': 'Get all available roles.',
+                             'errors': [],
+                             'name': 'GetRoles',
+                             'parameters': [{'default': [],
+                                             'doc': 'A list of role names to limit the '
+                                                    'result.',
+                                             'item': {'type': 'unicode'},
+                                             'name': 'names',
+                                             'optional': True,
+                                             'type': 'list'}],
+                             'result': {}},
+              '2013-11-04': {'doc': 'Get all available roles.',
+                             'errors': [],
+                             'name': 'GetRoles',
+                             'parameters': [{'default': [],
+                                             'doc': 'A list of role names to limit the '
+                                                    'result.',
+                                             'item': {'type': 'unicode'},
+                                             'name': 'names',
+                                             'optional': True,
+                                             'type': 'list'}],
+                             'result': {}}},
+ 'GetSavedSearches': {'2011-08-01': {'doc': 'Retrieve saved searches associated with '
+                                            'the current account.',
+                                     'errors': [],
+                                     'name': 'GetSavedSearches',
+                                     'parameters': [{'default': 0,
+                                                     'doc': 'The offset inside the '
+                                                            'list of results.',
+                                                     'name': 'offset',
+                                                     'optional': True,
+                                                     'type': 'integer'},
+                                                    {'default': 1000,
+                                                     'doc': 'The maximum number of '
+                                                            'results returned by the '
+                                                            'method. It defaults to '
+                                                            '1000.',
+                                                     'name': 'limit',
+                                                     'optional': True,
+                                                     'type': 'integer'}],
+                                     'result': {}},
+                      '2013-11-04': {'doc': 'Retrieve saved searches associated with '
+                                            'the current account.',
+                                     'errors': [],
+                                     'name': 'GetSavedSearches',
+                                     'parameters': [{'default': 0,
+                                                     'doc': 'The offset inside the '
+                                                            'list of results.',
+                                                     'name': 'offset',
+                                                     'optional': True,
+                                                     'type': 'integer'},
+                                                    {'default': 1000,
+                                                     'doc': 'The maximum number of '
+                                                            'results returned by the '
+                                                            'method. It defaults to '
+                                                            '1000.',
+                                                     'name': 'limit',
+                                                     'optional': True,
+                                                     'type': 'integer'}],
+                                     'result': {}}},
+ 'GetScriptCode': {'2011-08-01': {'doc': 'Retrieve the code portion of a given script.',
+                                  'errors': [{'code': 'UnknownScript'}],
+                                  'name': 'GetScriptCode',
+                                  'parameters': [{'doc': 'The identity of the script '
+                                                         'you wish to get the code '
+                                                         'for.',
+                                                  'name': 'script_id',
+                                                  'type': 'integer'}],
+                                  'result': {}},
+                   '2013-11-04': {'doc': 'Retrieve the code portion of a given script.',
+                                  'errors': [{'code': 'UnknownScript'}],
+                                  'name': 'GetScriptCode',
+                                  'parameters': [{'doc': 'The identity of the script '
+                                                         'you wish to get the code '
+                                                         'for.',
+                                                  'name': 'script_id',
+                                                  'type': 'integer'}],
+                                  'result': {}}},
+ 'GetScripts': {'2011-08-01': {'doc': 'Retrieve stored scripts associated with the '
+                                      'current account.',
+                               'errors': [],
+                               'name': 'GetScripts',
+                               'parameters': [{'default': 1000,
+                                               'doc': 'The maximum number of results '
+                                                      'returned by the method. It '
+                                                      'defaults to 1000.',
+                                               'name': 'limit',
+                                               'optional': True,
+                                               'type': 'integer'},
+                                              {'default': 0,
+                                               'doc': 'The offset inside the list of '
+                                                      'results.',
+                                               'name': 'offset',
+                                               'optional': True,
+                                               'type': 'integer'}],
+                               'result': {}},
+                '2013-11-04': {'doc': 'Retrieve stored scripts associated with the '
+                                      'current account.',
+                               'errors': [],
+                               'name': 'GetScripts',
+                               'parameters': [{'default': 1000,
+                                               'doc': 'The maximum number of results '
+                                                      'returned by the method. It '
+                                                      'defaults to 1000.',
+                                               'name': 'limit',
+                                               'optional': True,
+                                               'type': 'integer'},
+                                              {'default': 0,
+                                               'doc': 'The offset inside the list of '
+                                                      'results.',
+                                               'name': 'offset',
+                                               'optional': True,
+                                               'type': 'integer'}],
+                               'result': {}}},
+ 'GetSettings': {'2011-08-01': {'doc': '\n'
+                                       '    Get all settings and their value for the '
+                                       'current LDS installation.',
+                                'errors': [],
+                                'name': 'GetSettings',
+                                'parameters': [],
+                                'result': {}},
+                 '2013-11-04': {'doc': '\n'
+                                       '    Get all settings and their value for the '
+                                       'current LDS installation.',
+                                'errors': [],
+                                'name': 'GetSettings',
+                                'parameters': [],
+                                'result': {}}},
+ 'GetUSNTimeToFix': {'2011-08-01': {'doc': 'Return a break down of machines unpatched '
+                                           'periods following a USN release.',
+                                    'errors': [{'code': 'InvalidQuery'}],
+                                    'name': 'GetUSNTimeToFix',
+                                    'parameters': [{'default': '',
+                                                    'doc': 'A query string with space '
+                                                           'separated tokens used to '
+                                                           'filter the returned result '
+                                                           'objects.',
+                                                    'name': 'query',
+                                                    'optional': True,
+                                                    'type': 'unicode'},
+                                                   {'default': 1000,
+                                                    'doc': 'The maximum number of '
+                                                           'results returned by the '
+                                                           'method. It defaults to '
+                                                           '1000.',
+                                                    'name': 'limit',
+                                                    'optional': True,
+                                                    'type': 'integer'},
+                                                   {'default': 0,
+                                                    'doc': 'The offset inside the list '
+                                                           'of results.',
+                                                    'name': 'offset',
+                                                    'optional': True,
+                                                    'type': 'integer'},
+                                                   {'default': [],
+                                                    'doc': 'A list of periods of days '
+                                                           'to report on USN fixes '
+                                                           'being applied in',
+                                                    'item': {'type': 'integer'},
+                                                    'name': 'fixed_in_days',
+                                                    'optional': True,
+                                                    'type': 'list'},
+                                                   {'default': None,
+                                                    'doc': 'The period of days in the '
+                                                           'past to search for USNs '
+                                                           'that are pending on a '
+                                                           'computer.  This is '
+                                                           'independent of the in_last '
+                                                           'argument.',
+                                                    'name': 'pending_in_days',
+                                                    'optional': True,
+                                                    'type': 'integer'},
+                                                   {'default': None,
+                                                    'doc': 'The period of days to look '
+                                                           'into the past to find USN '
+                                                           'releases to be considered '
+                                                           'in these statistics.',
+                                                    'name': 'in_last',
+                                                    'optional': True,
+                                                    'type': 'integer'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'Return a break down of machines unpatched '
+                                           'periods following a USN release.',
+                                    'errors': [{'code': 'InvalidQuery'}],
+                                    'name': 'GetUSNTimeToFix',
+                                    'parameters': [{'default': '',
+                                                    'doc': 'A query string with space '
+                                                           'separated tokens used to '
+                                                           'filter the returned result '
+                                                           'objects.',
+                                                    'name': 'query',
+                                                    'optional': True,
+                                                    'type': 'unicode'},
+                                                   {'default': 1000,
+                                                    'doc': 'The maximum number of '
+                                                           'results returned by the '
+                                                           'method. It defaults to '
+                                                           '1000.',
+                                                    'name': 'limit',
+                                                    'optional': True,
+                                                    'type': 'integer'},
+                                                   {'default': 0,
+                                                    'doc': 'The offset inside the list '
+                                                           'of results.',
+                                                    'name': 'offset',
+                                                    'optional': True,
+                                                    'type': 'integer'},
+                                                   {'default': [],
+                                                    'doc': 'A list of periods of days '
+                                                           'to report on USN fixes '
+                                                           'being applied in',
+                                                    'item': {'type': 'integer'},
+                                                    'name': 'fixed_in_days',
+                                                    'optional': True,
+                                                    'type': 'list'},
+                                                   {'default': None,
+                                                    'doc': 'The period of days in the '
+                                                           'past to search for USNs '
+                                                           'that are pending on a '
+                                                           'computer.  This is '
+                                                           'independent of the in_last '
+                                                           'argument.',
+                                                    'name': 'pending_in_days',
+                                                    'optional': True,
+                                                    'type': 'integer'},
+                                                   {'default': None,
+                                                    'doc': 'The period of days to look '
+                                                           'into the past to find USN '
+                                                           'releases to be considered '
+                                                           'in these statistics.',
+                                                    'name': 'in_last',
+                                                    'optional': True,
+                                                    'type': 'integer'}],
+                                    'result': {}}},
+ 'GetUpgradeProfiles': {'2011-08-01': {'doc': 'List all previously created upgrade '
+                                              'profiles.',
+                                       'errors': [],
+                                       'name': 'GetUpgradeProfiles',
+                                       'parameters': [{'default': None,
+                                                       'doc': ' The type of upgrade '
+                                                              'you wish to list. This '
+                                                              'can be either "all" or '
+                                                              '"security", in which '
+                                                              'case the result will be '
+                                                              'a list of upgrade '
+                                                              'profiles with an '
+                                                              'upgrade type of "all" '
+                                                              'or "security" '
+                                                              'respectively. If '
+                                                              'omitted, the resulting '
+                                                              'list will contain all '
+                                                              'upgrade profiles, '
+                                                              'regardless of their '
+                                                              'upgrade type.',
+                                                       'name': 'upgrade_type',
+                                                       'optional': True,
+                                                       'type': 'unicode'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': 'List all previously created upgrade '
+                                              'profiles.',
+                                       'errors': [],
+                                       'name': 'GetUpgradeProfiles',
+                                       'parameters': [{'default': None,
+                                                       'doc': ' The type of upgrade '
+                                                              'you wish to list. This '
+                                                              'can be either "all" or '
+                                                              '"security", in which '
+                                                              'case the result will be '
+                                                              'a list of upgrade '
+                                                              'profiles with an '
+                                                              'upgrade type of "all" '
+                                                              'or "security" '
+                                                              'respectively. If '
+                                                              'omitted, the resulting '
+                                                              'list will contain all '
+                                                              'upgrade profiles, '
+                                                              'regardless of their '
+                                                              'upgrade type.',
+                                                       'name': 'upgrade_type',
+                                                       'optional': True,
+                                                       'type': 'unicode'}],
+                                       'result': {}}},
+ 'GetUpgradedComputersByFrequency': {'2011-08-01': {'doc': 'Return a dictionary of '
+                                                           'computer IDs broken down '
+                                                           'by their upgrade schedule.',
+                                                    'errors': [{'code': 'InvalidQuery'}],
+                                                    'name': 'GetUpgradedComputersByFrequency',
+                                                    'parameters': [{'default': '',
+                                                                    'doc': 'A query '
+                                                                           'string '
+                                                                           'with space '
+                                                                           'separated '
+                                                                           'tokens '
+                                                                           'used to '
+                                                                           'filter the '
+                                                                           'returned '
+                                                                           'result '
+                                                                           'objects.',
+                                                                    'name': 'query',
+                                                                    'optional': True,
+                                                                    'type': 'unicode'},
+                                                                   {'default': 1000,
+                                                                    'doc': 'The '
+                                                                           'maximum '
+                                                                           'number of '
+                                                                           'results '
+                                                                           'returned '
+                                                                           'by the '
+                                                                           'method. It '
+                                                                           'defaults '
+                                                                           'to 1000.',
+                                                                    'name': 'limit',
+                                                                    'optional': True,
+                                                                    'type': 'integer'},
+                                                                   {'default': 0,
+                                                                    'doc': 'The offset '
+                                                                           'inside the '
+                                                                           'list of '
+                                                                           'results.',
+                                                                    'name': 'offset',
+                                                                    'optional': True,
+                                                                    'type': 'integer'}],
+                                                    'result': {}},
+                                     '2013-11-04': {'doc': 'Return a dictionary of '
+                                                           'computer IDs broken down '
+                                                           'by their upgrade schedule.',
+                                                    'errors': [{'code': 'InvalidQuery'}],
+                                                    'name': 'GetUpgradedComputersByFrequency',
+                                                    'parameters': [{'default': '',
+                                                                    'doc': 'A query '
+                                                                           'string '
+                                                                           'with space '
+                                                                           'separated '
+                                                                           'tokens '
+                                                                           'used to '
+                                                                           'filter the '
+                                                                           'returned '
+                                                                           'result '
+                                                                           'objects.',
+                                                                    'name': 'query',
+                                                                    'optional': True,
+                                                                    'type': 'unicode'},
+                                                                   {'default': 1000,
+                                                                    'doc': 'The '
+                                                                           'maximum '
+                                                                           'number of '
+                                                                           'results '
+                                                                           'returned '
+                                                                           'by the '
+                                                                           'method. It '
+                                                                           'defaults '
+                                                                           'to 1000.',
+                                                                    'name': 'limit',
+                                                                    'optional': True,
+                                                                    'type': 'integer'},
+                                                                   {'default': 0,
+                                                                    'doc': 'The offset '
+                                                                           'inside the '
+                                                                           'list of '
+                                                                           'results.',
+                                                                    'name': 'offset',
+                                                                    'optional': True,
+                                                                    'type': 'integer'}],
+                                                    'result': {}}},
+ 'ImportGPGKey': {'2011-08-01': {'doc': 'Import a GPG key.',
+                                 'errors': [{'code': 'MultipleGPGKey'},
+                                            {'code': 'Unauthorised'},
+                                            {'code': 'DuplicateGPGKey'},
+                                            {'code': 'GPGKeyImportError'}],
+                                 'name': 'ImportGPGKey',
+                                 'parameters': [{'doc': 'Name of the GPG key. It must '
+                                                        'be unique within the account, '
+                                                        'start with an alphanumeric '
+                                                        'character and only contain '
+                                                        'lowercase letters, numbers '
+                                                        'and - or + signs.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The text representation of '
+                                                        'the key.',
+                                                 'name': 'material',
+                                                 'type': 'unicode'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': 'Import a GPG key.',
+                                 'errors': [{'code': 'MultipleGPGKey'},
+                                            {'code': 'Unauthorised'},
+                                            {'code': 'DuplicateGPGKey'},
+                                            {'code': 'GPGKeyImportError'}],
+                                 'name': 'ImportGPGKey',
+                                 'parameters': [{'doc': 'Name of the GPG key. It must '
+                                                        'be unique within the account, '
+                                                        'start with an alphanumeric '
+                                                        'character and only contain '
+                                                        'lowercase letters, numbers '
+                                                        'and - or + signs.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The text representation of '
+                                                        'the key.',
+                                                 'name': 'material',
+                                                 'type': 'unicode'}],
+                                 'result': {}}},
+ 'InstallPackages': {'2011-08-01': {'doc': 'Install packages on selected computers.',
+                                    'errors': [{'code': 'UnknownComputers'},
+                                               {'code': 'Unauthorised'},
+                                               {'code': 'InvalidQuery'},
+                                               {'code': 'UnknownPackages'},
+                                               {'code': 'InvalidTime'}],
+                                    'name': 'InstallPackages',
+                                    'parameters': [{'doc': 'A qualified criteria to be '
+                                                           'used in the search.',
+                                                    'name': 'query',
+                                                    'type': 'unicode'},
+                                                   {'doc': 'A list of package names on '
+                                                           'which to operate. Multiple '
+                                                           'package names can be '
+                                                           'supplied.',
+                                                    'item': {'type': 'unicode'},
+                                                    'name': 'packages',
+                                                    'type': 'list'},
+                                                   {'default': None,
+                                                    'doc': 'A time in the future to '
+                                                           'perform the package '
+                                                           'operation.',
+                                                    'name': 'deliver_after',
+                                                    'optional': True,
+                                                    'type': 'unicode'},
+                                                   {'default': 0,
+                                                    'doc': 'Randomise delivery within '
+                                                           'the given time frame '
+                                                           'specified in minutes',
+                                                    'name': 'deliver_delay_window',
+                                                    'optional': True,
+                                                    'type': 'integer'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'Install packages on selected computers.',
+                                    'errors': [{'code': 'UnknownComputers'},
+                                               {'code': 'Unauthorised'},
+                                               {'code': 'InvalidQuery'},
+                                               {'code': 'UnknownPackages'},
+                                               {'code': 'InvalidTime'}],
+                                    'name': 'InstallPackages',
+                                    'parameters': [{'doc': 'A qualified criteria to be '
+                                                           'used in the search.',
+                                                    'name': 'query',
+                                                    'type': 'unicode'},
+                                                   {'doc': 'A list of package names on '
+                                                           'which to operate. Multiple '
+                                                           'package names can be '
+                                                           'supplied.',
+                                                    'item': {'type': 'unicode'},
+                                                    'name': 'packages',
+                                                    'type': 'list'},
+                                                   {'default': None,
+                                                    'doc': 'A time in the future to '
+                                                           'perform the package '
+                                                           'operation.',
+                                                    'name': 'deliver_after',
+                                                    'optional': True,
+                                                    'type': 'unicode'},
+                                                   {'default': 0,
+                                                    'doc': 'Randomise delivery within '
+                                                           'the given time frame '
+                                                           'specified in minutes',
+                                                    'name': 'deliver_delay_window',
+                                                    'optional': True,
+                                                    'type': 'integer'}],
+                                    'result': {}}},
+ 'InviteAdministrator': {'2011-08-01': {'doc': 'Invite an administrator to your '
+                                               'account.',
+                                        'errors': [{'code': 'RepeatedInvitation'},
+                                                   {'code': 'UnknownRole'},
+                                                   {'code': 'InvalidEmailAddress'},
+                                                   {'code': 'MissingParameter'},
+                                                   {'code': 'MaximumAccountAdministrators'}],
+                                        'name': 'InviteAdministrator',
+                                        'parameters': [{'doc': 'The name of the person '
+                                                               'to invite.',
+                                                        'name': 'name',
+                                                        'type': 'unicode line'},
+                                                       {'doc': 'The email address of '
+                                                               'the administrator, to '
+                                                               'which the invitation '
+                                                               'will be send.',
+                                                        'name': 'email',
+                                                        'type': 'unicode line'},
+                                                       {'default': ['GlobalAdmin'],
+                                                        'doc': 'If specified, the '
+                                                               'roles that the '
+                                                               'administrator is going '
+                                                               'to have in your '
+                                                               'account. Default to '
+                                                               'GlobalAdmin',
+                                                        'item': {'type': 'unicode'},
+                                                        'name': 'roles',
+                                                        'optional': True,
+                                                        'type': 'list'}],
+                                        'result': {}},
+                         '2013-11-04': {'doc': 'Invite an administrator to your '
+                                               'account.',
+                                        'errors': [{'code': 'RepeatedInvitation'},
+                                                   {'code': 'UnknownRole'},
+                                                   {'code': 'InvalidEmailAddress'},
+                                                   {'code': 'MissingParameter'},
+                                                   {'code': 'MaximumAccountAdministrators'}],
+                                        'name': 'InviteAdministrator',
+                                        'parameters': [{'doc': 'The name of the person '
+                                                               'to invite.',
+                                                        'name': 'name',
+                                                        'type': 'unicode line'},
+                                                       {'doc': 'The email address of '
+                                                               'the administrator, to '
+                                                               'which the invitation '
+                                                               'will be send.',
+                                                        'name': 'email',
+                                                        'type': 'unicode line'},
+                                                       {'default': ['GlobalAdmin'],
+                                                        'doc': 'If specified, the '
+                                                               'roles that the '
+                                                               'administrator is going '
+                                                               'to have in your '
+                                                               'account. Default to '
+                                                               'GlobalAdmin',
+                                                        'item': {'type': 'unicode'},
+                                                        'name': 'roles',
+                                                        'optional': True,
+                                                        'type': 'list'}],
+                                        'result': {}}},
+ 'ListPocket': {'2011-08-01': {'doc': 'Return a list of the packages in a pocket.',
+                               'errors': [{'code': 'OperationInProgress'},
+                                          {'code': 'UnknownDistribution'},
+                                          {'code': 'UnknownPocket'},
+                                          {'code': 'UnknownSeries'}],
+                               'name': 'ListPocket',
+                               'parameters': [{'doc': 'The name of the pocket.',
+                                               'name': 'name',
+                                               'type': 'unicode'},
+                                              {'doc': 'The name of the series.',
+                                               'name': 'series',
+                                               'type': 'unicode'},
+                                              {'doc': 'The name of the distribution.',
+                                               'name': 'distribution',
+                                               'type': 'unicode'}],
+                               'result': {}},
+                '2013-11-04': {'doc': 'Return a list of the packages in a pocket.',
+                               'errors': [{'code': 'OperationInProgress'},
+                                          {'code': 'UnknownDistribution'},
+                                          {'code': 'UnknownPocket'},
+                                          {'code': 'UnknownSeries'}],
+                               'name': 'ListPocket',
+                               'parameters': [{'doc': 'The name of the pocket.',
+                                               'name': 'name',
+                                               'type': 'unicode'},
+                                              {'doc': 'The name of the series.',
+                                               'name': 'series',
+                                               'type': 'unicode'},
+                                              {'doc': 'The name of the distribution.',
+                                               'name': 'distribution',
+                                               'type': 'unicode'}],
+                               'result': {}}},
+ 'ModifyPackageProfile': {'2011-08-01': {'doc': 'THIS FUNCTION IS DEPRECATED. please '
+                                                'use edit-package-profile instead. \n'
+                                                '    Add or remove constraints related '
+                                                'to a package profile. Constraints '
+                                                'can\n'
+                                                '    be dependencies or conflicts.',
+                                         'errors': [{'code': 'EmptyPackageProfile'},
+                                                    {'code': 'UnknownPackageProfileName'},
+                                                    {'code': 'MissingParameter'},
+                                                    {'code': 'Unauthorised'},
+                                                    {'code': 'InvalidPackageConstraint'},
+                                                    {'code': 'InvalidConstraintType'}],
+                                         'name': 'ModifyPackageProfile',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'package profile.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'},
+                                                        {'default': None,
+                                                         'doc': 'The new title of the '
+                                                                'package profile.',
+                                                         'name': 'title',
+                                                         'optional': True,
+                                                         'type': 'unicode title'},
+                                                        {'default': [],
+                                                         'doc': 'List of constraints '
+                                                                'specifications to add '
+                                                                'in the form of '
+                                                                '"depends packagename" '
+                                                                'or "conflicts '
+                                                                'packagename < 1.0".',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'add_constraints',
+                                                         'optional': True,
+                                                         'type': 'list'},
+                                                        {'default': [],
+                                                         'doc': 'List of constraints '
+                                                                'specifications to '
+                                                                'remove in the form of '
+                                                                '"depends packagename" '
+                                                                'or "conflicts '
+                                                                'packagename < 1.0".',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'remove_constraints',
+                                                         'optional': True,
+                                                         'type': 'list'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'THIS FUNCTION IS DEPRECATED. please '
+                                                'use edit-package-profile instead. \n'
+                                                '    Add or remove constraints related '
+                                                'to a package profile. Constraints '
+                                                'can\n'
+                                                '    be dependencies or conflicts.',
+                                         'errors': [{'code': 'EmptyPackageProfile'},
+                                                    {'code': 'UnknownPackageProfileName'},
+                                                    {'code': 'MissingParameter'},
+                                                    {'code': 'Unauthorised'},
+                                                    {'code': 'InvalidPackageConstraint'},
+                                                    {'code': 'InvalidConstraintType'}],
+                                         'name': 'ModifyPackageProfile',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'package profile.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'},
+                                                        {'default': None,
+                                                         'doc': 'The new title of the '
+                                                                'package profile.',
+                                                         'name': 'title',
+                                                         'optional': True,
+                                                         'type': 'unicode title'},
+                                                        {'default': [],
+                                                         'doc': 'List of constraints '
+                                                                'specifications to add '
+                                                                'in the form of '
+                                                                '"depends packagename" '
+                                                                'or "conflicts '
+                                                                'packagename < 1.0".',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'add_constraints',
+                                                         'optional': True,
+                                                         'type': 'list'},
+                                                        {'default': [],
+                                                         'doc': 'List of constraints '
+                                                                'specifications to '
+                                                                'remove in the form of '
+                                                                '"depends packagename" '
+                                                                'or "conflicts '
+                                                                'packagename < 1.0".',
+                                                         'item': {'type': 'unicode'},
+                                                         'name': 'remove_constraints',
+                                                         'optional': True,
+                                                         'type': 'list'}],
+                                         'result': {}}},
+ 'PullPackagesToPocket': {'2011-08-01': {'doc': '\n'
+                                                '    Import packages to a pocket in '
+                                                'pull mode from its parent pocket.\n'
+                                                '    ',
+                                         'errors': [{'code': 'InvalidPocketMode'},
+                                                    {'code': 'UnknownDistribution'},
+                                                    {'code': 'OperationInProgress'},
+                                                    {'code': 'UnknownPocket'},
+                                                    {'code': 'UnknownSeries'}],
+                                         'name': 'PullPackagesToPocket',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'pocket to pull '
+                                                                'packages to.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'},
+                                                        {'doc': 'The name of the '
+                                                                'series.',
+                                                         'name': 'series',
+                                                         'type': 'unicode'},
+                                                        {'doc': 'The name of the '
+                                                                'distribution.',
+                                                         'name': 'distribution',
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': '\n'
+                                                '    Import packages to a pocket in '
+                                                'pull mode from its parent pocket.\n'
+                                                '    ',
+                                         'errors': [{'code': 'InvalidPocketMode'},
+                                                    {'code': 'UnknownDistribution'},
+                                                    {'code': 'OperationInProgress'},
+                                                    {'code': 'UnknownPocket'},
+                                                    {'code': 'UnknownSeries'}],
+                                         'name': 'PullPackagesToPocket',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'pocket to pull '
+                                                                'packages to.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'},
+                                                        {'doc': 'The name of the '
+                                                                'series.',
+                                                         'name': 'series',
+                                                         'type': 'unicode'},
+                                                        {'doc': 'The name of the '
+                                                                'distribution.',
+                                                         'name': 'distribution',
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'RebootComputers': {'2011-08-01': {'doc': 'Reboot a list of computers.',
+                                    'errors': [{'code': 'InvalidTime'},
+                                               {'code': 'UnknownComputer'}],
+                                    'name': 'RebootComputers',
+                                    'parameters': [{'doc': 'A list of computer ids to '
+                                                           'reboot.',
+                                                    'item': {'type': 'integer'},
+                                                    'name': 'computer_ids',
+                                                    'type': 'list'},
+                                                   {'default': None,
+                                                    'doc': 'A time in the future to '
+                                                           'deliver the script.',
+                                                    'name': 'deliver_after',
+                                                    'optional': True,
+                                                    'type': 'unicode'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'Reboot a list of computers.',
+                                    'errors': [{'code': 'InvalidTime'},
+                                               {'code': 'UnknownComputer'}],
+                                    'name': 'RebootComputers',
+                                    'parameters': [{'doc': 'A list of computer ids to '
+                                                           'reboot.',
+                                                    'item': {'type': 'integer'},
+                                                    'name': 'computer_ids',
+                                                    'type': 'list'},
+                                                   {'default': None,
+                                                    'doc': 'A time in the future to '
+                                                           'deliver the script.',
+                                                    'name': 'deliver_after',
+                                                    'optional': True,
+                                                    'type': 'unicode'}],
+                                    'result': {}}},
+ 'RegisterJujuEnvironment': {'2011-08-01': {'doc': 'Register a Juju environment.',
+                                            'errors': [{'code': 'InvalidEnvironmentName'},
+                                                       {'code': 'EnvironmentCredentialsError'},
+                                                       {'code': 'DuplicateEnvironment'},
+                                                       {'code': 'EnvironmentConnectionFailed'}],
+                                            'name': 'RegisterJujuEnvironment',
+                                            'parameters': [{'doc': 'The name of the '
+                                                                   'environment.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'},
+                                                           {'doc': 'The endpoint '
+                                                                   'address of the '
+                                                                   'Juju API.',
+                                                            'name': 'endpoint',
+                                                            'type': 'unicode'},
+                                                           {'doc': 'The username used '
+                                                                   'to authenticate '
+                                                                   'with the Juju API.',
+                                                            'name': 'username',
+                                                            'type': 'unicode'},
+                                                           {'doc': 'The password used '
+                                                                   'to authenticate '
+                                                                   'with the Juju API.',
+                                                            'name': 'password',
+                                                            'type': 'unicode'}],
+                                            'result': {}},
+                             '2013-11-04': {'doc': 'Register a Juju environment.',
+                                            'errors': [{'code': 'InvalidEnvironmentName'},
+                                                       {'code': 'EnvironmentCredentialsError'},
+                                                       {'code': 'DuplicateEnvironment'},
+                                                       {'code': 'EnvironmentConnectionFailed'}],
+                                            'name': 'RegisterJujuEnvironment',
+                                            'parameters': [{'doc': 'The name of the '
+                                                                   'environment.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'},
+                                                           {'doc': 'The endpoint '
+                                                                   'address of the '
+                                                                   'Juju API.',
+                                                            'name': 'endpoint',
+                                                            'type': 'unicode'},
+                                                           {'doc': 'The username used '
+                                                                   'to authenticate '
+                                                                   'with the Juju API.',
+                                                            'name': 'username',
+                                                            'type': 'unicode'},
+                                                           {'doc': 'The password used '
+                                                                   'to authenticate '
+                                                                   'with the Juju API.',
+                                                            'name': 'password',
+                                                            'type': 'unicode'}],
+                                            'result': {}}},
+ 'RegisterJujuModel': {'2011-08-01': {'doc': 'Register a Juju model.',
+                                      'errors': [{'code': 'DuplicateJujuModel'},
+                                                 {'code': 'InvalidJujuModelName'},
+                                                 {'code': 'JujuControllerCredentialsError'},
+                                                 {'code': 'JujuControllerConnectionFailed'}],
+                                      'name': 'RegisterJujuModel',
+                                      'parameters': [{'doc': 'The name of the model.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The endpoint address of '
+                                                             'the Juju API.',
+                                                      'name': 'endpoint',
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The username used to '
+                                                             'authenticate with the '
+                                                             'Juju API.',
+                                                      'name': 'username',
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The password used to '
+                                                             'authenticate with the '
+                                                             'Juju API.',
+                                                      'name': 'password',
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The UUID of the model to '
+                                                             'register from the '
+                                                             'controller.',
+                                                      'name': 'uuid',
+                                                      'type': 'unicode'}],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Register a Juju model.',
+                                      'errors': [{'code': 'DuplicateJujuModel'},
+                                                 {'code': 'InvalidJujuModelName'},
+                                                 {'code': 'JujuControllerCredentialsError'},
+                                                 {'code': 'JujuControllerConnectionFailed'}],
+                                      'name': 'RegisterJujuModel',
+                                      'parameters': [{'doc': 'The name of the model.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The endpoint address of '
+                                                             'the Juju API.',
+                                                      'name': 'endpoint',
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The username used to '
+                                                             'authenticate with the '
+                                                             'Juju API.',
+                                                      'name': 'username',
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The password used to '
+                                                             'authenticate with the '
+                                                             'Juju API.',
+                                                      'name': 'password',
+                                                      'type': 'unicode'},
+                                                     {'doc': 'The UUID of the model to '
+                                                             'register from the '
+                                                             'controller.',
+                                                      'name': 'uuid',
+                                                      'type': 'unicode'}],
+                                      'result': {}}},
+ 'RejectPendingComputers': {'2011-08-01': {'doc': '\n'
+                                                  '    Reject a list of pending '
+                                                  'computers associated with the '
+                                                  'account used for\n'
+                                                  '    authentication.\n'
+                                                  '    ',
+                                           'errors': [{'code': 'UnknownComputer'}],
+                                           'name': 'RejectPendingComputers',
+                                           'parameters': [{'doc': 'A list of computer '
+                                                                  'IDs to reject.',
+                                                           'item': {'type': 'integer'},
+                                                           'name': 'computer_ids',
+                                                           'type': 'list'}],
+                                           'result': {}},
+                            '2013-11-04': {'doc': '\n'
+                                                  '    Reject a list of pending '
+                                                  'computers associated with the '
+                                                  'account used for\n'
+                                                  '    authentication.\n'
+                                                  '    ',
+                                           'errors': [{'code': 'UnknownComputer'}],
+                                           'name': 'RejectPendingComputers',
+                                           'parameters': [{'doc': 'A list of computer '
+                                                                  'IDs to reject.',
+                                                           'item': {'type': 'integer'},
+                                                           'name': 'computer_ids',
+                                                           'type': 'list'}],
+                                           'result': {}}},
+ 'RemoveAPTSource': {'2011-08-01': {'doc': 'Remove apt source from the account.',
+                                    'errors': [{'code': 'UnknownAPTSource'},
+                                               {'code': 'APTSourceInUse'}],
+                                    'name': 'RemoveAPTSource',
+                                    'parameters': [{'doc': 'The name of the apt source '
+                                                           'to be removed.',
+                                                    'name': 'name',
+                                                    'type': 'unicode'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'Remove apt source from the account.',
+                                    'errors': [{'code': 'UnknownAPTSource'},
+                                               {'code': 'APTSourceInUse'}],
+                                    'name': 'RemoveAPTSource',
+                                    'parameters': [{'doc': 'The name of the apt source '
+                                                           'to be removed.',
+                                                    'name': 'name',
+                                                    'type': 'unicode'}],
+                                    'result': {}}},
+ 'RemoveAPTSourceFromRepositoryProfile': {'2011-08-01': {'doc': 'Remove APT source '
+                                                                'from a repository '
+                                                                'profile.\n'
+                                                                '            An '
+                                                                'activity will be '
+                                                                'created to remove the '
+                                                                'source from the\n'
+                                                                '            computers '
+                                                                'associated with the '
+                                                                'given profile.',
+                                                         'errors': [{'code': 'Unauthorised'},
+                                                                    {'code': 'UnknownRepositoryProfile'},
+                                                                    {'code': 'UnknownAPTSource'}],
+                                                         'name': 'RemoveAPTSourceFromRepositoryProfile',
+                                                         'parameters': [{'doc': 'Name '
+                                                                                'of '
+                                                                                'the '
+                                                                                'repository '
+                                                                                'profile.',
+                                                                         'name': 'name',
+                                                                         'type': 'unicode'},
+                                                                        {'doc': 'The '
+                                                                                'name '
+                                                                                'of '
+                                                                                'the '
+                                                                                'APT '
+                                                                                'source '
+                                                                                'to '
+                                                                                'remove.',
+                                                                         'name': 'apt_source',
+                                                                         'type': 'unicode'}],
+                                                         'result': {}},
+                                          '2013-11-04': {'doc': 'Remove APT source '
+                                                                'from a repository '
+                                                                'profile.\n'
+                                                                '            An '
+                                                                'activity will be '
+                                                                'created to remove the '
+                                                                'source from the\n'
+                                                                '            computers '
+                                                                'associated with the '
+                                                                'given profile.',
+                                                         'errors': [{'code': 'Unauthorised'},
+                                                                    {'code': 'UnknownRepositoryProfile'},
+                                                                    {'code': 'UnknownAPTSource'}],
+                                                         'name': 'RemoveAPTSourceFromRepositoryProfile',
+                                                         'parameters': [{'doc': 'Name '
+                                                                                'of '
+                                                                                'the '
+                                                                                'repository '
+                                                                                'profile.',
+                                                                         'name': 'name',
+                                                                         'type': 'unicode'},
+                                                                        {'doc': 'The '
+                                                                                'name '
+                                                                                'of '
+                                                                                'the '
+                                                                                'APT '
+                                                                                'source '
+                                                                                'to '
+                                                                                'remove.',
+                                                                         'name': 'apt_source',
+                                                                         'type': 'unicode'}],
+                                                         'result': {}}},
+ 'RemoveAPTSources': {'2011-08-01': {'doc': 'Deprecated: use RemoveAPTSource instead.',
+                                     'errors': [{'code': 'UnknownAPTSource'},
+                                                {'code': 'APTSourceInUse'}],
+                                     'name': 'RemoveAPTSources',
+                                     'parameters': [{'doc': 'List of names of the APT '
+                                                            'sources be removed. '
+                                                            'Multiple names can be '
+                                                            'supplied.',
+                                                     'item': {'type': 'unicode'},
+                                                     'name': 'names',
+                                                     'type': 'list'}],
+                                     'result': {}},
+                      '2013-11-04': {'doc': 'Deprecated: use RemoveAPTSource instead.',
+                                     'errors': [{'code': 'UnknownAPTSource'},
+                                                {'code': 'APTSourceInUse'}],
+                                     'name': 'RemoveAPTSources',
+                                     'parameters': [{'doc': 'List of names of the APT '
+                                                            'sources be removed. '
+                                                            'Multiple names can be '
+                                                            'supplied.',
+                                                     'item': {'type': 'unicode'},
+                                                     'name': 'names',
+                                                     'type': 'list'}],
+                                     'result': {}}},
+ 'RemoveAPTSourcesFromRepositoryProfile': {'2011-08-01': {'doc': '\n'
+                                                                 '            '
+                                                                 'Deprecated: use '
+                                                                 'RemoveAPTSourceFromRepositoryProfile '
+                                                                 'instead.\n'
+                                                                 '        ',
+                                                          'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                                     {'code': 'Unauthorised'},
+                                                                     {'code': 'UnknownAPTSource'}],
+                                                          'name': 'RemoveAPTSourcesFromRepositoryProfile',
+                                                          'parameters': [{'doc': 'Name '
+                                                                                 'of '
+                                                                                 'the '
+                                                                                 'repository '
+                                                                                 'profile.',
+                                                                          'name': 'name',
+                                                                          'type': 'unicode'},
+                                                                         {'doc': 'The '
+                                                                                 'names '
+                                                                                 'of '
+                                                                                 'the '
+                                                                                 'APT '
+                                                                                 'sources '
+                                                                                 'to '
+                                                                                 'remove.',
+                                                                          'item': {'type': 'unicode'},
+                                                                          'name': 'apt_sources',
+                                                                          'type': 'list'}],
+                                                          'result': {}},
+                                           '2013-11-04': {'doc': '\n'
+                                                                 '            '
+                                                                 'Deprecated: use '
+                                                                 'RemoveAPTSourceFromRepositoryProfile '
+                                                                 'instead.\n'
+                                                                 '        ',
+                                                          'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                                     {'code': 'Unauthorised'},
+                                                                     {'code': 'UnknownAPTSource'}],
+                                                          'name': 'RemoveAPTSourcesFromRepositoryProfile',
+                                                          'parameters': [{'doc': 'Name '
+                                                                                 'of '
+                                                                                 'the '
+                                                                                 'repository '
+                                                                                 'profile.',
+                                                                          'name': 'name',
+                                                                          'type': 'unicode'},
+                                                                         {'doc': 'The '
+                                                                                 'names '
+                                                                                 'of '
+                                                                                 'the '
+                                                                                 'APT '
+                                                                                 'sources '
+                                                                                 'to '
+                                                                                 'remove.',
+                                                                          'item': {'type': 'unicode'},
+                                                                          'name': 'apt_sources',
+                                                                          'type': 'list'}],
+                                                          'result': {}}},
+ 'RemoveAccessGroup': {'2011-08-01': {'doc': 'Remove an access group.',
+                                      'errors': [{'code': 'InvalidAccessGroup'},
+                                                 {'code': 'UnknownAccessGroup'},
+                                                 {'code': 'Unauthorised'}],
+                                      'name': 'RemoveAccessGroup',
+                                      'parameters': [{'doc': 'The name of the access '
+                                                             'group to remove.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'}],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Remove an access group.',
+                                      'errors': [{'code': 'InvalidAccessGroup'},
+                                                 {'code': 'UnknownAccessGroup'},
+                                                 {'code': 'Unauthorised'}],
+                                      'name': 'RemoveAccessGroup',
+                                      'parameters': [{'doc': 'The name of the access '
+                                                             'group to remove.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'}],
+                                      'result': {}}},
+ 'RemoveAccessGroupsFromRole': {'2011-08-01': {'doc': 'Remove the given access groups '
+                                                      'to a role.',
+                                               'errors': [{'code': 'UnknownRole'},
+                                                          {'code': 'UnknownAccessGroups'},
+                                                          {'code': 'ReadOnlyRole'}],
+                                               'name': 'RemoveAccessGroupsFromRole',
+                                               'parameters': [{'doc': 'The name of the '
+                                                                      'role to modify.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'A list of names '
+                                                                      'of access '
+                                                                      'groups to '
+                                                                      'remove from the '
+                                                                      'role.',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'access_groups',
+                                                               'type': 'list'}],
+                                               'result': {}},
+                                '2013-11-04': {'doc': 'Remove the given access groups '
+                                                      'to a role.',
+                                               'errors': [{'code': 'UnknownRole'},
+                                                          {'code': 'UnknownAccessGroups'},
+                                                          {'code': 'ReadOnlyRole'}],
+                                               'name': 'RemoveAccessGroupsFromRole',
+                                               'parameters': [{'doc': 'The name of the '
+                                                                      'role to modify.',
+                                                               'name': 'name',
+                                                               'type': 'unicode'},
+                                                              {'doc': 'A list of names '
+                                                                      'of access '
+                                                                      'groups to '
+                                                                      'remove from the '
+                                                                      'role.',
+                                                               'item': {'type': 'unicode'},
+                                                               'name': 'access_groups',
+                                                               'type': 'list'}],
+                                               'result': {}}},
+ 'RemoveAnnotationFromComputers': {'2011-08-01': {'doc': 'Remove annotation key from a '
+                                                         'selection of computers.',
+                                                  'errors': [{'code': 'InvalidAnnotationKey'},
+                                                             {'code': 'InvalidQuery'}],
+                                                  'name': 'RemoveAnnotationFromComputers',
+                                                  'parameters': [{'doc': 'A query '
+                                                                         'string used '
+                                                                         'to select '
+                                                                         'the '
+                                                                         'computers '
+                                                                         'from which '
+                                                                         'to remove '
+                                                                         'annotation.',
+                                                                  'name': 'query',
+                                                                  'type': 'unicode'},
+                                                                 {'doc': 'Annotation '
+                                                                         'key to '
+                                                                         'disassociate.',
+                                                                  'name': 'key',
+                                                                  'type': 'unicode'}],
+                                                  'result': {}},
+                                   '2013-11-04': {'doc': 'Remove annotation key from a '
+                                                         'selection of computers.',
+                                                  'errors': [{'code': 'InvalidAnnotationKey'},
+                                                             {'code': 'InvalidQuery'}],
+                                                  'name': 'RemoveAnnotationFromComputers',
+                                                  'parameters': [{'doc': 'A query '
+                                                                         'string used '
+                                                                         'to select '
+                                                                         'the '
+                                                                         'computers '
+                                                                         'from which '
+                                                                         'to remove '
+                                                                         'annotation.',
+                                                                  'name': 'query',
+                                                                  'type': 'unicode'},
+                                                                 {'doc': 'Annotation '
+                                                                         'key to '
+                                                                         'disassociate.',
+                                                                  'name': 'key',
+                                                                  'type': 'unicode'}],
+                                                  'result': {}}},
+ 'RemoveComputers': {'2011-08-01': {'doc': 'Remove a list of computers by ID.',
+                                    'errors': [{'code': 'UnknownComputer'},
+                                               {'code': 'Unauthorised'},
+                                               {'code': 'UnknownEntityIDs'}],
+                                    'name': 'RemoveComputers',
+                                    'parameters': [{'doc': 'A list of computer ids to '
+                                                           'remove.',
+                                                    'item': {'type': 'integer'},
+                                                    'name': 'computer_ids',
+                                                    'type': 'list'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'Remove a list of computers by ID.',
+                                    'errors': [{'code': 'UnknownComputer'},
+                                               {'code': 'Unauthorised'},
+                                               {'code': 'UnknownEntityIDs'}],
+                                    'name': 'RemoveComputers',
+                                    'parameters': [{'doc': 'A list of computer ids to '
+                                                           'remove.',
+                                                    'item': {'type': 'integer'},
+                                                    'name': 'computer_ids',
+                                                    'type': 'list'}],
+                                    'result': {}}},
+ 'RemoveDistribution': {'2011-08-01': {'doc': 'Remove the specified repository '
+                                              'distribution.',
+                                       'errors': [{'code': 'UnknownDistribution'},
+                                                  {'code': 'OperationInProgress'}],
+                                       'name': 'RemoveDistribution',
+                                       'parameters': [{'doc': 'The name of the '
+                                                              'distribution to remove.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'}],
+                                       'result': {}},
+                        '2013-11-04': {'doc': 'Remove the specified repository '
+                                              'distribution.',
+                                       'errors': [{'code': 'UnknownDistribution'},
+                                                  {'code': 'OperationInProgress'}],
+                                       'name': 'RemoveDistribution',
+                                       'parameters': [{'doc': 'The name of the '
+                                                              'distribution to remove.',
+                                                       'name': 'name',
+                                                       'type': 'unicode'}],
+                                       'result': {}}},
+ 'RemoveGPGKey': {'2011-08-01': {'doc': 'Remove a GPG key.',
+                                 'errors': [{'code': 'GPGKeyInUse'},
+                                            {'code': 'UnknownGPGKey'}],
+                                 'name': 'RemoveGPGKey',
+                                 'parameters': [{'doc': 'Name of the GPG key to '
+                                                        'remove.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': 'Remove a GPG key.',
+                                 'errors': [{'code': 'GPGKeyInUse'},
+                                            {'code': 'UnknownGPGKey'}],
+                                 'name': 'RemoveGPGKey',
+                                 'parameters': [{'doc': 'Name of the GPG key to '
+                                                        'remove.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'}],
+                                 'result': {}}},
+ 'RemoveJujuEnvironment': {'2011-08-01': {'doc': 'Remove a Juju environment from the '
+                                                 'account.',
+                                          'errors': [{'code': 'UnknownEnvironment'},
+                                                     {'code': 'Unauthorised'},
+                                                     {'code': 'UnknownEntityIDs'},
+                                                     {'code': 'JujuModelRemovalError'},
+                                                     {'code': 'EnvironmentRemovalError'}],
+                                          'name': 'RemoveJujuEnvironment',
+                                          'parameters': [{'doc': 'Name of the '
+                                                                 'environment to '
+                                                                 'remove.',
+                                                          'name': 'name',
+                                                          'type': 'unicode'}],
+                                          'result': {}},
+                           '2013-11-04': {'doc': 'Remove a Juju environment from the '
+                                                 'account.',
+                                          'errors': [{'code': 'UnknownEnvironment'},
+                                                     {'code': 'Unauthorised'},
+                                                     {'code': 'UnknownEntityIDs'},
+                                                     {'code': 'JujuModelRemovalError'},
+                                                     {'code': 'EnvironmentRemovalError'}],
+                                          'name': 'RemoveJujuEnvironment',
+                                          'parameters': [{'doc': 'Name of the '
+                                                                 'environment to '
+                                                                 'remove.',
+                                                          'name': 'name',
+                                                          'type': 'unicode'}],
+                                          'result': {}}},
+ 'RemoveJujuModel': {'2011-08-01': {'doc': 'Remove a Juju model from the account.',
+                                    'errors': [{'code': 'UnknownJujuModel'},
+                                               {'code': 'UnknownEntityIDs'},
+                                               {'code': 'Unauthorised'},
+                                               {'code': 'JujuModelRemovalError'},
+                                               {'code': 'EnvironmentRemovalError'}],
+                                    'name': 'RemoveJujuModel',
+                                    'parameters': [{'doc': 'Name of the model to '
+                                                           'remove.',
+                                                    'name': 'name',
+                                                    'type': 'unicode'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'Remove a Juju model from the account.',
+                                    'errors': [{'code': 'UnknownJujuModel'},
+                                               {'code': 'UnknownEntityIDs'},
+                                               {'code': 'Unauthorised'},
+                                               {'code': 'JujuModelRemovalError'},
+                                               {'code': 'EnvironmentRemovalError'}],
+                                    'name': 'RemoveJujuModel',
+                                    'parameters': [{'doc': 'Name of the model to '
+                                                           'remove.',
+                                                    'name': 'name',
+                                                    'type': 'unicode'}],
+                                    'result': {}}},
+ 'RemovePackageFiltersFromPocket': {'2011-08-01': {'doc': '\n'
+                                                          '    Remove package filters '
+                                                          'from a repository pocket.  '
+                                                          'The pocket must be in\n'
+                                                          '    pull mode and support '
+                                                          'blacklist/whitelist '
+                                                          'filtering.\n'
+                                                          '    ',
+                                                   'errors': [{'code': 'UnknownPocket'},
+                                                              {'code': 'UnknownSeries'},
+                                                              {'code': 'InvalidPocketMode'},
+                                                              {'code': 'UnknownDistribution'},
+                                                              {'code': 'NoPocketFiltering'},
+                                                              {'code': 'OperationInProgress'}],
+                                                   'name': 'RemovePackageFiltersFromPocket',
+                                                   'parameters': [{'doc': 'The name of '
+                                                                          'the pocket '
+                                                                          'to operate '
+                                                                          'on.',
+                                                                   'name': 'name',
+                                                                   'type': 'unicode'},
+                                                                  {'doc': 'The name of '
+                                                                          'the series '
+                                                                          'containing '
+                                                                          'the pocket.',
+                                                                   'name': 'series',
+                                                                   'type': 'unicode'},
+                                                                  {'doc': 'The name of '
+                                                                          'the '
+                                                                          'distribution '
+                                                                          'containing '
+                                                                          'the series.',
+                                                                   'name': 'distribution',
+                                                                   'type': 'unicode'},
+                                                                  {'doc': 'A list of '
+                                                                          'names of '
+                                                                          'packages to '
+                                                                          'be added or '
+                                                                          'removed '
+                                                                          'from the '
+                                                                          'pocket '
+                                                                          'filter.',
+                                                                   'item': {'type': 'unicode'},
+                                                                   'name': 'packages',
+                                                                   'type': 'list'}],
+                                                   'result': {}},
+                                    '2013-11-04': {'doc': '\n'
+                                                          '    Remove package filters '
+                                                          'from a repository pocket.  '
+                                                          'The pocket must be in\n'
+                                                          '    pull mode and support '
+                                                          'blacklist/whitelist '
+                                                          'filtering.\n'
+                                                          '    ',
+                                                   'errors': [{'code': 'UnknownPocket'},
+                                                              {'code': 'UnknownSeries'},
+                                                              {'code': 'InvalidPocketMode'},
+                                                              {'code': 'UnknownDistribution'},
+                                                              {'code': 'NoPocketFiltering'},
+                                                              {'code': 'OperationInProgress'}],
+                                                   'name': 'RemovePackageFiltersFromPocket',
+                                                   'parameters': [{'doc': 'The name of '
+                                                                          'the pocket '
+                                                                          'to operate '
+                                                                          'on.',
+                                                                   'name': 'name',
+                                                                   'type': 'unicode'},
+                                                                  {'doc': 'The name of '
+                                                                          'the series '
+                                                                          'containing '
+                                                                          'the pocket.',
+                                                                   'name': 'series',
+                                                                   'type': 'unicode'},
+                                                                  {'doc': 'The name of '
+                                                                          'the '
+                                                                          'distribution '
+                                                                          'containing '
+                                                                          'the series.',
+                                                                   'name': 'distribution',
+                                                                   'type': 'unicode'},
+                                                                  {'doc': 'A list of '
+                                                                          'names of '
+                                                                          'packages to '
+                                                                          'be added or '
+                                                                          'removed '
+                                                                          'from the '
+                                                                          'pocket '
+                                                                          'filter.',
+                                                                   'item': {'type': 'unicode'},
+                                                                   'name': 'packages',
+                                                                   'type': 'list'}],
+                                                   'result': {}}},
+ 'RemovePackageProfile': {'2011-08-01': {'doc': 'Remove a package profile, given its '
+                                                'name.',
+                                         'errors': [{'code': 'UnknownPackageProfileName'}],
+                                         'name': 'RemovePackageProfile',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'package profile to '
+                                                                'remove.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Remove a package profile, given its '
+                                                'name.',
+                                         'errors': [{'code': 'UnknownPackageProfileName'}],
+                                         'name': 'RemovePackageProfile',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'package profile to '
+                                                                'remove.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'RemovePackages': {'2011-08-01': {'doc': 'Remove packages on selected computers.',
+                                   'errors': [{'code': 'UnknownComputers'},
+                                              {'code': 'Unauthorised'},
+                                              {'code': 'InvalidQuery'},
+                                              {'code': 'UnknownPackages'},
+                                              {'code': 'InvalidTime'}],
+                                   'name': 'RemovePackages',
+                                   'parameters': [{'doc': 'A qualified criteria to be '
+                                                          'used in the search.',
+                                                   'name': 'query',
+                                                   'type': 'unicode'},
+                                                  {'doc': 'A list of package names on '
+                                                          'which to operate. Multiple '
+                                                          'package names can be '
+                                                          'supplied.',
+                                                   'item': {'type': 'unicode'},
+                                                   'name': 'packages',
+                                                   'type': 'list'},
+                                                  {'default': None,
+                                                   'doc': 'A time in the future to '
+                                                          'perform the package '
+                                                          'operation.',
+                                                   'name': 'deliver_after',
+                                                   'optional': True,
+                                                   'type': 'unicode'},
+                                                  {'default': 0,
+                                                   'doc': 'Randomise delivery within '
+                                                          'the given time frame '
+                                                          'specified in minutes',
+                                                   'name': 'deliver_delay_window',
+                                                   'optional': True,
+                                                   'type': 'integer'}],
+                                   'result': {}},
+                    '2013-11-04': {'doc': 'Remove packages on selected computers.',
+                                   'errors': [{'code': 'UnknownComputers'},
+                                              {'code': 'Unauthorised'},
+                                              {'code': 'InvalidQuery'},
+                                              {'code': 'UnknownPackages'},
+                                              {'code': 'InvalidTime'}],
+                                   'name': 'RemovePackages',
+                                   'parameters': [{'doc': 'A qualified criteria to be '
+                                                          'used in the search.',
+                                                   'name': 'query',
+                                                   'type': 'unicode'},
+                                                  {'doc': 'A list of package names on '
+                                                          'which to operate. Multiple '
+                                                          'package names can be '
+                                                          'supplied.',
+                                                   'item': {'type': 'unicode'},
+                                                   'name': 'packages',
+                                                   'type': 'list'},
+                                                  {'default': None,
+                                                   'doc': 'A time in the future to '
+                                                          'perform the package '
+                                                          'operation.',
+                                                   'name': 'deliver_after',
+                                                   'optional': True,
+                                                   'type': 'unicode'},
+                                                  {'default': 0,
+                                                   'doc': 'Randomise delivery within '
+                                                          'the given time frame '
+                                                          'specified in minutes',
+                                                   'name': 'deliver_delay_window',
+                                                   'optional': True,
+                                                   'type': 'integer'}],
+                                   'result': {}}},
+ 'RemovePackagesFromPocket': {'2011-08-01': {'doc': 'Remove packages from pockets in '
+                                                    'upload mode.',
+                                             'errors': [{'code': 'UnknownPocket'},
+                                                        {'code': 'OperationInProgress'},
+                                                        {'code': 'UnknownDistribution'},
+                                                        {'code': 'InvalidPocketMode'},
+                                                        {'code': 'UnknownSeries'}],
+                                             'name': 'RemovePackagesFromPocket',
+                                             'parameters': [{'doc': 'The name of the '
+                                                                    'pocket to remove '
+                                                                    'packages from.',
+                                                             'name': 'name',
+                                                             'type': 'unicode'},
+                                                            {'doc': 'The name of the '
+                                                                    'series containing '
+                                                                    'the pocket.',
+                                                             'name': 'series',
+                                                             'type': 'unicode'},
+                                                            {'doc': 'The name of the '
+                                                                    'distribution '
+                                                                    'containing the '
+                                                                    'series.',
+                                                             'name': 'distribution',
+                                                             'type': 'unicode'},
+                                                            {'doc': 'A list of names '
+                                                                    'of packages to be '
+                                                                    'removed from the '
+                                                                    'pockets.',
+                                                             'item': {'type': 'unicode'},
+                                                             'name': 'packages',
+                                                             'type': 'list'}],
+                                             'result': {}},
+                              '2013-11-04': {'doc': 'Remove packages from pockets in '
+                                                    'upload mode.',
+                                             'errors': [{'code': 'UnknownPocket'},
+                                                        {'code': 'OperationInProgress'},
+                                                        {'code': 'UnknownDistribution'},
+                                                        {'code': 'InvalidPocketMode'},
+                                                        {'code': 'UnknownSeries'}],
+                                             'name': 'RemovePackagesFromPocket',
+                                             'parameters': [{'doc': 'The name of the '
+                                                                    'pocket to remove '
+                                                                    'packages from.',
+                                                             'name': 'name',
+                                                             'type': 'unicode'},
+                                                            {'doc': 'The name of the '
+                                                                    'series containing '
+                                                                    'the pocket.',
+                                                             'name': 'series',
+                                                             'type': 'unicode'},
+                                                            {'doc': 'The name of the '
+                                                                    'distribution '
+                                                                    'containing the '
+                                                                    'series.',
+                                                             'name': 'distribution',
+                                                             'type': 'unicode'},
+                                                            {'doc': 'A list of names '
+                                                                    'of packages to be '
+                                                                    'removed from the '
+                                                                    'pockets.',
+                                                             'item': {'type': 'unicode'},
+                                                             'name': 'packages',
+                                                             'type': 'list'}],
+                                             'result': {}}},
+ 'RemovePermissionsFromRole': {'2011-08-01': {'doc': 'Remove permissions from a role.',
+                                              'errors': [{'code': 'UnknownRole'},
+                                                         {'code': 'ReadOnlyRole'},
+                                                         {'code': 'InvalidRolePermissions'}],
+                                              'name': 'RemovePermissionsFromRole',
+                                              'parameters': [{'doc': 'The name of the '
+                                                                     'role to modify.',
+                                                              'name': 'name',
+                                                              'type': 'unicode'},
+                                                             {'doc': 'A list of '
+                                                                     'permissions to '
+                                                                     'remove.',
+                                                              'item': {'type': 'unicode'},
+                                                              'name': 'permissions',
+                                                              'type': 'list'}],
+                                              'result': {}},
+                               '2013-11-04': {'doc': 'Remove permissions from a role.',
+                                              'errors': [{'code': 'UnknownRole'},
+                                                         {'code': 'ReadOnlyRole'},
+                                                         {'code': 'InvalidRolePermissions'}],
+                                              'name': 'RemovePermissionsFromRole',
+                                              'parameters': [{'doc': 'The name of the '
+                                                                     'role to modify.',
+                                                              'name': 'name',
+                                                              'type': 'unicode'},
+                                                             {'doc': 'A list of '
+                                                                     'permissions to '
+                                                                     'remove.',
+                                                              'item': {'type': 'unicode'},
+                                                              'name': 'permissions',
+                                                              'type': 'list'}],
+                                              'result': {}}},
+ 'RemovePersonsFromRole': {'2011-08-01': {'doc': 'Remove people from a role.',
+                                          'errors': [{'code': 'UnknownRole'},
+                                                     {'code': 'UnknownPersonEmails'},
+                                                     {'code': 'SelfRevokeGlobalAdmin'}],
+                                          'name': 'RemovePersonsFromRole',
+                                          'parameters': [{'doc': 'The name of the role '
+                                                                 'to modify.',
+                                                          'name': 'name',
+                                                          'type': 'unicode'},
+                                                         {'doc': 'A list of email '
+                                                                 'addresses of people '
+                                                                 'to remove.',
+                                                          'item': {'type': 'unicode'},
+                                                          'name': 'persons',
+                                                          'type': 'list'}],
+                                          'result': {}},
+                           '2013-11-04': {'doc': 'Remove people from a role.',
+                                          'errors': [{'code': 'UnknownRole'},
+                                                     {'code': 'UnknownPersonEmails'},
+                                                     {'code': 'SelfRevokeGlobalAdmin'}],
+                                          'name': 'RemovePersonsFromRole',
+                                          'parameters': [{'doc': 'The name of the role '
+                                                                 'to modify.',
+                                                          'name': 'name',
+                                                          'type': 'unicode'},
+                                                         {'doc': 'A list of email '
+                                                                 'addresses of people '
+                                                                 'to remove.',
+                                                          'item': {'type': 'unicode'},
+                                                          'name': 'persons',
+                                                          'type': 'list'}],
+                                          'result': {}}},
+ 'RemovePocket': {'2011-08-01': {'doc': 'Remove a repository pocket from a series in a '
+                                        'distribution.',
+                                 'errors': [{'code': 'OperationInProgress'},
+                                            {'code': 'UnknownDistribution'},
+                                            {'code': 'UnknownPocket'},
+                                            {'code': 'UnknownSeries'}],
+                                 'name': 'RemovePocket',
+                                 'parameters': [{'doc': 'The name of the pocket to '
+                                                        'remove.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the series '
+                                                        'containing the pocket.',
+                                                 'name': 'series',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution '
+                                                        'containing the series.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': 'Remove a repository pocket from a series in a '
+                                        'distribution.',
+                                 'errors': [{'code': 'OperationInProgress'},
+                                            {'code': 'UnknownDistribution'},
+                                            {'code': 'UnknownPocket'},
+                                            {'code': 'UnknownSeries'}],
+                                 'name': 'RemovePocket',
+                                 'parameters': [{'doc': 'The name of the pocket to '
+                                                        'remove.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the series '
+                                                        'containing the pocket.',
+                                                 'name': 'series',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution '
+                                                        'containing the series.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'}],
+                                 'result': {}}},
+ 'RemovePocketsFromRepositoryProfile': {'2011-08-01': {'doc': 'Remove repository '
+                                                              'pockets from a '
+                                                              'repository profile.\n'
+                                                              '            An activity '
+                                                              'will be created to '
+                                                              'remove the pockets from '
+                                                              'the APT\n'
+                                                              '            sources of '
+                                                              'the computers '
+                                                              'associated with the '
+                                                              'given profile.',
+                                                       'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                                  {'code': 'Unauthorised'},
+                                                                  {'code': 'UnknownDistribution'},
+                                                                  {'code': 'UnknownPocket'},
+                                                                  {'code': 'UnknownSeries'}],
+                                                       'name': 'RemovePocketsFromRepositoryProfile',
+                                                       'parameters': [{'doc': 'Name of '
+                                                                              'the '
+                                                                              'repository '
+                                                                              'profile.',
+                                                                       'name': 'name',
+                                                                       'type': 'unicode'},
+                                                                      {'doc': 'The '
+                                                                              'names '
+                                                                              'of the '
+                                                                              'pockets '
+                                                                              'to '
+                                                                              'remove.',
+                                                                       'item': {'type': 'unicode'},
+                                                                       'name': 'pockets',
+                                                                       'type': 'list'},
+                                                                      {'doc': 'The '
+                                                                              'name of '
+                                                                              'the '
+                                                                              'series '
+                                                                              'the '
+                                                                              'pocket '
+                                                                              'belongs '
+                                                                              'to.',
+                                                                       'name': 'series',
+                                                                       'type': 'unicode'},
+                                                                      {'doc': 'The '
+                                                                              'name of '
+                                                                              'the '
+                                                                              'distribution '
+                                                                              'the '
+                                                                              'series '
+                                                                              'belongs '
+                                                                              'to.',
+                                                                       'name': 'distribution',
+                                                                       'type': 'unicode'}],
+                                                       'result': {}},
+                                        '2013-11-04': {'doc': 'Remove repository '
+                                                              'pockets from a '
+                                                              'repository profile.\n'
+                                                              '            An activity '
+                                                              'will be created to '
+                                                              'remove the pockets from '
+                                                              'the APT\n'
+                                                              '            sources of '
+                                                              'the computers '
+                                                              'associated with the '
+                                                              'given profile.',
+                                                       'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                                  {'code': 'Unauthorised'},
+                                                                  {'code': 'UnknownDistribution'},
+                                                                  {'code': 'UnknownPocket'},
+                                                                  {'code': 'UnknownSeries'}],
+                                                       'name': 'RemovePocketsFromRepositoryProfile',
+                                                       'parameters': [{'doc': 'Name of '
+                                                                              'the '
+                                                                              'repository '
+                                                                              'profile.',
+                                                                       'name': 'name',
+                                                                       'type': 'unicode'},
+                                                                      {'doc': 'The '
+                                                                              'names '
+                                                                              'of the '
+                                                                              'pockets '
+                                                                              'to '
+                                                                              'remove.',
+                                                                       'item': {'type': 'unicode'},
+                                                                       'name': 'pockets',
+                                                                       'type': 'list'},
+                                                                      {'doc': 'The '
+                                                                              'name of '
+                                                                              'the '
+                                                                              'series '
+                                                                              'the '
+                                                                              'pocket '
+                                                                              'belongs '
+                                                                              'to.',
+                                                                       'name': 'series',
+                                                                       'type': 'unicode'},
+                                                                      {'doc': 'The '
+                                                                              'name of '
+                                                                              'the '
+                                                                              'distribution '
+                                                                              'the '
+                                                                              'series '
+                                                                              'belongs '
+                                                                              'to.',
+                                                                       'name': 'distribution',
+                                                                       'type': 'unicode'}],
+                                                       'result': {}}},
+ 'RemoveRemovalProfile': {'2011-08-01': {'doc': 'Remove an existing removal profile by '
+                                                'name.',
+                                         'errors': [{'code': 'UnknownRemovalProfile'}],
+                                         'name': 'RemoveRemovalProfile',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'removal profile you '
+                                                                'wish toremove.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Remove an existing removal profile by '
+                                                'name.',
+                                         'errors': [{'code': 'UnknownRemovalProfile'}],
+                                         'name': 'RemoveRemovalProfile',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'removal profile you '
+                                                                'wish toremove.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'RemoveRepositoryProfile': {'2011-08-01': {'doc': 'Remove repository profile from the '
+                                                   'account.',
+                                            'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                       {'code': 'Unauthorised'}],
+                                            'name': 'RemoveRepositoryProfile',
+                                            'parameters': [{'doc': 'The name of the '
+                                                                   'repository profile '
+                                                                   'to be removed.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'}],
+                                            'result': {}},
+                             '2013-11-04': {'doc': 'Remove repository profile from the '
+                                                   'account.',
+                                            'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                       {'code': 'Unauthorised'}],
+                                            'name': 'RemoveRepositoryProfile',
+                                            'parameters': [{'doc': 'The name of the '
+                                                                   'repository profile '
+                                                                   'to be removed.',
+                                                            'name': 'name',
+                                                            'type': 'unicode'}],
+                                            'result': {}}},
+ 'RemoveRepositoryProfiles': {'2011-08-01': {'doc': 'Deprecated: use '
+                                                    'RemoveRepositoryProfile instead.',
+                                             'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                        {'code': 'Unauthorised'}],
+                                             'name': 'RemoveRepositoryProfiles',
+                                             'parameters': [{'doc': 'Names of the '
+                                                                    'repository '
+                                                                    'profiles to be '
+                                                                    'removed.',
+                                                             'item': {'type': 'unicode'},
+                                                             'name': 'names',
+                                                             'type': 'list'}],
+                                             'result': {}},
+                              '2013-11-04': {'doc': 'Deprecated: use '
+                                                    'RemoveRepositoryProfile instead.',
+                                             'errors': [{'code': 'UnknownRepositoryProfile'},
+                                                        {'code': 'Unauthorised'}],
+                                             'name': 'RemoveRepositoryProfiles',
+                                             'parameters': [{'doc': 'Names of the '
+                                                                    'repository '
+                                                                    'profiles to be '
+                                                                    'removed.',
+                                                             'item': {'type': 'unicode'},
+                                                             'name': 'names',
+                                                             'type': 'list'}],
+                                             'result': {}}},
+ 'RemoveRole': {'2011-08-01': {'doc': 'Remove an access role.',
+                               'errors': [{'code': 'UnknownRole'},
+                                          {'code': 'ReadOnlyRole'}],
+                               'name': 'RemoveRole',
+                               'parameters': [{'doc': 'The name of the role.',
+                                               'name': 'name',
+                                               'type': 'unicode'}],
+                               'result': {}},
+                '2013-11-04': {'doc': 'Remove an access role.',
+                               'errors': [{'code': 'UnknownRole'},
+                                          {'code': 'ReadOnlyRole'}],
+                               'name': 'RemoveRole',
+                               'parameters': [{'doc': 'The name of the role.',
+                                               'name': 'name',
+                                               'type': 'unicode'}],
+                               'result': {}}},
+ 'RemoveSavedSearch': {'2011-08-01': {'doc': 'Remove a saved search associated with '
+                                             'the current account.',
+                                      'errors': [{'code': 'UnknownSavedSearch'}],
+                                      'name': 'RemoveSavedSearch',
+                                      'parameters': [{'doc': 'The "slug" name for this '
+                                                             'saved search.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'}],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Remove a saved search associated with '
+                                             'the current account.',
+                                      'errors': [{'code': 'UnknownSavedSearch'}],
+                                      'name': 'RemoveSavedSearch',
+                                      'parameters': [{'doc': 'The "slug" name for this '
+                                                             'saved search.',
+                                                      'name': 'name',
+                                                      'type': 'unicode'}],
+                                      'result': {}}},
+ 'RemoveScript': {'2011-08-01': {'doc': 'Remove scripts.',
+                                 'errors': [{'code': 'Unauthorised'},
+                                            {'code': 'UnknownScript'}],
+                                 'name': 'RemoveScript',
+                                 'parameters': [{'doc': 'The identity of the script to '
+                                                        'remove.',
+                                                 'name': 'script_id',
+                                                 'type': 'integer'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': 'Remove scripts.',
+                                 'errors': [{'code': 'Unauthorised'},
+                                            {'code': 'UnknownScript'}],
+                                 'name': 'RemoveScript',
+                                 'parameters': [{'doc': 'The identity of the script to '
+                                                        'remove.',
+                                                 'name': 'script_id',
+                                                 'type': 'integer'}],
+                                 'result': {}}},
+ 'RemoveScriptAttachment': {'2011-08-01': {'doc': 'Remove a script attachment.',
+                                           'errors': [{'code': 'UnknownScriptAttachment'},
+                                                      {'code': 'UnknownScript'}],
+                                           'name': 'RemoveScriptAttachment',
+                                           'parameters': [{'doc': 'The identity of the '
+                                                                  'script to remove.',
+                                                           'name': 'script_id',
+                                                           'type': 'integer'},
+                                                          {'doc': 'The filename of the '
+                                                                  'attachment to '
+                                                                  'remove.',
+                                                           'name': 'filename',
+                                                           'type': 'unicode'}],
+                                           'result': {}},
+                            '2013-11-04': {'doc': 'Remove a script attachment.',
+                                           'errors': [{'code': 'UnknownScriptAttachment'},
+                                                      {'code': 'UnknownScript'}],
+                                           'name': 'RemoveScriptAttachment',
+                                           'parameters': [{'doc': 'The identity of the '
+                                                                  'script to remove.',
+                                                           'name': 'script_id',
+                                                           'type': 'integer'},
+                                                          {'doc': 'The filename of the '
+                                                                  'attachment to '
+                                                                  'remove.',
+                                                           'name': 'filename',
+                                                           'type': 'unicode'}],
+                                           'result': {}}},
+ 'RemoveSeries': {'2011-08-01': {'doc': '\n'
+                                        '    Remove a repository series from a '
+                                        'distribution.\n'
+                                        '    ',
+                                 'errors': [{'code': 'UnknownDistribution'},
+                                            {'code': 'OperationInProgress'},
+                                            {'code': 'UnknownSeries'}],
+                                 'name': 'RemoveSeries',
+                                 'parameters': [{'doc': 'The name of the series to '
+                                                        'remove.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'}],
+                                 'result': {}},
+                  '2013-11-04': {'doc': '\n'
+                                        '    Remove a repository series from a '
+                                        'distribution.\n'
+                                        '    ',
+                                 'errors': [{'code': 'UnknownDistribution'},
+                                            {'code': 'OperationInProgress'},
+                                            {'code': 'UnknownSeries'}],
+                                 'name': 'RemoveSeries',
+                                 'parameters': [{'doc': 'The name of the series to '
+                                                        'remove.',
+                                                 'name': 'name',
+                                                 'type': 'unicode'},
+                                                {'doc': 'The name of the distribution.',
+                                                 'name': 'distribution',
+                                                 'type': 'unicode'}],
+                                 'result': {}}},
+ 'RemoveTagsFromComputers': {'2011-08-01': {'doc': 'Remove tags from a selection of '
+                                                   'computers.',
+                                            'errors': [{'code': 'InvalidQuery'},
+                                                       {'code': 'InvalidTag'}],
+                                            'name': 'RemoveTagsFromComputers',
+                                            'parameters': [{'doc': 'A query string '
+                                                                   'used to select the '
+                                                                   'computers to '
+                                                                   'remove tags from.',
+                                                            'name': 'query',
+                                                            'type': 'unicode'},
+                                                           {'doc': 'Tag names to be '
+                                                                   'removed.',
+                                                            'item': {'type': 'unicode'},
+                                                            'name': 'tags',
+                                                            'type': 'list'}],
+                                            'result': {}},
+                             '2013-11-04': {'doc': 'Remove tags from a selection of '
+                                                   'computers.',
+                                            'errors': [{'code': 'InvalidQuery'},
+                                                       {'code': 'InvalidTag'}],
+                                            'name': 'RemoveTagsFromComputers',
+                                            'parameters': [{'doc': 'A query string '
+                                                                   'used to select the '
+                                                                   'computers to '
+                                                                   'remove tags from.',
+                                                            'name': 'query',
+                                                            'type': 'unicode'},
+                                                           {'doc': 'Tag names to be '
+                                                                   'removed.',
+                                                            'item': {'type': 'unicode'},
+                                                            'name': 'tags',
+                                                            'type': 'list'}],
+                                            'result': {}}},
+ 'RemoveUpgradeProfile': {'2011-08-01': {'doc': 'Remove an existing upgrade profile by '
+                                                'name.',
+                                         'errors': [{'code': 'UnknownUpgradeProfile'}],
+                                         'name': 'RemoveUpgradeProfile',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'upgrade profile you '
+                                                                'wish to cancel.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Remove an existing upgrade profile by '
+                                                'name.',
+                                         'errors': [{'code': 'UnknownUpgradeProfile'}],
+                                         'name': 'RemoveUpgradeProfile',
+                                         'parameters': [{'doc': 'The name of the '
+                                                                'upgrade profile you '
+                                                                'wish to cancel.',
+                                                         'name': 'name',
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'RemoveUploaderGPGKeysFromPocket': {'2011-08-01': {'doc': '\n'
+                                                           '    Remove GPG keys for '
+                                                           'uploaded packages '
+                                                           'validation from a '
+                                                           'repository pocket\n'
+                                                           '    in upload mode.\n'
+                                                           '    ',
+                                                    'errors': [{'code': 'GPGKeyNotAssociated'},
+                                                               {'code': 'UnknownSeries'},
+                                                               {'code': 'UnknownDistribution'},
+                                                               {'code': 'UnknownGPGKey'},
+                                                               {'code': 'UnknownPocket'},
+                                                               {'code': 'GPGKeyAlreadyAssociated'},
+                                                               {'code': 'InvalidPocketMode'},
+                                                               {'code': 'OperationInProgress'}],
+                                                    'name': 'RemoveUploaderGPGKeysFromPocket',
+                                                    'parameters': [{'doc': 'The name '
+                                                                           'of the '
+                                                                           'pocket on '
+                                                                           'which to '
+                                                                           'associate '
+                                                                           'keys.',
+                                                                    'name': 'name',
+                                                                    'type': 'unicode'},
+                                                                   {'doc': 'The name '
+                                                                           'of the '
+                                                                           'series '
+                                                                           'containing '
+                                                                           'the '
+                                                                           'pocket.',
+                                                                    'name': 'series',
+                                                                    'type': 'unicode'},
+                                                                   {'doc': 'The name '
+                                                                           'of the '
+                                                                           'distribution '
+                                                                           'containing '
+                                                                           'the '
+                                                                           'series.',
+                                                                    'name': 'distribution',
+                                                                    'type': 'unicode'},
+                                                                   {'doc': 'A list of '
+                                                                           'GPG keys '
+                                                                           'on which '
+                                                                           'to '
+                                                                           'operate.',
+                                                                    'item': {'type': 'unicode'},
+                                                                    'name': 'gpg_keys',
+                                                                    'type': 'list'}],
+                                                    'result': {}},
+                                     '2013-11-04': {'doc': '\n'
+                                                           '    Remove GPG keys for '
+                                                           'uploaded packages '
+                                                           'validation from a '
+                                                           'repository pocket\n'
+                                                           '    in upload mode.\n'
+                                                           '    ',
+                                                    'errors': [{'code': 'GPGKeyNotAssociated'},
+                                                               {'code': 'UnknownSeries'},
+                                                               {'code': 'UnknownDistribution'},
+                                                               {'code': 'UnknownGPGKey'},
+                                                               {'code': 'UnknownPocket'},
+                                                               {'code': 'GPGKeyAlreadyAssociated'},
+                                                               {'code': 'InvalidPocketMode'},
+                                                               {'code': 'OperationInProgress'}],
+                                                    'name': 'RemoveUploaderGPGKeysFromPocket',
+                                                    'parameters': [{'doc': 'The name '
+                                                                           'of the '
+                                                                           'pocket on '
+                                                                           'which to '
+                                                                           'associate '
+                                                                           'keys.',
+                                                                    'name': 'name',
+                                                                    'type': 'unicode'},
+                                                                   {'doc': 'The name '
+                                                                           'of the '
+                                                                           'series '
+                                                                           'containing '
+                                                                           'the '
+                                                                           'pocket.',
+                                                                    'name': 'series',
+                                                                    'type': 'unicode'},
+                                                                   {'doc': 'The name '
+                                                                           'of the '
+                                                                           'distribution '
+                                                                           'containing '
+                                                                           'the '
+                                                                           'series.',
+                                                                    'name': 'distribution',
+                                                                    'type': 'unicode'},
+                                                                   {'doc': 'A list of '
+                                                                           'GPG keys '
+                                                                           'on which '
+                                                                           'to '
+                                                                           'operate.',
+                                                                    'item': {'type': 'unicode'},
+                                                                    'name': 'gpg_keys',
+                                                                    'type': 'list'}],
+                                                    'result': {}}},
+ 'RenameComputers': {'2011-08-01': {'doc': 'Rename a set of computers.',
+                                    'errors': [{'code': 'InvalidTitle'},
+                                               {'code': 'UnknownComputer'}],
+                                    'name': 'RenameComputers',
+                                    'parameters': [{'doc': 'mapping of computer_ids to '
+                                                           'computer titles',
+                                                    'key': {'doc': 'The ID of the '
+                                                                   'computer to rename',
+                                                            'type': 'integer'},
+                                                    'name': 'computer_titles',
+                                                    'type': 'mapping',
+                                                    'value': {'doc': 'The new name to '
+                                                                     'apply.',
+                                                              'type': 'unicode'}}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': 'Rename a set of computers.',
+                                    'errors': [{'code': 'InvalidTitle'},
+                                               {'code': 'UnknownComputer'}],
+                                    'name': 'RenameComputers',
+                                    'parameters': [{'doc': 'mapping of computer_ids to '
+                                                           'computer titles',
+                                                    'key': {'doc': 'The ID of the '
+                                                                   'computer to rename',
+                                                            'type': 'integer'},
+                                                    'name': 'computer_titles',
+                                                    'type': 'mapping',
+                                                    'value': {'doc': 'The new name to '
+                                                                     'apply.',
+                                                              'type': 'unicode'}}],
+                                    'result': {}}},
+ 'SetSettings': {'2011-08-01': {'doc': '\n'
+                                       '    Set configuration settings for the current '
+                                       'LDS installation.',
+                                'errors': [{'code': 'SettingsValue'}],
+                                'name': 'SetSettings',
+                                'parameters': [{'doc': 'Key/value pairs to set, '
+                                                       "separated by '='. 'true' and "
+                                                       "'false' strings will be "
+                                                       'interpreted as booleans.',
+                                                'item': {'type': 'unicode'},
+                                                'name': 'key_values',
+                                                'type': 'list'}],
+                                'result': {}},
+                 '2013-11-04': {'doc': '\n'
+                                       '    Set configuration settings for the current '
+                                       'LDS installation.',
+                                'errors': [{'code': 'SettingsValue'}],
+                                'name': 'SetSettings',
+                                'parameters': [{'doc': 'Key/value pairs to set, '
+                                                       "separated by '='. 'true' and "
+                                                       "'false' strings will be "
+                                                       'interpreted as booleans.',
+                                                'item': {'type': 'unicode'},
+                                                'name': 'key_values',
+                                                'type': 'list'}],
+                                'result': {}}},
+ 'ShutdownComputers': {'2011-08-01': {'doc': 'Shutdown a list of computers.',
+                                      'errors': [{'code': 'InvalidTime'},
+                                                 {'code': 'UnknownComputer'}],
+                                      'name': 'ShutdownComputers',
+                                      'parameters': [{'doc': 'A list of computer ids '
+                                                             'to shutdown.',
+                                                      'item': {'type': 'integer'},
+                                                      'name': 'computer_ids',
+                                                      'type': 'list'},
+                                                     {'default': None,
+                                                      'doc': 'A time in the future to '
+                                                             'deliver the script.',
+                                                      'name': 'deliver_after',
+                                                      'optional': True,
+                                                      'type': 'unicode'}],
+                                      'result': {}},
+                       '2013-11-04': {'doc': 'Shutdown a list of computers.',
+                                      'errors': [{'code': 'InvalidTime'},
+                                                 {'code': 'UnknownComputer'}],
+                                      'name': 'ShutdownComputers',
+                                      'parameters': [{'doc': 'A list of computer ids '
+                                                             'to shutdown.',
+                                                      'item': {'type': 'integer'},
+                                                      'name': 'computer_ids',
+                                                      'type': 'list'},
+                                                     {'default': None,
+                                                      'doc': 'A time in the future to '
+                                                             'deliver the script.',
+                                                      'name': 'deliver_after',
+                                                      'optional': True,
+                                                      'type': 'unicode'}],
+                                      'result': {}}},
+ 'SubscribeToAlert': {'2011-08-01': {'doc': 'Subscribe to an alert.',
+                                     'errors': [{'code': 'UnknownAlertTypeError'},
+                                                {'code': 'Unauthorised'}],
+                                     'name': 'SubscribeToAlert',
+                                     'parameters': [{'doc': 'The alert type to add a '
+                                                            'subscription to.',
+                                                     'name': 'alert_type',
+                                                     'type': 'unicode'}],
+                                     'result': {}},
+                      '2013-11-04': {'doc': 'Subscribe to an alert.',
+                                     'errors': [{'code': 'UnknownAlertTypeError'},
+                                                {'code': 'Unauthorised'}],
+                                     'name': 'SubscribeToAlert',
+                                     'parameters': [{'doc': 'The alert type to add a '
+                                                            'subscription to.',
+                                                     'name': 'alert_type',
+                                                     'type': 'unicode'}],
+                                     'result': {}}},
+ 'SyncMirrorPocket': {'2011-08-01': {'doc': 'Synchronize a mirror repository pocket.',
+                                     'errors': [{'code': 'InvalidPocketMode'},
+                                                {'code': 'UnknownDistribution'},
+                                                {'code': 'OperationInProgress'},
+                                                {'code': 'UnknownPocket'},
+                                                {'code': 'UnknownSeries'}],
+                                     'name': 'SyncMirrorPocket',
+                                     'parameters': [{'doc': 'The name of the pocket to '
+                                                            'synchronize.',
+                                                     'name': 'name',
+                                                     'type': 'unicode'},
+                                                    {'doc': 'The name of the series.',
+                                                     'name': 'series',
+                                                     'type': 'unicode'},
+                                                    {'doc': 'The name of the '
+                                                            'distribution.',
+                                                     'name': 'distribution',
+                                                     'type': 'unicode'}],
+                                     'result': {}},
+                      '2013-11-04': {'doc': 'Synchronize a mirror repository pocket.',
+                                     'errors': [{'code': 'InvalidPocketMode'},
+                                                {'code': 'UnknownDistribution'},
+                                                {'code': 'OperationInProgress'},
+                                                {'code': 'UnknownPocket'},
+                                                {'code': 'UnknownSeries'}],
+                                     'name': 'SyncMirrorPocket',
+                                     'parameters': [{'doc': 'The name of the pocket to '
+                                                            'synchronize.',
+                                                     'name': 'name',
+                                                     'type': 'unicode'},
+                                                    {'doc': 'The name of the series.',
+                                                     'name': 'series',
+                                                     'type': 'unicode'},
+                                                    {'doc': 'The name of the '
+                                                            'distribution.',
+                                                     'name': 'distribution',
+                                                     'type': 'unicode'}],
+                                     'result': {}}},
+ 'UnsubscribeFromAlert': {'2011-08-01': {'doc': 'Unsubscribe from an alert.',
+                                         'errors': [{'code': 'UnknownAlertTypeError'}],
+                                         'name': 'UnsubscribeFromAlert',
+                                         'parameters': [{'doc': 'The alert type to '
+                                                                'remove a subscription '
+                                                                'from.',
+                                                         'name': 'alert_type',
+                                                         'type': 'unicode'}],
+                                         'result': {}},
+                          '2013-11-04': {'doc': 'Unsubscribe from an alert.',
+                                         'errors': [{'code': 'UnknownAlertTypeError'}],
+                                         'name': 'UnsubscribeFromAlert',
+                                         'parameters': [{'doc': 'The alert type to '
+                                                                'remove a subscription '
+                                                                'from.',
+                                                         'name': 'alert_type',
+                                                         'type': 'unicode'}],
+                                         'result': {}}},
+ 'UpgradePackages': {'2011-08-01': {'doc': '\n'
+                                           '    Request upgrading of all packages '
+                                           'identified as being upgradable, on all\n'
+                                           '    computers selected by query.\n'
+                                           '    ',
+                                    'errors': [{'code': 'UnknownComputers'},
+                                               {'code': 'InvalidQuery'},
+                                               {'code': 'InvalidTime'}],
+                                    'name': 'UpgradePackages',
+                                    'parameters': [{'doc': 'A qualified criteria to be '
+                                                           'used in the search.',
+                                                    'name': 'query',
+                                                    'type': 'unicode'},
+                                                   {'default': [],
+                                                    'doc': 'List of package names on '
+                                                           'which to perform an '
+                                                           'upgrade. Multiple package '
+                                                           'names can be supplied like '
+                                                           'packages.1=foo and '
+                                                           'packages.2=bar.',
+                                                    'item': {'type': 'unicode'},
+                                                    'name': 'packages',
+                                                    'optional': True,
+                                                    'type': 'list'},
+                                                   {'default': False,
+                                                    'doc': "If 'true' then only "
+                                                           'packages with USNs, i.e. '
+                                                           'security upgrades will be '
+                                                           'applied.',
+                                                    'name': 'security_only',
+                                                    'optional': True,
+                                                    'type': 'boolean'},
+                                                   {'default': None,
+                                                    'doc': 'A time in the future to '
+                                                           'perform the package '
+                                                           'upgrade.',
+                                                    'name': 'deliver_after',
+                                                    'optional': True,
+                                                    'type': 'unicode'},
+                                                   {'default': 0,
+                                                    'doc': 'Randomise delivery within '
+                                                           'the given time frame '
+                                                           'specified in minutes',
+                                                    'name': 'deliver_delay_window',
+                                                    'optional': True,
+                                                    'type': 'integer'}],
+                                    'result': {}},
+                     '2013-11-04': {'doc': '\n'
+                                           '    Request upgrading of all packages '
+                                           'identified as being upgradable, on all\n'
+                                           '    computers selected by query.\n'
+                                           '    ',
+                                    'errors': [{'code': 'UnknownComputers'},
+                                               {'code': 'InvalidQuery'},
+                                               {'code': 'InvalidTime'}],
+                                    'name': 'UpgradePackages',
+                                    'parameters': [{'doc': 'A qualified criteria to be '
+                                                           'used in the search.',
+                                                    'name': 'query',
+                                                    'type': 'unicode'},
+                                                   {'default': [],
+                                                    'doc': 'List of package names on '
+                                                           'which to perform an '
+                                                           'upgrade. Multiple package '
+                                                           'names can be supplied like '
+                                                           'packages.1=foo and '
+                                                           'packages.2=bar.',
+                                                    'item': {'type': 'unicode'},
+                                                    'name': 'packages',
+                                                    'optional': True,
+                                                    'type': 'list'},
+                                                   {'default': False,
+                                                    'doc': "If 'true' then only "
+                                                           'packages with USNs, i.e. '
+                                                           'security upgrades will be '
+                                                           'applied.',
+                                                    'name': 'security_only',
+                                                    'optional': True,
+                                                    'type': 'boolean'},
+                                                   {'default': None,
+                                                    'doc': 'A time in the future to '
+                                                           'perform the package '
+                                                           'upgrade.',
+                                                    'name': 'deliver_after',
+                                                    'optional': True,
+                                                    'type': 'unicode'},
+                                                   {'default': 0,
+                                                    'doc': 'Randomise delivery within '
+                                                           'the given time frame '
+                                                           'specified in minutes',
+                                                    'name': 'deliver_delay_window',
+                                                    'optional': True,
+                                                    'type': 'integer'}],
+                                    'result': {}}}}
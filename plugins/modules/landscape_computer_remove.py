@@ -4,8 +4,6 @@ __metaclass__ = type
 
 from ansible.module_utils.basic import AnsibleModule
 
-from ansible_collections.gikuluca.landscape.plugins.module_utils.base import API, HTTPError
-
 DOCUMENTATION = """
 module: landscape_computer_remove
 short_description: Ubuntu Landscape remove computer
@@ -76,9 +74,14 @@ class LandscapeComputerRemove:
             'changed': False,
             'response': ''
         }
+        # Imported only after AnsibleModule has validated the arguments, so
+        # argument-spec failures don't pay for loading the API schema.
+        from ansible_collections.gikuluca.landscape.plugins.module_utils.base import API
         self.API_landscape = API(self.landscape_url, self.landscape_key, self.landscape_secret, self.landscape_ca)
 
     def get_computers(self):
+        from ansible_collections.gikuluca.landscape.plugins.module_utils.base import HTTPError
+
         result = []
         try:
             result = self.API_landscape.get_computers()
@@ -88,17 +91,12 @@ class LandscapeComputerRemove:
                                   "Message: %s\n" % (e.code, e.message))
         return result
 
-    def check_state(self, computers):
-        return True if self.computer_name in computers else False
-
-    def get_computer_id(self, computers):
-        return_id = -1
-        for computer in computers:
-            if computer['hostname'] in self.computer_name:
-                return_id = computer['id']
-        return return_id
+    def get_computer_index(self, computers):
+        return {computer['hostname']: computer['id'] for computer in computers}
 
     def delete_computer(self, computer_id):
+        from ansible_collections.gikuluca.landscape.plugins.module_utils.base import HTTPError
+
         try:
             self.API_landscape.remove_computers(computer_ids=[computer_id])
         except HTTPError as e:
@@ -109,11 +107,10 @@ class LandscapeComputerRemove:
 
 def main():
     lsc = LandscapeComputerRemove()
-    computers = lsc.get_computers()
-    actual_computers = list(map(lambda x: x['hostname'], computers))
-    lsc.result['changed'] = lsc.check_state(actual_computers)
+    computer_ids = lsc.get_computer_index(lsc.get_computers())
+    computer_id = computer_ids.get(lsc.computer_name)
+    lsc.result['changed'] = computer_id is not None
     if lsc.result['changed']:
-        computer_id = lsc.get_computer_id(computers)
         lsc.delete_computer(computer_id)
     else:
         lsc.result['response'] = 'No computer deleted'
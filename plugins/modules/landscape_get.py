@@ -4,8 +4,6 @@ __metaclass__ = type
 
 from ansible.module_utils.basic import AnsibleModule
 
-from ansible_collections.gikuluca.landscape.plugins.module_utils.base import API, HTTPError
-
 DOCUMENTATION = """
 module: landscape_get
 short_description: Ubuntu Landscape Get Functions
@@ -65,6 +63,16 @@ EXAMPLES = """
 RETURN = """
 """
 
+# The API getters this module is allowed to dispatch to; bound once at
+# import instead of being rebuilt for every AnsibleModule instantiation.
+GET_FUNCTIONS = (
+    'get_activities', 'get_activity_types', 'get_alert_subscribers', 'get_alerts',
+    'get_administrators', 'get_computers', 'get_gpg_keys', 'get_packages',
+    'get_package_profiles', 'get_removal_profiles', 'get_distributions',
+    'get_apt_sources', 'get_access_groups', 'get_permissions', 'get_roles',
+    'get_event_log',
+)
+
 
 class LandscapeApiGet:
     def __init__(self):
@@ -75,11 +83,7 @@ class LandscapeApiGet:
                 landscape_secret=dict(required=True, type='str'),
                 landscape_ca_path=dict(required=False, type='str', default=None),
                 function=dict(required=True, type='str',
-                              choices=['get_activities', 'get_activity_types', 'get_alert_subscribers', 'get_alerts',
-                                       'get_administrators', 'get_computers', 'get_gpg_keys', 'get_packages',
-                                       'get_package_profiles', 'get_removal_profiles', 'get_distributions',
-                                       'get_apt_sources', 'get_access_groups', 'get_permissions', 'get_roles',
-                                       'get_event_log']),
+                              choices=GET_FUNCTIONS),
                 # query=dict(required=False, type='str', default=None)
             )
         )
@@ -96,9 +100,14 @@ class LandscapeApiGet:
 def main():
     lsc = LandscapeApiGet()
 
+    # Imported only after AnsibleModule has validated the arguments, so
+    # argument-spec failures don't pay for loading the API schema.
+    from ansible_collections.gikuluca.landscape.plugins.module_utils.base import API, HTTPError
+
     api = API(lsc.landscape_url, lsc.landscape_key, lsc.landscape_secret, lsc.landscape_ca)
     try:
-        lsc.result = eval('api.%s()' % (lsc.functions_local))#, lsc.query))
+        handler = getattr(api, lsc.functions_local)
+        lsc.result = handler()
     except HTTPError as e:
         lsc.module.fail_json("\nGot server error:\n"
                              "Code: %d\n"
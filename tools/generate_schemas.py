@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# Copyright (c) 2020 Jiří Altman <jiri.altman@konicaminolta.cz>
+# Copyright (c) 2005-2013 Canonical Limited.  All rights reserved.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Regenerate plugins/module_utils/schemas.py in normalized form.
+
+The SCHEMA literal is treated as generated output: to update it, replace
+the dict in schemas.py with a fresh schema dump and run this script.  It
+re-emits the literal with sorted keys and stable formatting (so diffs
+against the server schema stay reviewable) and removes the marshalled
+sidecar cache, which base.py rebuilds on the next import.
+
+Usage: python tools/generate_schemas.py
+"""
+
+import ast
+import importlib.util
+import os
+import pprint
+import sys
+
+HEADER = '''\
+# Copyright (c) 2020 Jiří Altman <jiri.altman@konicaminolta.cz>
+# Copyright (c) 2005-2013 Canonical Limited.  All rights reserved.
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+"""Landscape API schema data.
+
+This module only holds the big C{SCHEMA} dict describing every API action
+for each supported API version.  It is imported lazily by
+C{base.load_schema}, which caches the parsed dict in a marshalled sidecar
+file so that regular startups do not pay for compiling this literal.
+
+Generated by tools/generate_schemas.py; do not hand-edit the literal.
+"""
+
+'''
+
+
+def module_utils_dir():
+    here = os.path.dirname(os.path.abspath(__file__))
+    return os.path.normpath(
+        os.path.join(here, os.pardir, "plugins", "module_utils")
+    )
+
+
+def load_current_schema(path):
+    spec = importlib.util.spec_from_file_location("_landscape_schemas", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SCHEMA
+
+
+def main():
+    schemas_path = os.path.join(module_utils_dir(), "schemas.py")
+    schema = load_current_schema(schemas_path)
+
+    literal = pprint.pformat(schema, width=88, sort_dicts=True)
+    generated = HEADER + "SCHEMA = " + literal + "\n"
+
+    # Self-check: the emitted literal must parse back to the same dict.
+    reparsed = ast.literal_eval(generated[generated.index("SCHEMA = ") + 9:])
+    if reparsed != schema:
+        sys.exit("generated literal does not round-trip; aborting")
+
+    with open(schemas_path, "w", encoding="utf-8") as schemas_file:
+        schemas_file.write(generated)
+
+    cache_path = os.path.join(module_utils_dir(), "base_schema.dat")
+    try:
+        os.remove(cache_path)
+    except OSError:
+        pass
+    print("wrote %s (%d actions)" % (schemas_path, len(schema)))
+
+
+if __name__ == "__main__":
+    main()